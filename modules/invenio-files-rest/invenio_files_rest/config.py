@@ -138,6 +138,18 @@ FILES_REST_DEFAULT_PDF_TTL = 1 * 60 * 60  # 1 hour
 FILES_REST_FILE_TAGS_HEADER = 'X-Invenio-File-Tags'
 """Header for updating file tags."""
 
+FILES_REST_ACCEPT_RANGES = True
+"""Send the partial content of the byte ranges requested by the clients."""
+
+FILES_REST_X_ACCEL_REDIRECT_LOCATIONS = {}
+"""Internal nginx locations of the local file storage paths.
+
+When the path of a file starts with a key, the file is sent by nginx from
+the internal location of the value with an ``X-Accel-Redirect`` header, e.g.
+``{'/var/tmp': '/protected_files'}`` with the nginx location
+``location /protected_files { internal; alias /var/tmp; }``.
+"""
+
 FILES_REST_ROLES_ENV = [
     'INVENIO_ROLE_SYSTEM',
     'INVENIO_ROLE_REPOSITORY',
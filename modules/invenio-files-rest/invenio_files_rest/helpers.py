@@ -14,10 +14,13 @@ import hashlib
 import mimetypes
 import os
 import unicodedata
+from calendar import timegm
 from time import time
+from uuid import uuid4
 
 from flask import current_app, request
 from werkzeug.datastructures import Headers
+from werkzeug.http import parse_if_range_header, parse_range_header
 from werkzeug.urls import url_quote
 from werkzeug.wsgi import FileWrapper
 
@@ -63,7 +66,8 @@ def chunk_size_or_default(chunk_size):
 
 def send_stream(stream, filename, size, mtime, mimetype=None, restricted=True,
                 as_attachment=False, etag=None, content_md5=None,
-                chunk_size=None, conditional=True, trusted=False):
+                chunk_size=None, conditional=True, trusted=False,
+                x_accel_redirect=None):
     """Send the contents of a file to the client.
 
     .. warning::
@@ -98,6 +102,9 @@ def send_stream(stream, filename, size, mtime, mimetype=None, restricted=True,
         that prevents your browser from rendering e.g. a HTML file which could
         contain a malicious script tag.
         (Default: ``False``)
+    :param x_accel_redirect: If defined, the body is not sent and nginx is
+        asked to send the file of this internal URI instead. The stream is
+        not used. (Default: ``None``)
     :returns: A Flask response instance.
     """
     chunk_size = chunk_size_or_default(chunk_size)
@@ -148,12 +155,18 @@ def send_stream(stream, filename, size, mtime, mimetype=None, restricted=True,
         headers.add('Content-Disposition', 'inline')
 
     # Construct response object.
-    rv = current_app.response_class(
-        FileWrapper(stream, buffer_size=chunk_size),
-        mimetype=mimetype,
-        headers=headers,
-        direct_passthrough=True,
-    )
+    if x_accel_redirect:
+        # nginx sends the file and the byte ranges of it.
+        del headers['Content-Length']
+        headers['X-Accel-Redirect'] = x_accel_redirect
+        rv = current_app.response_class(mimetype=mimetype, headers=headers)
+    else:
+        rv = current_app.response_class(
+            FileWrapper(stream, buffer_size=chunk_size),
+            mimetype=mimetype,
+            headers=headers,
+            direct_passthrough=True,
+        )
 
     # Set etag if defined
     if etag:
@@ -174,9 +187,141 @@ def send_stream(stream, filename, size, mtime, mimetype=None, restricted=True,
     if conditional:
         rv = rv.make_conditional(request)
 
+    if not x_accel_redirect \
+            and current_app.config.get('FILES_REST_ACCEPT_RANGES'):
+        rv.headers['Accept-Ranges'] = 'bytes'
+        if rv.status_code == 200:
+            ranges = get_byte_ranges(size, etag=etag, mtime=mtime)
+            if ranges is not None:
+                rv = make_range_response(rv, stream, ranges, size,
+                                         chunk_size=chunk_size)
+
     return rv
 
 
+def get_byte_ranges(size, etag=None, mtime=None):
+    """Get the byte ranges requested by the ``Range`` header.
+
+    Overlapping and adjacent ranges are merged.
+
+    :param size: The file size.
+    :param etag: The HTTP E-Tag of the file, checked with ``If-Range``.
+    :param mtime: The Unix timestamp of the file, checked with ``If-Range``.
+    :returns: The list of the ``(start, stop)`` ranges, an empty list if none
+        of them can be satisfied or ``None`` if the whole file is sent.
+    """
+    if request.method not in ('GET', 'HEAD'):
+        return None
+    rng = parse_range_header(request.headers.get('Range'))
+    if rng is None or rng.units != 'bytes':
+        return None
+
+    if_range = request.headers.get('If-Range')
+    if if_range:
+        if_range = parse_if_range_header(if_range)
+        if if_range.etag:
+            if not etag or if_range.etag != etag:
+                return None
+        elif if_range.date is None or mtime is None \
+                or timegm(if_range.date.utctimetuple()) != int(mtime):
+            return None
+
+    ranges = []
+    for start, stop in rng.ranges:
+        if start < 0:
+            start, stop = max(size + start, 0), size
+        else:
+            stop = size if stop is None else min(stop, size)
+        if start < stop:
+            ranges.append((start, stop))
+
+    merged = []
+    for start, stop in sorted(ranges):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], stop))
+        else:
+            merged.append((start, stop))
+    return merged
+
+
+def iter_byte_ranges(stream, ranges, chunk_size=None, part_headers=None,
+                     end=b''):
+    """Iterate over the byte ranges of a stream and close it at the end.
+
+    :param stream: The file stream.
+    :param ranges: The list of the ``(start, stop)`` ranges.
+    :param chunk_size: The chunk size.
+    :param part_headers: The headers sent before each range of a multipart
+        body, ``None`` for a single range.
+    :param end: The end of a multipart body.
+    """
+    chunk_size = chunk_size_or_default(chunk_size)
+    try:
+        for i, (start, stop) in enumerate(ranges):
+            if part_headers:
+                yield part_headers[i]
+            stream.seek(start)
+            remaining = stop - start
+            while remaining > 0:
+                data = stream.read(min(chunk_size, remaining))
+                if not data:
+                    break
+                remaining -= len(data)
+                yield data
+            if part_headers:
+                yield b'\r\n'
+        if end:
+            yield end
+    finally:
+        stream.close()
+
+
+def make_range_response(rv, stream, ranges, size, chunk_size=None):
+    """Make the partial content response of the byte ranges.
+
+    :param rv: The response of the whole file.
+    :param stream: The file stream.
+    :param ranges: The list of the ``(start, stop)`` ranges.
+    :param size: The file size.
+    :param chunk_size: The chunk size.
+    :returns: A Flask response instance.
+    """
+    headers = Headers(rv.headers)
+    if not ranges:
+        rv.close()
+        headers['Content-Range'] = 'bytes */{0}'.format(size)
+        headers['Content-Length'] = 0
+        return current_app.response_class(status=416, headers=headers)
+
+    if len(ranges) == 1:
+        start, stop = ranges[0]
+        headers['Content-Range'] = 'bytes {0}-{1}/{2}'.format(
+            start, stop - 1, size)
+        headers['Content-Length'] = stop - start
+        body = iter_byte_ranges(stream, ranges, chunk_size=chunk_size)
+    else:
+        boundary = uuid4().hex
+        part_headers = [
+            '--{0}\r\nContent-Type: {1}\r\n'
+            'Content-Range: bytes {2}-{3}/{4}\r\n\r\n'.format(
+                boundary, headers.get('Content-Type'), start, stop - 1, size
+            ).encode('latin-1')
+            for start, stop in ranges
+        ]
+        end = '--{0}--\r\n'.format(boundary).encode('latin-1')
+        headers['Content-Type'] = \
+            'multipart/byteranges; boundary={0}'.format(boundary)
+        headers['Content-Length'] = sum(
+            len(part) + stop - start + 2
+            for part, (start, stop) in zip(part_headers, ranges)
+        ) + len(end)
+        body = iter_byte_ranges(stream, ranges, chunk_size=chunk_size,
+                                part_headers=part_headers, end=end)
+
+    return current_app.response_class(
+        body, status=206, headers=headers, direct_passthrough=True)
+
+
 def sanitize_mimetype(mimetype, filename=None):
     """Sanitize a MIME type so the browser does not render the file."""
     # Allow some few mime type like plain text, images and audio.
@@ -94,6 +94,28 @@ class FileStorage(object):
                   checksum=None, trusted=False, chunk_size=None,
                   as_attachment=False):
         """Send the file to the client."""
+        md5_checksum = None
+        if checksum:
+            algo, value = checksum.split(':')
+            if algo == 'md5':
+                md5_checksum = value
+
+        x_accel_redirect = self.get_x_accel_redirect()
+        if x_accel_redirect:
+            return send_stream(
+                None,
+                filename,
+                self._size,
+                self._modified,
+                mimetype=mimetype,
+                restricted=restricted,
+                etag=checksum,
+                content_md5=md5_checksum,
+                trusted=trusted,
+                as_attachment=as_attachment,
+                x_accel_redirect=x_accel_redirect,
+            )
+
         try:
             fp = self.open(mode='rb')
         except Exception as e:
@@ -101,12 +123,6 @@ class FileStorage(object):
             raise StorageError('Could not send file: {}'.format(e))
 
         try:
-            md5_checksum = None
-            if checksum:
-                algo, value = checksum.split(':')
-                if algo == 'md5':
-                    md5_checksum = value
-
             # Send stream is responsible for closing the file.
             return send_stream(
                 fp,
@@ -125,6 +141,13 @@ class FileStorage(object):
             fp.close()
             raise StorageError('Could not send file: {}'.format(e))
 
+    def get_x_accel_redirect(self):
+        """Get the internal nginx URI the file is sent from.
+
+        :returns: The URI, or ``None`` if the file is sent by the application.
+        """
+        return None
+
     def checksum(self, chunk_size=None, progress_callback=None, **kwargs):
         """Compute checksum of file."""
         fp = self.open(mode='rb')
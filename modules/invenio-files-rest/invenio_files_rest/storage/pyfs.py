@@ -18,6 +18,7 @@ import cchardet as chardet
 from flask import current_app
 from fs.opener import opener
 from fs.path import basename, dirname
+from werkzeug.urls import url_quote
 
 from ..helpers import make_path
 from .base import FileStorage, StorageError
@@ -63,6 +64,23 @@ class PyFSFileStorage(FileStorage):
         fs, path = self._get_fs()
         return fs.open(path, mode=mode)
 
+    def get_x_accel_redirect(self):
+        """Get the internal nginx URI of a local file.
+
+        The URI is made from ``FILES_REST_X_ACCEL_REDIRECT_LOCATIONS``.
+        """
+        path = self.fileurl
+        if path.startswith('file://'):
+            path = path[len('file://'):]
+        locations = current_app.config.get(
+            'FILES_REST_X_ACCEL_REDIRECT_LOCATIONS') or {}
+        for prefix, location in locations.items():
+            prefix = prefix.rstrip('/') + '/'
+            if path.startswith(prefix):
+                return location.rstrip('/') + '/' + url_quote(
+                    path[len(prefix):])
+        return None
+
     def delete(self):
         """Delete a file.
 
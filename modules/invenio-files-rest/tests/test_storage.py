@@ -309,6 +309,113 @@ def test_pyfs_send_file_xss_prevention(app, pyfs):
         assert h['Content-Disposition'] == 'attachment; filename=doc.pdf'
 
 
+def test_pyfs_send_file_range(app, pyfs):
+    """Test send file with byte ranges."""
+    data = b'0123456789'
+    uri, size, checksum = pyfs.save(BytesIO(data))
+
+    with app.test_request_context():
+        res = pyfs.send_file('myfilename.txt', mimetype='text/plain',
+                             checksum=checksum)
+        assert res.status_code == 200
+        assert res.headers['Accept-Ranges'] == 'bytes'
+        assert b''.join(res.response) == data
+
+    # Single range
+    with app.test_request_context(headers={'Range': 'bytes=2-5'}):
+        res = pyfs.send_file('myfilename.txt', mimetype='text/plain',
+                             checksum=checksum)
+        assert res.status_code == 206
+        assert res.headers['Content-Range'] == 'bytes 2-5/10'
+        assert res.headers['Content-Length'] == '4'
+        assert res.headers['ETag'] == '"{0}"'.format(checksum)
+        assert b''.join(res.response) == b'2345'
+
+    # Suffix and open ranges
+    with app.test_request_context(headers={'Range': 'bytes=-3'}):
+        res = pyfs.send_file('myfilename.txt', mimetype='text/plain')
+        assert res.headers['Content-Range'] == 'bytes 7-9/10'
+        assert b''.join(res.response) == b'789'
+    with app.test_request_context(headers={'Range': 'bytes=8-'}):
+        res = pyfs.send_file('myfilename.txt', mimetype='text/plain')
+        assert b''.join(res.response) == b'89'
+
+    # Multiple ranges, the overlapping ones are merged
+    with app.test_request_context(
+            headers={'Range': 'bytes=0-1,6-7,7-8'}):
+        res = pyfs.send_file('myfilename.txt', mimetype='text/plain')
+        assert res.status_code == 206
+        content_type = res.headers['Content-Type']
+        assert content_type.startswith('multipart/byteranges; boundary=')
+        boundary = content_type.split('boundary=')[1]
+        body = b''.join(res.response)
+        assert res.headers['Content-Length'] == str(len(body))
+        assert body == (
+            '--{0}\r\nContent-Type: text/plain; charset=utf-8\r\n'
+            'Content-Range: bytes 0-1/10\r\n\r\n01\r\n'
+            '--{0}\r\nContent-Type: text/plain; charset=utf-8\r\n'
+            'Content-Range: bytes 6-8/10\r\n\r\n678\r\n'
+            '--{0}--\r\n'.format(boundary)).encode('latin-1')
+
+    # Unsatisfiable range
+    with app.test_request_context(headers={'Range': 'bytes=20-30'}):
+        res = pyfs.send_file('myfilename.txt', mimetype='text/plain')
+        assert res.status_code == 416
+        assert res.headers['Content-Range'] == 'bytes */10'
+
+    # The whole file is sent when If-Range does not match
+    with app.test_request_context(
+            headers={'Range': 'bytes=2-5', 'If-Range': '"md5:other"'}):
+        res = pyfs.send_file('myfilename.txt', mimetype='text/plain',
+                             checksum=checksum)
+        assert res.status_code == 200
+        assert b''.join(res.response) == data
+    with app.test_request_context(
+            headers={'Range': 'bytes=2-5',
+                     'If-Range': '"{0}"'.format(checksum)}):
+        res = pyfs.send_file('myfilename.txt', mimetype='text/plain',
+                             checksum=checksum)
+        assert res.status_code == 206
+
+    # Ranges are disabled
+    app.config['FILES_REST_ACCEPT_RANGES'] = False
+    try:
+        with app.test_request_context(headers={'Range': 'bytes=2-5'}):
+            res = pyfs.send_file('myfilename.txt', mimetype='text/plain')
+            assert res.status_code == 200
+            assert 'Accept-Ranges' not in res.headers
+    finally:
+        app.config['FILES_REST_ACCEPT_RANGES'] = True
+
+
+def test_pyfs_send_file_x_accel_redirect(app, pyfs, pyfs_testpath):
+    """Test send file by nginx."""
+    uri, size, checksum = pyfs.save(BytesIO(b'sendthis'))
+    base = dirname(dirname(pyfs_testpath))
+    app.config['FILES_REST_X_ACCEL_REDIRECT_LOCATIONS'] = {
+        base: '/protected_files/'}
+    try:
+        with app.test_request_context():
+            with patch.object(pyfs, 'open') as mock_open:
+                res = pyfs.send_file('myfilename.txt', mimetype='text/plain',
+                                     checksum=checksum, as_attachment=True)
+                mock_open.assert_not_called()
+            assert res.status_code == 200
+            assert res.headers['X-Accel-Redirect'] == \
+                '/protected_files/' + pyfs_testpath[len(base) + 1:]
+            assert res.headers['Content-Disposition'] == \
+                'attachment; filename=myfilename.txt'
+            assert res.headers['ETag'] == '"{0}"'.format(checksum)
+            assert res.get_data() == b''
+
+        # Files out of the locations are sent by the application
+        app.config['FILES_REST_X_ACCEL_REDIRECT_LOCATIONS'] = {
+            '/other/path': '/protected_files'}
+        assert pyfs.get_x_accel_redirect() is None
+    finally:
+        app.config['FILES_REST_X_ACCEL_REDIRECT_LOCATIONS'] = {}
+
+
 def test_pyfs_send_file_fail(app, pyfs):
     """Test send file."""
     pyfs.save(BytesIO(b'content'))
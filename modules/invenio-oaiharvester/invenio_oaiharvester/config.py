@@ -61,3 +61,5 @@ OAIHARVESTER_ENABLE_ITEM_VERSIONING = False
 OAIHARVESTER_RETRY_COUNT = 5
 OAIHARVESTER_BACKOFF_FACTOR = 1.0
 
+OAIHARVESTER_PROCESS_WORKERS = 1
+"""Number of the records of a page registered in parallel."""
@@ -21,7 +21,8 @@
 
 import copy
 import re
-from collections import OrderedDict, defaultdict
+from collections import OrderedDict, defaultdict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 from json import dumps, loads
 
@@ -57,6 +58,10 @@ DDI_MAPPING_KEY_TITLE = 'stdyDscr.citation.titlStmt.titl.@value'
 DDI_MAPPING_KEY_URI = 'stdyDscr.citation.holdings.@value'
 
 TEXT = '#text'
+
+ItemTypeInfo = namedtuple('ItemTypeInfo', [
+    'id', 'name', 'version_id', 'updated', 'schema'])
+"""The values of an item type read by the mappers."""
 LANG = '@xml:lang'
 
 
@@ -84,6 +89,20 @@ def list_sets(url, encoding='utf-8'):
     return sets
 
 
+def create_session():
+    """Create a keep-alive session retrying the failed requests.
+
+    The session can be shared by all the requests of a harvesting.
+    """
+    session = requests.Session()
+    retries = Retry(total=OAIHARVESTER_RETRY_COUNT,
+                    backoff_factor=OAIHARVESTER_BACKOFF_FACTOR,
+                    status_forcelist=[500, 502, 503, 504])
+    session.mount('https://', HTTPAdapter(max_retries=retries))
+    session.mount('http://', HTTPAdapter(max_retries=retries))
+    return session
+
+
 def list_records(
         url,
         from_date=None,
@@ -91,7 +110,8 @@ def list_records(
         metadata_prefix=None,
         setspecs='*',
         resumption_token=None,
-        encoding='utf-8'):
+        encoding='utf-8',
+        session=None):
     """Get records list."""
     # Avoid SSLError - dh key too small
     requests.packages.urllib3.disable_warnings()
@@ -111,26 +131,58 @@ def list_records(
     records = []
     rtoken = None
 
-    with requests.Session() as s:
-        retries = Retry(total=OAIHARVESTER_RETRY_COUNT,
-                        backoff_factor=OAIHARVESTER_BACKOFF_FACTOR,
-                        status_forcelist=[500, 502, 503, 504])
-        s.mount('https://', HTTPAdapter(max_retries=retries))
-        s.mount('http://', HTTPAdapter(max_retries=retries))
-        response = s.get(url, params=payload,
-                         verify=OAIHARVESTER_VERIFY_TLS_CERTIFICATE)
-
-    response.raise_for_status()
-    et = etree.XML(response.text.encode(encoding))
-    records = records + et.findall('./ListRecords/record', namespaces=et.nsmap)
-    resumptionToken = et.find(
-        './ListRecords/resumptionToken',
-        namespaces=et.nsmap)
-    if resumptionToken is not None:
-        rtoken = resumptionToken.text
+    if session is None:
+        with create_session() as s:
+            return list_records(url, from_date, until_date, metadata_prefix,
+                                setspecs, resumption_token, encoding, s)
+
+    with session.get(url, params=payload, stream=True,
+                     verify=OAIHARVESTER_VERIFY_TLS_CERTIFICATE) as response:
+        response.raise_for_status()
+        response.raw.decode_content = True
+        # Parse the records while the response is read.
+        for _, elem in etree.iterparse(response.raw, events=('end',),
+                                       encoding=encoding):
+            parent = elem.getparent()
+            if parent is None \
+                    or etree.QName(parent).localname != 'ListRecords':
+                continue
+            tag = etree.QName(elem).localname
+            if tag == 'record':
+                records.append(elem)
+            elif tag == 'resumptionToken':
+                rtoken = elem.text
     return records, rtoken
 
 
+def iter_list_records(
+        url,
+        from_date=None,
+        until_date=None,
+        metadata_prefix=None,
+        setspecs='*',
+        resumption_token=None,
+        encoding='utf-8'):
+    """Get the records lists of all the pages.
+
+    The next page is fetched while the current page is processed, with one
+    keep-alive session for all the pages.
+
+    :return: generator of the records and the resumption token of each page.
+    """
+    with create_session() as session, \
+            ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(
+            list_records, url, from_date, until_date, metadata_prefix,
+            setspecs, resumption_token, encoding, session)
+        while future is not None:
+            records, rtoken = future.result()
+            future = executor.submit(
+                list_records, url, resumption_token=rtoken,
+                encoding=encoding, session=session) if rtoken else None
+            yield records, rtoken
+
+
 def map_field(schema):
     """Get field map."""
     res = {}
@@ -260,6 +312,66 @@ def subitem_recs(subitems, subitem_key_list, schema, oai_key_list, metadata):
                 current_app.logger.debug("metadata: {}".format(metadata))
 
 
+def compile_parsing_plan(mappin, props, patterns):
+    """Get the subitem keys assigned by the patterns of an add function.
+
+    Args:
+        mappin (dict): item type mapping.
+        props (dict): properties of the item type schema.
+        patterns (list): pairs of mapping key and oai key.
+
+    Returns:
+        tuple: item key, item schema and the pairs of subitem key list and
+            oai key list. None if the patterns are not mapped.
+
+    """
+    mapping = mappin.get(patterns[0][0])
+    if not mapping:
+        return None
+    else:
+        mapping.sort()
+
+    item_key = mapping[0].split('.')[0]
+    item_schema = props.get(item_key) if item_key else None
+    steps = []
+    for mapping_key, oai_key in patterns:
+        mapping = mappin.get(mapping_key)
+        if mapping and oai_key:
+            mapping.sort()
+
+            subitem_key_list = None
+            if ',' in mapping[0]:
+                subitem_key_list = mapping[0].split(',')[0].split('.')[1:]
+            else:
+                subitem_key_list = mapping[0].split('.')[1:]
+
+            if subitem_key_list:
+                steps.append((subitem_key_list, oai_key.split('.')))
+    return item_key, item_schema, steps
+
+
+class MappingPlan(dict):
+    """Item type mapping compiled for a mapping type.
+
+    The subitem keys assigned by the patterns of each add function are
+    computed at the first record, and reused for the next records.
+    """
+
+    def __init__(self, item_map, props):
+        """Init."""
+        super().__init__(item_map)
+        self.props = props
+        self.parsing_plans = {}
+
+    def get_parsing_plan(self, patterns):
+        """Get the parsing plan of the patterns."""
+        key = tuple(patterns)
+        if key not in self.parsing_plans:
+            self.parsing_plans[key] = compile_parsing_plan(
+                self, self.props, patterns)
+        return self.parsing_plans[key]
+
+
 def parsing_metadata(mappin, props, patterns, metadata, res):
     """Genererate item metadata.
 
@@ -283,38 +395,26 @@ def parsing_metadata(mappin, props, patterns, metadata, res):
     #     __file__, 'parsing_metadata()', 'metadata', metadata))
     # current_app.logger.debug('{0} {1} {2}: {3}'.format(
     #     __file__, 'parsing_metadata()', 'res', res))
-    mapping = mappin.get(patterns[0][0])
-    if not mapping:
-        return None, None
+    if isinstance(mappin, MappingPlan) and props is mappin.props:
+        plan = mappin.get_parsing_plan(patterns)
     else:
-        mapping.sort()
-
-    item_key = mapping[0].split('.')[0]
+        plan = compile_parsing_plan(mappin, props, patterns)
+    if not plan:
+        return None, None
+    item_key, item_schema, steps = plan
 
-    if item_key and props.get(item_key):
-        item_schema = props[item_key]
+    if item_key and item_schema:
         ret = []
         for data in metadata:
             items = {}
-            for mapping_key, oai_key in patterns:
-                mapping = mappin.get(mapping_key)
-                if mapping and oai_key:
-                    mapping.sort()
-
-                    subitem_key_list = None
-                    if ',' in mapping[0]:
-                        subitem_key_list = mapping[0].split(',')[0].split('.')[1:]
-                    else:
-                        subitem_key_list = mapping[0].split('.')[1:]
-                    
-                    if subitem_key_list:
-                        subitem_recs(
-                            items,
-                            subitem_key_list,
-                            item_schema,
-                            oai_key.split('.'),
-                            data
-                        )
+            for subitem_key_list, oai_key_list in steps:
+                subitem_recs(
+                    items,
+                    subitem_key_list,
+                    item_schema,
+                    oai_key_list,
+                    data
+                )
 
             if items:
                 ret.append(items)
@@ -1405,13 +1505,23 @@ class BaseMapper:
     """BaseMapper."""
 
     itemtype_map = {}
+    mapping_plans = {}
     identifiers = []
 
     @classmethod
     def update_itemtype_map(cls):
-        """Update itemtype map."""
+        """Update itemtype map.
+
+        The item types are kept as plain values, not as ORM objects, as the
+        map is shared by the worker threads of the harvesting and the
+        objects would be refreshed through the session of the thread that
+        loaded them.
+        """
         for t in ItemType.query.all():
-            cls.itemtype_map[t.item_type_name.name] = t
+            cls.itemtype_map[t.item_type_name.name] = ItemTypeInfo(
+                id=t.id, name=t.item_type_name.name, version_id=t.version_id,
+                updated=t.updated, schema=t.schema)
+        cls.mapping_plans.clear()
 
     def __init__(self, xml):
         """Init."""
@@ -1443,6 +1553,23 @@ class BaseMapper:
         """Map itemtype."""
         self.itemtype = BaseMapper.itemtype_map.get('Multiple')
 
+    def get_mapping_plan(self, mapping_type):
+        """Get the item type mapping compiled for the mapping type.
+
+        The plan is kept for each revision of the item type until the
+        itemtype map is updated.
+        """
+        key = (self.itemtype.id, self.itemtype.version_id,
+               self.itemtype.updated, mapping_type)
+        plan = BaseMapper.mapping_plans.get(key)
+        if plan is None:
+            item_type_mapping = Mapping.get_record(self.itemtype.id)
+            plan = MappingPlan(
+                get_full_mapping(item_type_mapping, mapping_type),
+                self.itemtype.schema.get('properties'))
+            BaseMapper.mapping_plans[key] = plan
+        return plan
+
 class DCMapper(BaseMapper):
     """DC Mapper."""
 
@@ -1458,10 +1585,9 @@ class DCMapper(BaseMapper):
         self.identifiers = []
         res = {'$schema': self.itemtype.id,
                'pubdate': str(self.datestamp())}
-        item_type_mapping = Mapping.get_record(self.itemtype.id)
-        item_map = get_full_mapping(item_type_mapping, "oai_dc_mapping")
+        item_map = self.get_mapping_plan("oai_dc_mapping")
 
-        args = [self.itemtype.schema.get('properties'), item_map, res]
+        args = [item_map.props, item_map, res]
 
         add_funcs = {
             'dc:creator': partial(add_creator_dc, *args),
@@ -1510,10 +1636,9 @@ class JPCOARMapper(BaseMapper):
                'pubdate': str(self.datestamp())}
 
         schema = "jpcoar_mapping" if version == "2.0" else "jpcoar_v1_mapping"
-        item_type_mapping = Mapping.get_record(self.itemtype.id)
-        item_map = get_full_mapping(item_type_mapping, schema)
+        item_map = self.get_mapping_plan(schema)
 
-        args = [self.itemtype.schema.get('properties'), item_map, res]
+        args = [item_map.props, item_map, res]
 
         add_funcs = {
             'dc:title':
@@ -26,6 +26,7 @@ import signal
 import traceback
 from ast import literal_eval as make_tuple
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 import dateutil
@@ -38,6 +39,7 @@ from invenio_db import db
 from invenio_pidstore.models import PersistentIdentifier, PIDStatus
 from invenio_records.models import RecordMetadata
 from lxml import etree
+from sqlalchemy.orm.attributes import flag_modified
 from weko_deposit.api import WekoDeposit, WekoRecord
 from weko_index_tree.models import Index
 from weko_records.models import ItemMetadata
@@ -46,7 +48,7 @@ from weko_records_ui.utils import restore, soft_delete
 from .api import get_records, list_records, send_run_status_mail
 from .config import OAIHARVESTER_ENABLE_ITEM_VERSIONING
 from .harvester import DCMapper, DDIMapper, JPCOARMapper
-from .harvester import list_records as harvester_list_records
+from .harvester import iter_list_records
 from .harvester import list_sets, map_sets
 from .models import HarvestLogs, HarvestSettings
 from .signals import oaiharvest_finished
@@ -339,6 +341,81 @@ def process_item(record, harvesting, counter, request_info):
         event_counter('deleted_items', counter)
 
 
+def process_item_in_worker(app, harvesting_id, xml, request_info):
+    """Process item in a worker thread, with its own db session.
+
+    :param app: the application.
+    :param harvesting_id: id of the harvest settings.
+    :param xml: the record.
+    :param request_info: request info of the harvesting.
+    :return: the counter of the item, the number of the processed items
+        and the error message.
+    """
+    counter = {}
+    errmsg = None
+    with app.app_context():
+        harvesting = HarvestSettings.query.filter_by(id=harvesting_id).one()
+        # Only the counter of the main thread is saved.
+        db.session.expunge(harvesting)
+        item_processed = harvesting.item_processed
+        try:
+            process_item(etree.fromstring(xml), harvesting, counter,
+                         request_info)
+            db.session.commit()
+        except ValueError as ex:
+            errmsg = str(ex)
+            event_counter('error_items', counter)
+        except Exception as ex:
+            current_app.logger.debug(traceback.format_exc())
+            current_app.logger.error(
+                'Error occurred while processing harvesting item\n' + str(ex))
+            db.session.rollback()
+            event_counter('error_items', counter)
+    return counter, harvesting.item_processed - item_processed, errmsg
+
+
+def process_records(records, harvesting, counter, request_info, errormsg,
+                    executor=None):
+    """Process the records of a page.
+
+    :param records: the records.
+    :param harvesting: the harvest settings.
+    :param counter: the counter of the harvesting.
+    :param request_info: request info of the harvesting.
+    :param errormsg: list of the error messages.
+    :param executor: the worker pool, the records are processed one by one
+        if it is None.
+    """
+    if executor is None:
+        for record in records:
+            try:
+                process_item(record, harvesting, counter, request_info)
+                db.session.commit()
+            except ValueError as ex:
+                errormsg.append(str(ex))
+                event_counter('error_items', counter)
+            except Exception as ex:
+                current_app.logger.debug(traceback.format_exc())
+                current_app.logger.error(
+                    'Error occurred while processing harvesting item\n' + str(ex))
+                db.session.rollback()
+                event_counter('error_items', counter)
+        return
+
+    app = current_app._get_current_object()
+    futures = [executor.submit(process_item_in_worker, app, harvesting.id,
+                               etree.tostring(record, encoding='utf-8'),
+                               request_info)
+               for record in records]
+    for future in futures:
+        item_counter, item_processed, errmsg = future.result()
+        for k, v in item_counter.items():
+            counter[k] = counter.get(k, 0) + v
+        harvesting.item_processed = harvesting.item_processed + item_processed
+        if errmsg:
+            errormsg.append(errmsg)
+
+
 @ shared_task
 def link_success_handler(retval):
     """Register task stats into invenio-stats."""
@@ -449,37 +526,37 @@ def run_harvesting(id, start_time, user_data, request_info):
             pause = True
         signal.signal(signal.SIGTERM, sigterm_handler)
         _errormsg = []
-        while True:
-            records, rtoken = harvester_list_records(
-                harvesting.base_url,
-                harvesting.from_date.__str__() if harvesting.from_date and not rtoken else None,
-                harvesting.until_date.__str__() if harvesting.until_date and not rtoken else None,
-                harvesting.metadata_prefix,
-                harvesting.set_spec,
-                rtoken)
-            current_app.logger.info('[{0}] [{1}]'.format(
-                                    0, 'Processing records'))
-            for record in records:
-                try:
-                    process_item(record, harvesting, counter, request_info)
-                    db.session.commit()
-                except ValueError as ex:
-                    _errormsg.append(str(ex))
-                    event_counter('error_items', counter)
-                except Exception as ex:
-                    current_app.logger.debug(traceback.format_exc())
-                    current_app.logger.error(
-                        'Error occurred while processing harvesting item\n' + str(ex))
-                    db.session.rollback()
-                    event_counter('error_items', counter)
-            harvesting.resumption_token = rtoken
-            db.session.commit()
-            if not rtoken:
-                harvest_log.status = 'Successful'
-                break
-            elif pause is True:
-                harvest_log.status = 'Suspended'
-                break
+        workers = current_app.config.get('OAIHARVESTER_PROCESS_WORKERS', 1)
+        executor = ThreadPoolExecutor(max_workers=workers) \
+            if workers > 1 else None
+        pages = iter_list_records(
+            harvesting.base_url,
+            harvesting.from_date.__str__() if harvesting.from_date and not rtoken else None,
+            harvesting.until_date.__str__() if harvesting.until_date and not rtoken else None,
+            harvesting.metadata_prefix,
+            harvesting.set_spec,
+            rtoken)
+        try:
+            for records, rtoken in pages:
+                current_app.logger.info('[{0}] [{1}]'.format(
+                                        0, 'Processing records'))
+                process_records(records, harvesting, counter, request_info,
+                                _errormsg, executor)
+                # Checkpoint, a suspended harvesting resumes from this page.
+                harvesting.resumption_token = rtoken
+                harvest_log.counter = counter
+                flag_modified(harvest_log, 'counter')
+                db.session.commit()
+                if not rtoken:
+                    harvest_log.status = 'Successful'
+                    break
+                elif pause is True:
+                    harvest_log.status = 'Suspended'
+                    break
+        finally:
+            pages.close()
+            if executor is not None:
+                executor.shutdown()
         if _errormsg:
             harvest_log.errmsg = '\n'.join(_errormsg)[:255]
     except Exception as ex:
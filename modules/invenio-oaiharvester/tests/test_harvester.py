@@ -7,6 +7,7 @@ from datetime import datetime
 from lxml import etree
 from mock import patch, MagicMock
 import copy
+import time
 import xmltodict
 import dateutil
 from collections import OrderedDict
@@ -15,8 +16,10 @@ from weko_records.api import Mapping
 from weko_records.models import ItemType,ItemTypeName
 from weko_records.serializers.utils import get_full_mapping
 from invenio_oaiharvester.harvester import (
+    create_session,
     list_sets,
     list_records,
+    iter_list_records,
     map_field,
     subitem_recs,
     parsing_metadata,
@@ -84,6 +87,7 @@ from invenio_oaiharvester.harvester import (
     map_sets,
     add_data_by_key,
     BaseMapper,
+    MappingPlan,
     DCMapper,
     JPCOARMapper,
     DDIMapper,
@@ -212,6 +216,58 @@ def test_list_records():
         list_records("https://500_test.org/",None,None,None,"*",resumption_token=None)
 
 
+# def iter_list_records(
+# .tox/c1/bin/pytest --cov=invenio_oaiharvester tests/test_harvester.py::test_iter_list_records -vv -s --cov-branch --cov-report=term --basetemp=/code/modules/invenio-oaiharvester/.tox/c1/tmp
+@responses.activate
+def test_iter_list_records():
+    def _body(records, token=None):
+        return '<OAI-PMH xmlns="http://www.openarchives.org/OAI/2.0/">'\
+            '<ListRecords>'\
+            + ''.join('<record><header><identifier>{}</identifier></header></record>'.format(r) for r in records)\
+            + ('<resumptionToken>{}</resumptionToken>'.format(token) if token else '<resumptionToken/>')\
+            + '</ListRecords>'\
+            '</OAI-PMH>'
+    # stub OAI-PMH endpoint with 3 pages
+    responses.add(
+        responses.GET,
+        "https://test.org/?verb=ListRecords&from=2023-01-10&metadataPrefix=jpcoar_1.0&set=*",
+        body=_body(["oai:1", "oai:2"], "token1"),
+        content_type='text/xml'
+    )
+    responses.add(
+        responses.GET,
+        "https://test.org/?verb=ListRecords&resumptionToken=token1",
+        body=_body(["oai:3"], "token2"),
+        content_type='text/xml'
+    )
+    responses.add(
+        responses.GET,
+        "https://test.org/?verb=ListRecords&resumptionToken=token2",
+        body=_body(["oai:4"]),
+        content_type='text/xml'
+    )
+    namespaces = {"x": 'http://www.openarchives.org/OAI/2.0/'}
+    pages = []
+    with patch("invenio_oaiharvester.harvester.create_session", wraps=create_session) as mock_session:
+        for records, rtoken in iter_list_records(
+                "https://test.org/", "2023-01-10", None, "jpcoar_1.0", "*"):
+            # the next page is fetched while this page is processed
+            if rtoken:
+                time.sleep(0.1)
+                assert len(responses.calls) == len(pages) + 2
+            pages.append((
+                [r.xpath("./x:header/x:identifier", namespaces=namespaces)[0].text for r in records],
+                rtoken))
+        # one session for all the pages
+        mock_session.assert_called_once()
+    assert pages == [(["oai:1", "oai:2"], "token1"), (["oai:3"], "token2"), (["oai:4"], None)]
+
+    # resume from a token
+    pages = [rtoken for _, rtoken in iter_list_records(
+        "https://test.org/", resumption_token="token2")]
+    assert pages == [None]
+
+
 # def map_field(schema):
 # .tox/c1/bin/pytest --cov=invenio_oaiharvester tests/test_harvester.py::test_map_field -vv -s --cov-branch --cov-report=term --basetemp=/code/modules/invenio-oaiharvester/.tox/c1/tmp
 def test_map_field():
@@ -1945,7 +2001,12 @@ class TestBaseMapper:
         BaseMapper.update_itemtype_map()
         mapper = BaseMapper(xml)
         assert hasattr(mapper, "itemtype") == True
-        assert mapper.itemtype == item_type2
+        assert mapper.itemtype.id == item_type2.id
+        # the map holds no ORM objects, the commits do not expire it
+        assert mapper.itemtype.name == "Multiple"
+        assert not isinstance(mapper.itemtype, ItemType)
+        db.session.commit()
+        assert mapper.itemtype.schema == {}
 
 #     def is_deleted(self):
 #     def identifier(self):
@@ -1984,7 +2045,7 @@ class TestBaseMapper:
         mapper = BaseMapper(xml)
         mapper.map_itemtype("jpcoar:jpcoar")
         assert hasattr(mapper, "itemtype") == True
-        assert mapper.itemtype == item_type1
+        assert mapper.itemtype.id == item_type1.id
 
 # class DCMapper(BaseMapper):
 # .tox/c1/bin/pytest --cov=invenio_oaiharvester tests/test_harvester.py::TestDCMapper -vv -s --cov-branch --cov-report=term --basetemp=/code/modules/invenio-oaiharvester/.tox/c1/tmp
@@ -2838,6 +2899,46 @@ class TestJPCOARMapper:
         # 
         assert result 
 
+#     def get_mapping_plan(self, mapping_type):
+# .tox/c1/bin/pytest --cov=invenio_oaiharvester tests/test_harvester.py::TestJPCOARMapper::test_map_mapping_plan -vv -s --cov-branch --cov-report=term --basetemp=/code/modules/invenio-oaiharvester/.tox/c1/tmp
+    def test_map_mapping_plan(self, db_itemtype):
+        record_xml = '<record xmlns="http://www.openarchives.org/OAI/2.0/"><header><identifier>oai:weko3.example.org:{0:08d}</identifier><datestamp>2023-02-20T06:24:47Z</datestamp></header><metadata><jpcoar:jpcoar xmlns:datacite="https://schema.datacite.org/meta/kernel-4/" xmlns:dc="http://purl.org/dc/elements/1.1/" xmlns:dcterms="http://purl.org/dc/terms/" xmlns:jpcoar="https://github.com/JPCOAR/schema/blob/master/1.0/" xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"><dc:title xml:lang="ja">test item {0}</dc:title><dcterms:alternative xml:lang="en">other title {0}</dcterms:alternative><jpcoar:creator><jpcoar:nameIdentifier nameIdentifierURI="https://orcid.org/1234" nameIdentifierScheme="ORCID">1234</jpcoar:nameIdentifier><jpcoar:creatorName xml:lang="ja">テスト, 太郎</jpcoar:creatorName><jpcoar:familyName xml:lang="ja">テスト</jpcoar:familyName><jpcoar:givenName xml:lang="ja">太郎</jpcoar:givenName></jpcoar:creator><dcterms:accessRights rdf:resource="http://purl.org/coar/access_right/c_abf2">open access</dcterms:accessRights><jpcoar:subject xml:lang="ja" subjectScheme="Other">テスト主題</jpcoar:subject><datacite:description xml:lang="en" descriptionType="Abstract">abstract {0}</datacite:description><dc:publisher xml:lang="ja">test publisher</dc:publisher><datacite:date dateType="Issued">2022-10-19</datacite:date><dc:language>jpn</dc:language><dc:type rdf:resource="http://purl.org/coar/resource_type/c_6501">journal article</dc:type><jpcoar:identifier identifierType="URI">https://192.168.56.103/records/{0}</jpcoar:identifier><jpcoar:sourceTitle xml:lang="ja">test journal</jpcoar:sourceTitle><jpcoar:volume>5</jpcoar:volume><jpcoar:issue>2</jpcoar:issue><jpcoar:pageStart>123</jpcoar:pageStart><jpcoar:pageEnd>456</jpcoar:pageEnd></jpcoar:jpcoar></metadata></record>'
+        count = 3
+        BaseMapper.update_itemtype_map()
+
+        class UncompiledMapping(dict):
+            # The item type mapping of each record as before the plans.
+            def __init__(self, item_map, props):
+                super().__init__(item_map)
+                self.props = props
+
+        def uncompiled_mapping_plan(mapper, mapping_type):
+            return UncompiledMapping(
+                get_full_mapping(Mapping.get_record(mapper.itemtype.id), mapping_type),
+                mapper.itemtype.schema.get('properties'))
+
+        mappers = [JPCOARMapper(record_xml.format(i)) for i in range(count)]
+        with patch("invenio_oaiharvester.harvester.BaseMapper.get_mapping_plan",
+                   autospec=True, side_effect=uncompiled_mapping_plan):
+            expected = [mapper.map("2.0") for mapper in mappers]
+
+        mappers = [JPCOARMapper(record_xml.format(i)) for i in range(count)]
+        with patch("invenio_oaiharvester.harvester.get_full_mapping",
+                   wraps=get_full_mapping) as mock_full_mapping:
+            result = [mapper.map("2.0") for mapper in mappers]
+        # the same output as the uncompiled mapping
+        assert result == expected
+        assert result[1]['title'] == 'test item 1'
+        # one plan per item type and mapping type
+        assert mock_full_mapping.call_count == 1
+        assert len(BaseMapper.mapping_plans) == 1
+        assert isinstance(list(BaseMapper.mapping_plans.values())[0], MappingPlan)
+
+        # the plans are compiled again when the itemtype map is updated
+        BaseMapper.update_itemtype_map()
+        assert BaseMapper.mapping_plans == {}
+
+
 # class DDIMapper(BaseMapper):
 # .tox/c1/bin/pytest --cov=invenio_oaiharvester tests/test_harvester.py::TestDDIMapper -vv -s --cov-branch --cov-report=term --basetemp=/code/modules/invenio-oaiharvester/.tox/c1/tmp
 class TestDDIMapper:
@@ -40,7 +40,7 @@ from invenio_oaiharvester.signals import oaiharvest_finished
 from invenio_oaiharvester.tasks import create_indexes, event_counter, \
     get_specific_records, list_records_from_dates, map_indexes, \
     process_item, run_harvesting,link_success_handler,link_error_handler,\
-        is_harvest_running,check_schedules_and_run
+        is_harvest_running,check_schedules_and_run, process_records
 
 # .tox/c1/bin/pytest --cov=invenio_oaiharvester tests/test_tasks.py -vv -s --cov-branch --cov-report=term --basetemp=/code/modules/invenio-oaiharvester/.tox/c1/tmp
 
@@ -599,6 +599,49 @@ def test_run_harvesting(app, db,mocker):
             assert res == ({'task_state': 'SUCCESS', 'start_time': '2022-10-01T00:00:00', 'end_time': res[0]["end_time"], 'total_records': 0, 'execution_time': res[0]['execution_time'], 'task_name': 'harvest', 'repository_name': 'weko', 'task_id': None}, '2022-10-01T23:59:59')
         
 
+# def process_records(records, harvesting, counter, request_info, errormsg, executor=None):
+# def process_item_in_worker(app, harvesting_id, xml, request_info):
+# .tox/c1/bin/pytest --cov=invenio_oaiharvester tests/test_tasks.py::test_process_records -vv -s --cov-branch --cov-report=term --basetemp=/code/modules/invenio-oaiharvester/.tox/c1/tmp
+def test_process_records(app, db):
+    from concurrent.futures import ThreadPoolExecutor
+    index = Index()
+    db.session.add(index)
+    db.session.commit()
+    harvesting = HarvestSettings(
+        id=1,
+        repository_name="jpcoar_test1",
+        base_url="http://export.arxiv.org/oai2/",
+        metadata_prefix="jpcoar_1.0",
+        index_id=1,
+        item_processed=0
+    )
+    db.session.add(harvesting)
+    db.session.commit()
+    records = [etree.fromstring('<record>test_record{}</record>'.format(i)) for i in range(4)]
+
+    def mock_process_item(record, harvesting, counter, request_info):
+        event_counter('processed_items', counter)
+        if record.text == 'test_record2':
+            raise ValueError("test_error")
+        if record.text == 'test_record3':
+            raise Exception("test_error")
+        event_counter('created_items', counter)
+        harvesting.item_processed = harvesting.item_processed + 1
+
+    for executor in [None, ThreadPoolExecutor(max_workers=2)]:
+        harvesting.item_processed = 0
+        db.session.commit()
+        counter = {}
+        errormsg = []
+        with patch("invenio_oaiharvester.tasks.process_item", side_effect=mock_process_item):
+            process_records(records, harvesting, counter, {}, errormsg, executor)
+        assert counter == {'processed_items': 4, 'created_items': 2, 'error_items': 2}
+        assert harvesting.item_processed == 2
+        assert errormsg == ["test_error"]
+        if executor:
+            executor.shutdown()
+
+
 # .tox/c1/bin/pytest --cov=invenio_oaiharvester tests/test_tasks.py::test_check_schedules_and_run -vv -s --cov-branch --cov-report=term --basetemp=/code/modules/invenio-oaiharvester/.tox/c1/tmp
 def test_check_schedules_and_run(app,db,mocker):
     index = Index()
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Invenio.
+# Copyright (C) 2015-2018 CERN.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Command line interface for Invenio-OAIServer."""
+
+from __future__ import absolute_import, print_function
+
+import click
+from flask.cli import with_appcontext
+
+from .utils import delete_metadata_cache, get_metadata_cache_stats
+
+
+@click.group()
+def oaiserver():
+    """OAI-PMH server commands."""
+
+
+@oaiserver.group('metadata-cache')
+def metadata_cache():
+    """Metadata cache commands."""
+
+
+@metadata_cache.command('stats')
+@with_appcontext
+def stats_metadata_cache():
+    """Show the hit and miss counters of the metadata cache."""
+    stats = get_metadata_cache_stats()
+    total = stats['hit'] + stats['miss']
+    click.secho('hit: {hit}, miss: {miss}'.format(**stats), fg='green')
+    if total:
+        click.secho('hit ratio: {:.1%}'.format(stats['hit'] / total),
+                    fg='green')
+
+
+@metadata_cache.command('clear')
+@click.option('--record-uuid', default=None,
+              help='Clear only the cache of the record.')
+@with_appcontext
+def clear_metadata_cache(record_uuid):
+    """Clear the metadata cache and its counters."""
+    delete_metadata_cache(record_uuid)
+    click.secho('Metadata cache has been cleared.', fg='green')
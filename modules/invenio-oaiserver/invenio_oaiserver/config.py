@@ -214,3 +214,29 @@ OAISERVER_MESSAGE_NO_RECORDS_MATCH = "The combination of the values of the " \
 
 OAISERVER_ES_MAX_CLAUSE_COUNT = 1024
 """The number of clauses a Lucene BooleanQuery can have."""
+
+OAISERVER_METADATA_CACHE_ENABLED = False
+"""Enable the cache of the serialized metadata of records."""
+
+OAISERVER_METADATA_CACHE_REDIS_DB = None
+"""Redis database of the metadata cache. ``CACHE_REDIS_DB`` if not set."""
+
+OAISERVER_METADATA_CACHE_KEY = 'oaiserver_metadata::{record_uuid}'
+"""Redis key of the metadata cache of a record."""
+
+OAISERVER_METADATA_CACHE_STATS_KEY = 'oaiserver_metadata_cache_stats'
+"""Redis key of the hit and miss counters of the metadata cache."""
+
+OAISERVER_METADATA_CACHE_TTL = 7 * 24 * 60 * 60
+"""Time to live of the metadata cache of a record in seconds."""
+
+OAISERVER_STREAMING_RESPONSE = False
+"""Stream ListRecords responses record by record.
+
+The response is sent while the records are serialized, so the memory usage
+and the time to the first byte do not depend on ``OAISERVER_PAGE_SIZE``.
+The response is not pretty printed.
+"""
+
+OAISERVER_STREAMING_CHUNK_SIZE = 10
+"""Number of records loaded at once in streaming ListRecords responses."""
@@ -55,6 +55,14 @@ class _AppState(object):
                                                      weak=False)
         if self.app.config['OAISERVER_REGISTER_SET_SIGNALS']:
             self.register_signals_oaiset()
+        if self.app.config['OAISERVER_METADATA_CACHE_ENABLED']:
+            self.register_signals_metadata_cache()
+
+    def register_signals_metadata_cache(self):
+        """Register Record signals to fill the metadata cache."""
+        from .receivers import fill_metadata_cache
+        records_signals.after_record_insert.connect(fill_metadata_cache)
+        records_signals.after_record_update.connect(fill_metadata_cache)
 
     def register_signals_oaiset(self):
         """Register OAISet signals to update records."""
@@ -74,6 +82,13 @@ class _AppState(object):
             records_signals.before_record_update.disconnect(
                 self.update_function)
         self.unregister_signals_oaiset()
+        self.unregister_signals_metadata_cache()
+
+    def unregister_signals_metadata_cache(self):
+        """Unregister signals metadata cache."""
+        from .receivers import fill_metadata_cache
+        records_signals.after_record_insert.disconnect(fill_metadata_cache)
+        records_signals.after_record_update.disconnect(fill_metadata_cache)
 
     def unregister_signals_oaiset(self):
         """Unregister signals oaiset."""
@@ -12,8 +12,11 @@ from __future__ import absolute_import, print_function
 
 from time import sleep
 
+from flask import current_app, has_app_context
+from invenio_db import db
+
 from .percolator import _delete_percolator, _new_percolator, get_record_sets
-from .tasks import update_affected_records
+from .tasks import update_affected_records, update_metadata_cache
 
 
 class OAIServerUpdater(object):
@@ -59,3 +62,26 @@ def after_delete_oai_set(mapper, connection, target):
     update_affected_records.delay(
         spec=target.spec
     )
+
+
+def fill_metadata_cache(sender, record=None, **kwargs):
+    """Fill the metadata cache of an updated record after the commit."""
+    if record is not None and record.get('_oai', {}).get('id'):
+        db.session.info.setdefault(
+            'oaiserver_metadata_cache_records', set()).add(str(record.id))
+
+
+@db.event.listens_for(db.session, 'after_commit')
+def _after_commit_metadata_cache(session):
+    """Queue the metadata cache of the committed records."""
+    record_ids = session.info.pop('oaiserver_metadata_cache_records', None)
+    if record_ids and has_app_context() \
+            and current_app.config['OAISERVER_METADATA_CACHE_ENABLED']:
+        for record_id in record_ids:
+            update_metadata_cache.delay(record_id)
+
+
+@db.event.listens_for(db.session, 'after_rollback')
+def _after_rollback_metadata_cache(session):
+    """Forget the records of a rolled back session."""
+    session.info.pop('oaiserver_metadata_cache_records', None)
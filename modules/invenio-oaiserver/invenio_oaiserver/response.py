@@ -8,6 +8,7 @@
 
 """OAI-PMH 2.0 response generator."""
 import copy
+import itertools
 import pickle
 import traceback
 from datetime import MINYEAR, datetime, timedelta
@@ -17,8 +18,10 @@ from flask_babelex import get_locale, to_user_timezone, to_utc
 from invenio_communities import config as invenio_communities_config
 from invenio_communities.models import Community
 from invenio_db import db
-from invenio_pidstore.errors import PIDDoesNotExistError
-from invenio_pidstore.models import PIDStatus
+from invenio_pidstore.errors import PersistentIdentifierError, \
+    PIDDoesNotExistError
+from invenio_pidstore.models import PersistentIdentifier, PIDStatus
+from invenio_records.api import Record
 from invenio_records.models import RecordMetadata
 from lxml import etree
 from lxml.etree import Element, ElementTree, SubElement
@@ -36,7 +39,8 @@ from .query import get_records
 from .resumption_token import serialize
 from .utils import HARVEST_PRIVATE, OUTPUT_HARVEST, PRIVATE_INDEX, \
     datetime_to_datestamp, get_index_state, get_index_state_by_id, \
-    handle_license_free, is_output_harvest, serializer, get_community_index_from_set
+    get_metadata_cache, handle_license_free, is_output_harvest, \
+    serializer, set_metadata_cache, get_community_index_from_set
 
 NS_OAIPMH = 'http://www.openarchives.org/OAI/2.0/'
 NS_OAIPMH_XSD = 'http://www.openarchives.org/OAI/2.0/OAI-PMH.xsd'
@@ -277,8 +281,13 @@ def listmetadataformats(**kwargs):
     return e_tree
 
 
-def header(parent, identifier, datestamp, sets=[], deleted=False):
-    """Attach ``<header/>`` element to a parent."""
+def header(parent, identifier, datestamp, sets=[], deleted=False,
+           set_paths=None):
+    """Attach ``<header/>`` element to a parent.
+
+    :param set_paths: Result of :func:`get_set_paths` resolved for the
+        whole page. If not set, the sets are resolved here.
+    """
     e_header = SubElement(parent, etree.QName(NS_OAIPMH, 'header'))
     if deleted:
         e_header.set('status', 'deleted')
@@ -287,21 +296,43 @@ def header(parent, identifier, datestamp, sets=[], deleted=False):
     e_datestamp = SubElement(e_header, etree.QName(NS_OAIPMH, 'datestamp'))
     e_datestamp.text = datetime_to_datestamp(datestamp)
     if sets:
-        _paths, _sets = extract_paths_from_sets(sets)
+        if set_paths is None:
+            set_paths = get_set_paths(sets)
+        index_paths, other_sets = set_paths
 
-        paths = Indexes.get_path_name(_paths)
+        paths = sorted([index_paths[_set] for _set in set(sets)
+                        if _set in index_paths],
+                       key=lambda path: path.path)
         for path in paths:
             if path.public_state and path.harvest_public_state:
                 e = SubElement(e_header, etree.QName(NS_OAIPMH, 'setSpec'))
                 e.text = path.path.replace('/', ':')
 
-        for set in _sets:
-            e = SubElement(e_header, etree.QName(NS_OAIPMH, 'setSpec'))
-            e.text = set
+        for set_ in sets:
+            if set_ in other_sets:
+                e = SubElement(e_header, etree.QName(NS_OAIPMH, 'setSpec'))
+                e.text = set_
 
     return e_header
 
 
+def get_set_paths(sets):
+    """Resolve the sets of one or more records to index paths at once.
+
+    Args:
+        sets (list): list of sets
+
+    Returns:
+        dict,set: index paths by index id and the sets which are not index
+    """
+    _paths, _sets = extract_paths_from_sets(set(sets))
+    index_paths = {}
+    if _paths:
+        for path in Indexes.get_path_name(_paths):
+            index_paths[str(path.cid)] = path
+    return index_paths, set(_sets)
+
+
 def extract_paths_from_sets(sets):
     """Extract the paths in the set
 
@@ -362,6 +393,104 @@ def is_private_index_by_public_list(item_path, public_index_ids):
     return True
 
 
+def copy_record_metadata(record):
+    """Copy a record before it is passed to the serializer.
+
+    The serializer and :func:`handle_license_free` edit dicts and lists of
+    the metadata in place, so only those containers are copied. Unlike
+    pickling the record, the model and the immutable values are shared.
+
+    Args:
+        record (WekoRecord): record
+
+    Returns:
+        WekoRecord: copy of the record
+    """
+    def _copy(data):
+        if isinstance(data, dict):
+            return {key: _copy(value) for key, value in data.items()}
+        elif isinstance(data, list):
+            return [_copy(value) for value in data]
+        return data
+
+    if isinstance(record, Record):
+        return record.__class__(_copy(record), model=record.model)
+    return _copy(record)
+
+
+def get_records_by_hits(hits):
+    """Load the OAI PIDs and records of a page of search hits at once.
+
+    Args:
+        hits (list): search hits returned by ``get_records``
+
+    Returns:
+        dict,dict: OAI PIDs by pid_value and records by object_uuid
+    """
+    pid_values = []
+    for r in hits:
+        try:
+            pid_values.append(
+                oaiid_fetcher(r['id'], r['json']['_source']).pid_value)
+        except PersistentIdentifierError:
+            continue
+
+    pids = {}
+    if pid_values:
+        query = PersistentIdentifier.query.filter(
+            PersistentIdentifier.pid_type == OAIIDProvider.pid_type,
+            PersistentIdentifier.pid_provider == OAIIDProvider.pid_provider,
+            PersistentIdentifier.pid_value.in_(pid_values))
+        for pid_object in query:
+            pids[pid_object.pid_value] = pid_object
+
+    records = {}
+    object_uuids = [pid_object.object_uuid for pid_object in pids.values()
+                    if pid_object.object_uuid]
+    if object_uuids:
+        query = RecordMetadata.query.filter(
+            RecordMetadata.id.in_(object_uuids))
+        for model in query:
+            # Same as WekoRecord.get_record, deleted records are not found.
+            if model.json is None:
+                continue
+            records[model.id] = WekoRecord(model.json, model=model)
+
+    return pids, records
+
+
+def dump_metadata(record_dumper, pid, record, metadata_prefix,
+                  refresh=False):
+    """Serialize the metadata of a record.
+
+    The serialized metadata is read from and saved to the metadata cache.
+
+    Args:
+        record_dumper (function): serializer of the metadata prefix
+        pid (PersistentIdentifier): OAI PID of the record
+        record (WekoRecord): record
+        metadata_prefix (str): metadata prefix
+        refresh (bool): serialize even if the metadata is cached
+
+    Returns:
+        Element: serialized metadata
+    """
+    if not refresh:
+        root = get_metadata_cache(record, metadata_prefix)
+        if root is not None:
+            return root
+
+    etree_record = copy_record_metadata(record)
+    if not etree_record.get('system_identifier_doi', None):
+        etree_record['system_identifier_doi'] = get_identifier(record)
+    # Merge licensetype and licensefree
+    etree_record = handle_license_free(etree_record)
+    root = record_dumper(pid, {'_source': etree_record})
+
+    set_metadata_cache(record, metadata_prefix, root)
+    return root
+
+
 def set_identifier(param_record, param_rec):
     """Set identifier (doi, cnri, url) for this record."""
     # Set default value for system_identifier_doi.
@@ -458,15 +587,8 @@ def getrecord(**kwargs):
         e_metadata = SubElement(e_record,
                                 etree.QName(NS_OAIPMH, 'metadata'))
 
-        etree_record = pickle.loads(pickle.dumps(record, -1))
-
-        if not etree_record.get('system_identifier_doi', None):
-            etree_record['system_identifier_doi'] = get_identifier(record)
-
-        # Merge licensetype and licensefree
-        etree_record = handle_license_free(etree_record)
-
-        root = record_dumper(pid_object, {'_source': etree_record})
+        root = dump_metadata(record_dumper, pid_object, record,
+                             kwargs['metadataPrefix'])
 
         e_metadata.append(root)
     except Exception as ex:
@@ -505,11 +627,23 @@ def listidentifiers(**kwargs):
     if not result.total:
         return error(get_error_code_msg(), **kwargs)
 
-    for r in result.items:
+    hits = list(result.items)
+    pids, records = get_records_by_hits(hits)
+    set_paths = get_set_paths(
+        [_set for record in records.values()
+         for _set in record.get('path', []) + record.get('_oai', {}).get(
+             'sets', [])])
+
+    for r in hits:
         try:
             pid = oaiid_fetcher(r['id'], r['json']['_source'])
-            pid_object = OAIIDProvider.get(pid_value=pid.pid_value).pid
-            record = WekoRecord.get_record_by_uuid(pid_object.object_uuid)
+            pid_object = pids.get(pid.pid_value)
+            if pid_object is None:
+                raise PIDDoesNotExistError(
+                    OAIIDProvider.pid_type, pid.pid_value)
+            record = records.get(pid_object.object_uuid)
+            if record is None:
+                raise NoResultFound()
             set_identifier(record, record)
 
             path_list = record.get('path') if 'path' in record else []
@@ -555,7 +689,8 @@ def listidentifiers(**kwargs):
                     identifier=pid.pid_value,
                     # datestamp=r['updated'],
                     datestamp=record.updated,
-                    sets=_sets
+                    sets=_sets,
+                    set_paths=set_paths
                 )
         except PIDDoesNotExistError:
             current_app.logger.error(
@@ -577,17 +712,23 @@ def listidentifiers(**kwargs):
     return e_tree
 
 
-def listrecords(**kwargs):
-    """Create OAI-PMH response for verb ListRecords."""
-    current_app.logger.debug("kwargs: {}".format(kwargs))
-    record_dumper = serializer(kwargs['metadataPrefix'])
-    e_tree, e_listrecords = verb(**kwargs)
+def get_listrecords_page(chunk_size=None, **kwargs):
+    """Collect the records of a page of ListRecords.
 
+    Args:
+        chunk_size (int): number of records loaded at once. All the records
+            of the page are loaded at once if not set.
+
+    Returns:
+        tuple: search result and generator of (pid, record, deleted,
+            set_paths) loading the records lazily. ``None`` if no records
+            match.
+    """
     identify = OaiIdentify.get_all()
     if not identify or not identify.outPutSetting:
         current_app.logger.debug(
             "No identify.outPutSetting")
-        return error(get_error_code_msg(), **kwargs)
+        return None
 
     index_state = get_index_state()
     set_is_output = 0
@@ -597,7 +738,7 @@ def listrecords(**kwargs):
             com_prefix = current_app.config.get('COMMUNITIES_OAI_FORMAT').replace('{community_id}', '')
             set_obj = OAISet.get_set_by_spec(com_prefix + kwargs['set'])
         if not set_obj:
-            return error(get_error_code_msg(), **kwargs)
+            return None
         set_value = kwargs['set']
         if set_value and set_value[0].isdigit():
             path = set_value.replace(':', '/')
@@ -606,88 +747,148 @@ def listrecords(**kwargs):
         set_is_output = is_output_harvest([path], index_state)
         current_app.logger.debug("set_is_output: {}".format(set_is_output))
         if set_is_output == HARVEST_PRIVATE:
-            return error(get_error_code_msg(), **kwargs)
+            return None
 
     result = get_records(**kwargs)
     if not result.total:
-        return error(get_error_code_msg(), **kwargs)
+        return None
 
-    for r in result.items:
-        try:
-            pid = oaiid_fetcher(r['id'], r['json']['_source'])
-            pid_object = OAIIDProvider.get(pid_value=pid.pid_value).pid
-            record = WekoRecord.get_record_by_uuid(pid_object.object_uuid)
-            set_identifier(record, record)
-            path_list = record.get('path') if 'path' in record else []
-            _is_output = is_output_harvest(path_list, index_state)
+    return result, _iter_listrecords_entries(
+        list(result.items), index_state, chunk_size)
 
-            current_app.logger.debug("pid:{}".format(pid))
-            current_app.logger.debug("_is_output:{}".format(_is_output))
-            current_app.logger.debug("path_list:{}".format(path_list))
-            current_app.logger.debug(
-                "is_exists_doi(record):{}".format(is_exists_doi(record)))
-            current_app.logger.debug(
-                "is_pubdate_in_future(record):{}".format(is_pubdate_in_future(record)))
-            current_app.logger.debug("is_deleted_workflow(pid_object, record):{}".format(
-                is_deleted_workflow(pid_object, record)))
-            current_app.logger.debug(
-                "is_private_workflow(pid_object):{}".format(is_private_workflow(record)))
-            # Harvest is private
-            if path_list and (_is_output == HARVEST_PRIVATE or
-                              (is_exists_doi(record) and
-                               (_is_output == PRIVATE_INDEX or is_pubdate_in_future(record))) or
-                              is_new_workflow(record)):
-                continue
-            # Item is deleted
-            # or Harvest is public & Item is private
-            # or Harvest is public & Index is private
-            # or Harvest is public & There is no guest role in the index Browsing Privilege
-            elif _is_output == PRIVATE_INDEX or \
-                    not path_list or \
-                    is_deleted_workflow(pid_object, record) or \
-                    is_private_workflow(record) or \
-                    is_pubdate_in_future(record):
-                e_record = SubElement(
-                    e_listrecords, etree.QName(NS_OAIPMH, 'record'))
-                header(
-                    e_record,
-                    identifier=pid.pid_value,
-                    #datestamp=r['updated'],
-                    datestamp=record.updated,
-                    deleted=True
-                )
-            else:
-                etree_record = pickle.loads(pickle.dumps(record, -1))
-                if not etree_record.get('system_identifier_doi', None):
-                    etree_record['system_identifier_doi'] = get_identifier(record)
-                # Merge licensetype and licensefree
-                etree_record = handle_license_free(etree_record)
-                _record_serializer = record_dumper(pid, {'_source': etree_record})
-
-                e_record = SubElement(
-                    e_listrecords, etree.QName(NS_OAIPMH, 'record'))
-                _sets = list(set(record.get('path', []) +
-                                 record['_oai'].get('sets', [])))
-                header(
-                    e_record,
-                    identifier=pid.pid_value,
-                    datestamp=record.updated,
-                    sets=_sets
-                )
-                e_metadata = SubElement(e_record, etree.QName(NS_OAIPMH,
-                                                              'metadata'))
-                e_metadata.append(_record_serializer)
 
-        except PIDDoesNotExistError:
-            current_app.logger.error(
-                "PIDDoesNotExistError: pid_value: {}".format(pid.pid_value))
-            current_app.logger.error(
-                "PIDDoesNotExistError: recid: {}".format(r['id']))
-        except NoResultFound:
-            current_app.logger.error(
-                "NoResultFound: object_uuid: {}".format(pid_object.object_uuid))
-        except BaseException as ex:
-            current_app.logger.error("BaseException: {}".format(ex))
+def _iter_listrecords_entries(hits, index_state, chunk_size=None):
+    """Load the records of the hits and check whether to output them.
+
+    Yields:
+        tuple: (pid, record, deleted, set_paths)
+    """
+    chunk_size = chunk_size or len(hits) or 1
+    for i in range(0, len(hits), chunk_size):
+        chunk = hits[i:i + chunk_size]
+        pids, records = get_records_by_hits(chunk)
+        set_paths = get_set_paths(
+            [_set for record in records.values()
+             for _set in record.get('path', []) + record.get(
+                 '_oai', {}).get('sets', [])])
+        for r in chunk:
+            # Not yielded in the try, GeneratorExit must not be caught.
+            entry = None
+            try:
+                pid = oaiid_fetcher(r['id'], r['json']['_source'])
+                pid_object = pids.get(pid.pid_value)
+                if pid_object is None:
+                    raise PIDDoesNotExistError(
+                        OAIIDProvider.pid_type, pid.pid_value)
+                record = records.get(pid_object.object_uuid)
+                if record is None:
+                    raise NoResultFound()
+                set_identifier(record, record)
+                path_list = record.get('path') if 'path' in record else []
+                _is_output = is_output_harvest(path_list, index_state)
+
+                current_app.logger.debug("pid:{}".format(pid))
+                current_app.logger.debug("_is_output:{}".format(_is_output))
+                current_app.logger.debug("path_list:{}".format(path_list))
+                current_app.logger.debug(
+                    "is_exists_doi(record):{}".format(is_exists_doi(record)))
+                current_app.logger.debug(
+                    "is_pubdate_in_future(record):{}".format(is_pubdate_in_future(record)))
+                current_app.logger.debug("is_deleted_workflow(pid_object, record):{}".format(
+                    is_deleted_workflow(pid_object, record)))
+                current_app.logger.debug(
+                    "is_private_workflow(pid_object):{}".format(is_private_workflow(record)))
+                # Harvest is private
+                if path_list and (_is_output == HARVEST_PRIVATE or
+                                  (is_exists_doi(record) and
+                                   (_is_output == PRIVATE_INDEX or is_pubdate_in_future(record))) or
+                                  is_new_workflow(record)):
+                    continue
+                # Item is deleted
+                # or Harvest is public & Item is private
+                # or Harvest is public & Index is private
+                # or Harvest is public & There is no guest role in the index Browsing Privilege
+                elif _is_output == PRIVATE_INDEX or \
+                        not path_list or \
+                        is_deleted_workflow(pid_object, record) or \
+                        is_private_workflow(record) or \
+                        is_pubdate_in_future(record):
+                    entry = (pid, record, True, set_paths)
+                else:
+                    entry = (pid, record, False, set_paths)
+
+            except PIDDoesNotExistError:
+                current_app.logger.error(
+                    "PIDDoesNotExistError: pid_value: {}".format(pid.pid_value))
+                current_app.logger.error(
+                    "PIDDoesNotExistError: recid: {}".format(r['id']))
+            except NoResultFound:
+                current_app.logger.error(
+                    "NoResultFound: object_uuid: {}".format(pid_object.object_uuid))
+            except BaseException as ex:
+                current_app.logger.error("BaseException: {}".format(ex))
+            if entry is not None:
+                yield entry
+
+
+def record_element(record_dumper, pid, record, deleted, set_paths,
+                   metadata_prefix):
+    """Create ``<record/>`` element of ListRecords.
+
+    Args:
+        record_dumper (function): serializer of the metadata prefix
+        pid (FetchedPID): OAI PID of the record
+        record (WekoRecord): record
+        deleted (bool): output only the deleted header
+        set_paths (tuple): result of :func:`get_set_paths`
+        metadata_prefix (str): metadata prefix
+
+    Returns:
+        Element: ``<record/>`` element. ``None`` if failed to serialize.
+    """
+    e_record = Element(etree.QName(NS_OAIPMH, 'record'))
+    try:
+        if deleted:
+            header(
+                e_record,
+                identifier=pid.pid_value,
+                datestamp=record.updated,
+                deleted=True
+            )
+        else:
+            _record_serializer = dump_metadata(
+                record_dumper, pid, record, metadata_prefix)
+            _sets = list(set(record.get('path', []) +
+                             record['_oai'].get('sets', [])))
+            header(
+                e_record,
+                identifier=pid.pid_value,
+                datestamp=record.updated,
+                sets=_sets,
+                set_paths=set_paths
+            )
+            e_metadata = SubElement(e_record, etree.QName(NS_OAIPMH,
+                                                          'metadata'))
+            e_metadata.append(_record_serializer)
+    except BaseException as ex:
+        current_app.logger.error("BaseException: {}".format(ex))
+        return None
+    return e_record
+
+
+def listrecords(**kwargs):
+    """Create OAI-PMH response for verb ListRecords."""
+    current_app.logger.debug("kwargs: {}".format(kwargs))
+    record_dumper = serializer(kwargs['metadataPrefix'])
+    e_tree, e_listrecords = verb(**kwargs)
+
+    page = get_listrecords_page(**kwargs)
+    if page is None:
+        return error(get_error_code_msg(), **kwargs)
+    result, entries = page
+
+    for e_record in _iter_record_elements(record_dumper, entries, **kwargs):
+        e_listrecords.append(e_record)
 
     # Check <record> tag not exist.
     if len(e_listrecords) == 0:
@@ -699,6 +900,92 @@ def listrecords(**kwargs):
     return e_tree
 
 
+class _StreamBuffer(object):
+    """File-like object collecting the output of ``etree.xmlfile``."""
+
+    def __init__(self):
+        """Initialize buffer."""
+        self.chunks = []
+
+    def write(self, data):
+        """Collect written data."""
+        self.chunks.append(data)
+
+    def drain(self):
+        """Return and clear collected data."""
+        data = b''.join(self.chunks)
+        self.chunks = []
+        return data
+
+
+def _iter_record_elements(record_dumper, entries, **kwargs):
+    """Serialize the ``<record/>`` elements, skipping failed records."""
+    for pid, record, deleted, set_paths in entries:
+        e_record = record_element(record_dumper, pid, record, deleted,
+                                  set_paths, kwargs['metadataPrefix'])
+        if e_record is not None:
+            yield e_record
+
+
+def listrecords_stream(**kwargs):
+    """Create streaming OAI-PMH response for verb ListRecords.
+
+    The records are loaded by chunks of ``OAISERVER_STREAMING_CHUNK_SIZE``
+    and each ``<record/>`` is written as soon as it is serialized, so the
+    whole page is never held in memory. The first record is serialized
+    before the response starts, so that a page without any record is
+    answered with ``noRecordsMatch`` like :func:`listrecords`.
+
+    Returns:
+        ElementTree or generator: error response, or generator of the
+            chunks of the response.
+    """
+    current_app.logger.debug("kwargs: {}".format(kwargs))
+    page = get_listrecords_page(
+        chunk_size=current_app.config['OAISERVER_STREAMING_CHUNK_SIZE'],
+        **kwargs)
+    if page is None:
+        return error(get_error_code_msg(), **kwargs)
+    result, entries = page
+    e_records = _iter_record_elements(
+        serializer(kwargs['metadataPrefix']), entries, **kwargs)
+    first = next(e_records, None)
+    if first is None:
+        return error(get_error_code_msg(), **kwargs)
+    return _generate_listrecords(
+        result, itertools.chain([first], e_records), **kwargs)
+
+
+def _generate_listrecords(result, e_records, **kwargs):
+    """Generate the chunks of ListRecords response."""
+    e_tree, e_oaipmh = envelope(**kwargs)
+    buf = _StreamBuffer()
+
+    with etree.xmlfile(buf, encoding='UTF-8') as xf:
+        xf.write_declaration()
+        if current_app.config['OAISERVER_XSL_URL']:
+            xf.write(e_oaipmh.getprevious())
+        with xf.element(e_oaipmh.tag, attrib=dict(e_oaipmh.attrib),
+                        nsmap=NSMAP):
+            for child in e_oaipmh:
+                xf.write(child)
+            with xf.element(etree.QName(NS_OAIPMH, kwargs['verb'])):
+                count = 0
+                for e_record in e_records:
+                    xf.write(e_record)
+                    xf.flush()
+                    count += 1
+                    yield buf.drain()
+
+                current_app.logger.debug(
+                    "number of records :{}".format(count))
+                e_parent = Element(etree.QName(NS_OAIPMH, kwargs['verb']))
+                resumption_token(e_parent, result, **kwargs)
+                for child in e_parent:
+                    xf.write(child)
+    yield buf.drain()
+
+
 def get_error_code_msg(code=''):
     """Return list error message."""
     msg = ""
@@ -76,3 +76,41 @@ def update_affected_records(spec=None, search_pattern=None):
         update_records_sets.s(list(filter(None, chunk)))
         for chunk in zip_longest(*[iter(record_ids)] * chunk_size)
     )()
+
+
+@shared_task(base=RequestContextTask, ignore_result=True)
+def update_metadata_cache(record_uuid):
+    """Fill the metadata cache of a record for all metadata prefixes.
+
+    :param record_uuid: The record UUID.
+    """
+    from sqlalchemy.orm.exc import NoResultFound
+    from weko_deposit.api import WekoRecord
+    from weko_schema_ui.schema import get_oai_metadata_formats
+
+    from .fetchers import oaiid_fetcher
+    from .provider import OAIIDProvider
+    from .response import dump_metadata, set_identifier
+    from .utils import serializer
+
+    if not current_app.config['OAISERVER_METADATA_CACHE_ENABLED']:
+        return
+    try:
+        record = WekoRecord.get_record(record_uuid)
+    except NoResultFound:
+        return
+    if not record.get('_oai', {}).get('id'):
+        return
+
+    try:
+        pid = oaiid_fetcher(record_uuid, record)
+        pid_object = OAIIDProvider.get(pid_value=pid.pid_value).pid
+        set_identifier(record, record)
+        # The cache holds the metadata of the site URL.
+        with current_app.test_request_context(
+                current_app.config['THEME_SITEURL']):
+            for metadata_prefix in get_oai_metadata_formats(current_app):
+                dump_metadata(serializer(metadata_prefix), pid_object, record,
+                              metadata_prefix, refresh=True)
+    except Exception as e:
+        current_app.logger.error(e)
@@ -13,11 +13,12 @@ from __future__ import absolute_import, print_function
 from datetime import datetime
 from functools import partial
 
-from flask import current_app
+from flask import current_app, has_request_context, request
 from lxml import etree
 from lxml.builder import E
 from lxml.etree import Element
 from weko_index_tree.api import Indexes
+from weko_redis.redis import RedisConnection
 from weko_schema_ui.schema import get_oai_metadata_formats
 from werkzeug.utils import import_string
 
@@ -297,4 +298,118 @@ def get_community_index_from_set(set):
         '{community_id}', '')
     com_id = set.replace(com_prefix, '')
     com = Community.query.filter_by(id=com_id).first()
-    return str(com.root_node_id) if com else None
\ No newline at end of file
+    return str(com.root_node_id) if com else None
+
+
+def _get_metadata_cache_datastore():
+    """Get the Redis connection of the metadata cache."""
+    db = current_app.config['OAISERVER_METADATA_CACHE_REDIS_DB']
+    if db is None:
+        db = current_app.config['CACHE_REDIS_DB']
+    return RedisConnection().connection(db=db)
+
+
+def _get_metadata_cache_field(metadata_prefix):
+    """Get the field of the metadata cache of a record.
+
+    The record URLs in the metadata depend on the requested host, so only
+    the metadata of the site URL is cached.
+
+    :returns: The field or ``None`` if the request is for another host.
+    """
+    url_root = current_app.config['THEME_SITEURL'].rstrip('/') + '/'
+    if has_request_context() and request.url_root != url_root:
+        return None
+    return '{}::{}'.format(metadata_prefix, url_root)
+
+
+def get_metadata_cache(record, metadata_prefix):
+    """Get the serialized metadata of a record from the cache.
+
+    :param record: The :class:`weko_deposit.api.WekoRecord` instance.
+    :param metadata_prefix: The metadata prefix.
+    :returns: A LXML Element instance or ``None`` if it is not cached.
+    """
+    if not current_app.config['OAISERVER_METADATA_CACHE_ENABLED']:
+        return None
+    field = _get_metadata_cache_field(metadata_prefix)
+    if field is None:
+        return None
+    try:
+        datastore = _get_metadata_cache_datastore()
+        revision_id, value = datastore.hmget(
+            current_app.config['OAISERVER_METADATA_CACHE_KEY'].format(
+                record_uuid=record.id),
+            'revision_id', field)
+        hit = value is not None and revision_id is not None \
+            and int(revision_id) == record.revision_id
+        datastore.hincrby(
+            current_app.config['OAISERVER_METADATA_CACHE_STATS_KEY'],
+            'hit' if hit else 'miss')
+        if hit:
+            return etree.fromstring(value)
+    except Exception as ex:
+        current_app.logger.error(
+            'Could not get metadata cache: {}'.format(ex))
+    return None
+
+
+def set_metadata_cache(record, metadata_prefix, root):
+    """Save the serialized metadata of a record to the cache.
+
+    The cache of the other revisions of the record is deleted.
+
+    :param record: The :class:`weko_deposit.api.WekoRecord` instance.
+    :param metadata_prefix: The metadata prefix.
+    :param root: A LXML Element instance.
+    """
+    if not current_app.config['OAISERVER_METADATA_CACHE_ENABLED']:
+        return
+    field = _get_metadata_cache_field(metadata_prefix)
+    if field is None:
+        return
+    try:
+        datastore = _get_metadata_cache_datastore()
+        key = current_app.config['OAISERVER_METADATA_CACHE_KEY'].format(
+            record_uuid=record.id)
+        revision_id = datastore.hget(key, 'revision_id')
+        pipe = datastore.pipeline()
+        if revision_id is None or int(revision_id) != record.revision_id:
+            pipe.delete(key)
+            pipe.hset(key, 'revision_id', record.revision_id)
+        pipe.hset(key, field, etree.tostring(root))
+        pipe.expire(key, current_app.config['OAISERVER_METADATA_CACHE_TTL'])
+        pipe.execute()
+    except Exception as ex:
+        current_app.logger.error(
+            'Could not set metadata cache: {}'.format(ex))
+
+
+def delete_metadata_cache(record_uuid=None):
+    """Delete the metadata cache.
+
+    :param record_uuid: The record UUID. If not set, the cache of all
+        records and the counters are deleted.
+    """
+    datastore = _get_metadata_cache_datastore()
+    key = current_app.config['OAISERVER_METADATA_CACHE_KEY']
+    if record_uuid:
+        datastore.delete(key.format(record_uuid=record_uuid))
+        return
+    for k in datastore.scan_iter(match=key.format(record_uuid='*')):
+        datastore.delete(k)
+    datastore.delete(current_app.config['OAISERVER_METADATA_CACHE_STATS_KEY'])
+
+
+def get_metadata_cache_stats():
+    """Get the hit and miss counters of the metadata cache.
+
+    :returns: A dict of the counters.
+    """
+    datastore = _get_metadata_cache_datastore()
+    stats = datastore.hgetall(
+        current_app.config['OAISERVER_METADATA_CACHE_STATS_KEY'])
+    return {
+        'hit': int(stats.get(b'hit', 0)),
+        'miss': int(stats.get(b'miss', 0)),
+    }
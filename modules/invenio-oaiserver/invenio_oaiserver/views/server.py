@@ -10,7 +10,8 @@
 
 from __future__ import absolute_import
 
-from flask import Blueprint, make_response,current_app
+from flask import Blueprint, Response, make_response, current_app, \
+    stream_with_context
 from invenio_pidstore.errors import PIDDoesNotExistError
 from itsdangerous import BadSignature
 from invenio_db import db
@@ -91,7 +92,14 @@ def resumptiontoken_error(exception):
 @use_args(make_request_validator)
 def response(args):
     """Response endpoint."""
-    e_tree = getattr(xml, args['verb'].lower())(**args)
+    if args['verb'] == 'ListRecords' \
+            and current_app.config['OAISERVER_STREAMING_RESPONSE']:
+        e_tree = xml.listrecords_stream(**args)
+        if not isinstance(e_tree, etree._ElementTree):
+            return Response(stream_with_context(e_tree),
+                            content_type='text/xml')
+    else:
+        e_tree = getattr(xml, args['verb'].lower())(**args)
 
     response = make_response(etree.tostring(
         e_tree,
@@ -108,6 +108,9 @@ setup(
     include_package_data=True,
     platforms='any',
     entry_points={
+        'flask.commands': [
+            'oaiserver = invenio_oaiserver.cli:oaiserver',
+        ],
         'invenio_base.apps': [
             'invenio_oaiserver = invenio_oaiserver:InvenioOAIServer',
         ],
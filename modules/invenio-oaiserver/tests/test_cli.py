@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of Invenio.
+# Copyright (C) 2015-2018 CERN.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Test CLI."""
+
+from click.testing import CliRunner
+from flask.cli import ScriptInfo
+from mock import patch
+
+from invenio_oaiserver.cli import clear_metadata_cache, stats_metadata_cache
+# .tox/c1/bin/pytest --cov=invenio_oaiserver tests/test_cli.py -vv -s --cov-branch --cov-report=term --basetemp=/code/modules/invenio-oaiserver/.tox/c1/tmp
+
+
+# def stats_metadata_cache():
+# .tox/c1/bin/pytest --cov=invenio_oaiserver tests/test_cli.py::test_stats_metadata_cache -vv -s --cov-branch --cov-report=term --basetemp=/code/modules/invenio-oaiserver/.tox/c1/tmp
+def test_stats_metadata_cache(app):
+    runner = CliRunner()
+    script_info = ScriptInfo(create_app=lambda info: app)
+    with patch("invenio_oaiserver.cli.get_metadata_cache_stats", return_value={"hit": 3, "miss": 1}):
+        result = runner.invoke(stats_metadata_cache, [], obj=script_info)
+        assert result.exit_code == 0
+        assert result.output == "hit: 3, miss: 1\nhit ratio: 75.0%\n"
+    with patch("invenio_oaiserver.cli.get_metadata_cache_stats", return_value={"hit": 0, "miss": 0}):
+        result = runner.invoke(stats_metadata_cache, [], obj=script_info)
+        assert result.exit_code == 0
+        assert result.output == "hit: 0, miss: 0\n"
+
+
+# def clear_metadata_cache(record_uuid):
+# .tox/c1/bin/pytest --cov=invenio_oaiserver tests/test_cli.py::test_clear_metadata_cache -vv -s --cov-branch --cov-report=term --basetemp=/code/modules/invenio-oaiserver/.tox/c1/tmp
+def test_clear_metadata_cache(app):
+    runner = CliRunner()
+    script_info = ScriptInfo(create_app=lambda info: app)
+    with patch("invenio_oaiserver.cli.delete_metadata_cache") as mock_delete:
+        result = runner.invoke(clear_metadata_cache, [], obj=script_info)
+        assert result.exit_code == 0
+        assert result.output == "Metadata cache has been cleared.\n"
+        mock_delete.assert_called_with(None)
+        result = runner.invoke(clear_metadata_cache, ["--record-uuid", "test_uuid"], obj=script_info)
+        mock_delete.assert_called_with("test_uuid")
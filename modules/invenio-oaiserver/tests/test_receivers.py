@@ -5,7 +5,8 @@ from invenio_oaiserver.receivers import (
     OAIServerUpdater,
     after_update_oai_set,
     after_delete_oai_set,
-    after_insert_oai_set
+    after_insert_oai_set,
+    fill_metadata_cache
 )
 # .tox/c1/bin/pytest --cov=invenio_oaiserver tests/test_receivers.py -vv -s --cov-branch --cov-report=term --basetemp=/code/modules/invenio-oaiserver/.tox/c1/tmp
 
@@ -74,4 +75,32 @@ def test_after_delete_oai_set(app,db,mocker):
             return "test_spec"
     mocker.patch("invenio_oaiserver.receivers._delete_percolator")
     mocker.patch("invenio_oaiserver.receivers.update_affected_records.delay")
-    after_delete_oai_set(None,None,Target())
\ No newline at end of file
+    after_delete_oai_set(None,None,Target())
+
+
+# def fill_metadata_cache(sender, record=None, **kwargs):
+# .tox/c1/bin/pytest --cov=invenio_oaiserver tests/test_receivers.py::test_fill_metadata_cache -vv -s --cov-branch --cov-report=term --basetemp=/code/modules/invenio-oaiserver/.tox/c1/tmp
+def test_fill_metadata_cache(app,db,mocker):
+    mock_task = mocker.patch("invenio_oaiserver.receivers.update_metadata_cache.delay")
+    app.config["OAISERVER_METADATA_CACHE_ENABLED"] = True
+    fill_metadata_cache(app)
+    fill_metadata_cache(app, record={"_oai": {"sets": []}})
+    db.session.commit()
+    mock_task.assert_not_called()
+
+    class MockRecord(dict):
+        id = "test_uuid"
+    # queued once after the commit
+    fill_metadata_cache(app, record=MockRecord(_oai={"id": "oai:test"}))
+    fill_metadata_cache(app, record=MockRecord(_oai={"id": "oai:test"}))
+    mock_task.assert_not_called()
+    db.session.commit()
+    mock_task.assert_called_once_with("test_uuid")
+
+    # not queued after a rollback
+    mock_task.reset_mock()
+    fill_metadata_cache(app, record=MockRecord(_oai={"id": "oai:test"}))
+    db.session.rollback()
+    db.session.commit()
+    mock_task.assert_not_called()
+    app.config["OAISERVER_METADATA_CACHE_ENABLED"] = False
@@ -14,12 +14,10 @@ from mock import patch
 from flask import current_app
 from flask_babelex import Babel
 from werkzeug.utils import cached_property
-from sqlalchemy.orm.exc import NoResultFound
 from lxml import etree
 from lxml.etree import Element, SubElement
 
 from invenio_records.models import RecordMetadata
-from invenio_pidstore.errors import PIDDoesNotExistError
 from invenio_pidstore.models import PersistentIdentifier,PIDStatus
 from invenio_pidrelations.models import PIDRelation
 
@@ -57,7 +55,13 @@ from invenio_oaiserver.response import (
     get_identifier,
     header,
     identify,
-    is_draft_workflow
+    is_draft_workflow,
+    copy_record_metadata,
+    get_records_by_hits,
+    get_set_paths,
+    dump_metadata,
+    record_element,
+    listrecords_stream
 )
 
 
@@ -405,7 +409,7 @@ def test_getrecord(app, db, item_type, mocker):
             verb="GetRecord",
             identifier=str(record[2].pid_value)
         )
-        with patch("invenio_oaiserver.response.pickle.loads",side_effect=Exception):
+        with patch("invenio_oaiserver.response.copy_record_metadata",side_effect=Exception):
             res = getrecord(**kwargs)
             assert res.xpath("/x:OAI-PMH/x:error",namespaces=NAMESPACES)[0].attrib["code"] == "idDoesNotExist"
 
@@ -831,15 +835,15 @@ def test_listidentifiers(es_app,records,item_type,mock_execute,db,mocker):
         )
         with patch("invenio_oaiserver.response.get_records",return_value=MockPagenation(dummy_data)):
             # raise PIDDoesNotExistError
-            with patch("invenio_oaiserver.response.OAIIDProvider.get",side_effect=PIDDoesNotExistError("test pid_type","test pid_value")):
+            with patch("invenio_oaiserver.response.get_records_by_hits",return_value=({}, {})):
                 res=listidentifiers(**kwargs)
                 assert res.xpath("/x:OAI-PMH/x:error",namespaces=NAMESPACES)[0].attrib["code"] == "noRecordsMatch"
             # raise NoResultFound
-            with patch("invenio_oaiserver.response.WekoRecord.get_record_by_uuid",side_effect=NoResultFound()):
+            with patch("invenio_oaiserver.response.get_records_by_hits",side_effect=lambda hits: (get_records_by_hits(hits)[0], {})):
                 res=listidentifiers(**kwargs)
                 assert res.xpath("/x:OAI-PMH/x:error",namespaces=NAMESPACES)[0].attrib["code"] == "noRecordsMatch"
             # raise Exception
-            with patch("invenio_oaiserver.response.WekoRecord.get_record_by_uuid",side_effect=Exception()):
+            with patch("invenio_oaiserver.response.set_identifier",side_effect=Exception()):
                 res=listidentifiers(**kwargs)
                 assert res.xpath("/x:OAI-PMH/x:error",namespaces=NAMESPACES)[0].attrib["code"] == "noRecordsMatch"
 
@@ -1176,11 +1180,11 @@ def test_listrecords(es_app,records,item_type,mock_execute,db,mocker):
         )
         with patch("invenio_oaiserver.response.get_records",return_value=MockPagenation(dummy_data)):
             # raise PIDDoesNotExistError
-            with patch("invenio_oaiserver.response.OAIIDProvider.get",side_effect=PIDDoesNotExistError("test pid_type","test pid_value")):
+            with patch("invenio_oaiserver.response.get_records_by_hits",return_value=({}, {})):
                 res=listrecords(**kwargs)
                 assert res.xpath("/x:OAI-PMH/x:error",namespaces=NAMESPACES)[0].attrib["code"] == "noRecordsMatch"
             # raise NoResultFound
-            with patch("invenio_oaiserver.response.WekoRecord.get_record_by_uuid",side_effect=NoResultFound()):
+            with patch("invenio_oaiserver.response.get_records_by_hits",side_effect=lambda hits: (get_records_by_hits(hits)[0], {})):
                 res=listrecords(**kwargs)
                 assert res.xpath("/x:OAI-PMH/x:error",namespaces=NAMESPACES)[0].attrib["code"] == "noRecordsMatch"
 
@@ -1620,9 +1624,221 @@ def test_is_private_index_by_public_list():
     result = is_private_index_by_public_list(item_path, public_ids)
     assert result == True
 
+# def copy_record_metadata(record):
+# .tox/c1/bin/pytest --cov=invenio_oaiserver tests/test_response.py::test_copy_record_metadata -vv -s --cov-branch --cov-report=term --basetemp=/code/modules/invenio-oaiserver/.tox/c1/tmp
+def test_copy_record_metadata(app,db,records):
+    record = WekoRecord.get_record(records[0][2].id)
+    result = copy_record_metadata(record)
+    assert isinstance(result, WekoRecord)
+    assert result == record
+    assert result.model == record.model
+    assert result["json"] is not record["json"]
+    assert result["path"] is not record["path"]
+    result["json"]["_source"]["_item_metadata"]["system_identifier_doi"] = None
+    result["path"].append("1")
+    assert record["json"]["_source"]["_item_metadata"]["system_identifier_doi"]
+    assert record["path"] == ["1557819692844"]
+
+    data = {"item_1": {"attribute_value_mlt": [{"licensetype": "license_free"}]}, "recid": "1"}
+    result = copy_record_metadata(data)
+    assert result == data
+    assert result["item_1"]["attribute_value_mlt"][0] is not data["item_1"]["attribute_value_mlt"][0]
+
+# def dump_metadata(record_dumper, pid, record, metadata_prefix, refresh=False):
+# .tox/c1/bin/pytest --cov=invenio_oaiserver tests/test_response.py::test_dump_metadata -vv -s --cov-branch --cov-report=term --basetemp=/code/modules/invenio-oaiserver/.tox/c1/tmp
+def test_dump_metadata(app,db,records,mocker):
+    record = WekoRecord.get_record(records[0][2].id)
+    cached = Element("cached")
+    dumped = Element("dumped")
+    mocker.patch("invenio_oaiserver.response.get_identifier",return_value=None)
+    mock_set = mocker.patch("invenio_oaiserver.response.set_metadata_cache")
+    def record_dumper(pid, data):
+        assert data["_source"] is not record
+        assert data["_source"]["system_identifier_doi"] is None
+        return dumped
+
+    # cache hit
+    with patch("invenio_oaiserver.response.get_metadata_cache",return_value=cached):
+        assert dump_metadata(record_dumper, None, record, "jpcoar_1.0") == cached
+        mock_set.assert_not_called()
+        # refresh
+        assert dump_metadata(record_dumper, None, record, "jpcoar_1.0", refresh=True) == dumped
+        mock_set.assert_called_once_with(record, "jpcoar_1.0", dumped)
+
+    # cache miss
+    mock_set.reset_mock()
+    with patch("invenio_oaiserver.response.get_metadata_cache",return_value=None):
+        assert dump_metadata(record_dumper, None, record, "jpcoar_1.0") == dumped
+        mock_set.assert_called_once_with(record, "jpcoar_1.0", dumped)
+    assert "system_identifier_doi" not in record
+
+# def get_records_by_hits(hits):
+# .tox/c1/bin/pytest --cov=invenio_oaiserver tests/test_response.py::test_get_records_by_hits -vv -s --cov-branch --cov-report=term --basetemp=/code/modules/invenio-oaiserver/.tox/c1/tmp
+def test_get_records_by_hits(app,db,records):
+    hits = [
+        {"id": records[0][2].id, "json": {"_source": {"_oai": {"id": str(records[0][0])}}}},
+        {"id": records[1][2].id, "json": {"_source": {"_oai": {"id": str(records[1][0])}}}},
+        {"id": uuid.uuid4(), "json": {"_source": {"_oai": {"id": "not_exist"}}}},
+        {"id": uuid.uuid4(), "json": {"_source": {}}},
+    ]
+    pids, result = get_records_by_hits(hits)
+    assert list(pids.keys()) == [str(records[0][0]), str(records[1][0])] or \
+        list(pids.keys()) == [str(records[1][0]), str(records[0][0])]
+    assert len(result) == 2
+    assert result[records[0][2].id] == records[0][2]
+    assert isinstance(result[records[1][2].id], WekoRecord)
+
+    # deleted record
+    records[1][2].model.json = None
+    db.session.merge(records[1][2].model)
+    db.session.commit()
+    pids, result = get_records_by_hits(hits)
+    assert len(pids) == 2
+    assert list(result.keys()) == [records[0][2].id]
+
+    assert get_records_by_hits([]) == ({}, {})
+
+# def get_set_paths(sets):
+# .tox/c1/bin/pytest --cov=invenio_oaiserver tests/test_response.py::test_get_set_paths -vv -s --cov-branch --cov-report=term --basetemp=/code/modules/invenio-oaiserver/.tox/c1/tmp
+def test_get_set_paths(app,db):
+    index = Index(
+        id=1,
+        parent=0,
+        position=1,
+        index_name_english="test_index",
+        index_link_name_english="test_index_link",
+        harvest_public_state=True,
+        public_state=True,
+        browsing_role="3,-99"
+    )
+    db.session.add(index)
+    db.session.commit()
+    with patch("weko_index_tree.utils.get_user_groups",return_value=[]):
+        with patch("weko_index_tree.utils.check_roles",return_value=True):
+            index_paths, other_sets = get_set_paths(["1","1","test_set"])
+    assert list(index_paths.keys()) == ["1"]
+    assert index_paths["1"].path == "1"
+    assert other_sets == {"test_set"}
+
+    assert get_set_paths([]) == ({}, set())
+
+# .tox/c1/bin/pytest --cov=invenio_oaiserver tests/test_response.py::test_get_records_by_hits_same_as_per_hit -vv -s --cov-branch --cov-report=term --basetemp=/code/modules/invenio-oaiserver/.tox/c1/tmp
+def test_get_records_by_hits_same_as_per_hit(app,db):
+    import pickle
+    from .helpers import create_record_oai
+
+    hits = []
+    for i in range(5):
+        record_data = {
+            "path": ["1557819692844"],
+            "publish_date": "2000-08-09",
+            "publish_status": "0",
+            "_oai": {"sets": ["1557819692844"]},
+            "item_type_id": "1",
+            "item_1617186331708": {
+                "attribute_name": "Title",
+                "attribute_value_mlt": [
+                    {"subitem_1551255647225": "title {}".format(i),
+                     "subitem_1551255648112": "ja"}
+                ]
+            }
+        }
+        pid, oai, record, item = create_record_oai(record_data, {"title": "title {}".format(i)})
+        hits.append({"id": record.id, "json": {"_source": {"_oai": {"id": str(pid)}}}})
+    db.session.commit()
+
+    before = []
+    for r in hits:
+        pid_object = OAIIDProvider.get(pid_value=r["json"]["_source"]["_oai"]["id"]).pid
+        record = WekoRecord.get_record_by_uuid(pid_object.object_uuid)
+        before.append(pickle.loads(pickle.dumps(record, -1)))
+    db.session.expire_all()
+
+    after = []
+    pids, _records = get_records_by_hits(hits)
+    for r in hits:
+        pid_object = pids[r["json"]["_source"]["_oai"]["id"]]
+        after.append(copy_record_metadata(_records[pid_object.object_uuid]))
+
+    assert [dict(r) for r in before] == [dict(r) for r in after]
+
 # def set_identifier(param_record, param_rec):
 # def is_exists_doi(param_record):
 
+# def record_element(record_dumper, pid, record, deleted, set_paths, metadata_prefix):
+# .tox/c1/bin/pytest --cov=invenio_oaiserver tests/test_response.py::test_record_element -vv -s --cov-branch --cov-report=term --basetemp=/code/modules/invenio-oaiserver/.tox/c1/tmp
+def test_record_element(app,db,records,mocker):
+    record = WekoRecord.get_record(records[0][2].id)
+    pid = OAIIDProvider.get(pid_value=str(records[0][0])).pid
+    mocker.patch("invenio_oaiserver.response.dump_metadata",return_value=Element("jpcoar"))
+
+    # deleted
+    result = record_element(None, pid, record, True, ({}, set()), "jpcoar_1.0")
+    assert result.xpath("./x:header",namespaces=NAMESPACES)[0].attrib["status"] == "deleted"
+    assert len(result.xpath("./x:metadata",namespaces=NAMESPACES)) == 0
+
+    # not deleted
+    result = record_element(None, pid, record, False, ({}, set()), "jpcoar_1.0")
+    assert result.xpath("./x:header/x:identifier",namespaces=NAMESPACES)[0].text == str(records[0][0])
+    assert result.xpath("./x:metadata/jpcoar",namespaces=NAMESPACES)
+
+    # failed to serialize
+    with patch("invenio_oaiserver.response.dump_metadata",side_effect=Exception("test_error")):
+        assert record_element(None, pid, record, False, ({}, set()), "jpcoar_1.0") is None
+
+# def listrecords_stream(**kwargs):
+# .tox/c1/bin/pytest --cov=invenio_oaiserver tests/test_response.py::test_listrecords_stream -vv -s --cov-branch --cov-report=term --basetemp=/code/modules/invenio-oaiserver/.tox/c1/tmp
+def test_listrecords_stream(app,mocker):
+    class MockPagination():
+        page = 1
+        per_page = 2
+        total = 3
+        has_next = True
+        next_num = 2
+
+    class MockPid():
+        def __init__(self, pid_value):
+            self.pid_value = pid_value
+
+    def mock_record_element(record_dumper, pid, record, deleted, set_paths, metadata_prefix):
+        if pid.pid_value == "oai:error":
+            return None
+        e_record = Element(etree.QName(NS_OAIPMH, "record"))
+        SubElement(e_record, etree.QName(NS_OAIPMH, "header")).text = pid.pid_value
+        return e_record
+
+    kwargs = dict(
+        metadataPrefix="jpcoar_1.0",
+        verb="ListRecords",
+    )
+    mocker.patch("invenio_oaiserver.response.serializer")
+    mocker.patch("invenio_oaiserver.response.record_element",side_effect=mock_record_element)
+    mocker.patch("invenio_oaiserver.response.serialize",return_value="test_token")
+    with app.test_request_context():
+        # no records match
+        with patch("invenio_oaiserver.response.get_listrecords_page",return_value=None):
+            res = listrecords_stream(**kwargs)
+            assert res.xpath("/x:OAI-PMH/x:error",namespaces=NAMESPACES)[0].attrib["code"] == "noRecordsMatch"
+
+        entries = [(MockPid("oai:1"), None, False, ({}, set())), (MockPid("oai:error"), None, False, ({}, set())), (MockPid("oai:2"), None, True, ({}, set()))]
+        # every record fails to serialize
+        with patch("invenio_oaiserver.response.get_listrecords_page",return_value=(MockPagination(), iter(entries[1:2]))):
+            res = listrecords_stream(**kwargs)
+            assert res.xpath("/x:OAI-PMH/x:error",namespaces=NAMESPACES)[0].attrib["code"] == "noRecordsMatch"
+
+        with patch("invenio_oaiserver.response.get_listrecords_page",return_value=(MockPagination(), iter(entries))) as mock_page:
+            res = listrecords_stream(**kwargs)
+            assert mock_page.call_args[1]["chunk_size"] == 10
+            chunks = list(res)
+            assert len(chunks) == 3
+            tree = etree.fromstring(b"".join(chunks))
+            headers = tree.xpath("/x:OAI-PMH/x:ListRecords/x:record/x:header",namespaces=NAMESPACES)
+            assert [h.text for h in headers] == ["oai:1", "oai:2"]
+            assert tree.xpath("/x:OAI-PMH/x:request",namespaces=NAMESPACES)[0].attrib["verb"] == "ListRecords"
+            token = tree.xpath("/x:OAI-PMH/x:ListRecords/x:resumptionToken",namespaces=NAMESPACES)[0]
+            assert token.text == "test_token"
+            assert token.attrib["completeListSize"] == "3"
+
 # def get_error_code_msg(code=''):
 # .tox/c1/bin/pytest --cov=invenio_oaiserver tests/test_response.py::test_get_error_code_msg -vv -s --cov-branch --cov-report=term --basetemp=/code/modules/invenio-oaiserver/.tox/c1/tmp
 def test_get_error_code_msg(app):
@@ -4,7 +4,7 @@ from flask import current_app
 from invenio_records.models import RecordMetadata
 from invenio_oaiserver.models import OAISet
 
-from invenio_oaiserver.tasks import _records_commit,update_records_sets, update_affected_records
+from invenio_oaiserver.tasks import _records_commit,update_records_sets, update_affected_records, update_metadata_cache
 # .tox/c1/bin/pytest --cov=invenio_oaiserver tests/test_tasks.py -vv -s --cov-branch --cov-report=term --cov-report=html --basetemp=/code/modules/invenio-oaiserver/.tox/c1/tmp
 
 
@@ -57,4 +57,39 @@ def test_update_affected_records(app,db,without_oaiset_signals,mocker):
     
     db.session.add(oai)
     db.session.commit()
-    update_affected_records.delay(oai.spec,oai.search_pattern)
\ No newline at end of file
+    update_affected_records.delay(oai.spec,oai.search_pattern)
+
+
+# def update_metadata_cache(record_uuid):
+# .tox/c1/bin/pytest --cov=invenio_oaiserver tests/test_tasks.py::test_update_metadata_cache -vv -s --cov-branch --cov-report=term --basetemp=/code/modules/invenio-oaiserver/.tox/c1/tmp
+def test_update_metadata_cache(app,db,records,mocker):
+    mock_dump = mocker.patch("invenio_oaiserver.response.dump_metadata")
+    mocker.patch("invenio_oaiserver.response.get_identifier",return_value=None)
+
+    # cache is disabled
+    update_metadata_cache(records[0][2].id)
+    mock_dump.assert_not_called()
+
+    app.config["OAISERVER_METADATA_CACHE_ENABLED"] = True
+    # record does not exist
+    update_metadata_cache(uuid.uuid4())
+    mock_dump.assert_not_called()
+
+    # record has no oai id
+    update_metadata_cache(records[0][2].id)
+    mock_dump.assert_not_called()
+
+    record = records[0][2]
+    record.model.json = dict(record, _oai={"id": str(records[0][0]), "sets": []})
+    db.session.merge(record.model)
+    db.session.commit()
+    update_metadata_cache(record.id)
+    assert mock_dump.call_count == 1
+    args, kwargs = mock_dump.call_args
+    assert args[3] == "jpcoar_1.0"
+    assert kwargs == {"refresh": True}
+
+    # exception is raised
+    mock_dump.side_effect = Exception("test_error")
+    update_metadata_cache(record.id)
+    app.config["OAISERVER_METADATA_CACHE_ENABLED"] = False
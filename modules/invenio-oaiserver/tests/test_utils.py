@@ -17,7 +17,11 @@ from invenio_oaiserver.utils import (
     get_index_state,
     get_index_state_by_id,
     is_output_harvest,
-    get_community_index_from_set
+    get_community_index_from_set,
+    get_metadata_cache,
+    set_metadata_cache,
+    delete_metadata_cache,
+    get_metadata_cache_stats
 )
 
 from tests.helpers import create_record2
@@ -296,4 +300,54 @@ def test_get_community_index_from_set(app, db, users):
     # no exist community
     result = get_community_index_from_set("no_exist_comm")
     assert result is None
-    
\ No newline at end of file
+    
+
+
+#def get_metadata_cache(record, metadata_prefix):
+#def set_metadata_cache(record, metadata_prefix, root):
+#def delete_metadata_cache(record_uuid=None):
+#def get_metadata_cache_stats():
+# .tox/c1/bin/pytest --cov=invenio_oaiserver tests/test_utils.py::test_metadata_cache -vv -s --cov-branch --cov-report=term --basetemp=/code/modules/invenio-oaiserver/.tox/c1/tmp
+def test_metadata_cache(app, records, redis_connect):
+    record = records[0][2]
+    root = etree.fromstring('<jpcoar xmlns="https://github.com/JPCOAR/schema/blob/master/1.0/"><title>test</title></jpcoar>')
+
+    # cache is disabled
+    set_metadata_cache(record, "jpcoar_1.0", root)
+    assert get_metadata_cache(record, "jpcoar_1.0") is None
+    assert get_metadata_cache_stats() == {"hit": 0, "miss": 0}
+
+    app.config["OAISERVER_METADATA_CACHE_ENABLED"] = True
+    with app.test_request_context():
+        assert get_metadata_cache(record, "jpcoar_1.0") is None
+        set_metadata_cache(record, "jpcoar_1.0", root)
+        result = get_metadata_cache(record, "jpcoar_1.0")
+        assert etree.tostring(result) == etree.tostring(root)
+        assert get_metadata_cache(record, "oai_dc") is None
+        assert get_metadata_cache_stats() == {"hit": 1, "miss": 2}
+
+        # revision is changed
+        record["title"] = "updated"
+        record.commit()
+        assert get_metadata_cache(record, "jpcoar_1.0") is None
+        set_metadata_cache(record, "oai_dc", root)
+        assert redis_connect.hkeys("oaiserver_metadata::{}".format(record.id)) == [b"revision_id", b"oai_dc::http://app/"]
+
+        # another host is not cached
+        with app.test_request_context(base_url="http://other"):
+            set_metadata_cache(record, "jpcoar_1.0", root)
+            assert get_metadata_cache(record, "jpcoar_1.0") is None
+        assert redis_connect.hkeys("oaiserver_metadata::{}".format(record.id)) == [b"revision_id", b"oai_dc::http://app/"]
+
+        # redis error
+        with patch("invenio_oaiserver.utils._get_metadata_cache_datastore", side_effect=Exception("test_error")):
+            set_metadata_cache(record, "jpcoar_1.0", root)
+            assert get_metadata_cache(record, "jpcoar_1.0") is None
+
+        delete_metadata_cache(record.id)
+        assert not redis_connect.exists("oaiserver_metadata::{}".format(record.id))
+        set_metadata_cache(record, "jpcoar_1.0", root)
+        delete_metadata_cache()
+        assert not redis_connect.exists("oaiserver_metadata::{}".format(record.id))
+        assert get_metadata_cache_stats() == {"hit": 0, "miss": 0}
+    app.config["OAISERVER_METADATA_CACHE_ENABLED"] = False
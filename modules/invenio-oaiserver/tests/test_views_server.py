@@ -118,4 +118,19 @@ def test_dbsession_clean(app, db):
     itemtype_name3 = ItemTypeName(id=3,name="テスト3",has_site_license=True, is_active=True)
     db.session.add(itemtype_name3)
     dbsession_clean(Exception)
-    assert ItemTypeName.query.filter_by(id=3).first() is None
\ No newline at end of file
+    assert ItemTypeName.query.filter_by(id=3).first() is None
+
+
+# def response(args):
+# .tox/c1/bin/pytest --cov=invenio_oaiserver tests/test_views_server.py::test_response_streaming -vv -s --cov-branch --cov-report=term --basetemp=/code/modules/invenio-oaiserver/.tox/c1/tmp
+def test_response_streaming(app, client, mocker):
+    def mock_stream(**kwargs):
+        yield b"<?xml version='1.0' encoding='UTF-8'?>\n"
+        yield b"<OAI-PMH/>"
+    mocker.patch("invenio_oaiserver.views.server.xml.listrecords_stream", side_effect=mock_stream)
+    app.config["OAISERVER_STREAMING_RESPONSE"] = True
+    res = client.get("/oai?verb=ListRecords&metadataPrefix=jpcoar_1.0")
+    assert res.status_code == 200
+    assert res.headers["Content-Type"] == "text/xml"
+    assert res.data == b"<?xml version='1.0' encoding='UTF-8'?>\n<OAI-PMH/>"
+    app.config["OAISERVER_STREAMING_RESPONSE"] = False
@@ -21,14 +21,19 @@
 """WEKO3 module docstring."""
 
 import datetime
+import hashlib
+import io
+import json
 import os
-import shutil
 import sys
 import tempfile
 import traceback
+import zipfile
 from datetime import timedelta
 
-from flask import current_app, request, send_file
+from flask import Response, current_app, request, send_file, \
+    stream_with_context
+from flask_login import current_user
 from invenio_communities.models import Community
 from invenio_db import db
 from invenio_pidrelations.contrib.versioning import PIDVersioning
@@ -45,7 +50,8 @@ from sqlalchemy.exc import SQLAlchemyError
 from weko_deposit.api import ItemTypes, WekoRecord
 from weko_index_tree.api import Indexes
 from weko_items_ui.utils import _export_item, check_item_type_name, \
-    make_stats_file, package_export_file
+    get_export_files, make_stats_file, package_export_file
+from weko_records_ui.utils import evict_file_cache, get_cached_file
 
 from .config import INVENIO_CAPABILITY_URL, VALIDATE_MESSAGE, WEKO_ROOT_INDEX
 from .models import ChangeListIndexes, ResourceListIndexes
@@ -503,91 +509,13 @@ class ResourceListHandler(object):
         :param record_id: Identifier of record
         :return: Zip file
         """
-        include_contents = True
-        result = {'items': []}
-        temp_path = tempfile.TemporaryDirectory(
-            prefix=current_app.config['INVENIO_RESOURCESYNCSERVER_TMP_PREFIX'])
-        item_types_data = {}
         if not self._validation(record_id):
             return None
-        # Set export folder
-        export_path = temp_path.name + '/' + datetime.datetime.utcnow() \
-            .strftime(
-            "%Y%m%d%H%M%S")
-        try:
-            # Double check for limits
-            record_path = export_path + '/recid_' + str(record_id)
-            os.makedirs(record_path, exist_ok=True)
-            exported_item, list_item_role = _export_item(
-                record_id,
-                None,
-                include_contents,
-                record_path,
-            )
-
-            result['items'].append(exported_item)
-
-            item_type_id = exported_item.get('item_type_id')
-            item_type = ItemTypes.get_by_id(item_type_id)
-            if not item_types_data.get(item_type_id):
-                item_type_name = check_item_type_name(
-                    item_type.item_type_name.name)
-                item_types_data[item_type_id] = {
-                    'item_type_id': item_type_id,
-                    'name': '{}({})'.format(
-                        item_type_name,
-                        item_type_id),
-                    'root_url': request.url_root,
-                    'jsonschema': 'items/jsonschema/' + item_type_id,
-                    'keys': [],
-                    'labels': [],
-                    'recids': [],
-                    'data': {},
-                }
-            item_types_data[item_type_id]['recids'].append(record_id)
-
-            # Create export info file
-            for item_type_id in item_types_data:
-                headers, records = make_stats_file(
-                    item_type_id,
-                    item_types_data[item_type_id]['recids'],
-                    list_item_role)
-                keys, labels, is_systems, options = headers
-                item_types_data[item_type_id]['recids'].sort()
-                item_types_data[item_type_id]['keys'] = keys
-                item_types_data[item_type_id]['labels'] = labels
-                item_types_data[item_type_id]['is_systems'] = is_systems
-                item_types_data[item_type_id]['options'] = options
-                item_types_data[item_type_id]['data'] = records
-                item_type_data = item_types_data[item_type_id]
-
-                with open('{}/{}.{}'.format(export_path,
-                                            item_type_data.get('name'),
-                                            current_app.config.get(
-                                                'WEKO_ADMIN_OUTPUT_FORMAT', 'tsv')
-                                                .lower()),
-                          'w') as file:
-                    output_file = package_export_file(item_type_data)
-                    file.write(output_file.getvalue())
-
-            if self.resource_dump_manifest:
-                with open('{}/{}.xml'.format(export_path,
-                                             'manifest'),
-                          'w') as file:
-                    xml_output = self.get_resource_dump_manifest(
-                        record_id
-                    )
-                    file.write(xml_output)
-
-            # Create download file
-            shutil.make_archive(export_path, 'zip', export_path)
-        except Exception:
-            current_app.logger.error('-' * 60)
-            traceback.print_exc(file=sys.stdout)
-            current_app.logger.error('-' * 60)
-            return None
-
-        return send_file(export_path + '.zip')
+        return send_record_content_file(
+            record_id,
+            self.get_resource_dump_manifest
+            if self.resource_dump_manifest else None,
+            'resource_dump', self.repository_id)
 
 
 class ChangeListHandler(object):
@@ -1192,91 +1120,13 @@ class ChangeListHandler(object):
         :param record_id: Identifier of record
         :return: Zip file
         """
-        include_contents = True
-        result = {'items': []}
-        temp_path = tempfile.TemporaryDirectory(
-            prefix=current_app.config['INVENIO_RESOURCESYNCSERVER_TMP_PREFIX'])
-        item_types_data = {}
         if not self._is_record_in_index(record_id):
             return None
-        try:
-            # Set export folder
-            export_path = temp_path.name + '/' + datetime.datetime.utcnow()\
-                .strftime(
-                "%Y%m%d%H%M%S")
-            # Double check for limits
-            record_path = export_path + '/recid_' + str(record_id)
-            os.makedirs(record_path, exist_ok=True)
-            exported_item, list_item_role = _export_item(
-                record_id,
-                None,
-                include_contents,
-                record_path,
-            )
-
-            result['items'].append(exported_item)
-
-            item_type_id = exported_item.get('item_type_id')
-            item_type = ItemTypes.get_by_id(item_type_id)
-            if not item_types_data.get(item_type_id):
-                item_type_name = check_item_type_name(
-                    item_type.item_type_name.name)
-                item_types_data[item_type_id] = {
-                    'item_type_id': item_type_id,
-                    'name': '{}({})'.format(
-                        item_type_name,
-                        item_type_id),
-                    'root_url': request.url_root,
-                    'jsonschema': 'items/jsonschema/' + item_type_id,
-                    'keys': [],
-                    'labels': [],
-                    'recids': [],
-                    'data': {},
-                }
-            item_types_data[item_type_id]['recids'].append(record_id)
-
-            # Create export info file
-            for item_type_id in item_types_data:
-                headers, records = make_stats_file(
-                    item_type_id,
-                    item_types_data[item_type_id]['recids'],
-                    list_item_role)
-                keys, labels, is_systems, options = headers
-                item_types_data[item_type_id]['recids'].sort()
-                item_types_data[item_type_id]['keys'] = keys
-                item_types_data[item_type_id]['labels'] = labels
-                item_types_data[item_type_id]['is_systems'] = is_systems
-                item_types_data[item_type_id]['options'] = options
-                item_types_data[item_type_id]['data'] = records
-                item_type_data = item_types_data[item_type_id]
-
-                with open('{}/{}.{}'.format(export_path,
-                                            item_type_data.get('name'),
-                                            current_app.config.get(
-                                                'WEKO_ADMIN_OUTPUT_FORMAT', 'tsv')
-                                                .lower()),
-                          'w') as file:
-                    output_file = package_export_file(item_type_data)
-                    file.write(output_file.getvalue())
-
-            # Create bag
-            if self.change_dump_manifest:
-                with open('{}/{}.xml'.format(export_path,
-                                             'manifest'),
-                          'w') as file:
-                    xml_output = self.get_change_dump_manifest_xml(
-                        record_id
-                    )
-                    file.write(xml_output)
-
-            # Create download file
-            shutil.make_archive(export_path, 'zip', export_path)
-        except Exception:
-            current_app.logger.error('-' * 60)
-            traceback.print_exc(file=sys.stdout)
-            current_app.logger.error('-' * 60)
-            return None
-        return send_file(export_path + '.zip')
+        return send_record_content_file(
+            record_id,
+            self.get_change_dump_manifest_xml
+            if self.change_dump_manifest else None,
+            'change_dump', self.repository_id)
 
     @classmethod
     def get_capability_content(cls):
@@ -1378,3 +1228,210 @@ class ChangeListHandler(object):
         except BaseException as ex:
             current_app.logger.debug(ex)
             return []
+
+
+def get_record_content_entries(record_id, get_manifest=None):
+    """
+    Get the entries of the content zip of a record.
+
+    The metadata and the manifest are made in memory, the files are read
+    from the file storage when the zip is written.
+
+    :param record_id: Identifier of record
+    :param get_manifest: Function returning the manifest xml of the record
+    :return: list of the path in the zip and the bytes or the FileInstance
+    """
+    record = WekoRecord.get_record_by_pid(record_id)
+    exported_item, list_item_role = _export_item(record_id, None, False)
+    item_type_id = exported_item.get('item_type_id')
+    item_type = ItemTypes.get_by_id(item_type_id)
+    item_type_data = {
+        'item_type_id': item_type_id,
+        'name': '{}({})'.format(
+            check_item_type_name(item_type.item_type_name.name),
+            item_type_id),
+        'root_url': request.url_root,
+        'jsonschema': 'items/jsonschema/' + item_type_id,
+        'recids': [record_id],
+    }
+
+    # Create export info file
+    headers, records = make_stats_file(
+        item_type_id, item_type_data['recids'], list_item_role)
+    keys, labels, is_systems, options = headers
+    item_type_data['keys'] = keys
+    item_type_data['labels'] = labels
+    item_type_data['is_systems'] = is_systems
+    item_type_data['options'] = options
+    item_type_data['data'] = records
+    entries = [(
+        '{}.{}'.format(
+            item_type_data.get('name'),
+            current_app.config.get('WEKO_ADMIN_OUTPUT_FORMAT', 'tsv').lower()),
+        package_export_file(item_type_data).getvalue().encode('utf-8'))]
+
+    for file in get_export_files(record):
+        entries.append((
+            'recid_{}/{}'.format(record_id, file.obj.basename),
+            file.obj.file))
+
+    if get_manifest:
+        entries.append(('manifest.xml', get_manifest(record_id).encode('utf-8')))
+    return entries
+
+
+def get_record_content_cache_key(record_id, dump_type, repository_id,
+                                 with_manifest):
+    """
+    Get the cache key of the content zip of a record.
+
+    The zip depends on the record revision, the files the user can
+    download, the item type, the dump and the url of the site. As the files
+    are those the user can download now, the key changes when the embargo
+    of a file ends.
+
+    :param record_id: Identifier of record
+    :param dump_type: 'resource_dump' or 'change_dump'
+    :param repository_id: Identifier of the repository of the dump
+    :param with_manifest: True if the zip includes the manifest
+    :return: The cache key
+    """
+    record = WekoRecord.get_record_by_pid(record_id)
+    item_type = ItemTypes.get_by_id(record.get('item_type_id'))
+    key = [
+        str(record_id),
+        record.revision_id,
+        [(f.obj.key, str(f.obj.version_id)) for f in get_export_files(record)],
+        str(item_type.updated) if item_type else None,
+        dump_type,
+        str(repository_id),
+        request.url_root,
+        current_app.config.get('WEKO_ADMIN_OUTPUT_FORMAT', 'tsv'),
+        with_manifest,
+    ]
+    return hashlib.sha1(json.dumps(key).encode('utf-8')).hexdigest()
+
+
+def get_cached_record_content(cache_key):
+    """
+    Get the cached content zip of a record.
+
+    :param cache_key: The cache key
+    :return: The file path, or None if it is not cached
+    """
+    return get_cached_file(os.path.join(
+        current_app.config['INVENIO_RESOURCESYNCSERVER_DUMP_CACHE_DIR'],
+        cache_key + '.zip'))
+
+
+def evict_record_content_cache():
+    """Delete the least recently used cached zips over the size limit."""
+    evict_file_cache(
+        current_app.config['INVENIO_RESOURCESYNCSERVER_DUMP_CACHE_DIR'],
+        current_app.config['INVENIO_RESOURCESYNCSERVER_DUMP_CACHE_MAX_SIZE'])
+
+
+class _ZipStream(io.RawIOBase):
+    """Unseekable stream collecting the bytes written by ZipFile."""
+
+    def __init__(self):
+        """Init."""
+        super(_ZipStream, self).__init__()
+        self._chunks = []
+
+    def writable(self):
+        """Return True."""
+        return True
+
+    def write(self, b):
+        """Collect the bytes."""
+        self._chunks.append(bytes(b))
+        return len(b)
+
+    def pop(self):
+        """Get and forget the collected bytes."""
+        data = b''.join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def generate_zip(entries, chunk_size=1024 * 1024):
+    """
+    Generate a zip file without a temporary copy of the files.
+
+    :param entries: list of the path in the zip and the bytes or the
+        FileInstance of the entry
+    :param chunk_size: Size of the chunks read from the file storage
+    :return: generator of the bytes of the zip
+    """
+    stream = _ZipStream()
+    with zipfile.ZipFile(stream, 'w', zipfile.ZIP_DEFLATED) as zf:
+        for name, data in entries:
+            if isinstance(data, bytes):
+                zf.writestr(name, data)
+            else:
+                with data.storage().open() as src, \
+                        zf.open(name, 'w', force_zip64=True) as dest:
+                    for chunk in iter(lambda: src.read(chunk_size), b''):
+                        dest.write(chunk)
+                        yield stream.pop()
+            yield stream.pop()
+    yield stream.pop()
+
+
+def send_record_content_file(record_id, get_manifest=None, dump_type=None,
+                             repository_id=None):
+    """
+    Send the content zip of a record.
+
+    The zip is streamed while it is generated. If the dump cache is enabled,
+    the zips for anonymous users are kept and sent for the next requests
+    until the record is updated.
+
+    :param record_id: Identifier of record
+    :param get_manifest: Function returning the manifest xml of the record
+    :param dump_type: 'resource_dump' or 'change_dump'
+    :param repository_id: Identifier of the repository of the dump
+    :return: Response of the zip file
+    """
+    try:
+        cache_key = None
+        if current_app.config['INVENIO_RESOURCESYNCSERVER_DUMP_CACHE_ENABLED'] \
+                and not current_user.is_authenticated:
+            cache_key = get_record_content_cache_key(
+                record_id, dump_type, repository_id, get_manifest is not None)
+            cache_path = get_cached_record_content(cache_key)
+            if cache_path:
+                return send_file(cache_path, mimetype='application/zip',
+                                 conditional=True)
+        entries = get_record_content_entries(record_id, get_manifest)
+    except Exception:
+        current_app.logger.error('-' * 60)
+        traceback.print_exc(file=sys.stdout)
+        current_app.logger.error('-' * 60)
+        return None
+
+    def generate():
+        if not cache_key:
+            yield from generate_zip(entries)
+            return
+        cache_dir = current_app.config[
+            'INVENIO_RESOURCESYNCSERVER_DUMP_CACHE_DIR']
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp = tempfile.NamedTemporaryFile(
+            dir=cache_dir, suffix='.tmp', delete=False)
+        is_written = False
+        try:
+            with tmp:
+                for chunk in generate_zip(entries):
+                    tmp.write(chunk)
+                    yield chunk
+            os.replace(tmp.name, os.path.join(cache_dir, cache_key + '.zip'))
+            is_written = True
+            evict_record_content_cache()
+        finally:
+            if not is_written and os.path.exists(tmp.name):
+                os.remove(tmp.name)
+
+    return Response(stream_with_context(generate()),
+                    mimetype='application/zip')
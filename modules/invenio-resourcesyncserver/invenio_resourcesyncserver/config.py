@@ -8,6 +8,9 @@
 
 """Module of invenio-resourcesyncserver."""
 
+import os
+import tempfile
+
 # TODO: This is an example file. Remove it if your package does not use any
 # extra configuration variables.
 
@@ -46,3 +49,15 @@ VALIDATE_MESSAGE = 'Selected repository has been registered already. ' \
 """Validate message."""
 
 INVENIO_RESOURCESYNCSERVER_TMP_PREFIX = 'weko_resync_'
+
+INVENIO_RESOURCESYNCSERVER_DUMP_CACHE_ENABLED = False
+"""Keep the content zips of the records sent to anonymous users to serve the
+next requests until the records are updated."""
+
+INVENIO_RESOURCESYNCSERVER_DUMP_CACHE_DIR = os.path.join(
+    tempfile.gettempdir(), 'weko_resync_dumps')
+"""Directory of the cached content zips."""
+
+INVENIO_RESOURCESYNCSERVER_DUMP_CACHE_MAX_SIZE = 10 * 1024 * 1024 * 1024
+"""Total size in bytes of the cached zips, the least recently used are
+deleted over it."""
@@ -1,5 +1,7 @@
+import io
 import os
 import json
+import zipfile
 import copy
 import pytest
 import unittest
@@ -10,7 +12,8 @@ from flask_login import current_user
 from flask_babelex import Babel
 from invenio_communities.models import Community
 
-from invenio_resourcesyncserver.api import ResourceListHandler, ChangeListHandler
+from invenio_resourcesyncserver.api import ResourceListHandler, ChangeListHandler, \
+    generate_zip, get_record_content_cache_key, send_record_content_file
 from invenio_resourcesyncserver.models import ChangeListIndexes, ResourceListIndexes
 
 
@@ -332,7 +335,9 @@ def test_get_record_content_file_ResourceListHandler(i18n_app):
         assert not test.get_record_content_file(1)
 
     with patch("invenio_resourcesyncserver.api.ResourceListHandler._validation", return_value=True):
-        with patch("invenio_resourcesyncserver.api._export_item", return_value=[data1, data2]):
+        with patch("invenio_resourcesyncserver.api.WekoRecord.get_record_by_pid", return_value=MagicMock()), \
+                patch("invenio_resourcesyncserver.api.get_export_files", return_value=[]), \
+                patch("invenio_resourcesyncserver.api._export_item", return_value=[data1, data2]):
             with patch("weko_deposit.api.ItemTypes.get_by_id", return_value=data3):
                 with patch("invenio_resourcesyncserver.api.check_item_type_name", return_value=data3):
                     with patch("invenio_resourcesyncserver.api.make_stats_file", return_value=[data4, data2]):
@@ -342,6 +347,104 @@ def test_get_record_content_file_ResourceListHandler(i18n_app):
                     assert not test.get_record_content_file(1)
 
 
+# def generate_zip(entries, chunk_size=1024 * 1024):
+# .tox/c1/bin/pytest --cov=invenio_resourcesyncserver tests/test_api.py::test_generate_zip -vv -s --cov-branch --cov-report=term --basetemp=/code/modules/invenio-resourcesyncserver/.tox/c1/tmp
+def test_generate_zip(tmpdir):
+    content = os.urandom(3 * 1024) * 10
+    path = tmpdir.join("helloworld.pdf")
+    path.write_binary(content)
+    file_instance = MagicMock()
+    file_instance.storage.return_value.open.side_effect = lambda: open(str(path), "rb")
+
+    data = b"".join(generate_zip([
+        ("item(1).tsv", "タイトル\ttitle".encode("utf-8")),
+        ("recid_1/helloworld.pdf", file_instance),
+        ("manifest.xml", b"<xml/>"),
+    ], chunk_size=1024))
+    with zipfile.ZipFile(io.BytesIO(data)) as zf:
+        assert zf.namelist() == ["item(1).tsv", "recid_1/helloworld.pdf", "manifest.xml"]
+        assert zf.read("item(1).tsv").decode("utf-8") == "タイトル\ttitle"
+        assert zf.read("recid_1/helloworld.pdf") == content
+        assert zf.read("manifest.xml") == b"<xml/>"
+        assert zf.testzip() is None
+
+
+# def send_record_content_file(record_id, get_manifest=None, dump_type=None, repository_id=None):
+# .tox/c1/bin/pytest --cov=invenio_resourcesyncserver tests/test_api.py::test_send_record_content_file -vv -s --cov-branch --cov-report=term --basetemp=/code/modules/invenio-resourcesyncserver/.tox/c1/tmp
+def test_send_record_content_file(i18n_app, tmpdir):
+    entries = [("item(1).tsv", b"data")]
+    i18n_app.config.update(
+        INVENIO_RESOURCESYNCSERVER_DUMP_CACHE_ENABLED=False,
+        INVENIO_RESOURCESYNCSERVER_DUMP_CACHE_DIR=str(tmpdir.join("dumps")),
+        INVENIO_RESOURCESYNCSERVER_DUMP_CACHE_MAX_SIZE=1024 * 1024)
+    with i18n_app.test_request_context():
+        with patch("invenio_resourcesyncserver.api.get_record_content_entries", return_value=entries) as mock_entries:
+            # not cached
+            res = send_record_content_file(1)
+            with zipfile.ZipFile(io.BytesIO(b"".join(res.response))) as zf:
+                assert zf.read("item(1).tsv") == b"data"
+            assert res.mimetype == "application/zip"
+            assert not os.path.exists(str(tmpdir.join("dumps")))
+
+            i18n_app.config.update(INVENIO_RESOURCESYNCSERVER_DUMP_CACHE_ENABLED=True)
+            with patch("invenio_resourcesyncserver.api.get_record_content_cache_key", return_value="key1"):
+                # the zip is cached while it is sent
+                res = send_record_content_file(1)
+                data = b"".join(res.response)
+                with open(str(tmpdir.join("dumps", "key1.zip")), "rb") as f:
+                    assert f.read() == data
+                assert os.listdir(str(tmpdir.join("dumps"))) == ["key1.zip"]
+
+                # the cached zip is sent without making the entries
+                mock_entries.reset_mock()
+                with patch("invenio_resourcesyncserver.api.generate_zip") as mock_generate:
+                    res = send_record_content_file(1)
+                    res.direct_passthrough = False
+                    assert res.get_data() == data
+                    mock_generate.assert_not_called()
+                    mock_entries.assert_not_called()
+
+                # the cache is not written if the zip is not finished
+                with patch("invenio_resourcesyncserver.api.get_cached_record_content", return_value=None):
+                    res = send_record_content_file(1)
+                    next(iter(res.response))
+                    res.close()
+                    assert os.listdir(str(tmpdir.join("dumps"))) == ["key1.zip"]
+
+            # the least recently used zips are deleted
+            i18n_app.config.update(INVENIO_RESOURCESYNCSERVER_DUMP_CACHE_MAX_SIZE=len(data))
+            with patch("invenio_resourcesyncserver.api.get_record_content_cache_key", return_value="key2"):
+                b"".join(send_record_content_file(1).response)
+            assert os.listdir(str(tmpdir.join("dumps"))) == ["key2.zip"]
+
+        mock_entries.side_effect = Exception("test")
+        assert send_record_content_file(1) is None
+
+
+# def get_record_content_cache_key(record_id, dump_type, repository_id, with_manifest):
+# .tox/c1/bin/pytest --cov=invenio_resourcesyncserver tests/test_api.py::test_get_record_content_cache_key -vv -s --cov-branch --cov-report=term --basetemp=/code/modules/invenio-resourcesyncserver/.tox/c1/tmp
+def test_get_record_content_cache_key(i18n_app):
+    record = MagicMock(revision_id=2)
+    open_file = MagicMock()
+    open_file.obj.key = "open.pdf"
+    open_file.obj.version_id = "v1"
+    embargo_file = MagicMock()
+    embargo_file.obj.key = "embargo.pdf"
+    embargo_file.obj.version_id = "v2"
+    with i18n_app.test_request_context(), \
+            patch("invenio_resourcesyncserver.api.WekoRecord.get_record_by_pid", return_value=record), \
+            patch("invenio_resourcesyncserver.api.ItemTypes.get_by_id", return_value=None), \
+            patch("invenio_resourcesyncserver.api.get_export_files", return_value=[open_file]) as mock_files:
+        key = get_record_content_cache_key(1, "resource_dump", 1, True)
+        assert get_record_content_cache_key(1, "resource_dump", 1, True) == key
+        # the dump and the repository change the key
+        assert get_record_content_cache_key(1, "change_dump", 1, True) != key
+        assert get_record_content_cache_key(1, "resource_dump", 2, True) != key
+        # the key changes when the embargo of a file ends
+        mock_files.return_value = [open_file, embargo_file]
+        assert get_record_content_cache_key(1, "resource_dump", 1, True) != key
+
+
 # class ChangeListHandler(object):
 #     def __init__(self, **kwargs):
 #     def save(self):
@@ -289,7 +289,12 @@ class StatAggregator(object):
         return parser.parse(result[0]['timestamp'])
 
     def agg_iter(self, lower_limit=None, upper_limit=None, manual=False):
-        """Aggregate and return dictionary to be indexed in ES."""
+        """Aggregate and return dictionary to be indexed in ES.
+
+        The buckets are fetched page by page with a composite aggregation,
+        so that only one page of STATS_AGGREGATION_PAGE_SIZE buckets is held
+        at a time.
+        """
         logger = get_task_logger(__name__)
 
         lower_limit = (
@@ -299,7 +304,6 @@ class StatAggregator(object):
         )
         upper_limit = upper_limit or (
             datetime.datetime.utcnow().replace(microsecond=0).isoformat())
-        aggregation_data = {}
 
         self.agg_query = Search(using=self.client,
                                 index=self.event_index).\
@@ -311,38 +315,57 @@ class StatAggregator(object):
         for modifier in self.query_modifiers:
             self.agg_query = modifier(self.agg_query)
 
-        hist = self.agg_query.aggs.bucket(
-            'histogram',
-            'date_histogram',
-            field='timestamp',
-            interval=self.aggregation_interval
-        )
-        terms = hist.bucket(
-            'terms', 'terms', field=self.aggregation_field,
-            size=current_app.config['STATS_ES_INTEGER_MAX_VALUE']
-        )
-        # FIXME: Paginate?
-        top = terms.metric(
-            'top_hit', 'top_hits', size=1, sort={'timestamp': 'desc'}
-        )
+        composite = {
+            'sources': [
+                {'timestamp': {'date_histogram': {
+                    'field': 'timestamp',
+                    'interval': self.aggregation_interval}}},
+                {'terms': {'terms': {'field': self.aggregation_field}}}
+            ],
+            'size': current_app.config.get('STATS_AGGREGATION_PAGE_SIZE', 1000)
+        }
+        aggs = {
+            'top_hit': {
+                'top_hits': {'size': 1, 'sort': {'timestamp': 'desc'}}
+            }
+        }
         for dst, (metric, src, opts) in self.metric_aggregation_fields.items():
-            terms.metric(dst, metric, field=src, **opts)
-        logger.debug("agg_query query: {}".format(self.agg_query))
-        results = self.agg_query.execute()
-        logger.debug("agg_query result: {}".format(len(results)))
-        for interval in results.aggregations['histogram'].buckets:
-            interval_date = datetime.datetime.strptime(
-                interval['key_as_string'], '%Y-%m-%dT%H:%M:%S')
-            for aggregation in interval['terms'].buckets:
+            aggs[dst] = {metric: dict(field=src, **opts)}
+        body = self.agg_query.extra(size=0).to_dict()
+        body['aggs'] = {'composite': {'composite': composite, 'aggs': aggs}}
+        index_name = '{0}-stats-{1}'.\
+                     format(self.search_index_prefix, self.event)
+        logger.debug("index_name: {}".format(index_name))
+
+        while True:
+            logger.debug("agg_query query: {}".format(body))
+            results = self.client.search(index=self.event_index, body=body)
+            agg = results['aggregations']['composite']
+            buckets = agg['buckets']
+            logger.debug("agg_query result: {}".format(len(buckets)))
+            if not buckets:
+                break
+
+            target_indices = {}
+            if manual:
+                target_indices = self._get_target_indices(
+                    index_name, [b['key']['terms'] for b in buckets])
+
+            rtn_datas = []
+            for aggregation in buckets:
+                key = aggregation['key']['terms']
+                interval_date = datetime.datetime.utcfromtimestamp(
+                    aggregation['key']['timestamp'] / 1000)
+                aggregation_data = {}
                 aggregation_data['timestamp'] = interval_date.isoformat()
-                aggregation_data[self.aggregation_field] = aggregation['key']
+                aggregation_data[self.aggregation_field] = key
                 aggregation_data['count'] = aggregation['doc_count']
 
                 if self.metric_aggregation_fields:
                     for f in self.metric_aggregation_fields:
                         aggregation_data[f] = aggregation[f]['value']
 
-                doc = aggregation.top_hit.hits.hits[0]['_source']
+                doc = aggregation['top_hit']['hits']['hits'][0]['_source']
                 for destination, source in self.copy_fields.items():
                     if isinstance(source, six.string_types):
                         if source == 'root_file_id' and source not in doc:
@@ -356,32 +379,49 @@ class StatAggregator(object):
                             aggregation_data
                         )
 
-                index_name = '{0}-stats-{1}'.\
-                             format(self.search_index_prefix, self.event)
-                logger.debug("index_name: {}".format(index_name))
-
-                if manual:
-                    res = Search(using=self.client,
-                                 index=index_name).\
-                        filter('term', unique_id=aggregation['key']).\
-                        execute()
-                    
-                    if res.hits.total > 0:
-                        index_name = res.hits.hits[0]['_index']
-
                 rtn_data = dict(
-                    _id='{0}'.format(aggregation['key']),
-                    _index=index_name,
+                    _id='{0}'.format(key),
+                    _index=target_indices.get(key, index_name),
                     _type=self.aggregation_doc_type,
                     _source=aggregation_data
                 )
-                self.indices.add(index_name)
-                if current_app.config['STATS_WEKO_DB_BACKUP_AGGREGATION']:
-                    # Save stats aggregation into Database.
-                    StatsAggregation.save(rtn_data, delete=True)
+                self.indices.add(rtn_data['_index'])
+                rtn_datas.append(rtn_data)
+
+            if current_app.config['STATS_WEKO_DB_BACKUP_AGGREGATION']:
+                # Save stats aggregation into Database.
+                StatsAggregation.save_all(rtn_datas)
 
+            for rtn_data in rtn_datas:
                 yield rtn_data
 
+            after_key = agg.get('after_key') or buckets[-1]['key']
+            if len(buckets) < composite['size']:
+                break
+            composite['after'] = after_key
+
+    def _get_target_indices(self, index_name, keys):
+        """Get the indices in which the aggregations are already saved.
+
+        :param index_name: alias of the aggregation indices.
+        :param keys: unique ids of the aggregations.
+        :returns: dictionary of the unique id and the index.
+        """
+        res = self.client.search(
+            index=index_name,
+            body={
+                'query': {'terms': {'unique_id': keys}},
+                'collapse': {'field': 'unique_id'},
+                '_source': ['unique_id'],
+                'size': len(keys)
+            },
+            ignore=[404]
+        )
+        return {
+            hit['_source']['unique_id']: hit['_index']
+            for hit in res.get('hits', {}).get('hits', [])
+        }
+
     def run(self, start_date=None, end_date=None, update_bookmark=True, manual=False):
         """Calculate statistics aggregations."""
         # If no events have been indexed there is nothing to aggregate
@@ -209,8 +209,23 @@ STATS_WEKO_DEFAULT_TIMEZONE = get_timezone
 STATS_WEKO_DB_BACKUP_EVENTS = True
 """Enable DB backup of events."""
 
+STATS_EVENTS_BULK_CHUNK_SIZE = 50
+"""Number of events indexed and saved into DB at once."""
+
+STATS_EVENTS_BULK_THREAD_COUNT = 1
+"""Number of chunks of events indexed in parallel."""
+
 STATS_WEKO_DB_BACKUP_AGGREGATION = False
 """Enable DB backup of aggregation."""
 
+STATS_AGGREGATION_PAGE_SIZE = 1000
+"""Number of buckets fetched at once by the aggregators."""
+
 STATS_WEKO_DB_BACKUP_BOOKMARK = False
 """Enable DB backup of bookmark."""
+
+STATS_REPORT_ROLLUP_ENABLED = False
+"""Read the reports of the past months from the rollup table.
+
+The table is filled by ``invenio_stats.tasks.rollup_reports``.
+"""
@@ -136,21 +136,8 @@ class _StataModelBase(Timestamp):
         :return:
         """
         try:
-            if data_object.get("_source"):
-                date = None
-                if 'timestamp' in data_object.get("_source"):
-                    date = data_object.get("_source").get("timestamp")
-                elif 'date' in data_object.get("_source"):
-                    date = data_object.get("_source").get("date")
-                stats_data = {
-                    'id': _generate_id(),
-                    'source_id': data_object.get("_id"),
-                    'index': data_object.get("_index"),
-                    'type': data_object.get("_type"),
-                    'source': json.dumps(data_object.get("_source")),
-                    'date': date
-                }
-            else:
+            stats_data = cls._get_stats_data(data_object)
+            if not stats_data:
                 return False
             uq_stats_key = cls.get_uq_key()
             stmt = insert(cls)
@@ -166,6 +153,62 @@ class _StataModelBase(Timestamp):
             db.session.rollback()
             return False
 
+    @classmethod
+    def save_all(cls, data_objects: list) -> bool:
+        """Save stats events with one multi-row insert.
+
+        :param data_objects: stats event objects.
+        :return:
+        """
+        uq_stats_key = cls.get_uq_key()
+        uq_columns = next(
+            c.columns for c in cls.__table__.constraints
+            if c.name == uq_stats_key)
+        # A row can be updated only once in an insert, the last one is saved.
+        rows = {}
+        for data_object in data_objects:
+            stats_data = cls._get_stats_data(data_object)
+            if stats_data:
+                key = tuple(stats_data[c.name] for c in uq_columns)
+                rows[key] = stats_data
+        if not rows:
+            return False
+        try:
+            stmt = insert(cls).values(list(rows.values()))
+            db.session.execute(
+                stmt.on_conflict_do_update(
+                    set_={'source': stmt.excluded.source},
+                    constraint=uq_stats_key))
+            db.session.commit()
+            return True
+        except SQLAlchemyError as err:
+            current_app.logger.error("Unexpected error: {}".format(err))
+            db.session.rollback()
+            return False
+
+    @classmethod
+    def _get_stats_data(cls, data_object: dict) -> dict:
+        """Get the row of stats event.
+
+        :param data_object:stats event object.
+        :return:
+        """
+        if not data_object.get("_source"):
+            return None
+        date = None
+        if 'timestamp' in data_object.get("_source"):
+            date = data_object.get("_source").get("timestamp")
+        elif 'date' in data_object.get("_source"):
+            date = data_object.get("_source").get("date")
+        return {
+            'id': _generate_id(),
+            'source_id': data_object.get("_id"),
+            'index': data_object.get("_index"),
+            'type': data_object.get("_type"),
+            'source': json.dumps(data_object.get("_source")),
+            'date': date
+        }
+
 
 class StatsEvents(db.Model, _StataModelBase):
     """Database for Stats events."""
@@ -213,6 +256,102 @@ class StatsBookmark(db.Model, _StataModelBase):
         return "uq_stats_key_stats_bookmark"
 
 
+class StatsReportRollup(db.Model, Timestamp):
+    """Database for the reports of the past months.
+
+    A report is stored by its name, its month and a key of the other
+    parameters of the report (event, repository...).
+    """
+
+    __tablename__ = "stats_report_rollup"
+
+    __table_args__ = (
+        db.UniqueConstraint('report', 'target_month', 'params_key',
+                            name='uq_stats_report_rollup'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    report = db.Column(db.String(100), nullable=False)
+    target_month = db.Column(db.String(7), nullable=False, index=True)
+    params_key = db.Column(db.String(40), nullable=False)
+    params = db.Column(
+        db.JSON()
+        .with_variant(postgresql.JSONB(none_as_null=True), "postgresql",)
+        .with_variant(JSONType(), "sqlite",)
+        .with_variant(JSONType(), "mysql",),
+        default=lambda: dict(),
+        nullable=True,
+    )
+    data = db.Column(
+        db.JSON()
+        .with_variant(postgresql.JSONB(none_as_null=True), "postgresql",)
+        .with_variant(JSONType(), "sqlite",)
+        .with_variant(JSONType(), "mysql",),
+        default=lambda: dict(),
+        nullable=True,
+    )
+
+    @classmethod
+    def get_params_key(cls, params: dict) -> str:
+        """Get the key of the report parameters.
+
+        :param params: report parameters.
+        :return:
+        """
+        return hashlib.sha1(
+            json.dumps(params, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+
+    @classmethod
+    def get_data(cls, report: str, target_month: str, params: dict):
+        """Get the stored report.
+
+        :param report: report name.
+        :param target_month: month of the report, YYYY-MM.
+        :param params: report parameters.
+        :return: the report, None if it is not stored.
+        """
+        rollup = cls.query.filter_by(
+            report=report,
+            target_month=target_month,
+            params_key=cls.get_params_key(params)
+        ).one_or_none()
+        return rollup.data if rollup else None
+
+    @classmethod
+    def save_data(cls, report: str, target_month: str, params: dict,
+                  data) -> bool:
+        """Save the report, the stored one is replaced.
+
+        :param report: report name.
+        :param target_month: month of the report, YYYY-MM.
+        :param params: report parameters.
+        :param data: the report.
+        :return:
+        """
+        try:
+            now = datetime.utcnow()
+            stmt = insert(cls)
+            db.session.execute(
+                stmt.on_conflict_do_update(
+                    set_={'data': stmt.excluded.data,
+                          'updated': stmt.excluded.updated},
+                    constraint='uq_stats_report_rollup'),
+                {'report': report,
+                 'target_month': target_month,
+                 'params_key': cls.get_params_key(params),
+                 'params': params,
+                 'data': data,
+                 'created': now,
+                 'updated': now})
+            db.session.commit()
+            return True
+        except SQLAlchemyError as err:
+            current_app.logger.error("Unexpected error: {}".format(err))
+            db.session.rollback()
+            return False
+
+
 def _generate_id():
     """Generate identifier.
 
@@ -255,4 +394,5 @@ __all__ = [
     "StatsEvents",
     "StatsBookmark",
     "StatsAggregation",
+    "StatsReportRollup",
 ]
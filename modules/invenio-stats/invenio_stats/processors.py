@@ -11,8 +11,8 @@
 from __future__ import absolute_import, print_function
 
 import hashlib
-from itertools import tee
-from time import mktime
+from itertools import islice, tee
+from time import mktime, time
 
 import arrow
 import elasticsearch
@@ -187,8 +187,12 @@ class EventsIndexer(object):
         ] if preprocessors is not None else self.default_preprocessors
         self.double_click_window = double_click_window
 
-    def actionsiter(self):
-        """Iterator."""
+    def actionsiter(self, save_events=True):
+        """Iterator.
+
+        :param save_events: save each event into Database if
+            STATS_WEKO_DB_BACKUP_EVENTS is enabled.
+        """
         for msg in self.queue.consume():
             try:
                 for preproc in self.preprocessors:
@@ -226,7 +230,8 @@ class EventsIndexer(object):
                     _type=self.doctype,
                     _source=msg,
                 )
-                if current_app.config['STATS_WEKO_DB_BACKUP_EVENTS']:
+                if save_events and \
+                        current_app.config['STATS_WEKO_DB_BACKUP_EVENTS']:
                     # Save stats event into Database.
                     StatsEvents.save(rtn_data, True)
 
@@ -235,10 +240,46 @@ class EventsIndexer(object):
                 current_app.logger.exception(u'Error while processing event')
 
     def run(self):
-        """Process events queue."""
-        return elasticsearch.helpers.bulk(
-            self.client,
-            self.actionsiter(),
-            stats_only=True,
-            chunk_size=50
-        )
+        """Process events queue.
+
+        The events are indexed by chunks of STATS_EVENTS_BULK_CHUNK_SIZE,
+        and each chunk is saved into Database with one insert just before
+        it is indexed. With STATS_EVENTS_BULK_THREAD_COUNT > 1, that many
+        chunks are indexed in parallel.
+
+        :returns: number of the indexed events and the errors.
+        """
+        chunk_size = current_app.config.get('STATS_EVENTS_BULK_CHUNK_SIZE', 50)
+        thread_count = current_app.config.get(
+            'STATS_EVENTS_BULK_THREAD_COUNT', 1)
+        save_events = current_app.config['STATS_WEKO_DB_BACKUP_EVENTS']
+        start = time()
+        success = failed = 0
+        actions = self.actionsiter(save_events=False)
+        while True:
+            batch = list(islice(actions, chunk_size * thread_count))
+            if not batch:
+                break
+            if save_events:
+                # Save stats events into Database.
+                for i in range(0, len(batch), chunk_size):
+                    StatsEvents.save_all(batch[i:i + chunk_size])
+            if thread_count > 1:
+                for ok, _ in elasticsearch.helpers.parallel_bulk(
+                        self.client, batch, thread_count=thread_count,
+                        chunk_size=chunk_size):
+                    if ok:
+                        success += 1
+                    else:
+                        failed += 1
+            else:
+                indexed, errors = elasticsearch.helpers.bulk(
+                    self.client, batch, stats_only=True, chunk_size=chunk_size)
+                success += indexed
+                failed += errors
+        elapsed = time() - start
+        current_app.logger.info(
+            'Indexed {0} events into {1} in {2:.1f}s ({3:.1f} events/sec).'
+            .format(success, self.index, elapsed,
+                    success / elapsed if elapsed else 0))
+        return success, failed
@@ -10,9 +10,12 @@
 
 from __future__ import absolute_import, print_function
 
+from datetime import datetime, timedelta
+
 from celery import shared_task
 from celery.utils.log import get_task_logger
 from dateutil.parser import parse as dateutil_parse
+from flask import current_app
 
 from .proxies import current_stats
 
@@ -45,3 +48,70 @@ def aggregate_events(aggregations, start_date=None, end_date=None,
             name=aggr_cfg.name, **aggr_cfg.aggregator_config)
         results.append(aggregator.run(start_date, end_date, update_bookmark, manual))
     return results
+
+
+@shared_task(ignore_result=True)
+def rollup_reports(year=None, month=None):
+    """Store the reports of a past month into the rollup table.
+
+    The last month is stored by default, so the events aggregated late are
+    taken into account the next night.
+    """
+    from invenio_communities.models import Community
+    from invenio_search import current_search_client
+
+    from . import config
+    from .utils import QueryCommonReportsHelper, QueryFileReportsHelper, \
+        QueryItemRegReportHelper, QueryRecordViewPerIndexReportHelper, \
+        QueryRecordViewReportHelper, QuerySearchReportHelper, \
+        get_start_end_date, pop_report_error, save_rollup_report
+
+    if not current_app.config.get('STATS_REPORT_ROLLUP_ENABLED'):
+        return
+    logger = get_task_logger(__name__)
+    if not year or not month:
+        last_month = datetime.now().replace(day=1) - timedelta(days=1)
+        year, month = last_month.year, last_month.month
+    # The helpers return an empty report on error, which must not be stored.
+    if not current_search_client.ping():
+        logger.error("rollup_reports: Elasticsearch is not available.")
+        return
+
+    def _rollup(helper, **kwargs):
+        pop_report_error()
+        data = helper.get(use_rollup=False, **kwargs)
+        if pop_report_error():
+            logger.error("rollup_reports: {} {} not stored.".format(
+                helper.rollup_name, kwargs))
+        elif data:
+            save_rollup_report(helper.rollup_name, data, **kwargs)
+        return data
+
+    start_date, end_date = get_start_end_date(year, month)
+    repository_ids = ['Root Index'] + \
+        [c.id for c in Community.query.all()]
+    for repository_id in repository_ids:
+        params = {'year': year, 'month': month,
+                  'repository_id': repository_id}
+        for event in ['file_download', 'file_preview', 'file_using_per_user',
+                      'billing_file_download', 'billing_file_preview']:
+            _rollup(QueryFileReportsHelper, event=event, **params)
+        for event in ['top_page_access', 'site_access', 'item_create']:
+            _rollup(QueryCommonReportsHelper, event=event, **params)
+        _rollup(QuerySearchReportHelper, **params)
+        _rollup(QueryRecordViewReportHelper, **params)
+        _rollup(QueryRecordViewPerIndexReportHelper, **params)
+        for target_report in config.TARGET_REPORTS.values():
+            for unit in ['Day', 'Week', 'Year', 'Item', 'Host', 'User']:
+                page_index = 0
+                num_page = 1
+                while page_index < num_page:
+                    data = _rollup(
+                        QueryItemRegReportHelper,
+                        target_report=target_report, start_date=start_date,
+                        end_date=end_date, unit=unit, page_index=page_index,
+                        repository_id=repository_id)
+                    num_page = data.get('num_page', 0)
+                    page_index += 1
+    logger.info("rollup_reports: {}-{} stored.".format(
+        year, str(month).zfill(2)))
@@ -15,6 +15,7 @@ from itertools import islice
 import operator
 import os
 import re
+import threading
 from base64 import b64encode
 from datetime import datetime, timedelta
 from math import ceil
@@ -40,7 +41,8 @@ from weko_accounts.utils import get_remote_addr
 from werkzeug.utils import import_string
 
 from . import config
-from .models import StatsAggregation, StatsBookmark, StatsEvents
+from .models import StatsAggregation, StatsBookmark, StatsEvents, \
+    StatsReportRollup
 from .permissions import stats_api_permission
 from .proxies import current_stats
 
@@ -236,9 +238,105 @@ def chunk_list(iterable, size):
         yield chunk
 
 
+def get_rollup_target_month(year=None, month=None, start_date=None,
+                            end_date=None, **kwargs):
+    """Get the month of a report which can be stored in the rollup table.
+
+    Only the report of a whole past month is stored, the report of the
+    current month is always computed.
+
+    :param year: year of the report.
+    :param month: month of the report.
+    :param start_date: start date of the report, YYYY-MM-DD.
+    :param end_date: end date of the report, YYYY-MM-DD.
+    :return: the month as YYYY-MM, None if the report is not stored.
+    """
+    try:
+        if start_date or end_date:
+            start = datetime.strptime(start_date, '%Y-%m-%d')
+            end = datetime.strptime(end_date, '%Y-%m-%d')
+            _, lastday = calendar.monthrange(start.year, start.month)
+            if start.day != 1 or end != start.replace(day=lastday):
+                return None
+            year, month = start.year, start.month
+        elif year and month:
+            year, month = int(year), int(month)
+            if not 0 < month <= 12:
+                return None
+        else:
+            return None
+    except (TypeError, ValueError):
+        return None
+    now = datetime.now()
+    if (year, month) >= (now.year, now.month):
+        return None
+    return str(year) + '-' + str(month).zfill(2)
+
+
+def get_rollup_params(**kwargs):
+    """Get the parameters identifying a report in the rollup table.
+
+    :return:
+    """
+    params = {k: v for k, v in kwargs.items()
+              if v is not None and k not in ('year', 'month', 'use_rollup')}
+    params['repository_id'] = params.get('repository_id') or 'Root Index'
+    return params
+
+
+def get_rollup_report(report, **kwargs):
+    """Get the report of a past month from the rollup table.
+
+    :param report: report name.
+    :return: the report, None if the report has to be computed.
+    """
+    if not current_app.config.get('STATS_REPORT_ROLLUP_ENABLED') \
+            or not kwargs.get('use_rollup', True):
+        return None
+    target_month = get_rollup_target_month(**kwargs)
+    if not target_month:
+        return None
+    return StatsReportRollup.get_data(report, target_month,
+                                      get_rollup_params(**kwargs))
+
+
+_report_state = threading.local()
+
+
+def mark_report_error():
+    """Remember that a report helper returned a report after an error."""
+    _report_state.error = True
+
+
+def pop_report_error():
+    """Return whether a report error was remembered since the last call.
+
+    :return: True if a report helper hit an error.
+    """
+    error = getattr(_report_state, 'error', False)
+    _report_state.error = False
+    return error
+
+
+def save_rollup_report(report, data, **kwargs):
+    """Save the report of a past month into the rollup table.
+
+    :param report: report name.
+    :param data: the report.
+    :return:
+    """
+    target_month = get_rollup_target_month(**kwargs)
+    if not target_month:
+        return False
+    return StatsReportRollup.save_data(report, target_month,
+                                       get_rollup_params(**kwargs), data)
+
+
 class QueryFileReportsHelper(object):
     """Helper for parsing elasticsearch aggregations."""
 
+    rollup_name = 'file_reports'
+
     @classmethod
     def calc_per_group_counts(cls, group_names, current_stats, current_count):
         """Count the downloads for group."""
@@ -390,6 +488,7 @@ class QueryFileReportsHelper(object):
                 cls.Calculation(open_access_res, open_access_list)
         except Exception as e:
             current_app.logger.error(e)
+            mark_report_error()
             traceback.print_exc()
 
         result['date'] = query_month
@@ -434,6 +533,7 @@ class QueryFileReportsHelper(object):
 
         except Exception as e:
             current_app.logger.error(e)
+            mark_report_error()
             traceback.print_exc()
 
         result['date'] = query_month
@@ -444,6 +544,9 @@ class QueryFileReportsHelper(object):
     @classmethod
     def get(cls, **kwargs):
         """Get file reports."""
+        rollup = get_rollup_report(cls.rollup_name, **kwargs)
+        if rollup is not None:
+            return rollup
         event = kwargs.get('event')
         if event == 'file_download' or event == 'file_preview':
             return cls.get_file_stats_report(**kwargs)
@@ -458,6 +561,8 @@ class QueryFileReportsHelper(object):
 class QuerySearchReportHelper(object):
     """Search Report helper."""
 
+    rollup_name = 'search_report'
+
     @classmethod
     def parse_bucket_response(cls, raw_res, pretty_result):
         """Parsing bucket response."""
@@ -473,6 +578,9 @@ class QuerySearchReportHelper(object):
     @classmethod
     def get(cls, **kwargs):
         """Get number of searches per keyword."""
+        rollup = get_rollup_report(cls.rollup_name, **kwargs)
+        if rollup is not None:
+            return rollup
         result = {}
         year = kwargs.get('year')
         month = kwargs.get('month')
@@ -511,6 +619,7 @@ class QuerySearchReportHelper(object):
             result['all'] = []
         except Exception as e:
             current_app.logger.debug(e)
+            mark_report_error()
             result['all'] = []
 
         return result
@@ -519,6 +628,8 @@ class QuerySearchReportHelper(object):
 class QueryCommonReportsHelper(object):
     """CommonReports helper class."""
 
+    rollup_name = 'common_reports'
+
     @classmethod
     def get_common_params(cls, **kwargs):
         """Get common params."""
@@ -557,6 +668,9 @@ class QueryCommonReportsHelper(object):
     @classmethod
     def get(cls, **kwargs):
         """Get file reports."""
+        rollup = get_rollup_report(cls.rollup_name, **kwargs)
+        if rollup is not None:
+            return rollup
         event = kwargs.get('event')
         if event == 'top_page_access':
             return cls.get_top_page_access_report(**kwargs)
@@ -613,6 +727,7 @@ class QueryCommonReportsHelper(object):
 
         except Exception as e:
             current_app.logger.debug(e)
+            mark_report_error()
 
         result['date'] = query_month
         result['all'] = all_list
@@ -672,6 +787,7 @@ class QueryCommonReportsHelper(object):
 
         except Exception as e:
             current_app.logger.debug(e)
+            mark_report_error()
 
         result['date'] = query_month
         result['site_license'] = [site_license_list]
@@ -707,6 +823,7 @@ class QueryCommonReportsHelper(object):
             Calculation(res, data_list)
         except Exception as e:
             current_app.logger.debug(e)
+            mark_report_error()
 
         result['date'] = query_date
         result['all'] = data_list
@@ -716,6 +833,8 @@ class QueryCommonReportsHelper(object):
 class QueryRecordViewPerIndexReportHelper(object):
     """RecordViewPerIndex helper class."""
 
+    rollup_name = 'record_view_per_index_report'
+
     nested_path = 'record_index_list'
     index_id_field = 'record_index_list.index_id'
     index_name_field = 'record_index_list.index_name'
@@ -774,6 +893,9 @@ class QueryRecordViewPerIndexReportHelper(object):
         from weko_index_tree.utils import get_descendant_index_names
         from invenio_communities.models import Community
 
+        rollup = get_rollup_report(cls.rollup_name, **kwargs)
+        if rollup is not None:
+            return rollup
         result = {}
         year = kwargs.get('year')
         month = kwargs.get('month')
@@ -810,6 +932,7 @@ class QueryRecordViewPerIndexReportHelper(object):
 
         except Exception as e:
             current_app.logger.error(e)
+            mark_report_error()
             traceback.print_exc()
             return {}
 
@@ -819,6 +942,8 @@ class QueryRecordViewPerIndexReportHelper(object):
 class QueryRecordViewReportHelper(object):
     """RecordViewReport helper class."""
 
+    rollup_name = 'record_view_report'
+
     @classmethod
     def Calculation(cls, res, data_list):
         """Create response object."""
@@ -898,6 +1023,9 @@ class QueryRecordViewReportHelper(object):
         """Get record view report."""
         from weko_index_tree.utils import get_descendant_index_names
         from invenio_communities.models import Community
+        rollup = get_rollup_report(cls.rollup_name, **kwargs)
+        if rollup is not None:
+            return rollup
         result = {}
         all_list = []
         query_date = ''
@@ -935,6 +1063,7 @@ class QueryRecordViewReportHelper(object):
             result['all'] = []
         except Exception as e:
             current_app.logger.error(e)
+            mark_report_error()
             traceback.print_exc()
 
         result['date'] = query_date
@@ -946,12 +1075,19 @@ class QueryRecordViewReportHelper(object):
 class QueryItemRegReportHelper(object):
     """Helper for providing item registration report."""
 
+    rollup_name = 'item_reg_report'
+
     @classmethod
     def get(cls, **kwargs):
         """Get item registration report."""
         from weko_index_tree.utils import get_descendant_index_names, get_item_ids_in_index
         from invenio_communities.models import Community
 
+        rollup = get_rollup_report(cls.rollup_name,
+                                   **cls.get_rollup_kwargs(**kwargs))
+        if rollup is not None:
+            return rollup
+
         target_report = kwargs.get('target_report').title()
         start_date = datetime.strptime(kwargs.get('start_date'), '%Y-%m-%d') \
             if kwargs.get('start_date') != '0' else None
@@ -1326,6 +1462,7 @@ class QueryItemRegReportHelper(object):
                 result = []
             except Exception as e:
                 current_app.logger.error(e)
+                mark_report_error()
                 traceback.print_exc()
 
         response = {
@@ -1335,6 +1472,14 @@ class QueryItemRegReportHelper(object):
         }
         return response
 
+    @classmethod
+    def get_rollup_kwargs(cls, **kwargs):
+        """Get the parameters of the report as stored in the rollup table."""
+        return dict(kwargs,
+                    target_report=kwargs.get('target_report').title(),
+                    unit=kwargs.get('unit').title(),
+                    page_index=kwargs.get('page_index', 0))
+
     @classmethod
     def merge_items_results(cls, results):
         """
@@ -8,6 +8,7 @@
 
 """Aggregation tests."""
 
+import copy
 import datetime
 import time
 
@@ -15,7 +16,7 @@ import pytest
 from tests.conftest import _create_file_download_event
 from elasticsearch_dsl import Index, Search
 from invenio_search import current_search, current_search_client
-from mock import patch
+from mock import MagicMock, patch
 
 from invenio_stats import current_stats
 from invenio_stats.aggregations import StatAggregator, filter_robots, BookmarkAPI
@@ -73,6 +74,78 @@ def test_StatAggregator(app):
                               aggregation_interval='day')
     stat_agg.run()
 
+# .tox/c1/bin/pytest --cov=invenio_stats tests/test_aggregations.py::test_StatAggregator_agg_iter_pages -v -s -vv --cov-branch --cov-report=term --cov-config=tox.ini --basetemp=/code/modules/invenio-stats/.tox/c1/tmp
+def test_StatAggregator_agg_iter_pages(app):
+    """Test that the buckets are fetched page by page."""
+    def _bucket(key, ts):
+        return {
+            'key': {'timestamp': ts, 'terms': key},
+            'doc_count': 2,
+            'unique_count': {'value': 1},
+            'top_hit': {'hits': {'hits': [{'_source': {'file_id': key, 'country': 'JP'}}]}}
+        }
+    ts = 1498867200000  # 2017-07-01T00:00:00
+    pages = [
+        {'aggregations': {'composite': {
+            'buckets': [_bucket('a', ts), _bucket('b', ts)],
+            'after_key': {'timestamp': ts, 'terms': 'b'}}}},
+        {'aggregations': {'composite': {
+            'buckets': [_bucket('c', ts)],
+            'after_key': {'timestamp': ts, 'terms': 'c'}}}},
+    ]
+    lookups = [
+        {'hits': {'hits': [{'_index': 'test-stats-file-download-0001', '_source': {'unique_id': 'a'}}]}},
+        {'hits': {'hits': []}},
+    ]
+    client = MagicMock()
+    bodies = []
+
+    def search(index, body, **kwargs):
+        bodies.append((index, copy.deepcopy(body)))
+        if 'aggs' in body:
+            return pages[len([b for b in bodies if 'aggs' in b[1]]) - 1]
+        return lookups[len([b for b in bodies if 'aggs' not in b[1]]) - 1]
+    client.search.side_effect = search
+
+    app.config['STATS_AGGREGATION_PAGE_SIZE'] = 2
+    stat_agg = StatAggregator(name='file-download-agg',
+                              client=client,
+                              event='file-download',
+                              aggregation_field='file_id',
+                              metric_aggregation_fields={
+                                  'unique_count': ('cardinality', 'unique_session_id', {})},
+                              copy_fields={'country': 'country'},
+                              aggregation_interval='day')
+    with patch('invenio_stats.aggregations.StatsAggregation.save_all') as mock_save:
+        docs = list(stat_agg.agg_iter(datetime.datetime(2017, 7, 1),
+                                      datetime.datetime(2017, 7, 2), manual=True))
+    app.config['STATS_AGGREGATION_PAGE_SIZE'] = 1000
+
+    assert [d['_id'] for d in docs] == ['a', 'b', 'c']
+    assert docs[0]['_source'] == {
+        'timestamp': '2017-07-01T00:00:00', 'file_id': 'a', 'count': 2,
+        'unique_count': 1, 'country': 'JP'}
+    # manual mode looks up the indices once per page
+    assert docs[0]['_index'] == 'test-stats-file-download-0001'
+    assert docs[1]['_index'] == 'test-stats-file-download'
+    agg_bodies = [b for _, b in bodies if 'aggs' in b]
+    lookup_bodies = [b for _, b in bodies if 'aggs' not in b]
+    assert len(agg_bodies) == 2
+    assert [b['query']['terms']['unique_id'] for b in lookup_bodies] == [['a', 'b'], ['c']]
+    # the next page starts after the last bucket
+    assert 'after' not in agg_bodies[0]['aggs']['composite']['composite']
+    assert agg_bodies[1]['aggs']['composite']['composite']['after'] == {'timestamp': ts, 'terms': 'b'}
+    assert agg_bodies[0]['aggs']['composite']['composite']['size'] == 2
+    assert agg_bodies[0]['size'] == 0
+    # one DB backup per page
+    app.config['STATS_WEKO_DB_BACKUP_AGGREGATION'] = True
+    bodies.clear()
+    with patch('invenio_stats.aggregations.StatsAggregation.save_all') as mock_save:
+        list(stat_agg.agg_iter(datetime.datetime(2017, 7, 1), datetime.datetime(2017, 7, 2)))
+    app.config['STATS_WEKO_DB_BACKUP_AGGREGATION'] = False
+    assert mock_save.call_count == 2
+
+
 # def test_overwriting_aggregations(app, mock_event_queue, es_with_templates):
 #     """Check that the StatAggregator correctly starts from bookmark.
 
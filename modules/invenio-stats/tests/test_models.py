@@ -7,7 +7,8 @@ from invenio_stats.models import (
     make_stats_events_partition_table,
     StatsEvents,
     StatsAggregation,
-    StatsBookmark
+    StatsBookmark,
+    StatsReportRollup
 )
 
 
@@ -42,6 +43,43 @@ def test_StatsEvents(app, db, stats_events_for_db):
         assert StatsEvents.save(_save_data1) == False
 
 
+# def save_all(cls, data_objects: list) -> bool:
+# .tox/c1/bin/pytest --cov=invenio_stats tests/test_models.py::test_StatsEvents_save_all -v -s -vv --cov-branch --cov-report=term --cov-config=tox.ini --basetemp=/code/modules/invenio-stats/.tox/c1/tmp
+def test_StatsEvents_save_all(app, db):
+    def _event(_id, timestamp, value):
+        return {
+            "_id": _id,
+            "_index": "test-events-stats-record-view",
+            "_type": "record-view",
+            "_source": {"timestamp": timestamp, "value": value}
+        }
+
+    assert StatsEvents.save_all([]) == False
+    assert StatsEvents.save_all([{"_source": None}]) == False
+
+    # one insert, in which the same event is saved once
+    with patch('invenio_db.db.session.execute', return_value=True) as mock_execute, \
+            patch('invenio_db.db.session.commit') as mock_commit:
+        assert StatsEvents.save_all([
+            _event("1", "2023-01-01T01:01:00", 1),
+            _event("2", "2023-01-01T01:01:00", 1),
+            _event("1", "2023-01-01T01:01:00", 2),
+            _event("1", "2023-01-02T01:01:00", 3),
+        ]) == True
+        assert mock_execute.call_count == 1
+        assert mock_commit.call_count == 1
+        rows = mock_execute.call_args[0][0].parameters
+        assert [(r["source_id"], r["date"]) for r in rows] == [
+            ("1", "2023-01-01T01:01:00"),
+            ("2", "2023-01-01T01:01:00"),
+            ("1", "2023-01-02T01:01:00"),
+        ]
+        assert '"value": 2' in rows[0]["source"]
+
+    with patch('invenio_db.db.session.execute', side_effect=SQLAlchemyError("test_sql_error")):
+        assert StatsEvents.save_all([_event("4", "2023-01-01T01:01:00", 1)]) == False
+
+
 # class StatsAggregation(db.Model, _StataModelBase):
 # .tox/c1/bin/pytest --cov=invenio_stats tests/test_models.py::test_StatsAggregation -v -s -vv --cov-branch --cov-report=term --cov-config=tox.ini --basetemp=/code/modules/invenio-stats/.tox/c1/tmp
 def test_StatsAggregation(app, db):
@@ -54,6 +92,34 @@ def test_StatsBookmark(app, db):
     assert StatsBookmark.get_uq_key() == 'uq_stats_key_stats_bookmark'
 
 
+# class StatsReportRollup(db.Model, Timestamp):
+# .tox/c1/bin/pytest --cov=invenio_stats tests/test_models.py::test_StatsReportRollup -v -s -vv --cov-branch --cov-report=term --cov-config=tox.ini --basetemp=/code/modules/invenio-stats/.tox/c1/tmp
+def test_StatsReportRollup(app, db):
+    params = {'event': 'file_download', 'repository_id': 'Root Index'}
+    assert StatsReportRollup.get_params_key(params) == \
+        StatsReportRollup.get_params_key(dict(reversed(list(params.items()))))
+    assert StatsReportRollup.get_data('file_reports', '2023-01', params) is None
+
+    assert StatsReportRollup.save_data(
+        'file_reports', '2023-01', params, {'all': [1]}) == True
+    assert StatsReportRollup.get_data(
+        'file_reports', '2023-01', params) == {'all': [1]}
+    assert StatsReportRollup.get_data('file_reports', '2023-02', params) is None
+    assert StatsReportRollup.get_data(
+        'file_reports', '2023-01', dict(params, event='file_preview')) is None
+
+    # the stored report is replaced
+    assert StatsReportRollup.save_data(
+        'file_reports', '2023-01', params, {'all': [2]}) == True
+    assert StatsReportRollup.get_data(
+        'file_reports', '2023-01', params) == {'all': [2]}
+    assert StatsReportRollup.query.count() == 1
+
+    with patch('invenio_db.db.session.execute', side_effect=SQLAlchemyError("test_sql_error")):
+        assert StatsReportRollup.save_data(
+            'file_reports', '2023-01', params, {'all': [3]}) == False
+
+
 class DbExec():
     def __init__(self, sql) -> None:
         pass
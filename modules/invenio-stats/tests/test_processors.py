@@ -192,6 +192,7 @@ def test_events_indexer_preprocessors(app, mock_event_queue):
 
     def bulk(client, generator, *args, **kwargs):
         received_docs.extend(generator)
+        return len(generator), 0
 
     with patch('elasticsearch.helpers.bulk', side_effect=bulk):
         indexer.run()
@@ -225,6 +226,7 @@ def test_events_indexer_id_windowing(app, mock_event_queue):
 
     def bulk(client, generator, *args, **kwargs):
         received_docs.extend(generator)
+        return len(generator), 0
 
     mock_event_queue.consume.return_value = [
         _create_file_download_event(date) for date in
@@ -245,6 +247,48 @@ def test_events_indexer_id_windowing(app, mock_event_queue):
     assert len(ids) == 3
 
 
+def test_events_indexer_chunks(app, mock_event_queue):
+    """Check that EventsIndexer saves and indexes the events by chunks."""
+    indexer = EventsIndexer(mock_event_queue, preprocessors=[])
+    received_chunks = []
+
+    def bulk(client, actions, *args, **kwargs):
+        received_chunks.append(list(actions))
+        return len(actions), 0
+
+    app.config['STATS_EVENTS_BULK_CHUNK_SIZE'] = 30
+    with patch('elasticsearch.helpers.bulk', side_effect=bulk), \
+            patch('invenio_stats.processors.StatsEvents.save_all') as mock_save, \
+            patch('invenio_stats.processors.StatsEvents.save') as mock_save_one:
+        assert indexer.run() == (100, 0)
+    assert [len(chunk) for chunk in received_chunks] == [30, 30, 30, 10]
+    # one insert per chunk, with the same events
+    assert [c[0][0] for c in mock_save.call_args_list] == received_chunks
+    mock_save_one.assert_not_called()
+
+    # index the chunks in parallel
+    app.config['STATS_EVENTS_BULK_THREAD_COUNT'] = 2
+    mock_event_queue.consume.return_value = mock_event_queue.queued_events
+    with patch('elasticsearch.helpers.parallel_bulk',
+               side_effect=lambda client, actions, **kwargs: [(True, {})] * len(actions)) as mock_parallel, \
+            patch('invenio_stats.processors.StatsEvents.save_all') as mock_save:
+        assert indexer.run() == (100, 0)
+    assert [len(c[0][1]) for c in mock_parallel.call_args_list] == [60, 40]
+    assert mock_parallel.call_args[1]['chunk_size'] == 30
+    assert mock_save.call_count == 4
+
+    # events are not saved without DB backup
+    app.config['STATS_WEKO_DB_BACKUP_EVENTS'] = False
+    with patch('elasticsearch.helpers.parallel_bulk',
+               side_effect=lambda client, actions, **kwargs: [(True, {})] * len(actions)), \
+            patch('invenio_stats.processors.StatsEvents.save_all') as mock_save:
+        indexer.run()
+    mock_save.assert_not_called()
+    app.config['STATS_WEKO_DB_BACKUP_EVENTS'] = True
+    app.config['STATS_EVENTS_BULK_CHUNK_SIZE'] = 50
+    app.config['STATS_EVENTS_BULK_THREAD_COUNT'] = 1
+
+
 def test_double_clicks(app, mock_event_queue, es):
     """Test that events occurring within a time window are counted as 1."""
     event_type = 'file-download'
@@ -10,8 +10,10 @@
 
 from __future__ import absolute_import, print_function
 
+from mock import patch
+
 from invenio_stats import current_stats
-from invenio_stats.tasks import process_events
+from invenio_stats.tasks import process_events, rollup_reports
 
 
 def test_process_events(app, es, event_queues):
@@ -24,3 +26,63 @@ def test_process_events(app, es, event_queues):
     process_events.delay(['file-download'])
     # FIXME: no need to publish events. We should just mock "consume" and test
     # that the events are properly received and processed.
+
+
+# def rollup_reports(year=None, month=None):
+# .tox/c1/bin/pytest --cov=invenio_stats tests/test_tasks.py::test_rollup_reports -v -s -vv --cov-branch --cov-report=term --cov-config=tox.ini --basetemp=/code/modules/invenio-stats/.tox/c1/tmp
+def test_rollup_reports(app, db):
+    _report = {'date': '2022-10', 'all': []}
+    # nothing is computed while the rollup is disabled
+    app.config['STATS_REPORT_ROLLUP_ENABLED'] = False
+    with patch('invenio_search.current_search_client.ping') as mock_ping:
+        rollup_reports(2022, 10)
+        mock_ping.assert_not_called()
+
+    app.config['STATS_REPORT_ROLLUP_ENABLED'] = True
+    with patch('invenio_search.current_search_client.ping', return_value=False), \
+            patch('invenio_stats.utils.save_rollup_report') as mock_save:
+        rollup_reports(2022, 10)
+        mock_save.assert_not_called()
+
+    with patch('invenio_search.current_search_client.ping', return_value=True), \
+            patch('invenio_stats.utils.QueryFileReportsHelper.get', return_value=_report) as mock_file, \
+            patch('invenio_stats.utils.QueryCommonReportsHelper.get', return_value=_report), \
+            patch('invenio_stats.utils.QuerySearchReportHelper.get', return_value=_report) as mock_search, \
+            patch('invenio_stats.utils.QueryRecordViewReportHelper.get', return_value=_report), \
+            patch('invenio_stats.utils.QueryRecordViewPerIndexReportHelper.get', return_value={}), \
+            patch('invenio_stats.utils.QueryItemRegReportHelper.get', return_value={'num_page': 2, 'page': 1, 'data': []}) as mock_item_reg, \
+            patch('invenio_stats.utils.save_rollup_report') as mock_save:
+        rollup_reports(2022, 10)
+        mock_search.assert_called_once_with(
+            use_rollup=False, year=2022, month=10, repository_id='Root Index')
+        assert mock_file.call_count == 5
+        # 3 target reports, 6 units, 2 pages
+        assert mock_item_reg.call_count == 36
+        mock_item_reg.assert_any_call(
+            use_rollup=False, target_report='1', start_date='2022-10-01',
+            end_date='2022-10-31', unit='Day', page_index=1,
+            repository_id='Root Index')
+        # an empty report is not stored
+        assert mock_save.call_count == 5 + 3 + 1 + 1 + 36
+        mock_save.assert_any_call(
+            'search_report', _report, year=2022, month=10,
+            repository_id='Root Index')
+
+    # a report computed after an error is not stored
+    from invenio_stats.utils import mark_report_error
+    def _search_error(**kwargs):
+        mark_report_error()
+        return _report
+    with patch('invenio_search.current_search_client.ping', return_value=True), \
+            patch('invenio_stats.utils.QueryFileReportsHelper.get', return_value={}), \
+            patch('invenio_stats.utils.QueryCommonReportsHelper.get', return_value={}), \
+            patch('invenio_stats.utils.QuerySearchReportHelper.get', side_effect=_search_error), \
+            patch('invenio_stats.utils.QueryRecordViewReportHelper.get', return_value=_report), \
+            patch('invenio_stats.utils.QueryRecordViewPerIndexReportHelper.get', return_value={}), \
+            patch('invenio_stats.utils.QueryItemRegReportHelper.get', return_value={}), \
+            patch('invenio_stats.utils.save_rollup_report') as mock_save:
+        rollup_reports(2022, 10)
+        mock_save.assert_called_once_with(
+            'record_view_report', _report, year=2022, month=10,
+            repository_id='Root Index')
+    app.config['STATS_REPORT_ROLLUP_ENABLED'] = False
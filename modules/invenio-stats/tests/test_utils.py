@@ -33,6 +33,10 @@ from invenio_stats.utils import (
     get_doctype,
     is_valid_access,
     chunk_list,
+    get_rollup_target_month,
+    get_rollup_params,
+    get_rollup_report,
+    save_rollup_report,
     QueryFileReportsHelper,
     QuerySearchReportHelper,
     QueryCommonReportsHelper,
@@ -175,6 +179,77 @@ def test_chunk_list(iterable, size, expected):
     result = list(chunk_list(iterable, size))
     assert result == expected
 
+# def get_rollup_target_month(year=None, month=None, start_date=None, end_date=None, **kwargs):
+# .tox/c1/bin/pytest --cov=invenio_stats tests/test_utils.py::test_get_rollup_target_month -v -s -vv --cov-branch --cov-report=term --cov-config=tox.ini --basetemp=/code/modules/invenio-stats/.tox/c1/tmp
+def test_get_rollup_target_month(app):
+    assert get_rollup_target_month(year=2022, month=3) == '2022-03'
+    assert get_rollup_target_month(year='2022', month='12') == '2022-12'
+    assert get_rollup_target_month(year=2022, month=0) is None
+    assert get_rollup_target_month(year=2022, month=13) is None
+    assert get_rollup_target_month() is None
+    assert get_rollup_target_month(
+        start_date='2022-02-01', end_date='2022-02-28') == '2022-02'
+    assert get_rollup_target_month(
+        start_date='2022-02-02', end_date='2022-02-28') is None
+    assert get_rollup_target_month(
+        start_date='2022-02-01', end_date='2022-03-31') is None
+    assert get_rollup_target_month(start_date='0', end_date='0') is None
+    # a month with start_date and end_date is not the same report
+    assert get_rollup_target_month(
+        year=2022, month=2, start_date='2022-02-01', end_date='2022-02-10') is None
+    # the current month is always computed
+    now = datetime.datetime.now()
+    assert get_rollup_target_month(year=now.year, month=now.month) is None
+    assert get_rollup_target_month(year=now.year + 1, month=1) is None
+
+
+# def get_rollup_params(**kwargs):
+# .tox/c1/bin/pytest --cov=invenio_stats tests/test_utils.py::test_get_rollup_params -v -s -vv --cov-branch --cov-report=term --cov-config=tox.ini --basetemp=/code/modules/invenio-stats/.tox/c1/tmp
+def test_get_rollup_params(app):
+    assert get_rollup_params(year=2022, month=3, event='file_download',
+                             use_rollup=False, start_date=None) == \
+        {'event': 'file_download', 'repository_id': 'Root Index'}
+    assert get_rollup_params(year=2022, month=3, repository_id='123') == \
+        {'repository_id': '123'}
+
+
+# def get_rollup_report(report, **kwargs):
+# def save_rollup_report(report, data, **kwargs):
+# .tox/c1/bin/pytest --cov=invenio_stats tests/test_utils.py::test_rollup_report -v -s -vv --cov-branch --cov-report=term --cov-config=tox.ini --basetemp=/code/modules/invenio-stats/.tox/c1/tmp
+def test_rollup_report(app, db):
+    _report = {'date': '2022-10', 'all': [{'search_key': 'key1', 'count': 4}]}
+    assert save_rollup_report('search_report', _report, year=2022, month=10) == True
+    now = datetime.datetime.now()
+    assert save_rollup_report('search_report', _report, year=now.year, month=now.month) == False
+
+    app.config['STATS_REPORT_ROLLUP_ENABLED'] = False
+    assert get_rollup_report('search_report', year=2022, month=10) is None
+
+    app.config['STATS_REPORT_ROLLUP_ENABLED'] = True
+    assert get_rollup_report('search_report', year=2022, month=10) == _report
+    assert get_rollup_report('search_report', year=2022, month=10,
+                             repository_id='Root Index') == _report
+    assert get_rollup_report('search_report', year=2022, month=10,
+                             use_rollup=False) is None
+    assert get_rollup_report('search_report', year=2022, month=9) is None
+
+    # the helpers read the past months from the rollup table
+    with patch('invenio_stats.utils.current_stats') as mock_stats:
+        assert QuerySearchReportHelper.get(year=2022, month=10) == _report
+        mock_stats.queries.__getitem__.assert_not_called()
+        QuerySearchReportHelper.get(year=2022, month=10, use_rollup=False)
+        mock_stats.queries.__getitem__.assert_called_once_with('get-search-report')
+
+    _item_reg = {'num_page': 1, 'page': 1, 'data': [{'count': 1}]}
+    assert save_rollup_report(
+        'item_reg_report', _item_reg, target_report='1', start_date='2022-10-01',
+        end_date='2022-10-31', unit='Day', page_index=0) == True
+    assert QueryItemRegReportHelper.get(
+        target_report='1', start_date='2022-10-01', end_date='2022-10-31',
+        unit='day') == _item_reg
+    app.config['STATS_REPORT_ROLLUP_ENABLED'] = False
+
+
 # class QueryFileReportsHelper(object):
 #     def calc_per_group_counts(cls, group_names, current_stats, current_count):
 #     def calc_file_stats_reports(cls, res, data_list, all_groups):
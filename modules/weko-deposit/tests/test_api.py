@@ -48,6 +48,7 @@ from invenio_files_rest.models import Bucket, ObjectVersion,FileInstance
 from invenio_records.api import RecordRevision
 from six import BytesIO
 from elasticsearch import Elasticsearch
+from elasticsearch.helpers import BulkIndexError
 from sqlalchemy.orm.exc import NoResultFound
 from sqlalchemy.exc import SQLAlchemyError
 from weko_admin.models import AdminSettings
@@ -283,6 +284,69 @@ class TestWekoIndexer:
         assert '10' in recids
         assert not '10.2' in recids
 
+    #     def get_pid_by_es_search_after(self, path, only_latest_version=False, size=None):
+    # .tox/c1/bin/pytest --cov=weko_deposit tests/test_api.py::TestWekoIndexer::test_get_pid_by_es_search_after -vv -s --cov-branch --cov-report=term --basetemp=/code/modules/weko-deposit/.tox/c1/tmp
+    def test_get_pid_by_es_search_after(self,es_records):
+        def get_recids(pages):
+            recids = []
+            for ret in pages:
+                for obj_uuid in ret:
+                    r = RecordMetadata.query.filter_by(id=obj_uuid).first()
+                    recids.append(r.json['recid'])
+            return recids
+
+        indexer, records = es_records
+        # all pages are the same as one page
+        pages = list(indexer.get_pid_by_es_search_after(4, size=1))
+        assert all(len(ret) == 1 for ret in pages)
+        recids = get_recids(pages)
+        assert recids == get_recids(indexer.get_pid_by_es_search_after('4'))
+        assert '10' in recids
+        assert '10.2' in recids
+
+        # get only latest version
+        recids = get_recids(indexer.get_pid_by_es_search_after(4, only_latest_version=True))
+        assert '10' in recids
+        assert not '10.2' in recids
+
+        # multiple indexes
+        recids = get_recids(indexer.get_pid_by_es_search_after(['3', '4']))
+        assert '10.1' in recids
+        assert '10.2' in recids
+
+        assert list(indexer.get_pid_by_es_search_after('not_exist')) == []
+
+    #     def bulk_actions(self, actions, chunk_size=None, thread_count=None):
+    # .tox/c1/bin/pytest --cov=weko_deposit tests/test_api.py::TestWekoIndexer::test_bulk_actions -vv -s --cov-branch --cov-report=term --basetemp=/code/modules/weko-deposit/.tox/c1/tmp
+    def test_bulk_actions(self,app,es_records):
+        indexer, records = es_records
+        indexer.get_es_index()
+        record = records[0]['record']
+        actions = [
+            dict(_op_type='update', _index=indexer.es_index, _type=indexer.es_doc_type,
+                 _id=str(record.id), doc={'path': ['1']}),
+            dict(_op_type='update', _index=indexer.es_index, _type=indexer.es_doc_type,
+                 _id=str(uuid.uuid4()), doc={'path': ['1']}),
+        ]
+        report = indexer.bulk_actions(actions, chunk_size=1)
+        assert report['success'] == 1
+        assert len(report['failed']) == 1
+        assert report['failed'][0]['id'] == actions[1]['_id']
+        assert report['failed'][0]['status'] == 404
+
+        with patch("weko_deposit.api.parallel_bulk", return_value=iter([(True, {})])) as mock_parallel:
+            report = indexer.bulk_actions(actions[:1], thread_count=2)
+            assert report == {"success": 1, "failed": []}
+            assert mock_parallel.call_args[1]['thread_count'] == 2
+
+    #     def reindex_by_path(self, path, only_latest_version=False, chunk_size=None, thread_count=None):
+    # .tox/c1/bin/pytest --cov=weko_deposit tests/test_api.py::TestWekoIndexer::test_reindex_by_path -vv -s --cov-branch --cov-report=term --basetemp=/code/modules/weko-deposit/.tox/c1/tmp
+    def test_reindex_by_path(self,app,es_records):
+        indexer, records = es_records
+        count = sum(len(ret) for ret in indexer.get_pid_by_es_search_after(4))
+        report = indexer.reindex_by_path(4)
+        assert report == {"success": count, "failed": []}
+
     #     def get_metadata_by_item_id(self, item_id):
     # .tox/c1/bin/pytest --cov=weko_deposit tests/test_api.py::TestWekoIndexer::test_get_metadata_by_item_id -vv -s --cov-branch --cov-report=term --basetemp=/code/modules/weko-deposit/.tox/c1/tmp
     def test_get_metadata_by_item_id(self,es_records):
@@ -349,6 +413,73 @@ class TestWekoIndexer:
         with patch("weko_deposit.api.bulk",return_value=(0,["test_error1","test_error2"])):
             indexer.bulk_update(res)
 
+    #     def deferred_upload():
+    #     def bulk_upload(self, actions, chunk_size=500):
+    # .tox/c1/bin/pytest --cov=weko_deposit tests/test_api.py::TestWekoIndexer::test_deferred_upload -vv -s --cov-branch --cov-report=term --basetemp=/code/modules/weko-deposit/.tox/c1/tmp
+    def test_deferred_upload(self,app,db,es_records):
+        indexer, records = es_records
+        record = records[0]['record']
+        record_data = records[0]['record_data']
+        item_id = records[0]['recid'].id
+        title = 'DEFERRED{}'.format(uuid.uuid4())
+        record_data['title'] = title
+        missing_id = uuid.uuid4()
+        with WekoIndexer.deferred_upload() as actions:
+            indexer.upload_metadata(record_data, item_id, 5)
+            indexer.update_es_data(record, update_revision=False, field='publish_status')
+            indexer.update_relation_version_is_last({'id': missing_id, 'is_last': True})
+            assert [action['_op_type'] for action in actions] == ['index', 'update', 'update']
+            assert actions[0]['_id'] == str(item_id)
+            assert actions[0]['_source']['title'] == title
+            assert actions[0]['_version'] == 5
+            assert actions[0]['_version_type'] == 'external_gte'
+            indexer.upload_metadata(record_data, missing_id, 3)
+            new_action = actions.pop()
+            # nothing has been sent yet
+            assert indexer.get_metadata_by_item_id(item_id)['_source']['title'] != title
+            success, errors = indexer.bulk_upload(actions)
+        assert success == 2
+        assert errors == []
+        assert indexer.get_metadata_by_item_id(item_id)['_source']['title'] == title
+        # the version of an existing document is not checked
+        assert '_version' not in actions[0]
+
+        # the version of a new document is kept
+        success, errors = indexer.bulk_upload([new_action])
+        assert success == 1
+        assert indexer.get_metadata_by_item_id(missing_id)['_version'] == 3
+        indexer.delete_by_id(missing_id)
+
+        # pending writes are sent before the commit, and fail the commit
+        with WekoIndexer.deferred_upload() as actions:
+            indexer.upload_metadata(record_data, item_id, 6)
+            with db.session.begin_nested():
+                pass
+            assert len(actions) == 1
+            db.session.commit()
+            assert actions == []
+            indexer.upload_metadata(record_data, item_id, 7)
+            with patch.object(WekoIndexer, "bulk_upload", return_value=(0, [{"index": {"_id": str(item_id)}}])):
+                with pytest.raises(BulkIndexError):
+                    db.session.commit()
+            assert actions == []
+            db.session.rollback()
+
+        # writes are sent directly outside of the context
+        with patch.object(indexer.client, "update") as mock_update:
+            indexer.update_relation_version_is_last({'id': missing_id, 'is_last': True})
+            mock_update.assert_called_once()
+        # and in direct_upload inside of the context
+        with WekoIndexer.deferred_upload() as actions:
+            with WekoIndexer.direct_upload(), \
+                    patch.object(indexer.client, "update") as mock_update:
+                indexer.update_relation_version_is_last({'id': missing_id, 'is_last': True})
+                mock_update.assert_called_once()
+            assert actions == []
+            indexer.update_relation_version_is_last({'id': missing_id, 'is_last': True})
+            assert len(actions) == 1
+        assert indexer.bulk_upload([]) == (0, [])
+
 # class WekoDeposit(Deposit):
 # .tox/c1/bin/pytest --cov=weko_deposit tests/test_api.py::TestWekoDeposit -vv -s --cov-branch --cov-report=term --basetemp=/code/modules/weko-deposit/.tox/c1/tmp
 class TestWekoDeposit:
@@ -859,7 +990,7 @@ class TestWekoDeposit:
         for file_name, file_info in pdf_files.items():
             file_obj = file_info.get("file")
             is_pdf = file_info.get("is_pdf")
-            test[file_name]={"uri":file_obj.obj.file.uri,"size":file_obj.obj.file.size,"is_pdf":is_pdf}
+            test[file_name]={"uri":file_obj.obj.file.uri,"size":file_obj.obj.file.size,"is_pdf":is_pdf,"checksum":file_obj.obj.file.checksum}
         res = deposit.get_pdf_info()
         assert res == test
 
@@ -1348,6 +1479,42 @@ class TestWekoDeposit:
         assert 'sets' not in rec['_oai']
 
 
+    # def delete_by_index_tree_ids(cls, index_ids, ignore_items=[]):
+    # .tox/c1/bin/pytest --cov=weko_deposit tests/test_api.py::TestWekoDeposit::test_delete_by_index_tree_ids -vv -s --cov-branch --cov-report=term --basetemp=/code/modules/weko-deposit/.tox/c1/tmp
+    def test_delete_by_index_tree_ids(sel,app,db,location,es_records):
+        def check_status(pid, status):
+            assert PersistentIdentifier.get('depid', pid).status == status
+
+        # no index
+        assert WekoDeposit.delete_by_index_tree_ids([]) == {"success": 0, "failed": []}
+        assert WekoDeposit.delete_by_index_tree_ids(['']) == {"success": 0, "failed": []}
+
+        # ignored item
+        report = WekoDeposit.delete_by_index_tree_ids(['1'], ['2'])
+        assert report["failed"] == []
+        check_status(2, "R")
+        rec = WekoRecord.get_record_by_pid(2)
+        assert rec['path'] == ['1']
+
+        time.sleep(1)
+        # the indexes of the subtree are removed at once
+        report = WekoDeposit.delete_by_index_tree_ids(['1', '3', '4'])
+        assert report["success"] > 0
+        assert report["failed"] == []
+        check_status(2, "D")
+        rec = WekoRecord.get_record_by_pid(2)
+        assert rec['path'] == []
+        assert rec['_oai']['sets'] == []
+        check_status(10, "D")
+        rec = WekoRecord.get_record_by_pid(10)
+        assert rec['path'] == []
+        assert rec['_oai']['sets'] == []
+
+        # other items are not changed
+        check_status(3, "R")
+        rec = WekoRecord.get_record_by_pid(3)
+        assert rec['path'] == ['2']
+
     # def update_pid_by_index_tree_id(self, path):
     # .tox/c1/bin/pytest --cov=weko_deposit tests/test_api.py::TestWekoDeposit::test_update_pid_by_index_tree_id -vv -s --cov-branch --cov-report=term --basetemp=/code/modules/weko-deposit/.tox/c1/tmp
     def test_update_pid_by_index_tree_id(sel,app,db,location,es_records):
@@ -30,7 +30,10 @@ from weko_authors.models import AuthorsAffiliationSettings,AuthorsPrefixSettings
 from weko_deposit.api import WekoIndexer, WekoDeposit
 from weko_deposit.tasks import (
     update_items_by_authorInfo,
+    UPDATE_FILE_CONTENT_SCRIPT,
+    _extract_file_content,
     extract_pdf_and_update_file_contents,
+    update_extracted_file_contents,
     update_file_content,
     _get_author_prefix,
     _get_affiliation_id,
@@ -2055,36 +2058,108 @@ def test_extract_pdf_and_update_file_contents_cases(monkeypatch, tika_path, isfi
 
 
 # .tox/c1/bin/pytest --cov=weko_deposit tests/test_tasks.py::test_update_file_content_cases -v -s -vv --cov-branch --cov-report=term --cov-config=tox.ini --basetemp=/code/modules/weko-deposit/.tox/c1/tmp
-@pytest.mark.parametrize("content, file_datas, expected", [
-    ([{'filename': 'f1', 'attachment': {'content': ''}}, {'filename': 'f2', 'attachment': {'content': ''}}, {'filename': 'f3'}], {'f1': 'abc', 'f2': 'def'}, ['abc', 'def', None]),
-    ([{'filename': 'f1', 'attachment': {'content': ''}}], {'f2': 'zzz'}, [None]),
-    ([], {'f1': 'abc'}, []),
-    ([{'filename': 'f1'}, {'filename': 'f2', 'attachment': {'content': ''}}], {'f1': 'abc', 'f2': 'def'}, [None, 'def']),
+@pytest.mark.parametrize("file_datas", [
+    {'f1': 'abc', 'f2': 'def'},
+    {'f2': 'zzz'},
+    {},
 ])
-def test_update_file_content_cases(monkeypatch, content, file_datas, expected):
+def test_update_file_content_cases(monkeypatch, file_datas):
     called = {}
     class DummyClient:
+        def update(self, **kwargs):
+            called.update(kwargs)
+            return {'result': 'updated'}
         def index(self, **kwargs):
-            called['body'] = kwargs['body']
-            return {'result': 'ok'}
+            raise AssertionError("the whole document must not be indexed")
     class DummyIndexer:
         def __init__(self):
             self.client = DummyClient()
             self.es_index = 'idx'
             self.es_doc_type = 'doc'
         def get_es_index(self): pass
-        def get_metadata_by_item_id(self, rid):
-            return {
-                '_source': {'content': content} if content is not None else {},
-                '_version': 1,
-                '_type': 'doc'
-            }
     monkeypatch.setattr("weko_deposit.tasks.WekoIndexer", DummyIndexer)
     update_file_content('rid', file_datas)
-    if content:
-        result = called['body']['content']
-        for i, exp in enumerate(expected):
-            if exp is not None:
-                assert result[i].get('attachment', {}).get('content') == exp
-            else:
-                assert 'attachment' not in result[i] or result[i]['attachment'].get('content') == ''
+    assert called['index'] == 'idx'
+    assert called['id'] == 'rid'
+    script = called['body']['script']
+    assert script['source'] == UPDATE_FILE_CONTENT_SCRIPT
+    assert script['params'] == {'file_datas': file_datas}
+    assert 'doc' not in called['body']
+
+
+# def _extract_file_content(file):
+# .tox/c1/bin/pytest --cov=weko_deposit tests/test_tasks.py::test_extract_file_content_cache -v -s -vv --cov-branch --cov-report=term --cov-config=tox.ini --basetemp=/code/modules/weko-deposit/.tox/c1/tmp
+def test_extract_file_content_cache(app, db, location):
+    rec_uuid = uuid.uuid4()
+    pdf_files, deposit = create_record_with_pdf(rec_uuid, 1)
+    filename, info = next(
+        (k, v) for k, v in pdf_files.items()
+        if v["is_pdf"] and k != "not_exist.pdf")
+    file_instance = info["file"].obj.file
+    file = {
+        "uri": file_instance.uri,
+        "size": file_instance.size,
+        "is_pdf": True,
+        "checksum": file_instance.checksum
+    }
+    datastore = MagicMock()
+    datastore.redis.exists.return_value = False
+    with patch("weko_deposit.tasks.RedisConnection") as mock_redis, \
+            patch("weko_deposit.utils.extract_text_from_pdf", return_value="text") as mock_pdf:
+        mock_redis.return_value.connection.return_value = datastore
+        # extract and put in the cache
+        assert _extract_file_content(file) == "text"
+        assert mock_pdf.call_count == 1
+        key = "cache_extracted_text_{}_{}".format(
+            file_instance.checksum, app.config["WEKO_DEPOSIT_FILESIZE_LIMIT"])
+        datastore.put.assert_called_once_with(
+            key, b"text", ttl_secs=app.config["WEKO_DEPOSIT_EXTRACT_CACHE_TTL"])
+
+        # get from the cache
+        datastore.redis.exists.return_value = True
+        datastore.get.return_value = b"cached text"
+        assert _extract_file_content(file) == "cached text"
+        assert mock_pdf.call_count == 1
+
+        # not cached without checksum
+        datastore.reset_mock()
+        assert _extract_file_content(dict(file, checksum=None)) == "text"
+        datastore.put.assert_not_called()
+
+        # failed extraction is not cached
+        datastore.redis.exists.return_value = False
+        assert _extract_file_content(dict(file, uri="not_exist_dir1/data")) == ""
+        datastore.put.assert_not_called()
+
+
+# def extract_pdf_and_update_file_contents(files, record_uuid, retry_count=3, retry_delay=1):
+# .tox/c1/bin/pytest --cov=weko_deposit tests/test_tasks.py::test_extract_pdf_and_update_file_contents_parallel -v -s -vv --cov-branch --cov-report=term --cov-config=tox.ini --basetemp=/code/modules/weko-deposit/.tox/c1/tmp
+def test_extract_pdf_and_update_file_contents_parallel(app, mocker):
+    files = {
+        "a.pdf": {"uri": "a", "size": 1, "is_pdf": True, "checksum": "md5:a"},
+        "b.docx": {"uri": "b", "size": 1, "is_pdf": False, "checksum": "md5:b"},
+    }
+    mock_chord = mocker.patch("weko_deposit.tasks.chord")
+    mock_update = mocker.patch("weko_deposit.tasks.update_file_content")
+    mocker.patch("weko_deposit.tasks._extract_file_content", side_effect=["A", "B"])
+
+    app.config["WEKO_DEPOSIT_EXTRACT_PARALLEL"] = True
+    rec_uuid = uuid.uuid4()
+    extract_pdf_and_update_file_contents(files, rec_uuid)
+    header = list(mock_chord.call_args[0][0])
+    assert [sig.args for sig in header] == [(files["a.pdf"],), (files["b.docx"],)]
+    callback = mock_chord.return_value.call_args[0][0]
+    assert callback.args == (["a.pdf", "b.docx"], str(rec_uuid), 3, 1)
+    mock_update.assert_not_called()
+
+    # the chord callback updates es with the texts in order
+    update_extracted_file_contents(["A", "B"], ["a.pdf", "b.docx"], str(rec_uuid))
+    mock_update.assert_called_once_with(str(rec_uuid), {"a.pdf": "A", "b.docx": "B"})
+
+    # a single file is extracted in place
+    mock_chord.reset_mock()
+    mock_update.reset_mock()
+    extract_pdf_and_update_file_contents({"a.pdf": files["a.pdf"]}, rec_uuid)
+    mock_chord.assert_not_called()
+    mock_update.assert_called_once_with(rec_uuid, {"a.pdf": "A"})
+    app.config["WEKO_DEPOSIT_EXTRACT_PARALLEL"] = False
@@ -28,6 +28,7 @@ import io
 import chardet
 import traceback
 from collections import OrderedDict
+from contextlib import contextmanager
 from datetime import datetime, timezone,date
 from typing import NoReturn, Union
 from tika import parser
@@ -38,8 +39,10 @@ from redis import sentinel
 from dictdiffer import dot_lookup
 from dictdiffer.merge import Merger, UnresolvedConflictsException
 from elasticsearch.exceptions import TransportError
-from elasticsearch.helpers import bulk
-from flask import abort, current_app, json, request, session
+from elasticsearch.helpers import BulkIndexError, bulk, parallel_bulk, \
+    streaming_bulk
+from flask import abort, current_app, g, has_app_context, json, request, \
+    session
 from flask_security import current_user
 from invenio_accounts.models import User, Role
 from invenio_db import db
@@ -144,6 +147,103 @@ class WekoIndexer(RecordIndexer):
         self.es_doc_type = current_app.config['INDEXER_DEFAULT_DOCTYPE']
         self.file_doc_type = current_app.config['INDEXER_FILE_DOC_TYPE']
 
+    @staticmethod
+    @contextmanager
+    def deferred_upload():
+        """Collect the writes of WekoIndexer instead of sending them.
+
+        While the context is active, upload_metadata and the partial updates
+        of the item documents are appended to the yielded list as bulk
+        actions in the order they are issued. The pending actions are sent
+        with bulk_upload before each commit of the session, and the commit
+        fails if they fail, so the database is never committed ahead of the
+        index. Send the actions issued after the last commit with
+        bulk_upload. Reads such as get_metadata_by_item_id do not see the
+        pending actions.
+
+        Yields:
+            list: bulk actions.
+        """
+        actions = []
+        g.weko_indexer_deferred_actions = actions
+        try:
+            yield actions
+        finally:
+            g.pop('weko_indexer_deferred_actions', None)
+
+    @staticmethod
+    @contextmanager
+    def direct_upload():
+        """Send the writes directly while deferred_upload is active.
+
+        Used for the writes that restore the documents of a failed item,
+        which must not wait for the next commit.
+        """
+        actions = g.pop('weko_indexer_deferred_actions', None) \
+            if has_app_context() else None
+        try:
+            yield
+        finally:
+            if actions is not None:
+                g.weko_indexer_deferred_actions = actions
+
+    @staticmethod
+    def _get_deferred_actions():
+        """Get the bulk actions collected by deferred_upload, if any."""
+        if not has_app_context():
+            return None
+        return g.get('weko_indexer_deferred_actions')
+
+    def _update(self, index, doc_type, id, body, **kwargs):
+        """Update a document, or defer it in deferred_upload."""
+        actions = self._get_deferred_actions()
+        if actions is None:
+            return self.client.update(
+                index=index, doc_type=doc_type, id=id, body=body, **kwargs)
+        action = dict(_op_type='update', _index=index, _type=doc_type,
+                      _id=id, **body)
+        if 'version' in kwargs:
+            action['_version'] = kwargs['version']
+        actions.append(action)
+
+    def bulk_upload(self, actions, chunk_size=500):
+        """Send the actions collected by deferred_upload.
+
+        Updates of missing documents are ignored as update_relation_version_is_last
+        does. As in upload_metadata, the external version of an index action
+        is only checked when the document does not exist yet.
+
+        Args:
+            actions (list): bulk actions.
+            chunk_size (int, optional): number of actions per request.
+
+        Returns:
+            tuple: number of succeeded actions and list of errors.
+        """
+        if not actions:
+            return 0, []
+        versioned = [action for action in actions
+                     if action['_op_type'] == 'index' and '_version' in action]
+        if versioned:
+            docs = self.client.mget(
+                index=self.es_index, doc_type=self.es_doc_type,
+                body={'ids': list({action['_id'] for action in versioned})},
+                _source=False)
+            exists = {doc['_id'] for doc in docs['docs'] if doc.get('found')}
+            for action in versioned:
+                if action['_id'] in exists:
+                    del action['_version']
+                    del action['_version_type']
+        success, errors = bulk(self.client, actions, chunk_size=chunk_size,
+                               raise_on_error=False)
+        errors = [
+            error for error in errors
+            if not (error.get('update', {}).get('status') == 404)
+        ]
+        for error in errors:
+            current_app.logger.error(error)
+        return success, errors
+
     def upload_metadata(self, jrc, item_id, revision_id, skip_files=False):
         """Upload the item data to ElasticSearch.
 
@@ -166,6 +266,15 @@ class WekoIndexer(RecordIndexer):
         # body = dict(version=revision_id + 1,
         #             version_type=self._version_type,
         #             body=jrc)
+        actions = self._get_deferred_actions()
+        if actions is not None:
+            actions.append(dict(_op_type='index', _index=es_info['index'],
+                                _type=es_info['doc_type'], _id=es_info['id'],
+                                _version=revision_id,
+                                _version_type=self._version_type,
+                                _source=jrc))
+            return
+
         body = dict(version=revision_id,
                     version_type=self._version_type,
                     body=jrc)
@@ -206,7 +315,7 @@ class WekoIndexer(RecordIndexer):
         self.get_es_index()
         pst = 'relation_version_is_last'
         body = {'doc': {pst: version.get('is_last')}}
-        return self.client.update(
+        return self._update(
             index=self.es_index,
             doc_type=self.es_doc_type,
             id=str(version.get('id')),
@@ -230,6 +339,28 @@ class WekoIndexer(RecordIndexer):
 
         """
         self.get_es_index()
+        body = self._get_update_body(record, update_oai, is_deleted, field)
+
+        if update_revision:
+            return self._update(
+                index=self.es_index,
+                doc_type=self.es_doc_type,
+                id=str(record.id),
+                version=record.revision_id,
+                body=body
+            )
+        else:
+            return self._update(
+                index=self.es_index,
+                doc_type=self.es_doc_type,
+                id=str(record.id),
+                body=body
+            )
+
+    @staticmethod
+    def _get_update_body(record, update_oai=False, is_deleted=False,
+                         field='path'):
+        """Get the partial update of update_es_data."""
         _oai = '_oai'
         sets = 'sets'
         body = {}
@@ -261,22 +392,106 @@ class WekoIndexer(RecordIndexer):
                         tzinfo=timezone.utc).isoformat()
                 }
             }
+        return body
 
-        if update_revision:
-            return self.client.update(
-                index=self.es_index,
-                doc_type=self.es_doc_type,
-                id=str(record.id),
-                version=record.revision_id,
-                body=body
-            )
+    def bulk_update_es_data(self, records, update_oai=False, is_deleted=False,
+                            field='path', chunk_size=None, thread_count=None):
+        """Update es data of the records in bulk.
+
+        The same fields as update_es_data are updated, without the revision.
+
+        Args:
+            records (list): WekoDeposit of the records.
+            update_oai (bool, optional): Defaults to False.
+            is_deleted (bool, optional): Defaults to False.
+            field (str, optional): Defaults to 'path'.
+            chunk_size (int, optional): number of actions per request.
+            thread_count (int, optional): number of concurrent requests.
+
+        Returns:
+            dict: report of bulk_actions.
+        """
+        self.get_es_index()
+        actions = [
+            dict(_op_type='update', _index=self.es_index,
+                 _type=self.es_doc_type, _id=str(record.id),
+                 **self._get_update_body(record, update_oai, is_deleted, field))
+            for record in records
+        ]
+        return self.bulk_actions(actions, chunk_size=chunk_size,
+                                 thread_count=thread_count)
+
+    def bulk_actions(self, actions, chunk_size=None, thread_count=None):
+        """Send bulk actions with streaming_bulk, or parallel_bulk.
+
+        Args:
+            actions (iterable): bulk actions.
+            chunk_size (int, optional): number of actions per request.
+                Defaults to WEKO_DEPOSIT_BATCH_CHUNK_SIZE.
+            thread_count (int, optional): number of concurrent requests.
+                Defaults to WEKO_DEPOSIT_BATCH_THREAD_COUNT.
+
+        Returns:
+            dict: number of succeeded actions and the failed actions.
+                ex: {"success": 10, "failed": [{"id": "...", "status": 404, "error": "..."}]}
+        """
+        chunk_size = chunk_size or current_app.config.get(
+            'WEKO_DEPOSIT_BATCH_CHUNK_SIZE', 500)
+        thread_count = thread_count or current_app.config.get(
+            'WEKO_DEPOSIT_BATCH_THREAD_COUNT', 1)
+        kwargs = dict(chunk_size=chunk_size, raise_on_error=False,
+                      raise_on_exception=False)
+        if thread_count > 1:
+            results = parallel_bulk(self.client, actions,
+                                    thread_count=thread_count, **kwargs)
         else:
-            return self.client.update(
-                index=self.es_index,
-                doc_type=self.es_doc_type,
-                id=str(record.id),
-                body=body
-            )
+            results = streaming_bulk(self.client, actions, **kwargs)
+
+        report = {"success": 0, "failed": []}
+        for ok, item in results:
+            if ok:
+                report["success"] += 1
+                continue
+            info = next(iter(item.values()), {})
+            failed = {
+                "id": info.get("_id"),
+                "status": info.get("status"),
+                "error": info.get("error") or str(info.get("exception", ""))
+            }
+            current_app.logger.error(failed)
+            report["failed"].append(failed)
+        return report
+
+    @staticmethod
+    def merge_bulk_report(report, other):
+        """Merge the report of bulk_actions into the other."""
+        report["success"] += other["success"]
+        report["failed"].extend(other["failed"])
+        return report
+
+    def reindex_by_path(self, path, only_latest_version=False,
+                        chunk_size=None, thread_count=None):
+        """Update the path and oai sets of the items in the index from DB.
+
+        Args:
+            path (str|list): index id, or index ids.
+            only_latest_version (bool, optional): Defaults to False.
+            chunk_size (int, optional): number of actions per request.
+            thread_count (int, optional): number of concurrent requests.
+
+        Returns:
+            dict: report of bulk_actions.
+        """
+        report = {"success": 0, "failed": []}
+        for ids in self.get_pid_by_es_search_after(path, only_latest_version):
+            records = [
+                WekoDeposit(r.json, r) for r in RecordMetadata.query.filter(
+                    RecordMetadata.id.in_(ids)).all() if r.json
+            ]
+            self.merge_bulk_report(report, self.bulk_update_es_data(
+                records, update_oai=True, chunk_size=chunk_size,
+                thread_count=thread_count))
+        return report
 
     def index(self, record):
         """Index a record(fake function).
@@ -385,6 +600,62 @@ class WekoIndexer(RecordIndexer):
 
             self.client.clear_scroll(scroll_id=scroll_id)
 
+    def get_pid_by_es_search_after(self, path, only_latest_version=False,
+                                   size=None):
+        """Get pid by es search_after.
+
+        Unlike get_pid_by_es_scroll, no search context is kept between the
+        pages, so it does not expire while the pages are processed, and the
+        items can be updated during the iteration.
+
+        Args:
+            path (str|list): index id, or index ids.
+            only_latest_version (bool, optional): Defaults to False.
+            size (int, optional): number of ids per page.
+                Defaults to WEKO_DEPOSIT_BATCH_SEARCH_SIZE.
+
+        Yields:
+            list: ids of the items.
+        """
+        paths = [path] if isinstance(path, (str, int)) else path
+        search_query = {
+            "query": {
+                "bool": {
+                    "must": [
+                        {
+                            "terms": {
+                                "path": [str(p) for p in paths]
+                            }
+                        }
+                    ]
+                }
+            },
+            "_source": False,
+            "sort": [{"control_number": "asc"}],
+            "size": size or current_app.config.get(
+                'WEKO_DEPOSIT_BATCH_SEARCH_SIZE', 1000)
+        }
+
+        if only_latest_version:
+            search_query["query"]["bool"]["must"].append(
+                {
+                    "match": {
+                        "relation_version_is_last": "true"
+                    }
+                }
+            )
+
+        ind, doc_type = self.record_to_index({})
+        while True:
+            search_result = self.client.search(index=ind, doc_type=doc_type,
+                                               body=search_query)
+            hits = search_result.get('hits', {}).get('hits', []) \
+                if search_result else []
+            if not hits:
+                break
+            yield [h.get('_id') for h in hits]
+            search_query["search_after"] = hits[-1]['sort']
+
     def get_metadata_by_item_id(self, item_id, is_ignore=False):
         """Get metadata of item by id from ES.
 
@@ -413,7 +684,7 @@ class WekoIndexer(RecordIndexer):
         pst = 'feedback_mail_list'
         body = {'doc': {pst: feedback_mail.get('mail_list')}}
 
-        return self.client.update(
+        return self._update(
             index=self.es_index,
             doc_type=self.es_doc_type,
             id=str(feedback_mail.get('id')),
@@ -434,7 +705,7 @@ class WekoIndexer(RecordIndexer):
         pst = 'request_mail_list'
         body = {'doc': {pst: request_mail.get('mail_list')}}
 
-        return self.client.update(
+        return self._update(
             index=self.es_index,
             doc_type=self.es_doc_type,
             id=str(request_mail.get('id')),
@@ -448,7 +719,7 @@ class WekoIndexer(RecordIndexer):
         pst = 'author_link'
         body = {'doc': {pst: author_link.get('author_link')}}
 
-        return self.client.update(
+        return self._update(
             index=self.es_index,
             doc_type=self.es_doc_type,
             id=str(author_link.get('id')),
@@ -460,7 +731,7 @@ class WekoIndexer(RecordIndexer):
         # current_app.logger.error("dc:{}".format(dc));
         self.get_es_index()
         body = {'doc': {'_item_metadata': dc}}
-        return self.client.update(
+        return self._update(
             index=self.es_index,
             doc_type=self.es_doc_type,
             id=str(item_id),
@@ -496,6 +767,27 @@ class WekoIndexer(RecordIndexer):
                     current_app.logger.error(error)
 
 
+@db.event.listens_for(db.session, 'before_commit')
+def send_deferred_upload_before_commit(session):
+    """Send the actions of deferred_upload before the session is committed.
+
+    Savepoints are skipped, the actions are sent once before the commit of
+    the transaction.
+    """
+    actions = WekoIndexer._get_deferred_actions()
+    if not actions or session.transaction.parent is not None:
+        return
+    indexer = WekoIndexer()
+    indexer.get_es_index()
+    try:
+        _, errors = indexer.bulk_upload(actions)
+    finally:
+        del actions[:]
+    if errors:
+        raise BulkIndexError(
+            '%i document(s) failed to index.' % len(errors), errors)
+
+
 class WekoDeposit(Deposit):
     """Define API for changing deposit state."""
 
@@ -1241,7 +1533,8 @@ class WekoDeposit(Deposit):
                                 file_info = {
                                     "uri": file_instance.uri,
                                     "size": file_instance.size,
-                                    "is_pdf": mimetype == 'application/pdf'
+                                    "is_pdf": mimetype == 'application/pdf',
+                                    "checksum": file_instance.checksum
                                 }
                                 reading_targets[lst["filename"]] = file_info
                             attachment["content"] = data
@@ -1264,7 +1557,7 @@ class WekoDeposit(Deposit):
         """Get the path and size of the registered PDF file
 
         Returns:
-            pdf_files(dict): pdf_files ex: {'test1.pdf': {'uri': '/var/tmp/tmp5beo2byv/e2/5a/e1af-d89b-4ce0-bd01-a78833acbe1e/data', 'size': 1252395}"
+            pdf_files(dict): pdf_files ex: {'test1.pdf': {'uri': '/var/tmp/tmp5beo2byv/e2/5a/e1af-d89b-4ce0-bd01-a78833acbe1e/data', 'size': 1252395, 'is_pdf': True, 'checksum': 'md5:...'}"
         """
         pdf_files = {}
         fmd = self.get_file_data()
@@ -1282,7 +1575,8 @@ class WekoDeposit(Deposit):
                         file_info = {
                             "uri": file_instance.uri,
                             "size": file_instance.size,
-                            "is_pdf": mimetype == 'application/pdf'
+                            "is_pdf": mimetype == 'application/pdf',
+                            "checksum": file_instance.checksum
                         }
                         pdf_files[filename] = file_info
         return pdf_files
@@ -1780,6 +2074,47 @@ class WekoDeposit(Deposit):
             dep = WekoDeposit(r.json, r)
             dep.indexer.update_es_data(dep, update_revision=False, update_oai=True)
 
+    @classmethod
+    def delete_by_index_tree_ids(cls, index_ids, ignore_items=[]):
+        """Delete by index tree ids in bulk.
+
+        The indexes are removed from the path of the items in them as
+        delete_by_index_tree_id does, and the es data of the items are
+        updated in bulk page by page.
+
+        Args:
+            index_ids (list): index ids of the subtree.
+            ignore_items (list):
+                list of items that will be ingnored, therefore will not be deleted
+
+        Returns:
+            dict: report of WekoIndexer.bulk_actions.
+        """
+        from weko_records_ui.utils import soft_delete
+        index_ids = [str(i) for i in index_ids if i]
+        report = {"success": 0, "failed": []}
+        if not index_ids:
+            return report
+        for obj_ids in cls.indexer.get_pid_by_es_search_after(
+                index_ids, only_latest_version=True):
+            records = []
+            for r in RecordMetadata.query.filter(
+                    RecordMetadata.id.in_(obj_ids)).all():
+                if not r.json or r.json['recid'] in ignore_items:
+                    continue
+                r.json['path'] = [
+                    p for p in r.json['path'] if str(p) not in index_ids]
+                if '_oai' in r.json and 'sets' in r.json['_oai']:
+                    r.json['_oai']['sets'] = r.json['path']
+                flag_modified(r, 'json')
+                if not r.json['path']:
+                    soft_delete(str(r.id))
+                records.append(WekoDeposit(r.json, r))
+            cls.indexer.merge_bulk_report(
+                report, cls.indexer.bulk_update_es_data(
+                    records, update_oai=True))
+        return report
+
     def update_pid_by_index_tree_id(self, path):
         """
 
@@ -1797,7 +2132,7 @@ class WekoDeposit(Deposit):
         try:
             dt = datetime.utcnow()
             with db.session.begin_nested():
-                for result in self.indexer.get_pid_by_es_scroll(path):
+                for result in self.indexer.get_pid_by_es_search_after(path):
                     db.session.query(p). \
                         filter(p.object_uuid.in_(result),
                                p.object_type == 'rec'). \
@@ -2270,6 +2605,18 @@ class WekoRecord(Record):
             sqlalchemy.exc.OperationalError
             TypeError
         """
+        return self.switching_language(self.get_titles_with_language)
+
+    @property
+    def get_titles_with_language(self):
+        """Get titles of record with their languages.
+
+        Returns:
+            list: titles, e.g. [{'title': 'a', 'language': 'ja'}]
+        Raises:
+            sqlalchemy.exc.OperationalError
+            TypeError
+        """
         from weko_items_ui.utils import get_options_and_order_list, get_hide_list_by_schema_form
         item_type_id = self.get('item_type_id')
         item_type = ItemTypes.get_by_id(item_type_id)
@@ -2300,7 +2647,7 @@ class WekoRecord(Record):
                         titles.append(tmp.copy())
             if titles:
                 break
-        return self.switching_language(titles)
+        return titles
 
     @property
     def items_show_list(self):
@@ -58,6 +58,15 @@ WEKO_MIMETYPE_WHITELIST_FOR_ES = [
 WEKO_DEPOSIT_FILESIZE_LIMIT = 2 * 1024 * 1024
 """ The file size(Byte) limit for extracting text from a file. """
 
+WEKO_DEPOSIT_EXTRACT_PARALLEL = False
+""" Extract the text of each file of an item in a separate task. """
+
+WEKO_DEPOSIT_EXTRACT_CACHE_PREFIX = 'cache_extracted_text_{checksum}_{limit}'
+""" cache key of the text extracted from a file """
+
+WEKO_DEPOSIT_EXTRACT_CACHE_TTL = 60 * 60 * 24 * 7
+""" cache timeout of the text extracted from a file (sec.)"""
+
 FILES_REST_STORAGE_FACTORY = 'weko_deposit.storage.pyfs_storage_factory'
 """Import path of factory used to create a storage instance."""
 
@@ -88,6 +97,15 @@ WEKO_DEPOSIT_ITEMS_CACHE_TTL = 300
 
 WEKO_DEPOSIT_MAX_BACK_OFF_TIME = 32
 
+WEKO_DEPOSIT_BATCH_SEARCH_SIZE = 1000
+""" number of items per page in the batch operations of WekoIndexer """
+
+WEKO_DEPOSIT_BATCH_CHUNK_SIZE = 500
+""" number of actions per bulk request in the batch operations of WekoIndexer """
+
+WEKO_DEPOSIT_BATCH_THREAD_COUNT = 1
+""" number of concurrent bulk requests in the batch operations of WekoIndexer """
+
 _PID = 'pid(depid,record_class="weko_deposit.api:WekoDeposit")'
 
 #: Template for deposit list view.
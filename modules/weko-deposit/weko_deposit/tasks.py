@@ -30,7 +30,7 @@ from time import sleep
 from io import StringIO
 from distutils.util import strtobool
 
-from celery import shared_task
+from celery import chord, shared_task
 from celery.utils.log import get_task_logger
 from elasticsearch.exceptions import NotFoundError, ConflictError
 from flask import current_app
@@ -47,6 +47,7 @@ from sqlalchemy.exc import SQLAlchemyError, DisconnectionError, TimeoutError
 from amqp.exceptions import ConnectionError
 from weko_authors.models import Authors, AuthorsPrefixSettings, AuthorsAffiliationSettings
 from weko_records.api import ItemsMetadata
+from weko_redis.redis import RedisConnection
 from weko_schema_ui.models import PublishStatus
 from weko_workflow.utils import delete_cache_data, update_cache_data
 
@@ -60,6 +61,14 @@ SUCCESS_LABEL = "success_items"
 TARGET_LABEL = "target"
 ORIGIN_LABEL = "origin"
 TITLE_LIST = ["record_id", "author_ids", "message"]
+UPDATE_FILE_CONTENT_SCRIPT = (
+    "if (ctx._source.content != null) {"
+    " for (content in ctx._source.content) {"
+    " if (content.attachment != null && !content.attachment.isEmpty()"
+    " && params.file_datas.containsKey(content.filename)) {"
+    " content.attachment.content = params.file_datas.get(content.filename);"
+    " } } }"
+)
 
 @shared_task(ignore_result=True)
 def update_items_by_authorInfo( user_id, target, origin_pkid_list=[], origin_id_list=[], update_gather_flg=False, force_change=False):
@@ -633,40 +642,159 @@ def extract_pdf_and_update_file_contents(
         retry_count(int, Optional): The number of times to retry. Defaults to 3.
         retry_delay(int, Optional): The number of seconds to wait between retries. Defaults to 1.
     """
-    from weko_deposit.utils import extract_text_from_pdf, extract_text_with_tika
+    if current_app.config.get('WEKO_DEPOSIT_EXTRACT_PARALLEL') \
+            and len(files) > 1:
+        # extract each file in a separate task and update es at once.
+        chord(
+            extract_file_content.s(file) for file in files.values()
+        )(update_extracted_file_contents.s(
+            list(files.keys()), str(record_uuid), retry_count, retry_delay))
+        return
+
     file_datas = {}
     for filename, file in files.items():
-        data = ""
-        try:
-            storage = current_files_rest.storage_factory(
-                fileurl=file["uri"],
-                size=file["size"],
-            )
+        file_datas[filename] = _extract_file_content(file)
+    _update_file_content_with_retry(
+        record_uuid, file_datas, retry_count, retry_delay)
 
-            with storage.open(mode="rb") as fp:
-                with tempfile.NamedTemporaryFile(delete=True) as tmp:
-                    while True:
-                        chunk = fp.read(1024 * 1024)
-                        if not chunk:
-                            break
-                        tmp.write(chunk)
-                    tmp.flush()
-                    
-                    is_pdf = file.get("is_pdf", False)
-                    tmp_filename = tmp.name
-                    file_size_limit = current_app.config['WEKO_DEPOSIT_FILESIZE_LIMIT']
-                    if is_pdf:
-                        data = extract_text_from_pdf(tmp_filename,file_size_limit)
-                    else:
-                        data = extract_text_with_tika(tmp_filename,file_size_limit)
-        except FileNotFoundError as ex:
-            current_app.logger.error(ex)
-        except ResourceNotFoundError as ex:
-            current_app.logger.error(ex)
-        except Exception as ex:
-            current_app.logger.error(ex)
-        file_datas[filename] = data
 
+@shared_task
+def extract_file_content(file):
+    """Extract text from a file.
+
+    Args:
+        file(dict): file uri and size,is_pdf flag and checksum.
+
+    Returns:
+        str: Extracted text.
+    """
+    return _extract_file_content(file)
+
+
+@shared_task(ignore_result=True)
+def update_extracted_file_contents(
+    datas, filenames, record_uuid, retry_count=3, retry_delay=1):
+    """Update es document with the texts extracted by extract_file_content.
+
+    Args:
+        datas(list): Extracted texts in the order of filenames.
+        filenames(list): File names.
+        record_uuid(str): The id of the document to update.
+        retry_count(int, Optional): The number of times to retry. Defaults to 3.
+        retry_delay(int, Optional): The number of seconds to wait between retries. Defaults to 1.
+    """
+    _update_file_content_with_retry(
+        record_uuid, dict(zip(filenames, datas)), retry_count, retry_delay)
+
+
+def _extract_file_content(file):
+    """Extract text from a file, or get it from the cache by the checksum.
+
+    Args:
+        file(dict): file uri and size,is_pdf flag and checksum.
+
+    Returns:
+        str: Extracted text. Empty if the extraction failed.
+    """
+    from weko_deposit.utils import extract_text_from_pdf, extract_text_with_tika
+    file_size_limit = current_app.config['WEKO_DEPOSIT_FILESIZE_LIMIT']
+    cache_key = None
+    if file.get("checksum"):
+        cache_key = current_app.config.get(
+            'WEKO_DEPOSIT_EXTRACT_CACHE_PREFIX',
+            'cache_extracted_text_{checksum}_{limit}'
+        ).format(checksum=file["checksum"], limit=file_size_limit)
+        data = _get_extracted_text_cache(cache_key)
+        if data is not None:
+            return data
+
+    data = ""
+    try:
+        storage = current_files_rest.storage_factory(
+            fileurl=file["uri"],
+            size=file["size"],
+        )
+
+        with storage.open(mode="rb") as fp:
+            with tempfile.NamedTemporaryFile(delete=True) as tmp:
+                while True:
+                    chunk = fp.read(1024 * 1024)
+                    if not chunk:
+                        break
+                    tmp.write(chunk)
+                tmp.flush()
+
+                is_pdf = file.get("is_pdf", False)
+                tmp_filename = tmp.name
+                if is_pdf:
+                    data = extract_text_from_pdf(tmp_filename,file_size_limit)
+                else:
+                    data = extract_text_with_tika(tmp_filename,file_size_limit)
+    except FileNotFoundError as ex:
+        current_app.logger.error(ex)
+        return data
+    except ResourceNotFoundError as ex:
+        current_app.logger.error(ex)
+        return data
+    except Exception as ex:
+        current_app.logger.error(ex)
+        return data
+
+    if cache_key:
+        _set_extracted_text_cache(cache_key, data)
+    return data
+
+
+def _get_extracted_text_cache(cache_key):
+    """Get the extracted text from the cache.
+
+    Args:
+        cache_key(str): Cache key.
+
+    Returns:
+        str: Extracted text. None if it is not cached.
+    """
+    try:
+        redis_connection = RedisConnection()
+        datastore = redis_connection.connection(
+            db=current_app.config['CACHE_REDIS_DB'], kv=True)
+        if datastore.redis.exists(cache_key):
+            return datastore.get(cache_key).decode('utf-8')
+    except Exception as ex:
+        current_app.logger.warning(ex)
+    return None
+
+
+def _set_extracted_text_cache(cache_key, data):
+    """Put the extracted text in the cache.
+
+    Args:
+        cache_key(str): Cache key.
+        data(str): Extracted text.
+    """
+    try:
+        redis_connection = RedisConnection()
+        datastore = redis_connection.connection(
+            db=current_app.config['CACHE_REDIS_DB'], kv=True)
+        datastore.put(
+            cache_key, data.encode('utf-8'),
+            ttl_secs=current_app.config.get(
+                'WEKO_DEPOSIT_EXTRACT_CACHE_TTL', 60 * 60 * 24 * 7))
+    except Exception as ex:
+        current_app.logger.warning(ex)
+
+
+def _update_file_content_with_retry(
+    record_uuid, file_datas, retry_count=3, retry_delay=1):
+    """Update the content of the es document with retries.
+
+    Args:
+        record_uuid(str): The id of the document to update.
+        file_datas(dict): A dictionary of file names and contents.
+        retry_count(int, Optional): The number of times to retry. Defaults to 3.
+        retry_delay(int, Optional): The number of seconds to wait between retries. Defaults to 1.
+    """
+    success = False
     for attempt in range(retry_count):
         try:
             update_file_content(record_uuid, file_datas)
@@ -690,6 +818,10 @@ def extract_pdf_and_update_file_contents(
 
 def update_file_content(record_uuid, file_datas):
     """Update the content of the es document
+
+    Only "content[].attachment.content" of the files is updated by a
+    script, the rest of the document is not sent to Elasticsearch.
+
     Args:
         record_uuid (str): The id of the document to update.
         file_datas (dict): A dictionary of file names and contents.
@@ -700,21 +832,15 @@ def update_file_content(record_uuid, file_datas):
     """
     indexer = WekoIndexer()
     indexer.get_es_index()
-    res = indexer.get_metadata_by_item_id(record_uuid)
-    es_data = res.get("_source",{})
-    contents = es_data.get("content",[])
-    for content in contents:
-        if content.get("filename") not in list(file_datas.keys()):
-            continue
-        if content.get("attachment",{}):
-            content["attachment"]["content"] = file_datas[content.get("filename")]
-    es_data["content"] = contents
-
-    indexer.client.index(
+    indexer.client.update(
         index=indexer.es_index,
+        doc_type=indexer.es_doc_type,
         id=str(record_uuid),
-        body=es_data,
-        version=res.get('_version'),
-        version_type = "external_gte",
-        doc_type=res.get("_type")
+        body={
+            "script": {
+                "source": UPDATE_FILE_CONTENT_SCRIPT,
+                "lang": "painless",
+                "params": {"file_datas": file_datas}
+            }
+        }
     )
@@ -102,6 +102,9 @@ setup(
             'weko_index_tree_view = weko_index_tree.bundles:js_treeview',
             'weko_index_tree_js = weko_index_tree.bundles:js',
         ],
+        'flask.commands': [
+            'index_tree = weko_index_tree.cli:index_tree',
+        ],
         'invenio_db.alembic': [
             'weko_index_tree = weko_index_tree:alembic',
         ],
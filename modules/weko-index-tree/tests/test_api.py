@@ -291,6 +291,15 @@ def test_indexes_delete_by_action(app, db, user):
     res = Indexes.delete_by_action('delete', 1)
     assert res==0
 
+    # failed to update the items in the indexes
+    with patch("weko_index_tree.api.Indexes.delete", return_value=[1, 2]):
+        with patch("weko_deposit.api.WekoDeposit.delete_by_index_tree_ids",
+                   return_value={"success": 1, "failed": [{"id": "x"}]}):
+            assert Indexes.delete_by_action('all', 1) is None
+        with patch("weko_deposit.api.WekoDeposit.delete_by_index_tree_ids",
+                   return_value={"success": 2, "failed": []}):
+            assert Indexes.delete_by_action('all', 1) == [1, 2]
+
 
 # class Indexes(object):
 #     def move(cls, index_id, **data):
@@ -704,6 +713,87 @@ def test_Indexes_get_public_indexes_list(i18n_app, db):
     result = Indexes.get_public_indexes_list()
     assert result == ["1", "11"]
 
+# def get_harvest_public_states(cls):
+# def get_next_public_date(cls):
+# .tox/c1/bin/pytest --cov=weko_index_tree tests/test_api.py::test_Indexes_index_tree_snapshot -v -s -vv --cov-branch --cov-report=term --cov-config=tox.ini --basetemp=/code/modules/weko-index-tree/.tox/c1/tmp
+def test_Indexes_index_tree_snapshot(i18n_app, db, test_indices):
+    from weko_index_tree.utils import _index_tree_snapshots
+    from weko_redis.redis import RedisConnection
+    key = i18n_app.config["WEKO_INDEX_TREE_SNAPSHOT_VERSION_KEY"]
+    datastore = RedisConnection().connection(db=i18n_app.config["CACHE_REDIS_DB"])
+    datastore.delete(key)
+    _index_tree_snapshots.clear()
+    i18n_app.config["WEKO_INDEX_TREE_SNAPSHOT_ENABLED"] = True
+    try:
+        # get_harvest_public_state from the snapshot
+        assert Indexes.get_harvest_public_state(['3']) == True
+        assert Indexes.get_harvest_public_state(['33']) == None
+        assert Indexes.get_harvest_public_state(['33'], with_deleted=True) == False
+        assert Indexes.get_harvest_public_state(['3/33', '1/11'], with_deleted=True) == True
+        assert Indexes.get_harvest_public_state(['a']) == False
+        assert Indexes.get_harvest_public_states()[33] == (False, True)
+
+        # get_public_indexes_list expires at the next public date
+        assert Indexes.get_next_public_date() == None
+        assert Indexes.get_public_indexes_list() == ['1', '2', '3', '11', '21', '22']
+
+        # changes are visible after commit
+        index = Index.query.filter_by(id=31).one()
+        index.public_state = True
+        db.session.merge(index)
+        db.session.commit()
+        assert int(datastore.get(key)) == 1
+        assert Indexes.get_public_indexes_list() == ['1', '2', '3', '11', '21', '22', '31']
+
+        index = Index.query.filter_by(id=31).one()
+        index.public_date = datetime(2100, 1, 1)
+        db.session.merge(index)
+        db.session.commit()
+        assert Indexes.get_next_public_date().year == 2100
+    finally:
+        i18n_app.config["WEKO_INDEX_TREE_SNAPSHOT_ENABLED"] = False
+        _index_tree_snapshots.clear()
+        datastore.delete(key)
+
+#     def get_browsing_tree_paths(cls, index_id: int = 0):
+#     def _get_browsing_tree_paths(cls, index_id, is_authenticated, is_admin, roles, groups):
+# .tox/c1/bin/pytest --cov=weko_index_tree tests/test_api.py::test_Indexes_get_browsing_tree_paths_snapshot -v -s -vv --cov-branch --cov-report=term --cov-config=tox.ini --basetemp=/code/modules/weko-index-tree/.tox/c1/tmp
+def test_Indexes_get_browsing_tree_paths_snapshot(i18n_app, db, users, test_indices):
+    from weko_index_tree.utils import _index_tree_snapshots
+    from weko_redis.redis import RedisConnection
+    key = i18n_app.config["WEKO_INDEX_TREE_SNAPSHOT_VERSION_KEY"]
+    datastore = RedisConnection().connection(db=i18n_app.config["CACHE_REDIS_DB"])
+    datastore.delete(key)
+    _index_tree_snapshots.clear()
+    i18n_app.config["WEKO_INDEX_TREE_SNAPSHOT_ENABLED"] = True
+    try:
+        with i18n_app.test_request_context():
+            with patch("weko_index_tree.api.Indexes.get_browsing_tree_ignore_more",
+                       wraps=Indexes.get_browsing_tree_ignore_more) as mock_tree:
+                with patch("flask_login.utils._get_user", return_value=users[3]['obj']):
+                    res = Indexes.get_browsing_tree_paths(None)
+                    assert Indexes.get_browsing_tree_paths(None) == res
+                    assert mock_tree.call_count == 1
+
+                # another set of roles has its own paths
+                with patch("flask_login.utils._get_user", return_value=users[0]['obj']):
+                    Indexes.get_browsing_tree_paths(None)
+                    Indexes.get_browsing_tree_paths(None)
+                    assert mock_tree.call_count == 2
+
+                # the paths are built again after an index is changed
+                index = Index.query.filter_by(id=31).one()
+                index.public_state = not index.public_state
+                db.session.merge(index)
+                db.session.commit()
+                with patch("flask_login.utils._get_user", return_value=users[3]['obj']):
+                    Indexes.get_browsing_tree_paths(None)
+                    assert mock_tree.call_count == 3
+    finally:
+        i18n_app.config["WEKO_INDEX_TREE_SNAPSHOT_ENABLED"] = False
+        _index_tree_snapshots.clear()
+        datastore.delete(key)
+
 # .tox/c1/bin/pytest --cov=weko_index_tree tests/test_api.py::test_indexes_get_index_tree -v -s -vv --cov-branch --cov-report=html --cov-config=tox.ini --basetemp=/code/modules/weko-index-tree/.tox/c1/tmp
 def test_indexes_get_index_tree(i18n_app, db, redis_connect, users, db_records, test_indices, communities, mocker):
     os.environ['INVENIO_WEB_HOST_NAME'] = "test"
@@ -948,6 +1038,15 @@ def test_indexes_get_index_tree(i18n_app, db, redis_connect, users, db_records,
         res = Indexes.get_self_list(32, with_deleted=True)
         assert res==[(3, 32, '3/32', 'テストインデックス 3-/-テストインデックス 32', 'Test index 3-/-Test index 32', 2, True, None, '', '3,-99', 'g1,g2', True, True)]
 
+        # get_self_list_ids
+        res = Indexes.get_self_list_ids([1, 2, 3])
+        assert res==['1', '11', '2', '21', '22', '3']
+        res = Indexes.get_self_list_ids([1, 1, 31])
+        assert res==['1', '11']
+        with patch("flask_login.utils._get_user", return_value=users[3]['obj']):
+            res = Indexes.get_self_list_ids([31])
+            assert res==['31']
+
         # get_self_path
         res = Indexes.get_self_path(3)
         assert res==(0, 3, '3', 'テストインデックス 3', 'Test index 3', 1, True, None, '', '3,-99', 'g1,g2', True, False)
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of WEKO3.
+# Copyright (C) 2017 National Institute of Informatics.
+#
+# WEKO3 is free software; you can redistribute it
+# and/or modify it under the terms of the GNU General Public License as
+# published by the Free Software Foundation; either version 2 of the
+# License, or (at your option) any later version.
+#
+# WEKO3 is distributed in the hope that it will be
+# useful, but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with WEKO3; if not, write to the
+# Free Software Foundation, Inc., 59 Temple Place, Suite 330, Boston,
+# MA 02111-1307, USA.
+
+"""Module tests."""
+
+from click.testing import CliRunner
+from flask.cli import ScriptInfo
+
+from weko_index_tree.cli import check_closure, rebuild_closure
+from weko_index_tree.models import IndexClosure
+
+
+# def check_closure(fix):
+# .tox/c1/bin/pytest --cov=weko_index_tree tests/test_cli.py::test_check_closure -v -s -vv --cov-branch --cov-report=term --cov-config=tox.ini --basetemp=/code/modules/weko-index-tree/.tox/c1/tmp
+def test_check_closure(app, db, test_indices):
+    runner = CliRunner()
+    script_info = ScriptInfo(create_app=lambda info: app)
+
+    result = runner.invoke(check_closure, [], obj=script_info)
+    assert result.exit_code == 0
+    assert result.output == "Index closure table is consistent.\n"
+
+    with db.session.begin_nested():
+        db.session.query(IndexClosure).filter_by(descendant=11).delete()
+    db.session.commit()
+
+    result = runner.invoke(check_closure, [], obj=script_info)
+    assert result.exit_code == 1
+    assert "missing: ancestor=11, descendant=11, depth=0" in result.output
+    assert "Index closure table is inconsistent." in result.output
+
+    result = runner.invoke(check_closure, ["--fix"], obj=script_info)
+    assert result.exit_code == 0
+    assert "Index closure table has been rebuilt." in result.output
+    assert IndexClosure.check() == ([], [])
+
+
+# def rebuild_closure():
+# .tox/c1/bin/pytest --cov=weko_index_tree tests/test_cli.py::test_rebuild_closure -v -s -vv --cov-branch --cov-report=term --cov-config=tox.ini --basetemp=/code/modules/weko-index-tree/.tox/c1/tmp
+def test_rebuild_closure(app, db, test_indices):
+    runner = CliRunner()
+    script_info = ScriptInfo(create_app=lambda info: app)
+
+    db.session.query(IndexClosure).delete()
+    db.session.commit()
+
+    result = runner.invoke(rebuild_closure, [], obj=script_info)
+    assert result.exit_code == 0
+    assert "Index closure table has been rebuilt." in result.output
+    assert IndexClosure.check() == ([], [])
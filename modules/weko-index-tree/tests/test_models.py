@@ -1,6 +1,6 @@
 from mock import patch
 
-from weko_index_tree.models import Index, IndexStyle
+from weko_index_tree.models import Index, IndexClosure, IndexStyle
 
 
 # class Index(db.Model, Timestamp):
@@ -89,4 +89,73 @@ def test_IndexStyle(app, db):
         assert res == None
 
         res = IndexStyle.update("weko", **_data1)
-        assert res == None
\ No newline at end of file
+        assert res == None
+
+
+# class IndexClosure(db.Model):
+#     def insert_node(cls, connection, index_id, parent):
+#     def move_subtree(cls, connection, index_id, parent):
+#     def delete_node(cls, connection, index_id):
+#     def check(cls):
+#     def rebuild(cls):
+# .tox/c1/bin/pytest --cov=weko_index_tree tests/test_models.py::test_IndexClosure -v -s -vv --cov-branch --cov-report=term --cov-config=tox.ini --basetemp=/code/modules/weko-index-tree/.tox/c1/tmp
+def test_IndexClosure(app, db):
+    def get_rows():
+        return set(db.session.query(
+            IndexClosure.ancestor, IndexClosure.descendant,
+            IndexClosure.depth).all())
+
+    # children added before their parent are linked to it
+    with db.session.begin_nested():
+        db.session.add(Index(id=111, parent=11, position=0))
+        db.session.flush()
+        db.session.add(Index(id=11, parent=1, position=0))
+        db.session.flush()
+        db.session.add(Index(id=1, parent=0, position=0))
+        db.session.add(Index(id=2, parent=0, position=1))
+    db.session.commit()
+    assert get_rows() == {
+        (1, 1, 0), (0, 1, 1),
+        (2, 2, 0), (0, 2, 1),
+        (11, 11, 0), (1, 11, 1), (0, 11, 2),
+        (111, 111, 0), (11, 111, 1), (1, 111, 2), (0, 111, 3),
+    }
+    assert IndexClosure.check() == ([], [])
+
+    # move a subtree
+    index = Index.query.filter_by(id=11).one()
+    index.parent = 2
+    db.session.merge(index)
+    db.session.commit()
+    assert get_rows() == {
+        (1, 1, 0), (0, 1, 1),
+        (2, 2, 0), (0, 2, 1),
+        (11, 11, 0), (2, 11, 1), (0, 11, 2),
+        (111, 111, 0), (11, 111, 1), (2, 111, 2), (0, 111, 3),
+    }
+    assert IndexClosure.check() == ([], [])
+
+    # move to the root
+    index.parent = 0
+    db.session.merge(index)
+    db.session.commit()
+    assert (0, 111, 2) in get_rows()
+    assert (2, 111, 2) not in get_rows()
+    assert IndexClosure.check() == ([], [])
+
+    # delete
+    db.session.delete(Index.query.filter_by(id=2).one())
+    db.session.commit()
+    assert not [row for row in get_rows() if 2 in row[:2]]
+    assert IndexClosure.check() == ([], [])
+
+    # check and rebuild
+    with db.session.begin_nested():
+        db.session.query(IndexClosure).filter_by(descendant=111).delete()
+        db.session.add(IndexClosure(ancestor=1, descendant=11, depth=1))
+    db.session.commit()
+    missing, unexpected = IndexClosure.check()
+    assert missing == [(0, 111, 2), (11, 111, 1), (111, 111, 0)]
+    assert unexpected == [(1, 11, 1)]
+    assert IndexClosure.rebuild() == 7
+    assert IndexClosure.check() == ([], [])
@@ -24,6 +24,10 @@ from weko_index_tree.utils import (
     perform_delete_index,
     get_doi_items_in_index,
     cached_index_tree_json,
+    cached_index_tree_snapshot,
+    get_index_tree_version,
+    update_index_tree_version,
+    mark_index_tree_updated,
     reset_tree,
     get_tree_json,
     get_editing_items_in_index,
@@ -128,6 +132,125 @@ def test_cached_index_tree_json(i18n_app):
     assert cached_index_tree_json()
 
 
+# def get_index_tree_version():
+# def update_index_tree_version():
+# .tox/c1/bin/pytest --cov=weko_index_tree tests/test_utils.py::test_index_tree_version -v -s -vv --cov-branch --cov-report=term --cov-config=tox.ini --basetemp=/code/modules/weko-index-tree/.tox/c1/tmp
+def test_index_tree_version(i18n_app):
+    key = i18n_app.config["WEKO_INDEX_TREE_SNAPSHOT_VERSION_KEY"]
+    datastore = RedisConnection().connection(db=i18n_app.config["CACHE_REDIS_DB"])
+    datastore.delete(key)
+
+    with i18n_app.app_context():
+        assert get_index_tree_version() == 0
+        datastore.set(key, 5)
+        # read once per application context
+        assert get_index_tree_version() == 0
+        assert update_index_tree_version() == 6
+        assert get_index_tree_version() == 6
+    with i18n_app.app_context():
+        assert get_index_tree_version() == 6
+
+    with i18n_app.app_context():
+        with patch("weko_index_tree.utils.RedisConnection.connection", side_effect=Exception("redis error")):
+            assert get_index_tree_version() == None
+            assert update_index_tree_version() == None
+    datastore.delete(key)
+
+
+# def cached_index_tree_snapshot(expires=None):
+# .tox/c1/bin/pytest --cov=weko_index_tree tests/test_utils.py::test_cached_index_tree_snapshot -v -s -vv --cov-branch --cov-report=term --cov-config=tox.ini --basetemp=/code/modules/weko-index-tree/.tox/c1/tmp
+def test_cached_index_tree_snapshot(i18n_app):
+    from weko_index_tree.utils import _index_tree_snapshots
+    key = i18n_app.config["WEKO_INDEX_TREE_SNAPSHOT_VERSION_KEY"]
+    datastore = RedisConnection().connection(db=i18n_app.config["CACHE_REDIS_DB"])
+    datastore.delete(key)
+    _index_tree_snapshots.clear()
+    calls = []
+
+    class Tree:
+        @classmethod
+        @cached_index_tree_snapshot()
+        def get(cls, pid=0):
+            calls.append(pid)
+            return [{"id": pid, "children": []}]
+
+        @classmethod
+        @cached_index_tree_snapshot(expires=lambda: datetime(2000, 1, 1).astimezone())
+        def get_expired(cls):
+            calls.append("expired")
+            return []
+
+    # disabled
+    with i18n_app.app_context():
+        assert Tree.get(1) == [{"id": 1, "children": []}]
+        assert Tree.get(1) == [{"id": 1, "children": []}]
+    assert calls == [1, 1]
+
+    i18n_app.config["WEKO_INDEX_TREE_SNAPSHOT_ENABLED"] = True
+    try:
+        calls.clear()
+        with i18n_app.app_context():
+            tree = Tree.get(1)
+            tree[0]["children"].append("modified")
+            assert Tree.get(1) == [{"id": 1, "children": []}]
+            assert Tree.get(pid=2) == [{"id": 2, "children": []}]
+        with i18n_app.app_context():
+            assert Tree.get(1) == [{"id": 1, "children": []}]
+        assert calls == [1, 2]
+
+        # another worker updated the index tree
+        datastore.incr(key)
+        with i18n_app.app_context():
+            assert Tree.get(1) == [{"id": 1, "children": []}]
+            assert Tree.get(1) == [{"id": 1, "children": []}]
+        assert calls == [1, 2, 1]
+
+        # expired
+        with i18n_app.app_context():
+            Tree.get_expired()
+            Tree.get_expired()
+        assert calls == [1, 2, 1, "expired", "expired"]
+
+        # redis is not available
+        with i18n_app.app_context():
+            with patch("weko_index_tree.utils.get_index_tree_version", return_value=None):
+                Tree.get(1)
+        assert calls == [1, 2, 1, "expired", "expired", 1]
+    finally:
+        i18n_app.config["WEKO_INDEX_TREE_SNAPSHOT_ENABLED"] = False
+        _index_tree_snapshots.clear()
+        datastore.delete(key)
+
+
+# def mark_index_tree_updated(session=None):
+# .tox/c1/bin/pytest --cov=weko_index_tree tests/test_utils.py::test_mark_index_tree_updated -v -s -vv --cov-branch --cov-report=term --cov-config=tox.ini --basetemp=/code/modules/weko-index-tree/.tox/c1/tmp
+def test_mark_index_tree_updated(i18n_app, db):
+    key = i18n_app.config["WEKO_INDEX_TREE_SNAPSHOT_VERSION_KEY"]
+    datastore = RedisConnection().connection(db=i18n_app.config["CACHE_REDIS_DB"])
+    datastore.delete(key)
+    i18n_app.config["WEKO_INDEX_TREE_SNAPSHOT_ENABLED"] = True
+    try:
+        # index changes update the version on commit
+        db.session.add(Index(id=1, parent=0, position=0))
+        assert datastore.get(key) == None
+        db.session.commit()
+        assert int(datastore.get(key)) == 1
+
+        # bulk updates are marked explicitly
+        Indexes.set_online_issn_resc(0, "1234-5678")
+        db.session.commit()
+        assert int(datastore.get(key)) == 2
+
+        # rolled back changes do not update the version
+        mark_index_tree_updated()
+        db.session.rollback()
+        db.session.commit()
+        assert int(datastore.get(key)) == 2
+    finally:
+        i18n_app.config["WEKO_INDEX_TREE_SNAPSHOT_ENABLED"] = False
+        datastore.delete(key)
+
+
 # def reset_tree(tree, path=None, more_ids=None, ignore_more=False):
 # .tox/c1/bin/pytest --cov=weko_index_tree tests/test_utils.py::test_get_index_link_list -v -s -vv --cov-branch --cov-report=term --cov-config=tox.ini --basetemp=/code/modules/weko-index-tree/.tox/c1/tmp
 def test_reset_tree(app, db, users):
@@ -0,0 +1,50 @@
+#
+# This file is part of Invenio.
+# Copyright (C) 2016-2018 CERN.
+#
+# Invenio is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""add index closure"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7d4b1f0c9a2e'
+down_revision = 'efd70c593f4b'
+branch_labels = ()
+depends_on = None
+
+
+def upgrade():
+    """Upgrade database."""
+    op.create_table(
+        'index_closure',
+        sa.Column('ancestor', sa.BigInteger(), autoincrement=False,
+                  nullable=False),
+        sa.Column('descendant', sa.BigInteger(), autoincrement=False,
+                  nullable=False),
+        sa.Column('depth', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('ancestor', 'descendant',
+                                name=op.f('pk_index_closure'))
+    )
+    op.create_index('ix_index_closure_descendant_depth', 'index_closure',
+                    ['descendant', 'depth'], unique=False)
+    op.execute(
+        'INSERT INTO index_closure (ancestor, descendant, depth) '
+        'WITH RECURSIVE closure(ancestor, descendant, depth) AS ('
+        ' SELECT id, id, 0 FROM "index"'
+        ' UNION ALL'
+        ' SELECT i.parent, c.descendant, c.depth + 1'
+        ' FROM closure c JOIN "index" i ON i.id = c.ancestor'
+        ') SELECT ancestor, descendant, depth FROM closure'
+    )
+
+
+def downgrade():
+    """Downgrade database."""
+    op.drop_index('ix_index_closure_descendant_depth',
+                  table_name='index_closure')
+    op.drop_table('index_closure')
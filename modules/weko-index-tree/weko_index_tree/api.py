@@ -32,6 +32,7 @@ from redis.exceptions import RedisError
 from flask import current_app, json, request
 from flask_babelex import gettext as _
 from flask_login import current_user
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.orm import aliased
 from sqlalchemy.orm.attributes import flag_modified
@@ -46,11 +47,12 @@ from weko_groups.api import Group
 from weko_redis.redis import RedisConnection
 from weko_handle.api import Handle
 
-from .models import Index
-from .utils import cached_index_tree_json, check_doi_in_index, \
-    check_restrict_doi_with_indexes, filter_index_list_by_role, \
-    get_index_id_list, get_publish_index_id_list, get_tree_json, \
-    get_user_roles, is_index_locked, reset_tree, sanitize, save_index_trees_to_redis, \
+from .models import Index, IndexClosure
+from .utils import cached_index_tree_json, cached_index_tree_snapshot, \
+    check_doi_in_index, check_restrict_doi_with_indexes, \
+    filter_index_list_by_role, get_index_id_list, get_publish_index_id_list, \
+    get_tree_json, get_user_groups, get_user_roles, is_index_locked, \
+    mark_index_tree_updated, reset_tree, sanitize, save_index_trees_to_redis, \
     save_index_reset_trees_to_redis, save_index_reset_trees_ignore_more_to_redis
 
 
@@ -367,35 +369,23 @@ class Indexes(object):
                     synchronize_session='fetch')
                 slf.updated = updated
                 slf.is_deleted = True
+                mark_index_tree_updated()
                 p_lst = [o.id for o in obj_list]
+                connection = db.session.connection()
+                for child_id in p_lst:
+                    IndexClosure.move_subtree(connection, child_id,
+                                              slf.parent)
                 cls.delete_set_info('move', index_id, p_lst)
                 return p_lst
         else:
             with db.session.no_autoflush:
-                recursive_t = cls.recs_query(pid=index_id)
-                obj = db.session.query(recursive_t). \
-                    union_all(db.session.query(
-                        Index.parent,
-                        Index.id,
-                        literal_column("''", db.Text).label("path"),
-                        literal_column("''", db.Text).label("name"),
-                        literal_column("''", db.Text).label(
-                            "name_en"),
-                        literal_column("0", db.Integer).label("lev"),
-                        Index.public_state,
-                        Index.public_date,
-                        Index.comment,
-                        Index.browsing_role,
-                        Index.browsing_group,
-                        Index.harvest_public_state,
-                        Index.is_deleted,
-                    ).filter(
-                        Index.id == index_id,
-                        Index.is_deleted == False
-                    )).all()
+                recursive_t = cls.recs_closure_query(pid=index_id,
+                                                     min_depth=0)
+                obj = db.session.query(recursive_t.c.cid).all()
 
             if obj:
                 p_lst = [o.cid for o in obj]
+                mark_index_tree_updated()
                 with db.session.begin_nested():
                     e = 0
                     batch = 100
@@ -433,8 +423,12 @@ class Indexes(object):
             result = cls.delete(index_id)
             if result:
                 # delete indexes all
-                for i in result:
-                    WekoDeposit.delete_by_index_tree_id(i)
+                report = WekoDeposit.delete_by_index_tree_ids(result)
+                if report.get('failed'):
+                    current_app.logger.error(
+                        'Failed to update items of index {}: {}'.format(
+                            index_id, report['failed']))
+                    return None
         return result
 
     @classmethod
@@ -654,6 +648,7 @@ class Indexes(object):
         return ret
 
     @classmethod
+    @cached_index_tree_snapshot()
     @cached_index_tree_json(timeout=None,)
     def get_index_tree(cls, pid=0, lang=None, with_deleted=False):
         """Get index tree json."""
@@ -677,7 +672,8 @@ class Indexes(object):
     @classmethod
     def get_browsing_tree(cls, pid=0):
         """Get browsing tree."""
-        if pid == 0:
+        if pid == 0 and \
+                not current_app.config.get('WEKO_INDEX_TREE_SNAPSHOT_ENABLED'):
             try:
                 redis_connection = RedisConnection()
                 datastore = redis_connection.connection(db=current_app.config['CACHE_REDIS_DB'], kv = True)
@@ -727,7 +723,8 @@ class Indexes(object):
     @classmethod
     def get_browsing_tree_ignore_more(cls, pid=0):
         """Get browsing tree ignore more."""
-        if pid == 0:
+        if pid == 0 and \
+                not current_app.config.get('WEKO_INDEX_TREE_SNAPSHOT_ENABLED'):
             try:
                 redis_connection = RedisConnection()
                 datastore = redis_connection.connection(db=current_app.config['CACHE_REDIS_DB'], kv = True)
@@ -780,7 +777,32 @@ class Indexes(object):
         """
         if not index_id:
             index_id = 0
-        if current_user and current_user.is_authenticated:
+        is_authenticated = bool(current_user and current_user.is_authenticated)
+        is_admin, roles = get_user_roles(is_super_role=False)
+        groups = get_user_groups() if is_authenticated and not is_admin \
+            else []
+        return cls._get_browsing_tree_paths(
+            index_id, is_authenticated, is_admin,
+            tuple(sorted(roles or [])), tuple(sorted(groups)))
+
+    @classmethod
+    @cached_index_tree_snapshot(
+        expires=lambda: Indexes.get_next_public_date())
+    def _get_browsing_tree_paths(cls, index_id, is_authenticated, is_admin,
+                                 roles, groups):
+        """Get browsing tree paths of the current user.
+
+        The permissions of the user are given so that the paths are held in
+        the snapshot once for each set of roles and groups.
+
+        :param index_id: Index identifier.
+        :param is_authenticated: True if the user is logged in.
+        :param is_admin: True if the user has an administrator role.
+        :param roles: Sorted role ids of the user.
+        :param groups: Sorted group ids of the user.
+        :return: the list of the paths.
+        """
+        if is_authenticated:
             tree = cls.get_browsing_tree_ignore_more(index_id)
         elif index_id == 0:
             tree = cls.get_browsing_reset_tree_ignore_more(index_id)
@@ -1085,9 +1107,9 @@ class Indexes(object):
             if not index_id:
                 node_lst.remove(index_id)
 
-        recursive_t = cls.recs_query(with_deleted=with_deleted)
-        q = db.session.query(recursive_t).filter(
-            recursive_t.c.cid.in_(node_lst)).all()
+        recursive_t = cls.recs_query(with_deleted=with_deleted,
+                                     cids=node_lst)
+        q = db.session.query(recursive_t).all()
         return q
 
     @classmethod
@@ -1099,10 +1121,9 @@ class Indexes(object):
         :param with_deleted: Include deleted index.
         :return: the list of index.
         """
-        node_paths = [cls.get_full_path(item, with_deleted=with_deleted) for item in index_ids]
-        recursive_t = cls.recs_query(with_deleted=with_deleted)
-        q = db.session.query(recursive_t).filter(
-            recursive_t.c.path.in_(node_paths)). \
+        recursive_t = cls.recs_query(with_deleted=with_deleted,
+                                     cids=index_ids)
+        q = db.session.query(recursive_t). \
             order_by(recursive_t.c.path).all()
         return filter_index_list_by_role(q)
 
@@ -1141,6 +1162,43 @@ class Indexes(object):
 
         return lst
 
+    @classmethod
+    def get_self_list_ids(cls, index_ids, with_deleted=False):
+        """
+        Get the ids of the indexes listed by get_self_list for many indexes.
+
+        :param index_ids: Identifiers of the indexes.
+        :param with_deleted: Include deleted index.
+        :return: the list of index ids.
+        """
+        return cls._get_self_list_ids(
+            tuple(index_ids), get_user_roles(is_super_role=True)[0],
+            with_deleted)
+
+    @classmethod
+    @cached_index_tree_snapshot()
+    def _get_self_list_ids(cls, index_ids, is_super_role, with_deleted):
+        """
+        Get the ids of the indexes listed by get_self_list for many indexes.
+
+        :param index_ids: Identifiers of the indexes.
+        :param is_super_role: True if the user has a super role.
+        :param with_deleted: Include deleted index.
+        :return: the list of index ids.
+        """
+        ids = []
+        recursive_t = cls.recs_query(with_deleted=with_deleted)
+        for index_id in index_ids:
+            query = db.session.query(recursive_t.c.cid).filter(
+                db.or_(recursive_t.c.cid == index_id,
+                       recursive_t.c.pid == index_id))
+            if not is_super_role:
+                query = query.filter(recursive_t.c.public_state)
+            for cid, in query.order_by(recursive_t.c.path):
+                if str(cid) not in ids:
+                    ids.append(str(cid))
+        return ids
+
     @classmethod
     def get_self_path(cls, node_id, with_deleted=False):
         """Get index view path info.
@@ -1149,9 +1207,9 @@ class Indexes(object):
         :param with_deleted: Include deleted index.
         :return: the type of Index.
         """
-        recursive_t = cls.recs_query(with_deleted=with_deleted)
-        return db.session.query(recursive_t).filter(
-            recursive_t.c.cid == str(node_id)).one_or_none()
+        recursive_t = cls.recs_query(with_deleted=with_deleted,
+                                     cids=[node_id])
+        return db.session.query(recursive_t).one_or_none()
 
     @classmethod
     def get_child_list_recursive(cls, pid, with_deleted=False):
@@ -1162,70 +1220,69 @@ class Indexes(object):
         :param with_deleted: Include deleted index.
         :return: the list of index.
         """
-        def recursive_p():
-            query_p = db.session.query(
-                Index.parent.label("pid"),
-                Index.id.label("cid"),
-                func.cast(Index.id, db.Text).label("path"),
-            ).filter(Index.id == pid)
-
-            if not with_deleted:
-                query_p = query_p.filter(Index.is_deleted == False)
-
-            recursive_p = query_p.cte(name="recursive_p", recursive=True)
-
-            rec_alias = aliased(recursive_p, name="recursive")
-            test_alias = aliased(Index, name="test")
-            union_query_p = db.session.query(
-                test_alias.parent,
-                test_alias.id,
-                func.cast(test_alias.id, db.Text) + '/' + rec_alias.c.path,
-            ).filter(test_alias.id == rec_alias.c.pid)
-
-            if not with_deleted:
-                union_query_p = union_query_p.filter(
-                    test_alias.is_deleted == False
-                )
-
-            recursive_p = recursive_p.union_all(union_query_p)
-            path_index_searchs = db.session.query(recursive_p).filter_by(
-                pid=0).one()
-            return path_index_searchs.path
-
-        path_index_searchs = recursive_p()
-
-        query_t = db.session.query(
-            Index.parent.label("pid"),
-            Index.id.label("cid"),
-            func.cast(path_index_searchs, db.Text).label("path"),
-            Index.public_state.label("public_state"),
-        ).filter(Index.id == pid)
-
-        if not with_deleted:
-            query_t = query_t.filter(
-                Index.is_deleted == False
-            )
-
-        recursive_t = query_t.cte(name="recursive_t", recursive=True)
+        recursive_t = cls.recs_closure_query(
+            pid, min_depth=0, with_deleted=with_deleted)
+        q = db.session.query(recursive_t.c.cid). \
+            order_by(recursive_t.c.path).all()
+        return [str(item.cid) for item in q]
 
-        rec_alias = aliased(recursive_t, name="rec")
-        test_alias = aliased(Index, name="t")
-        union_query_t = db.session.query(
-                test_alias.parent,
-                test_alias.id,
-                rec_alias.c.path + '/' + func.cast(test_alias.id, db.Text),
-                test_alias.public_state,
-            ).filter(test_alias.parent == rec_alias.c.cid)
+    @classmethod
+    def recs_closure_query(cls, pid=0, columns=None, min_depth=1, cids=None,
+                           condition=None, with_deleted=False):
+        """
+        Init select condition of the subtree of index by the closure table.
 
+        :param pid: Identifier of the top index.
+        :param columns: Function returning the columns following pid, cid and
+            path. It receives the alias of the selected index, the alias of
+            the indexes on its path, the level and a function aggregating
+            a column of the indexes on the path.
+        :param min_depth: 1 to start from the children of pid, 0 to start
+            from pid itself.
+        :param cids: Identifiers of the indexes to select.
+        :param condition: Function returning the condition every index on
+            the path must satisfy. It receives the alias of the index.
+        :param with_deleted: Include deleted index.
+        :return: the query of db.session.
+        """
+        base = aliased(IndexClosure, name="base")
+        chain = aliased(IndexClosure, name="chain")
+        target = aliased(Index, name="t")
+        node = aliased(Index, name="node")
+
+        def _join_path(column, separator):
+            return func.string_agg(column, aggregate_order_by(
+                literal_column("'{}'".format(separator), db.Text),
+                chain.depth.desc()), type_=db.Text)
+
+        lev = base.depth + (1 - min_depth)
+        qlst = [
+            target.parent.label("pid"),
+            target.id.label("cid"),
+            _join_path(func.cast(node.id, db.Text), '/').label("path"),
+        ]
+        if columns:
+            qlst += columns(target, node, lev, _join_path)
+
+        query = db.session.query(*qlst).select_from(base). \
+            join(target, target.id == base.descendant). \
+            join(chain, and_(chain.descendant == base.descendant,
+                             chain.depth <= base.depth - min_depth)). \
+            join(node, node.id == chain.ancestor). \
+            filter(base.ancestor == pid, base.depth >= min_depth)
+        if cids is not None:
+            query = query.filter(base.descendant.in_(cids))
+
+        conditions = []
+        if condition:
+            conditions.append(condition(node))
         if not with_deleted:
-            union_query_t = union_query_t.filter(
-                test_alias.is_deleted == False
-            )
+            conditions.append(node.is_deleted == False)
+        if conditions:
+            query = query.having(func.every(and_(*conditions)))
 
-        recursive_t = recursive_t.union_all(union_query_t)
-        query = db.session.query(recursive_t)
-        q = query.order_by(recursive_t.c.path).all()
-        return [str(item.cid) for item in q]
+        return query.group_by(target.id, target.parent, base.depth). \
+            order_by(base.depth, target.id).subquery("recursive_t")
 
     @classmethod
     def recs_reverse_query(cls, pid=0, with_deleted=False):
@@ -1234,115 +1291,123 @@ class Indexes(object):
         :return: the query of db.session.
         """
         _id = str(pid)
-        query = db.session.query(
-            Index.parent.label("pid"),
-            Index.id.label("cid"),
-            func.cast(Index.id, db.Text).label("path"),
-            Index.index_name.label("name"),
-            Index.index_name_english.label("name_en"),
-            literal_column("1", db.Integer).label("lev"),
-            Index.public_state.label("public_state"),
-            Index.public_date.label("public_date"),
-            Index.comment.label("comment"),
-            Index.browsing_role.label("browsing_role"),
-            Index.browsing_group.label("browsing_group"),
-            Index.harvest_public_state.label("harvest_public_state"),
-            Index.is_deleted.label("is_deleted"),
-        ).filter(Index.id == pid)
+        top = aliased(IndexClosure, name="top_" + _id)
+        chain = aliased(IndexClosure, name="chain_" + _id)
+        target = aliased(Index, name="t_" + _id)
+        node = aliased(Index, name="node_" + _id)
 
-        if not with_deleted:
-            query = query.filter(Index.is_deleted == False)
+        def _join_path(column, separator):
+            return func.string_agg(column, aggregate_order_by(
+                literal_column("'{}'".format(separator), db.Text),
+                chain.depth), type_=db.Text)
 
-        recursive_t = query.cte(name='recursive_t_' + _id, recursive=True)
-
-        rec_alias = aliased(recursive_t, name="rec_" + _id)
-        test_alias = aliased(Index, name="t_" + _id)
-        union_query = db.session.query(
-            test_alias.parent,
-            test_alias.id,
-            rec_alias.c.path + '/' + func.cast(test_alias.id, db.Text),
-            case([(func.length(test_alias.index_name) == 0, None)],
-                    else_=rec_alias.c.name + '-/-' + test_alias.index_name),
-            rec_alias.c.name_en + '-/-' + test_alias.index_name_english,
-            rec_alias.c.lev + 1,
-            test_alias.public_state,
-            test_alias.public_date,
-            test_alias.comment,
-            test_alias.browsing_role,
-            test_alias.browsing_group,
-            test_alias.harvest_public_state,
-            test_alias.is_deleted,
-        ).filter(test_alias.id == rec_alias.c.pid)
+        query = db.session.query(
+            target.parent.label("pid"),
+            target.id.label("cid"),
+            _join_path(func.cast(node.id, db.Text), '/').label("path"),
+            case([(func.bool_or(and_(
+                chain.depth > 0,
+                func.length(func.coalesce(node.index_name, '')) == 0)),
+                None)],
+                else_=_join_path(node.index_name, '-/-')).label("name"),
+            _join_path(node.index_name_english, '-/-').label("name_en"),
+            (top.depth + 1).label("lev"),
+            target.public_state.label("public_state"),
+            target.public_date.label("public_date"),
+            target.comment.label("comment"),
+            target.browsing_role.label("browsing_role"),
+            target.browsing_group.label("browsing_group"),
+            target.harvest_public_state.label("harvest_public_state"),
+            target.is_deleted.label("is_deleted"),
+        ).select_from(top). \
+            join(target, target.id == top.ancestor). \
+            join(chain, and_(chain.descendant == top.descendant,
+                             chain.depth <= top.depth)). \
+            join(node, node.id == chain.ancestor). \
+            filter(top.descendant == pid)
 
         if not with_deleted:
-            union_query = union_query.filter(test_alias.is_deleted == False)
+            query = query.having(func.every(node.is_deleted == False))
 
-        return recursive_t.union_all(union_query)
+        return query.group_by(target.id, target.parent, top.depth). \
+            order_by(top.depth).subquery("recursive_t_" + _id)
 
     @classmethod
-    def recs_query(cls, pid=0, with_deleted=False):
+    def recs_query(cls, pid=0, with_deleted=False, cids=None):
         """
         Init select condition of index.
 
+        :param pid: Identifier of the parent index.
+        :param with_deleted: Include deleted index.
+        :param cids: Identifiers of the indexes to select.
         :return: the query of db.session.
         """
-        # !!! Important !!!
-        # If add/delete columns in here,
-        # please add/delete columns in Indexes.delete function, too.
-        query = db.session.query(
-            Index.parent.label("pid"),
-            Index.id.label("cid"),
-            func.cast(Index.id, db.Text).label("path"),
-            Index.index_name.label("name"),
-            # add by ryuu at 1108 start
-            Index.index_name_english.label("name_en"),
-            # add by ryuu at 1108 end
-            literal_column("1", db.Integer).label("lev"),
-            Index.public_state.label("public_state"),
-            Index.public_date.label("public_date"),
-            Index.comment.label("comment"),
-            Index.browsing_role.label("browsing_role"),
-            Index.browsing_group.label("browsing_group"),
-            Index.harvest_public_state.label("harvest_public_state"),
-            Index.is_deleted.label("is_deleted"),
-        ).filter(Index.parent == pid)
+        def _columns(target, node, lev, join_path):
+            name = case(
+                [(func.length(func.coalesce(node.index_name, '')) == 0,
+                  node.index_name_english)],
+                else_=node.index_name)
+            return [
+                case([(lev == 1, target.index_name)],
+                     else_=join_path(name, '-/-')).label("name"),
+                join_path(node.index_name_english, '-/-').label("name_en"),
+                lev.label("lev"),
+                target.public_state.label("public_state"),
+                target.public_date.label("public_date"),
+                target.comment.label("comment"),
+                target.browsing_role.label("browsing_role"),
+                target.browsing_group.label("browsing_group"),
+                target.harvest_public_state.label("harvest_public_state"),
+                target.is_deleted.label("is_deleted"),
+            ]
 
-        if not with_deleted:
-            query = query.filter(Index.is_deleted == False)
+        return cls.recs_closure_query(
+            pid, columns=_columns, cids=cids, with_deleted=with_deleted)
 
-        recursive_t = query.cte(name="recursive_t", recursive=True)
-
-        rec_alias = aliased(recursive_t, name="rec")
-        test_alias = aliased(Index, name="t")
-        union_query = db.session.query(
-            test_alias.parent,
-            test_alias.id,
-            rec_alias.c.path + '/' + func.cast(test_alias.id, db.Text),
-            case(
-                [
-                    (and_((func.length(rec_alias.c.name) > 0), (func.length(test_alias.index_name) == 0)), rec_alias.c.name + '-/-' + test_alias.index_name_english),
-                    (and_((func.length(rec_alias.c.name) == 0), (func.length(test_alias.index_name) > 0)), rec_alias.c.name_en + '-/-' + test_alias.index_name),
-                    (and_((func.length(rec_alias.c.name) > 0), (func.length(test_alias.index_name) > 0)), rec_alias.c.name + '-/-' + test_alias.index_name),
-                ],
-                else_=rec_alias.c.name_en + '-/-' + test_alias.index_name_english
-            ),
-            # add by ryuu at 1108 start
-            rec_alias.c.name_en + '-/-' + test_alias.index_name_english,
-            # add by ryuu at 1108 end
-            rec_alias.c.lev + 1,
-            test_alias.public_state,
-            test_alias.public_date,
-            test_alias.comment,
-            test_alias.browsing_role,
-            test_alias.browsing_group,
-            test_alias.harvest_public_state,
-            test_alias.is_deleted,
-        ).filter(test_alias.parent == rec_alias.c.cid)
+    @classmethod
+    def recs_tree_columns(cls, lang=None):
+        """
+        Get the columns of the index tree.
 
-        if not with_deleted:
-            union_query = union_query.filter(test_alias.is_deleted == False)
+        :param lang: Language of the names.
+        :return: the function returning the columns.
+        """
+        if lang is None:
+            lang = current_i18n.language
 
-        return recursive_t.union_all(union_query)
+        def _columns(target, node, lev, join_path):
+            if lang == 'ja':
+                name = case(
+                    [(func.length(func.coalesce(target.index_name, '')) == 0,
+                      target.index_name_english)],
+                    else_=target.index_name)
+                link_name = case(
+                    [(func.length(
+                        func.coalesce(target.index_link_name, '')) == 0,
+                      target.index_link_name_english)],
+                    else_=target.index_link_name)
+            else:
+                name = target.index_name_english
+                link_name = target.index_link_name_english
+            return [
+                name.label("name"),
+                link_name.label("link_name"),
+                target.index_link_enabled,
+                target.position,
+                target.public_state,
+                target.public_date,
+                target.browsing_role,
+                target.contribute_role,
+                target.browsing_group,
+                target.contribute_group,
+                target.more_check,
+                target.display_no,
+                target.coverpage_state,
+                target.recursive_coverpage_check,
+                target.is_deleted,
+                lev.label("lev"),
+            ]
+        return _columns
 
     @classmethod
     def recs_tree_query(cls, pid=0, lang=None, with_deleted=False):
@@ -1351,134 +1416,9 @@ class Indexes(object):
 
         :return: the query of db.session.
         """
-        if lang is None:
-            lang = current_i18n.language
-        if lang == 'ja':
-            query = db.session.query(
-                Index.parent.label("pid"),
-                Index.id.label("cid"),
-                func.cast(
-                    Index.id,
-                    db.Text).label("path"),
-                case([(func.length(func.coalesce(Index.index_name, '')) == 0,
-                       Index.index_name_english)],
-                     else_=Index.index_name).label('name'),
-                case([(func.length(func.coalesce(Index.index_link_name, '')) == 0,
-                       Index.index_link_name_english)],
-                     else_=Index.index_link_name).label('link_name'),
-                Index.index_link_enabled,
-                Index.position,
-                Index.public_state,
-                Index.public_date,
-                Index.browsing_role,
-                Index.contribute_role,
-                Index.browsing_group,
-                Index.contribute_group,
-                Index.more_check,
-                Index.display_no,
-                Index.coverpage_state,
-                Index.recursive_coverpage_check,
-                Index.is_deleted,
-                literal_column("1",db.Integer).label("lev")
-            ).filter(Index.parent == pid)
-
-            if not with_deleted:
-                query = query.filter(Index.is_deleted == False)
-
-            recursive_t = query.cte(name="recursive_t", recursive=True)
-
-            rec_alias = aliased(recursive_t, name="rec")
-            test_alias = aliased(Index, name="t")
-            union_query = db.session.query(
-                test_alias.parent,
-                test_alias.id,
-                rec_alias.c.path + '/' + func.cast(test_alias.id, db.Text),
-                case([(func.length(
-                    func.coalesce(test_alias.index_name, '')) == 0,
-                    test_alias.index_name_english)],
-                    else_=test_alias.index_name).label('name'),
-                case([(func.length(
-                    func.coalesce(test_alias.index_link_name, '')) == 0,
-                    test_alias.index_link_name_english)],
-                    else_=test_alias.index_link_name).label('link_name'),
-                test_alias.index_link_enabled,
-                test_alias.position,
-                test_alias.public_state,
-                test_alias.public_date,
-                test_alias.browsing_role,
-                test_alias.contribute_role,
-                test_alias.browsing_group,
-                test_alias.contribute_group,
-                test_alias.more_check,
-                test_alias.display_no,
-                test_alias.coverpage_state,
-                test_alias.recursive_coverpage_check,
-                test_alias.is_deleted,
-                rec_alias.c.lev + 1
-            ).filter(test_alias.parent == rec_alias.c.cid)
-
-            if not with_deleted:
-                union_query = union_query.filter(
-                    test_alias.is_deleted == False
-                )
-        else:
-            query = db.session.query(
-                Index.parent.label("pid"),
-                Index.id.label("cid"),
-                func.cast(Index.id, db.Text).label("path"),
-                Index.index_name_english.label("name"),
-                Index.index_link_name_english.label("link_name"),
-                Index.index_link_enabled,
-                Index.position,
-                Index.public_state,
-                Index.public_date,
-                Index.browsing_role,
-                Index.contribute_role,
-                Index.browsing_group,
-                Index.contribute_group,
-                Index.more_check,
-                Index.display_no,
-                Index.coverpage_state,
-                Index.recursive_coverpage_check,
-                Index.is_deleted,
-                literal_column("1", db.Integer).label("lev")
-            ).filter(Index.parent == pid)
-
-            if not with_deleted:
-                query = query.filter(Index.is_deleted == False)
-
-            recursive_t = query.cte(name="recursive_t", recursive=True)
-
-            rec_alias = aliased(recursive_t, name="rec")
-            test_alias = aliased(Index, name="t")
-            union_query = db.session.query(
-                test_alias.parent,
-                test_alias.id,
-                rec_alias.c.path + '/' + func.cast(test_alias.id, db.Text),
-                test_alias.index_name_english,
-                test_alias.index_link_name_english,
-                test_alias.index_link_enabled,
-                test_alias.position,
-                test_alias.public_state,
-                test_alias.public_date,
-                test_alias.browsing_role,
-                test_alias.contribute_role,
-                test_alias.browsing_group,
-                test_alias.contribute_group,
-                test_alias.more_check,
-                test_alias.display_no,
-                test_alias.coverpage_state,
-                test_alias.recursive_coverpage_check,
-                test_alias.is_deleted,
-                rec_alias.c.lev + 1
-            ).filter(test_alias.parent == rec_alias.c.cid)
-
-            if not with_deleted:
-                union_query = union_query.filter(
-                    test_alias.is_deleted == False
-                )
-
-        return recursive_t.union_all(union_query)
+        return cls.recs_closure_query(
+            pid, columns=cls.recs_tree_columns(lang),
+            with_deleted=with_deleted)
 
     @classmethod
     def recs_root_tree_query(cls, pid=0, lang=None, with_deleted=False):
@@ -1487,134 +1427,22 @@ class Indexes(object):
 
         :return: the query of db.session.
         """
-        if lang is None:
-            lang = current_i18n.language
-        if lang == 'ja':
-            query = db.session.query(
-                Index.parent.label("pid"),
-                Index.id.label("cid"),
-                func.cast(
-                    Index.id,
-                    db.Text).label("path"),
-                case([(func.length(func.coalesce(Index.index_name, '')) == 0,
-                       Index.index_name_english)],
-                     else_=Index.index_name).label('name'),
-                case([(func.length(func.coalesce(Index.index_link_name, '')) == 0,
-                       Index.index_link_name_english)],
-                     else_=Index.index_link_name).label('link_name'),
-                Index.index_link_enabled,
-                Index.position,
-                Index.public_state,
-                Index.public_date,
-                Index.browsing_role,
-                Index.contribute_role,
-                Index.browsing_group,
-                Index.contribute_group,
-                Index.more_check,
-                Index.display_no,
-                Index.coverpage_state,
-                Index.recursive_coverpage_check,
-                Index.is_deleted,
-                literal_column("1", db.Integer).label("lev")
-            ).filter(Index.id == pid)
-
-            if not with_deleted:
-                query = query.filter(Index.is_deleted == False)
-
-            recursive_t = query.cte(name="recursive_t", recursive=True)
-
-            rec_alias = aliased(recursive_t, name="rec")
-            test_alias = aliased(Index, name="t")
-            union_query = db.session.query(
-                test_alias.parent,
-                test_alias.id,
-                rec_alias.c.path + '/' + func.cast(test_alias.id, db.Text),
-                case([(func.length(func.coalesce(
-                    test_alias.index_name, '')) == 0,
-                    test_alias.index_name_english)],
-                    else_=test_alias.index_name),
-                case([(func.length(func.coalesce(
-                    test_alias.index_link_name, '')) == 0,
-                    test_alias.index_link_name_english)],
-                    else_=test_alias.index_link_name),
-                test_alias.index_link_enabled,
-                test_alias.position,
-                test_alias.public_state,
-                test_alias.public_date,
-                test_alias.browsing_role,
-                test_alias.contribute_role,
-                test_alias.browsing_group,
-                test_alias.contribute_group,
-                test_alias.more_check,
-                test_alias.display_no,
-                test_alias.coverpage_state,
-                test_alias.recursive_coverpage_check,
-                test_alias.is_deleted,
-                rec_alias.c.lev + 1
-            ).filter(test_alias.parent == rec_alias.c.cid)
+        return cls.recs_closure_query(
+            pid, columns=cls.recs_tree_columns(lang), min_depth=0,
+            with_deleted=with_deleted)
 
-            if not with_deleted:
-                union_query = union_query.filter(
-                    test_alias.is_deleted == False
-                )
-        else:
-            query = db.session.query(
-                Index.parent.label("pid"),
-                Index.id.label("cid"),
-                func.cast(Index.id, db.Text).label("path"),
-                Index.index_name_english.label("name"),
-                Index.index_link_name_english.label("link_name"),
-                Index.index_link_enabled,
-                Index.position,
-                Index.public_state,
-                Index.public_date,
-                Index.browsing_role,
-                Index.contribute_role,
-                Index.browsing_group,
-                Index.contribute_group,
-                Index.more_check,
-                Index.display_no,
-                Index.coverpage_state,
-                Index.recursive_coverpage_check,
-                Index.is_deleted,
-                literal_column("1", db.Integer).label("lev")
-            ).filter(Index.id == pid)
-
-            if not with_deleted:
-                query = query.filter(Index.is_deleted == False)
-
-            recursive_t = query.cte(name="recursive_t", recursive=True)
-
-            rec_alias = aliased(recursive_t, name="rec")
-            test_alias = aliased(Index, name="t")
-            union_query = db.session.query(
-                test_alias.parent,
-                test_alias.id,
-                rec_alias.c.path + '/' + func.cast(test_alias.id, db.Text),
-                test_alias.index_name_english,
-                test_alias.index_link_name_english,
-                test_alias.index_link_enabled,
-                test_alias.position,
-                test_alias.public_state,
-                test_alias.public_date,
-                test_alias.browsing_role,
-                test_alias.contribute_role,
-                test_alias.browsing_group,
-                test_alias.contribute_group,
-                test_alias.more_check,
-                test_alias.display_no,
-                test_alias.coverpage_state,
-                test_alias.recursive_coverpage_check,
-                test_alias.is_deleted,
-                rec_alias.c.lev + 1
-            ).filter(test_alias.parent == rec_alias.c.cid)
-
-            if not with_deleted:
-                union_query = union_query.filter(
-                    test_alias.is_deleted == False
-                )
+    @classmethod
+    @cached_index_tree_snapshot()
+    def get_harvest_public_states(cls):
+        """Get harvest_public_state and is_deleted of all indexes.
 
-        return recursive_t.union_all(union_query)
+        :return: dict of index id and the tuple of the states.
+        """
+        return {
+            index.id: (index.harvest_public_state, index.is_deleted)
+            for index in db.session.query(
+                Index.id, Index.harvest_public_state, Index.is_deleted)
+        }
 
     @classmethod
     def get_harvest_public_state(cls, paths, with_deleted=False):
@@ -1624,6 +1452,18 @@ class Indexes(object):
             paths ([type]): [description]
             with_deleted (bool, optional): Include deleted index.
         """
+        def _snapshot_state():
+            states = cls.get_harvest_public_states()
+            result = None
+            for path in paths:
+                path_states = [
+                    states[_id][0] for _id in map(int, path.split('/'))
+                    if _id in states and (with_deleted or not states[_id][1])
+                ]
+                if path_states:
+                    result = bool(result) or all(path_states)
+            return result
+
         def _query(path):
             query = db.session. \
                 query(func.every(Index.harvest_public_state).label(
@@ -1633,6 +1473,8 @@ class Indexes(object):
             return query
 
         try:
+            if current_app.config.get('WEKO_INDEX_TREE_SNAPSHOT_ENABLED'):
+                return _snapshot_state()
             _paths = pickle.loads(pickle.dumps(paths, -1))
             last_path = _paths.pop(-1).split('/')
             qry = _query(last_path)
@@ -1846,6 +1688,7 @@ class Indexes(object):
         :param index_id: search index id
         :param state: coverpage state of search index id
         """
+        mark_index_tree_updated()
         Index.query.filter_by(parent=index_id). \
             update({Index.coverpage_state: state},
                    synchronize_session='fetch')
@@ -1861,6 +1704,7 @@ class Indexes(object):
         :param state: state of index
         :param date: date of index
         """
+        mark_index_tree_updated()
         Index.query.filter_by(parent=index_id). \
             update({Index.public_state: state, Index.public_date: date},
                    synchronize_session='fetch')
@@ -1875,6 +1719,7 @@ class Indexes(object):
         :param index_id: search index id
         :param contribute_role: contribute role
         """
+        mark_index_tree_updated()
         Index.query.filter_by(parent=index_id). \
             update({Index.contribute_role: contribute_role},
                    synchronize_session='fetch')
@@ -1889,6 +1734,7 @@ class Indexes(object):
         :param index_id: search index id
         :param contribute_group: contribute group
         """
+        mark_index_tree_updated()
         Index.query.filter_by(parent=index_id). \
             update({Index.contribute_group: contribute_group},
                    synchronize_session='fetch')
@@ -1903,6 +1749,7 @@ class Indexes(object):
         :param index_id: search index id
         :param browsing_role: browsing role
         """
+        mark_index_tree_updated()
         Index.query.filter_by(parent=index_id). \
             update({Index.browsing_role: browsing_role},
                    synchronize_session='fetch')
@@ -1917,6 +1764,7 @@ class Indexes(object):
         :param index_id: search index id
         :param browsing_group: browsing group
         """
+        mark_index_tree_updated()
         Index.query.filter_by(parent=index_id). \
             update({Index.browsing_group: browsing_group},
                    synchronize_session='fetch')
@@ -1931,6 +1779,7 @@ class Indexes(object):
         :param index_id: search index id
         :param online_issn: Online ISSN
         """
+        mark_index_tree_updated()
         Index.query.filter_by(parent=index_id). \
             update({Index.online_issn: online_issn},
                    synchronize_session='fetch')
@@ -2013,20 +1862,11 @@ class Indexes(object):
             [list]: parent indexes list.
 
         """
-        # Define a CTE with recursive=True for the top portion of the query
-        topq = Index.query.filter(Index.id == index_id)
-        if not with_deleted:
-            topq = topq.filter(Index.is_deleted == False)
-        topq = topq.cte('cte', recursive=True)
-        # Define the bottom part of the query by joining it with the top part
-        bottomq = Index.query.join(topq, Index.id == topq.c.parent)
-        if not with_deleted:
-            bottomq = bottomq.filter(Index.is_deleted == False)
-        # applying a union function
-        recursive_q = topq.union(bottomq)
-        # Get index data
-        index_list = db.session.query(recursive_q).order_by(
-            recursive_q.c.id).all()
+        recursive_t = cls.recs_reverse_query(index_id,
+                                             with_deleted=with_deleted)
+        index_list = Index.query.filter(
+            Index.id.in_(db.session.query(recursive_t.c.cid))
+        ).order_by(Index.id).all()
         return index_list
 
     @classmethod
@@ -2058,39 +1898,15 @@ class Indexes(object):
         :param with_deleted: Include deleted index.
         :return: path.
         """
-        query = db.session.query(
-            Index.parent.label("pid"),
-            Index.id.label("cid")
-        ).filter(
-            Index.parent == 0,
-            Index.harvest_public_state.is_(True)
-        )
-
-        if not with_deleted:
-            query = query.filter(Index.is_deleted == False)
-
-        recursive_t = query.cte(name="recursive_t", recursive=True)
-
-        rec_alias = aliased(recursive_t, name="rec")
-        test_alias = aliased(Index, name="t")
-        union_query = db.session.query(
-            test_alias.parent,
-            test_alias.id
-        ).filter(
-            test_alias.parent == rec_alias.c.cid,
-            test_alias.harvest_public_state.is_(True)
-        )
-
-        if not with_deleted:
-            union_query = union_query.filter(test_alias.is_deleted == False)
-
-        recursive_t = recursive_t.union_all(union_query)
+        recursive_t = cls.recs_closure_query(
+            condition=lambda node: node.harvest_public_state.is_(True),
+            with_deleted=with_deleted)
 
         ret = []
         with db.session.begin_nested():
             qlst = [recursive_t.c.cid]
             indexes = db.session.query(*qlst). \
-                order_by(recursive_t.c.pid).all()
+                order_by(recursive_t.c.pid, recursive_t.c.cid).all()
             for idx in indexes:
                 ret.append(str(idx[0]))
         return ret
@@ -2117,50 +1933,38 @@ class Indexes(object):
             delete_index_handle.delay(id_list)
 
     @classmethod
+    def get_next_public_date(cls):
+        """Get the nearest public date in the future.
+
+        :return: the datetime in UTC or None.
+        """
+        public_date = db.session.query(func.min(Index.public_date)).filter(
+            Index.public_date > datetime.now(timezone.utc)).scalar()
+        if public_date and not public_date.tzinfo:
+            public_date = public_date.replace(tzinfo=timezone.utc)
+        return public_date
+
+    @classmethod
+    @cached_index_tree_snapshot(
+        expires=lambda: Indexes.get_next_public_date())
     def get_public_indexes_list(cls, with_deleted=False):
         """Get list id of public indexes.
 
         :return: path.
         """
-        query = db.session.query(
-            Index.parent.label("pid"),
-            Index.id.label("cid")
-        ).filter(
-            Index.parent == 0,
-            Index.public_state.is_(True)
-        ).filter(
-            db.or_(Index.public_date.is_(None),
-                   Index.public_date <= datetime.now(timezone.utc))
-        )
-
-        if not with_deleted:
-            query = query.filter(Index.is_deleted == False)
-
-        recursive_t = query.cte(name="recursive_t", recursive=True)
-
-        rec_alias = aliased(recursive_t, name="rec")
-        test_alias = aliased(Index, name="t")
-        union_query = db.session.query(
-            test_alias.parent,
-            test_alias.id
-        ).filter(
-            test_alias.parent == rec_alias.c.cid,
-            test_alias.public_state.is_(True)
-        ).filter(
-            db.or_(test_alias.public_date.is_(None),
-                    test_alias.public_date <= datetime.now(timezone.utc))
-        )
-
-        if not with_deleted:
-            union_query = union_query.filter(test_alias.is_deleted == False)
-
-        recursive_t = recursive_t.union_all(union_query)
+        now = datetime.now(timezone.utc)
+        recursive_t = cls.recs_closure_query(
+            condition=lambda node: and_(
+                node.public_state.is_(True),
+                db.or_(node.public_date.is_(None),
+                       node.public_date <= now)),
+            with_deleted=with_deleted)
 
         ids = []
         with db.session.begin_nested():
             qlst = [recursive_t.c.cid]
             indexes = db.session.query(*qlst). \
-                order_by(recursive_t.c.pid).all()
+                order_by(recursive_t.c.pid, recursive_t.c.cid).all()
             for idx in indexes:
                 ids.append(str(idx[0]))
         return ids
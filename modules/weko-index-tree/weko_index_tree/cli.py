@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of WEKO3.
+# Copyright (C) 2017 National Institute of Informatics.
+#
+# WEKO3 is free software; you can redistribute it
+# and/or modify it under the terms of the GNU General Public License as
+# published by the Free Software Foundation; either version 2 of the
+# License, or (at your option) any later version.
+#
+# WEKO3 is distributed in the hope that it will be
+# useful, but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with WEKO3; if not, write to the
+# Free Software Foundation, Inc., 59 Temple Place, Suite 330, Boston,
+# MA 02111-1307, USA.
+
+"""Command line interface creation kit."""
+
+import click
+from flask.cli import with_appcontext
+
+from .models import IndexClosure
+
+
+@click.group()
+def index_tree():
+    """Index tree commands."""
+
+
+@index_tree.group()
+def closure():
+    """Index closure table commands."""
+
+
+@closure.command('check')
+@click.option('--fix', is_flag=True, default=False,
+              help='Rebuild the closure table if it is inconsistent.')
+@with_appcontext
+def check_closure(fix):
+    """Check the closure table against the index table."""
+    missing, unexpected = IndexClosure.check()
+    if not missing and not unexpected:
+        click.secho('Index closure table is consistent.', fg='green')
+        return
+
+    for row in missing:
+        click.secho('missing: ancestor={}, descendant={}, depth={}'.format(
+            *row), fg='yellow')
+    for row in unexpected:
+        click.secho('unexpected: ancestor={}, descendant={}, depth={}'.format(
+            *row), fg='yellow')
+    if fix:
+        count = IndexClosure.rebuild()
+        click.secho('Index closure table has been rebuilt. rows={}'.format(
+            count), fg='green')
+    else:
+        raise click.ClickException('Index closure table is inconsistent.')
+
+
+@closure.command('rebuild')
+@with_appcontext
+def rebuild_closure():
+    """Rebuild the closure table from the index table."""
+    count = IndexClosure.rebuild()
+    click.secho('Index closure table has been rebuilt. rows={}'.format(
+        count), fg='green')
@@ -72,6 +72,12 @@ WEKO_INDEX_TREE_REST_ENDPOINTS = dict(
 WEKO_INDEX_TREE_UPDATED = True
 """For index tree cache."""
 
+WEKO_INDEX_TREE_SNAPSHOT_ENABLED = False
+"""Hold the index tree in each worker until the index tree version changes."""
+
+WEKO_INDEX_TREE_SNAPSHOT_VERSION_KEY = 'index_tree_version'
+"""Redis key of the index tree version."""
+
 WEKO_INDEX_TREE_RSS_DEFAULT_INDEX_ID = 0
 """Default number of the index_id in RSS."""
 
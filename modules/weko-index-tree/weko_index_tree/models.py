@@ -334,5 +334,181 @@ class IndexStyle(db.Model, Timestamp):
         return
 
 
+class IndexClosure(db.Model):
+    """
+    Represent the ancestor/descendant pairs of the index tree.
+
+    Every index has a row pointing to itself with depth 0 and a row for each
+    of its ancestors. The virtual root ``0`` is stored as an ancestor too, so
+    the whole tree can be queried as the subtree of ``0``. The rows are
+    maintained by the mapper events of :class:`Index` below.
+    """
+
+    __tablename__ = 'index_closure'
+
+    __table_args__ = (
+        db.Index('ix_index_closure_descendant_depth', 'descendant', 'depth'),
+    )
+
+    ancestor = db.Column(db.BigInteger, primary_key=True, autoincrement=False)
+    """Identifier of the ancestor index."""
+
+    descendant = db.Column(db.BigInteger, primary_key=True,
+                           autoincrement=False)
+    """Identifier of the descendant index."""
+
+    depth = db.Column(db.Integer, nullable=False, default=0)
+    """Distance between the ancestor and the descendant."""
+
+    @classmethod
+    def _link_subtree(cls, connection, index_id, parent):
+        """Link the subtree of an index to the ancestors of its parent."""
+        table = cls.__table__
+        sub = table.alias('sub')
+        if int(parent) == 0:
+            query = db.select([
+                db.literal_column('0', db.BigInteger),
+                sub.c.descendant,
+                sub.c.depth + 1
+            ]).where(sub.c.ancestor == index_id)
+        else:
+            sup = table.alias('sup')
+            query = db.select([
+                sup.c.ancestor,
+                sub.c.descendant,
+                sup.c.depth + sub.c.depth + 1
+            ]).where(db.and_(sup.c.descendant == parent,
+                             sub.c.ancestor == index_id))
+        connection.execute(table.insert().from_select(
+            ['ancestor', 'descendant', 'depth'], query))
+
+    @classmethod
+    def insert_node(cls, connection, index_id, parent):
+        """Add the rows of a new index.
+
+        Rows left by an index with the same identifier are replaced, and
+        children stored before their parent are linked here as well.
+
+        :param connection: The connection of the current transaction.
+        :param index_id: Identifier of the new index.
+        :param parent: Identifier of the parent index.
+        """
+        table = cls.__table__
+        connection.execute(table.delete().where(
+            table.c.descendant == index_id))
+        connection.execute(table.insert().values(
+            ancestor=index_id, descendant=index_id, depth=0))
+        cls._link_subtree(connection, index_id, parent)
+        index = Index.__table__
+        children = connection.execute(db.select([index.c.id]).where(
+            db.and_(index.c.parent == index_id,
+                    index.c.id != index_id))).fetchall()
+        for child in children:
+            cls.move_subtree(connection, child.id, index_id)
+
+    @classmethod
+    def move_subtree(cls, connection, index_id, parent):
+        """Move the subtree of an index under a new parent.
+
+        :param connection: The connection of the current transaction.
+        :param index_id: Identifier of the moved index.
+        :param parent: Identifier of the new parent index.
+        """
+        table = cls.__table__
+        subtree = db.select([table.c.descendant]).where(
+            table.c.ancestor == index_id)
+        connection.execute(table.delete().where(db.and_(
+            table.c.descendant.in_(subtree),
+            ~table.c.ancestor.in_(subtree))))
+        cls._link_subtree(connection, index_id, parent)
+
+    @classmethod
+    def delete_node(cls, connection, index_id):
+        """Remove the rows of a physically deleted index.
+
+        :param connection: The connection of the current transaction.
+        :param index_id: Identifier of the deleted index.
+        """
+        table = cls.__table__
+        connection.execute(table.delete().where(db.or_(
+            table.c.ancestor == index_id,
+            table.c.descendant == index_id)))
+
+    @classmethod
+    def get_expected_rows(cls):
+        """Compute the rows of the closure table from the index table.
+
+        :return: Set of tuples (ancestor, descendant, depth).
+        """
+        parents = dict(db.session.query(Index.id, Index.parent).all())
+        rows = set()
+        for index_id in parents:
+            rows.add((index_id, index_id, 0))
+            depth, current, visited = 0, index_id, {index_id}
+            while current in parents:
+                current = parents[current]
+                depth += 1
+                rows.add((current, index_id, depth))
+                if current in visited:
+                    break
+                visited.add(current)
+        return rows
+
+    @classmethod
+    def check(cls):
+        """Compare the closure table with the index table.
+
+        :return: Tuple of the missing rows and the unexpected rows.
+        """
+        expected = cls.get_expected_rows()
+        actual = set(db.session.query(
+            cls.ancestor, cls.descendant, cls.depth).all())
+        return sorted(expected - actual), sorted(actual - expected)
+
+    @classmethod
+    def rebuild(cls):
+        """Recreate all the rows of the closure table from the index table.
+
+        :return: Number of the stored rows.
+        """
+        rows = cls.get_expected_rows()
+        with db.session.begin_nested():
+            db.session.query(cls).delete(synchronize_session=False)
+            db.session.bulk_insert_mappings(cls, [
+                dict(ancestor=a, descendant=d, depth=depth)
+                for a, d, depth in rows])
+        db.session.commit()
+        return len(rows)
+
+
+@db.event.listens_for(Index, 'after_insert')
+def index_after_insert(mapper, connection, target):
+    """Add the closure rows of a new index."""
+    from .utils import mark_index_tree_updated
+    IndexClosure.insert_node(connection, target.id, target.parent or 0)
+    mark_index_tree_updated(db.inspect(target).session)
+
+
+@db.event.listens_for(Index, 'after_update')
+def index_after_update(mapper, connection, target):
+    """Move the closure rows of an index when its parent is changed."""
+    from .utils import mark_index_tree_updated
+    state = db.inspect(target)
+    history = state.attrs.parent.history
+    if history.has_changes() and (
+            not history.deleted or history.deleted[0] != target.parent):
+        IndexClosure.move_subtree(connection, target.id, target.parent or 0)
+    mark_index_tree_updated(state.session)
+
+
+@db.event.listens_for(Index, 'after_delete')
+def index_after_delete(mapper, connection, target):
+    """Remove the closure rows of a deleted index."""
+    from .utils import mark_index_tree_updated
+    IndexClosure.delete_node(connection, target.id)
+    mark_index_tree_updated(db.inspect(target).session)
+
+
 __all__ = ('Index',
+           'IndexClosure',
            'IndexStyle',)
@@ -20,6 +20,7 @@
 
 """Module of weko-index-tree utils."""
 import os
+import pickle
 import sys
 import traceback
 from datetime import date, datetime, time, timedelta, timezone
@@ -28,7 +29,8 @@ from operator import itemgetter
 
 from elasticsearch.exceptions import NotFoundError
 from elasticsearch_dsl.query import Bool, Exists, Q, QueryString
-from flask import Markup, current_app, session, json, Flask
+from flask import Markup, current_app, g, has_app_context, session, json, \
+    Flask
 from flask_babelex import get_locale
 from flask_babelex import gettext as _
 from flask_babelex import to_user_timezone, to_utc
@@ -71,6 +73,106 @@ def is_index_tree_updated():
     return current_app.config['WEKO_INDEX_TREE_UPDATED']
 
 
+_index_tree_snapshots = {}
+"""Index tree snapshots of this worker: key -> (version, expires, value)."""
+
+
+def __get_index_tree_version_store():
+    """Get the Redis connection holding the index tree version."""
+    return RedisConnection().connection(
+        db=current_app.config['CACHE_REDIS_DB'], kv=False)
+
+
+def get_index_tree_version():
+    """Get the index tree version.
+
+    The version is read from Redis once per application context.
+
+    :return: The version, or None if it can not be read.
+    """
+    if 'weko_index_tree_version' not in g:
+        try:
+            version = __get_index_tree_version_store().get(
+                current_app.config['WEKO_INDEX_TREE_SNAPSHOT_VERSION_KEY'])
+            g.weko_index_tree_version = int(version or 0)
+        except Exception as ex:
+            current_app.logger.error(ex)
+            g.weko_index_tree_version = None
+    return g.weko_index_tree_version
+
+
+def update_index_tree_version():
+    """Increment the index tree version.
+
+    :return: The new version, or None if it can not be updated.
+    """
+    _index_tree_snapshots.clear()
+    try:
+        version = __get_index_tree_version_store().incr(
+            current_app.config['WEKO_INDEX_TREE_SNAPSHOT_VERSION_KEY'])
+    except Exception as ex:
+        current_app.logger.error(ex)
+        version = None
+    g.weko_index_tree_version = version
+    return version
+
+
+def mark_index_tree_updated(session=None):
+    """Update the index tree version when the session is committed.
+
+    :param session: The session changing the index tree.
+    """
+    session = session or db.session
+    session.info['weko_index_tree_updated'] = True
+
+
+@db.event.listens_for(db.session, 'after_commit')
+def _after_commit_index_tree(session):
+    """Update the index tree version after an index change is committed."""
+    if session.info.pop('weko_index_tree_updated', False) \
+            and has_app_context() \
+            and current_app.config.get('WEKO_INDEX_TREE_SNAPSHOT_ENABLED'):
+        update_index_tree_version()
+
+
+@db.event.listens_for(db.session, 'after_rollback')
+def _after_rollback_index_tree(session):
+    """Forget the index changes of a rolled back session."""
+    session.info.pop('weko_index_tree_updated', None)
+
+
+def cached_index_tree_snapshot(expires=None):
+    """Hold the result in the index tree snapshot of this worker.
+
+    The result is reused until the index tree version changes and a copy is
+    returned, so callers may modify it.
+
+    :param expires: Function returning the datetime after which the result
+        has to be rebuilt even if the version did not change.
+    """
+    def caching(f):
+        @wraps(f)
+        def wrapper(*args, **kwargs):
+            if not current_app.config.get('WEKO_INDEX_TREE_SNAPSHOT_ENABLED'):
+                return f(*args, **kwargs)
+            version = get_index_tree_version()
+            if version is None:
+                return f(*args, **kwargs)
+
+            key = (f.__name__, args[1:], tuple(sorted(kwargs.items())),
+                   current_i18n.language)
+            now = datetime.now(timezone.utc)
+            snapshot = _index_tree_snapshots.get(key)
+            if snapshot is None or snapshot[0] != version \
+                    or (snapshot[1] is not None and snapshot[1] <= now):
+                value = pickle.dumps(f(*args, **kwargs), -1)
+                snapshot = (version, expires() if expires else None, value)
+                _index_tree_snapshots[key] = snapshot
+            return pickle.loads(snapshot[2])
+        return wrapper
+    return caching
+
+
 def cached_index_tree_json(timeout=50, key_prefix='index_tree_json'):
     """Cache index tree json."""
     def caching(f):
@@ -23,6 +23,7 @@ from flask_login import current_user
 from weko_records_ui.errors import AvailableFilesNotFoundRESTError
 from weko_redis.redis import RedisConnection
 from invenio_pidstore.models import PersistentIdentifier, PIDStatus
+from invenio_records.models import RecordMetadata
 from jsonschema import SchemaError, ValidationError
 from werkzeug.exceptions import BadRequest
 from invenio_accounts.testutils import login_user_via_session
@@ -78,6 +79,9 @@ from weko_items_ui.utils import (
     get_options_list,
     WekoQueryRankingHelper,
     get_ranking,
+    get_ranking_snapshot_key,
+    build_ranking_snapshot,
+    update_ranking_snapshot,
     get_title_in_request,
     get_user_info_by_email,
     get_user_info_by_username,
@@ -9447,6 +9451,59 @@ def test_get_ranking(app, users, db_records, db_ranking, esindex,mocker):
             result = get_ranking(ranking_settings)
             assert result == {}
 
+# def get_ranking(settings):
+# .tox/c1/bin/pytest --cov=weko_items_ui tests/test_utils.py::test_get_ranking_snapshot -v -vv -s --cov-branch --cov-report=term --basetemp=/code/modules/weko-items-ui/.tox/c1/tmp
+def test_get_ranking_snapshot(app, db, users, db_records, db_ranking, mocker):
+    cache = {}
+    mock_cache = mocker.patch("weko_items_ui.utils.current_cache")
+    mock_cache.get.side_effect = lambda key: cache.get(key)
+    mock_cache.set.side_effect = lambda key, value, timeout=None: cache.update({key: value})
+    mocker.patch("weko_items_ui.utils.Indexes.get_browsing_tree_paths", return_value=["1", "2", "3", "4"])
+    mocker.patch("weko_items_ui.utils.get_options_and_order_list", return_value=(None, None))
+    mocker.patch("weko_items_ui.utils.get_hide_list_by_schema_form", return_value=[])
+    mocker.patch("weko_deposit.api.WekoRecord.switching_language", return_value="test")
+    mocker.patch("weko_items_ui.utils.QueryRankingHelper.get", return_value=[])
+    mocker.patch("weko_items_ui.utils.QueryRankingHelper.get_new_items", return_value=[])
+    data = [{'key': '3', 'count': 5}, {'key': '1', 'count': 4}, {'key': '4', 'count': 2}]
+    settings = db_ranking['settings']
+    with app.test_request_context():
+        with patch("weko_items_ui.utils.WekoQueryRankingHelper.get", return_value=data):
+            snapshot = build_ranking_snapshot(settings)
+            assert [d["key"] for d in snapshot["most_reviewed_items"]] == ['3', '1', '4']
+            assert snapshot["most_reviewed_items"][0]["count"] == 5
+            assert snapshot["created_most_items_user"] == []
+            update_ranking_snapshot(settings)
+        assert get_ranking_snapshot_key(settings) in cache
+
+        app.config.update(WEKO_ITEMS_UI_RANKING_SNAPSHOT_ENABLED=True)
+        # The ranking is served from the snapshot without the stats.
+        with patch("weko_items_ui.utils.WekoQueryRankingHelper.get", side_effect=Exception):
+            result = get_ranking(settings)
+        assert result == {'most_reviewed_items': [{'key': '3', 'rank': 1, 'count': 5, 'title': 'test', 'url': '../records/3'}, {'key': '1', 'rank': 2, 'count': 4, 'title': 'test', 'url': '../records/1'}, {'key': '4', 'rank': 3, 'count': 2, 'title': 'test', 'url': '../records/4'}], 'most_downloaded_items': [], 'created_most_items_user': [], 'most_searched_keywords': [], 'new_items': []}
+
+        # Items out of the browsable indexes are hidden.
+        with patch("weko_items_ui.utils.Indexes.get_browsing_tree_paths", return_value=[]):
+            result = get_ranking(settings)
+        assert result["most_reviewed_items"] == []
+
+        # Items out of the community are hidden.
+        comm = MagicMock()
+        comm.index.id = 2
+        with app.test_request_context("/?c=comm"):
+            with patch("weko_items_ui.utils.GetCommunity.get_community_by_id", return_value=comm):
+                result = get_ranking(settings)
+        assert [d["key"] for d in result["most_reviewed_items"]] == ['3', '4']
+
+        # Items deleted or made private after the snapshot are hidden.
+        PersistentIdentifier.get("recid", "3").status = PIDStatus.DELETED
+        record = RecordMetadata.query.filter_by(
+            id=PersistentIdentifier.get("recid", "4").object_uuid).one()
+        record.json = dict(record.json, publish_status="1")
+        db.session.commit()
+        result = get_ranking(settings)
+        assert result["most_reviewed_items"] == [{'key': '1', 'rank': 1, 'count': 4, 'title': 'test', 'url': '../records/1'}]
+        app.config.update(WEKO_ITEMS_UI_RANKING_SNAPSHOT_ENABLED=False)
+
 # def __sanitize_string(s: str):
 # .tox/c1/bin/pytest --cov=weko_items_ui tests/test_utils.py::test___sanitize_string -vv -s --cov-branch --cov-report=term --basetemp=/code/modules/weko-items-ui/.tox/c1/tmp
 def test___sanitize_string():
@@ -208,6 +208,15 @@ WEKO_ITEMS_UI_RANKING_DEFAULT_SETTINGS = {
 
 WEKO_ITEMS_UI_RANKING_BUFFER = 100
 
+WEKO_ITEMS_UI_RANKING_SNAPSHOT_ENABLED = False
+"""Serve the ranking from the snapshots of update_ranking_snapshots task."""
+
+WEKO_ITEMS_UI_RANKING_SNAPSHOT_PERIODS = []
+"""Statistical periods of the snapshots other than the ranking settings."""
+
+WEKO_ITEMS_UI_RANKING_SNAPSHOT_TIMEOUT = 60 * 60 * 24 * 2
+"""Timeout of the ranking snapshots in seconds."""
+
 WEKO_ITEMS_UI_SEARCH_RANK_KEY_FILTER = ['']
 
 WEKO_ITEMS_UI_SHARED_USER_ROLE_ID_LIST = [1,2,3]
@@ -12,7 +12,7 @@ from kombu.compat import Consumer
 from kombu.entity import Exchange, Queue
 from invenio_pidstore.models import PersistentIdentifier
 from invenio_oaiserver.response import is_private_index
-from weko_admin.models import AdminSettings
+from weko_admin.models import AdminSettings, RankingSettings
 from celery.utils.log import get_task_logger
 from weko_authors.models import Authors
 from weko_deposit.api import WekoRecord
@@ -24,9 +24,36 @@ from weko_records.utils import json_loader
 from weko_records_ui.permissions import check_publish_status, file_permission_factory 
 from weko_schema_ui.schema import SchemaTree
 from .linkage import Researchmap
+from .utils import update_ranking_snapshot
 
 logger = get_task_logger(__name__)
 
+
+@shared_task(ignore_results=True)
+def update_ranking_snapshots():
+    """Compute the ranking snapshots of each statistical period."""
+    if not current_app.config['WEKO_ITEMS_UI_RANKING_SNAPSHOT_ENABLED']:
+        return
+    settings = RankingSettings.get()
+    if not settings:
+        return
+    periods = [settings.statistical_period] + [
+        period for period
+        in current_app.config['WEKO_ITEMS_UI_RANKING_SNAPSHOT_PERIODS']
+        if period != settings.statistical_period]
+    for period in periods:
+        snapshot_settings = RankingSettings(
+            new_item_period=settings.new_item_period,
+            statistical_period=period,
+            display_rank=settings.display_rank)
+        try:
+            update_ranking_snapshot(snapshot_settings)
+        except Exception as ex:
+            logger.error(
+                'Failed to update the ranking snapshot of {} days: {}'.format(
+                    period, ex))
+
+
 @shared_task(ignore_results=True)
 def bulk_post_item_to_researchmap():
     """ receive cris_researchmap_linkage Queue and process sequential."""
@@ -56,10 +56,12 @@ from invenio_pidrelations.models import PIDRelation
 from invenio_pidstore.models import PersistentIdentifier, PIDStatus
 from invenio_pidstore.errors import PIDDoesNotExistError
 from invenio_records.api import RecordBase
+from invenio_records.models import RecordMetadata
 from invenio_accounts.models import User
+from invenio_cache import current_cache
 from invenio_search import RecordsSearch
 from invenio_stats.utils import QueryRankingHelper
-from weko_admin.models import AdminSettings
+from weko_admin.models import AdminSettings, RankingSettings
 from weko_authors.api import WekoAuthors
 from weko_deposit.api import WekoDeposit, WekoRecord
 from weko_deposit.pidstore import get_record_without_version
@@ -86,7 +88,7 @@ from weko_search_ui.utils import (
 )
 from weko_schema_ui.models import PublishStatus
 from weko_user_profiles import UserProfile
-from weko_workflow.api import WorkActivity
+from weko_workflow.api import GetCommunity, WorkActivity
 from weko_workflow.config import (
     IDENTIFIER_GRANT_LIST, WEKO_SERVER_CNRI_HOST_LINK
 )
@@ -482,12 +484,85 @@ def get_permission_record(rank_type, es_data, display_rank, has_permission_index
 
     return result
 
+def get_permission_snapshot_record(rank_type, snapshot_data, display_rank,
+                                   has_permission_indexes):
+    """
+    Find items of the ranking snapshot that should be visible by the current user.
+
+    The status, indexes and publish date of the items are read from the
+    records at request time by one query, so that items deleted, made
+    private or moved after the snapshot are not listed.
+
+    parameter:
+        rank_type: Ranking Type. e.g. 'most_reviewed_items' or 'most_downloaded_items' or 'new_items'
+        snapshot_data: List of ranking data of the snapshot.
+        display_rank: Number of ranking display.
+        has_permission_indexes: List of can be view by the current user.
+    return: List of ranking data that the user can access.
+    """
+    if not snapshot_data:
+        return []
+
+    records = dict(
+        db.session.query(PersistentIdentifier.pid_value, RecordMetadata.json)
+        .join(RecordMetadata,
+              RecordMetadata.id == PersistentIdentifier.object_uuid)
+        .filter(PersistentIdentifier.pid_type == 'recid',
+                PersistentIdentifier.pid_value.in_(
+                    [data['key'] for data in snapshot_data]),
+                PersistentIdentifier.status != PIDStatus.DELETED)
+    )
+    result = []
+    roles = get_user_roles()
+    date_list = []
+    for data in snapshot_data:
+        if len(result) == display_rank:
+            break
+
+        record = records.get(data['key'])
+        if not record or \
+                record.get('publish_status') == PublishStatus.DELETE.value:
+            continue
+        if not roles[0]:
+            is_public = check_created_id(record) or \
+                check_publish_status(record)
+            has_index_permission = any(
+                str(idx) in has_permission_indexes
+                for idx in record.get('path', []))
+            if not (is_public and has_index_permission):
+                continue
+
+        title = WekoRecord.switching_language(data['titles'])
+        if rank_type == 'new_items':
+            publish_date = ''
+            if data['publish_date'] not in date_list:
+                publish_date = data['publish_date']
+                date_list.append(publish_date)
+            ranking_data = parse_ranking_results(
+                rank_type,
+                data['key'],
+                title=title,
+                date=publish_date
+            )
+        else:
+            ranking_data = parse_ranking_results(
+                rank_type,
+                data['key'],
+                count=data['count'],
+                rank=len(result) + 1,
+                title=title
+            )
+        result.append(ranking_data)
+
+    return result
+
 def parse_ranking_results(rank_type,
                           key,
                           count=-1,
                           rank=-1,
                           record=None,
-                          date=''):
+                          date='',
+                          title=''):
     """
     Parse the raw stats results to be usable by the view.
 
@@ -498,6 +573,7 @@ def parse_ranking_results(rank_type,
         rank: Rank number of rank data. Defaults to -1.
         record: WekoRecord object. Defaults to 'None'.
         date: Date of new item. Defaults to ''. e.g. '2022-10-01'
+        title: Title of the item, used when record is 'None'. Defaults to ''.
 
     Returns:
         Rank data.
@@ -506,7 +582,8 @@ def parse_ranking_results(rank_type,
 
     if rank_type in ['most_reviewed_items', 'most_downloaded_items', 'new_items']:
         url = '../records/{0}'.format(key)
-        title = record.get_titles
+        if record is not None:
+            title = record.get_titles
     elif rank_type == 'most_searched_keywords':
         url = '../search?page=1&size=20&search_type=1&q={0}'.format(key)
         title = key
@@ -2899,19 +2976,32 @@ def _export_item(record_id,
         # First get all of the files, checking for permissions while doing so
         if include_contents:
             # Get files
-            for file in record.files:  # TODO: Temporary processing
-                if check_file_download_permission(record, file.info()):
-                    if file.info().get('accessrole') != 'open_restricted':
-                        exported_item['files'].append(file.info())
-                        # TODO: Then convert the item into the desired format
-                        if file:
-                            with file.obj.file.storage().open() as file_buffered, \
-                                open(tmp_path + '/' + file.obj.basename, 'wb') as temp_file:
-                                temp_file.write(file_buffered.read())
+            for file in get_export_files(record):  # TODO: Temporary processing
+                exported_item['files'].append(file.info())
+                # TODO: Then convert the item into the desired format
+                if file:
+                    with file.obj.file.storage().open() as file_buffered, \
+                        open(tmp_path + '/' + file.obj.basename, 'wb') as temp_file:
+                        temp_file.write(file_buffered.read())
 
     return exported_item, list_item_role
 
 
+def get_export_files(record):
+    """Get the files of a record exported for the current user.
+
+    Args:
+        record (WekoRecord): The record.
+
+    Returns:
+        list: The files which the user can download, except the files of
+            restricted access.
+    """
+    return [file for file in record.files
+            if check_file_download_permission(record, file.info())
+            and file.info().get('accessrole') != 'open_restricted']
+
+
 def _custom_export_metadata(record_metadata: dict, hide_item: bool = True,
                             replace_license: bool = True):
     """Custom export metadata.
@@ -3843,6 +3933,16 @@ class WekoQueryRankingHelper(QueryRankingHelper):
 
         return result
 
+RANKING_TYPES = ('most_reviewed_items', 'most_downloaded_items',
+                 'created_most_items_user', 'most_searched_keywords',
+                 'new_items')
+"""Ranking types in the order of the ranking page."""
+
+RANKING_ITEM_TYPES = ('most_reviewed_items', 'most_downloaded_items',
+                      'new_items')
+"""Ranking types of items, checked for the permission of the user."""
+
+
 def get_ranking(settings):
     """Get ranking.
 
@@ -3861,11 +3961,122 @@ def get_ranking(settings):
 
     current_app.logger.debug("get_ranking start")
 
-    rank_buffer = current_app.config['WEKO_ITEMS_UI_RANKING_BUFFER']
+    if current_app.config['WEKO_ITEMS_UI_RANKING_SNAPSHOT_ENABLED']:
+        snapshot = current_cache.get(get_ranking_snapshot_key(settings))
+        if snapshot is not None:
+            return get_ranking_from_snapshot(settings, snapshot)
+
     index_json = Indexes.get_browsing_tree_ignore_more()
     index_info = {}
     _get_index_info(index_json, index_info)
     has_permission_indexes = list(index_info.keys())
+    rankings = get_ranking_stats(settings)
+    for rank_type in RANKING_ITEM_TYPES:
+        if rank_type in rankings:
+            rankings[rank_type] = get_permission_record(
+                rank_type, rankings[rank_type], settings.display_rank,
+                has_permission_indexes)
+    return rankings
+
+
+def get_ranking_snapshot_key(settings):
+    """Get the cache key of the ranking snapshot.
+
+    :param settings: ranking setting.
+    :return: The cache key.
+    """
+    return 'ranking_snapshot::{}_{}_{}'.format(
+        settings.statistical_period, settings.new_item_period,
+        settings.display_rank)
+
+
+def build_ranking_snapshot(settings):
+    """Compute all the ranking lists of the settings.
+
+    The items are stored with their titles, the visibility of the items is
+    checked against the records when the snapshot is read.
+
+    :param settings: ranking setting.
+    :return: The ranking lists by ranking type.
+    """
+    snapshot_settings = RankingSettings(
+        new_item_period=settings.new_item_period,
+        statistical_period=settings.statistical_period,
+        display_rank=settings.display_rank,
+        rankings={rank_type: True for rank_type in RANKING_TYPES})
+    snapshot = get_ranking_stats(snapshot_settings)
+    for rank_type in RANKING_ITEM_TYPES:
+        entries = []
+        for data in snapshot[rank_type]:
+            pid_value = data['key'] \
+                if 'key' in data \
+                else data.get('_item_metadata').get('control_number')
+            try:
+                record = WekoRecord.get_record_by_pid(pid_value)
+            except PIDDoesNotExistError:
+                continue
+            if (record.pid and record.pid.status == PIDStatus.DELETED) or \
+                    record.get('publish_status') == PublishStatus.DELETE.value:
+                continue
+            entries.append(dict(
+                key=pid_value,
+                count=data.get('count'),
+                publish_date=data.get('publish_date'),
+                titles=record.get_titles_with_language
+            ))
+        snapshot[rank_type] = entries
+    return snapshot
+
+
+def update_ranking_snapshot(settings):
+    """Compute the ranking snapshot of the settings into the cache.
+
+    :param settings: ranking setting.
+    """
+    current_cache.set(
+        get_ranking_snapshot_key(settings),
+        build_ranking_snapshot(settings),
+        timeout=current_app.config['WEKO_ITEMS_UI_RANKING_SNAPSHOT_TIMEOUT'])
+
+
+def get_ranking_from_snapshot(settings, snapshot):
+    """Get ranking from the snapshot for the current user.
+
+    :param settings: ranking setting.
+    :param snapshot: ranking snapshot made by build_ranking_snapshot.
+    :return:
+    """
+    paths = Indexes.get_browsing_tree_paths()
+    community = request.args.get('c', None)
+    if community:
+        # Same as the community filter of WekoRecord.navi.
+        comm = GetCommunity.get_community_by_id(community)
+        if comm:
+            paths = [path for path in paths
+                     if str(comm.index.id) in path.split('/')]
+    has_permission_indexes = [path.split('/')[-1] for path in paths]
+    rankings = {}
+    for rank_type in RANKING_TYPES:
+        if not settings.rankings.get(rank_type):
+            continue
+        if rank_type in RANKING_ITEM_TYPES:
+            rankings[rank_type] = get_permission_snapshot_record(
+                rank_type, snapshot.get(rank_type, []),
+                settings.display_rank, has_permission_indexes)
+        else:
+            rankings[rank_type] = snapshot.get(rank_type, [])
+    return rankings
+
+
+def get_ranking_stats(settings):
+    """Get the ranking lists from the stats.
+
+    The item rankings are the stats results before the permission check.
+
+    :param settings: ranking setting.
+    :return:
+    """
+    rank_buffer = current_app.config['WEKO_ITEMS_UI_RANKING_BUFFER']
     # get statistical period
     end_date_original = date.today()  # - timedelta(days=1)
     start_date_original = end_date_original - timedelta(
@@ -3886,7 +4097,7 @@ def get_ranking(settings):
             must_not=json.dumps([{"wildcard": {"pid_value": "*.*"}}]),
             ranking_type='most_view_ranking'
         )
-        rankings['most_reviewed_items'] = get_permission_record('most_reviewed_items', result, settings.display_rank, has_permission_indexes)
+        rankings['most_reviewed_items'] = result
 
     # most_downloaded_items
     current_app.logger.debug("get most_downloaded_items start")
@@ -3902,7 +4113,7 @@ def get_ranking(settings):
         )
 
         current_app.logger.debug("finished getting most_downloaded_items data from ES")
-        rankings['most_downloaded_items'] = get_permission_record('most_downloaded_items', result, settings.display_rank, has_permission_indexes)
+        rankings['most_downloaded_items'] = result
 
     # created_most_items_user
     current_app.logger.debug("get created_most_items_user start")
@@ -3975,7 +4186,7 @@ def get_ranking(settings):
         )
 
         current_app.logger.debug("finished getting new_items data from ES")
-        rankings['new_items'] = get_permission_record('new_items', result, settings.display_rank, has_permission_indexes)
+        rankings['new_items'] = result
 
     return rankings
 
@@ -126,6 +126,9 @@ setup(
         'invenio_db.models': [
             'weko_records_ui = weko_records_ui.models',
         ],
+        'invenio_celery.tasks': [
+            'weko_records_ui = weko_records_ui.tasks',
+        ],
         'invenio_oauth2server.scopes': [
             'file_read_scope = weko_records_ui.scopes:file_read_scope',
         ],
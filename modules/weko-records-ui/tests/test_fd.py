@@ -275,6 +275,60 @@ def test_add_signals_info(app,records,itemtypes,users):
                     add_signals_info(record,obj)
 
 
+# def get_signals_user_info():
+# def get_signals_billing_item(item_type_id):
+# def get_signals_index_list(record, groups):
+# .tox/c1/bin/pytest --cov=weko_records_ui tests/test_fd.py::test_add_signals_info_cache -vv -s --cov-branch --cov-report=term --basetemp=/code/modules/weko-records-ui/.tox/c1/tmp
+def test_add_signals_info_cache(app, db, records, itemtypes, users):
+    from sqlalchemy import event
+    from invenio_cache import current_cache
+    from weko_index_tree.utils import _index_tree_snapshots
+
+    indexer, results = records
+    recid = results[0]["recid"]
+    record = results[0]["record"]
+    fileobj = record_file_factory(recid, record, "helloworld.pdf")
+    obj = fileobj.obj
+
+    statements = []
+    def count_statements(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    def get_signals_info():
+        del statements[:]
+        event.listen(db.engine, "before_cursor_execute", count_statements)
+        try:
+            add_signals_info(record, obj)
+        finally:
+            event.remove(db.engine, "before_cursor_execute", count_statements)
+        info = (obj.userrole, obj.userid, obj.user_group_list,
+                obj.is_billing_item, obj.index_list)
+        return info, len(statements)
+
+    with app.test_request_context():
+        with patch("flask_login.utils._get_user", return_value=users[1]["obj"]):
+            # without cache, each download queries the user, item type and indexes
+            expected, count_no_cache = get_signals_info()
+            assert get_signals_info() == (expected, count_no_cache)
+            assert count_no_cache > 0
+
+            app.config["WEKO_RECORDS_UI_SIGNALS_CACHE_TIMEOUT"] = 300
+            app.config["WEKO_INDEX_TREE_SNAPSHOT_ENABLED"] = True
+            try:
+                # the first download fills the cache
+                info, _ = get_signals_info()
+                assert info == expected
+                # the next downloads do not query the database
+                info, count_cached = get_signals_info()
+                assert info == expected
+                assert count_cached == 0
+            finally:
+                app.config["WEKO_RECORDS_UI_SIGNALS_CACHE_TIMEOUT"] = 0
+                app.config["WEKO_INDEX_TREE_SNAPSHOT_ENABLED"] = False
+                _index_tree_snapshots.clear()
+                current_cache.clear()
+
+
 # .tox/c1/bin/pytest --cov=weko_records_ui tests/test_fd.py::test_error_response -vv -s --cov-branch --cov-report=term --basetemp=/code/modules/weko-records-ui/.tox/c1/tmp
 @patch('weko_records_ui.fd.render_template')
 def test_error_response(mock_render):
@@ -16,7 +16,8 @@ from weko_deposit.api import WekoDeposit as aWekoDeposit
 from weko_records.models import ItemType, ItemTypeMapping, ItemTypeName
 from weko_records.api import ItemsMetadata
 
-from weko_records_ui.pdf import get_east_asian_width_count,make_combined_pdf
+from weko_records_ui.pdf import get_east_asian_width_count,make_combined_pdf, \
+    evict_combined_pdf_cache, get_cached_combined_pdf, get_combined_pdf_cache_path
 
 
 # def get_east_asian_width_count(text):
@@ -469,4 +470,79 @@ def test_make_combined_pdf(app, db, esindex, location, pdfcoverpagesetting, mock
             assert args_list[2][0][3] == "Language: ja\nPublisher: \nDate of Publication: 2024-03-21\nKeywords: \nAuthor: \nE-mail: \nAffiliation: "
             mock_multi_cell.call_args_list.clear()
     if os.path.isdir(temp_path+"/comb_pdfs"):
-        shutil.rmtree(temp_path+"/comb_pdfs")
\ No newline at end of file
+        shutil.rmtree(temp_path+"/comb_pdfs")
+
+
+# def get_combined_pdf_cache_key(obj, records, item_type, lang):
+# def get_cached_combined_pdf(cache_key):
+# def evict_combined_pdf_cache():
+# .tox/c1/bin/pytest --cov=weko_records_ui tests/test_pdf.py::test_make_combined_pdf_cache -vv -s --cov-branch --cov-report=term --basetemp=/code/modules/weko-records-ui/.tox/c1/tmp
+def test_make_combined_pdf_cache(app, db, esindex, location, pdfcoverpagesetting, tmp_path, mocker):
+    import os
+    item_type_name = ItemTypeName(id=1, name="test_itemtype")
+    with open("tests/data/item_type_schema_pdftest.json", "r") as f:
+        item_type_schema = json.load(f)
+    with open("tests/data/item_type_form_pdftest.json", "r") as f:
+        item_type_form = json.load(f)
+    with open("tests/data/item_type_render_pdftest.json", "r") as f:
+        item_type_render = json.load(f)
+    with open("tests/data/item_type_mapping_pdftest.json", "r") as f:
+        item_type_mapping = json.load(f)
+    item_type = ItemType(
+        id=1, name_id=1, schema=item_type_schema, form=item_type_form, render=item_type_render, tag=1
+    )
+    itemtype_mapping = ItemTypeMapping(id=1, item_type_id=1, mapping=item_type_mapping)
+    with db.session.begin_nested():
+        db.session.add(item_type_name)
+        db.session.add(item_type)
+        db.session.add(itemtype_mapping)
+    db.session.commit()
+    indexer = WekoIndexer()
+    indexer.get_es_index()
+    record = make_record(indexer, 1, {"val": "test_publisher", "lang": "en"}, [{"val": "test_subject", "lang": "en"}], {"val": "test, taro", "lang": "en"}, {"val": "test_affiliation", "lang": "en"}, ["eng"])
+    db.session.commit()
+    fileobj = record.files["helloworld.pdf"]
+    obj = fileobj.obj
+
+    cache_dir = str(tmp_path / "comb_pdfs_cache")
+    max_size = app.config["WEKO_RECORDS_UI_PDF_COVERPAGE_CACHE_MAX_SIZE"]
+    app.config["WEKO_RECORDS_UI_PDF_COVERPAGE_CACHE_ENABLED"] = True
+    app.config["WEKO_RECORDS_UI_PDF_COVERPAGE_CACHE_DIR"] = cache_dir
+    from fpdf import FPDF
+    mock_output = mocker.spy(FPDF, "output")
+    try:
+        # the first download makes the file in the cache
+        with app.test_request_context(headers=[('Accept-Language', 'en')]):
+            res = make_combined_pdf(record.pid, fileobj, obj, None)
+            assert res.mimetype == "application/pdf"
+        assert mock_output.call_count == 1
+        cached_files = os.listdir(cache_dir)
+        assert len(cached_files) == 1
+        assert cached_files[0].endswith(".pdf")
+
+        # the next downloads are served from the cache
+        with app.test_request_context(headers=[('Accept-Language', 'en')]):
+            res = make_combined_pdf(record.pid, fileobj, obj, None)
+            assert res.mimetype == "application/pdf"
+        assert mock_output.call_count == 1
+
+        # another language has its own cover page
+        with app.test_request_context(headers=[('Accept-Language', 'ja')]):
+            make_combined_pdf(record.pid, fileobj, obj, None)
+        assert mock_output.call_count == 2
+        assert len(os.listdir(cache_dir)) == 2
+
+        # the least recently used file is evicted over the size limit
+        paths = sorted((os.path.join(cache_dir, f) for f in os.listdir(cache_dir)),
+                       key=os.path.getmtime)
+        os.utime(paths[0], (0, 0))
+        app.config["WEKO_RECORDS_UI_PDF_COVERPAGE_CACHE_MAX_SIZE"] = os.path.getsize(paths[1])
+        evict_combined_pdf_cache()
+        assert os.listdir(cache_dir) == [os.path.basename(paths[1])]
+
+        # a missing file is not cached
+        assert get_cached_combined_pdf("not_cached") is None
+        assert get_combined_pdf_cache_path("key") == os.path.join(cache_dir, "key.pdf")
+    finally:
+        app.config["WEKO_RECORDS_UI_PDF_COVERPAGE_CACHE_ENABLED"] = False
+        app.config["WEKO_RECORDS_UI_PDF_COVERPAGE_CACHE_MAX_SIZE"] = max_size
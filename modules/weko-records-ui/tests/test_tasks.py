@@ -0,0 +1,88 @@
+from mock import MagicMock, patch
+
+from weko_records_ui.tasks import COMBINED_PDFS_SESSION_KEY, \
+    cache_combined_pdfs, cache_combined_pdfs_on_item_created, \
+    queue_combined_pdfs_on_teardown
+
+
+# def cache_combined_pdfs(pid_value, host_url=None):
+# .tox/c1/bin/pytest --cov=weko_records_ui tests/test_tasks.py::test_cache_combined_pdfs -vv -s --cov-branch --cov-report=term --basetemp=/code/modules/weko-records-ui/.tox/c1/tmp
+def test_cache_combined_pdfs(app):
+    pdf_file = MagicMock()
+    pdf_file.obj.mimetype = "application/pdf"
+    text_file = MagicMock()
+    text_file.obj.mimetype = "text/plain"
+    record = MagicMock()
+    record.files = [pdf_file, text_file]
+    settings = MagicMock(avail="enable")
+    pid = MagicMock()
+
+    with patch("weko_records_ui.tasks.make_combined_pdf") as mock_make:
+        # cache is disabled
+        cache_combined_pdfs("1")
+        mock_make.assert_not_called()
+
+        app.config["WEKO_RECORDS_UI_PDF_COVERPAGE_CACHE_ENABLED"] = True
+        try:
+            with patch("weko_records_ui.tasks.PDFCoverPageSettings.find", return_value=settings), \
+                    patch("weko_records_ui.tasks.PersistentIdentifier.get", return_value=pid), \
+                    patch("weko_records_ui.tasks.WekoRecord.get_record_by_pid", return_value=record):
+                # cover page of the indexes is disabled
+                with patch("weko_records_ui.tasks.WekoRecord.get_record_cvs", return_value=False):
+                    cache_combined_pdfs("1")
+                    mock_make.assert_not_called()
+
+                # the pdf files are made in each language
+                with patch("weko_records_ui.tasks.WekoRecord.get_record_cvs", return_value=True):
+                    cache_combined_pdfs("1", "https://localhost/")
+                    assert mock_make.call_count == 2
+                    mock_make.assert_called_with(pid, pdf_file, pdf_file.obj, "en")
+
+                    # an error of a file does not stop the task
+                    mock_make.side_effect = Exception("test_error")
+                    cache_combined_pdfs("1", "https://localhost/")
+                    assert mock_make.call_count == 4
+
+                # cover page setting is disabled
+                settings.avail = "disable"
+                mock_make.reset_mock()
+                cache_combined_pdfs("1")
+                mock_make.assert_not_called()
+        finally:
+            app.config["WEKO_RECORDS_UI_PDF_COVERPAGE_CACHE_ENABLED"] = False
+
+
+# def cache_combined_pdfs_on_item_created(app, user_id, item_id, item_title, **kwargs):
+# .tox/c1/bin/pytest --cov=weko_records_ui tests/test_tasks.py::test_cache_combined_pdfs_on_item_created -vv -s --cov-branch --cov-report=term --basetemp=/code/modules/weko-records-ui/.tox/c1/tmp
+def test_cache_combined_pdfs_on_item_created(app, db):
+    item_id = MagicMock(pid_value="1")
+    with patch("weko_records_ui.tasks.cache_combined_pdfs.apply_async") as mock_task:
+        cache_combined_pdfs_on_item_created(app, 1, item_id, "title")
+        db.session.commit()
+        mock_task.assert_not_called()
+
+        app.config["WEKO_RECORDS_UI_PDF_COVERPAGE_CACHE_ENABLED"] = True
+        try:
+            # the task is queued after the commit
+            cache_combined_pdfs_on_item_created(app, 1, item_id, "title")
+            mock_task.assert_not_called()
+            db.session.commit()
+            mock_task.assert_called_once_with(("1",))
+
+            # nothing is queued after a rollback
+            mock_task.reset_mock()
+            cache_combined_pdfs_on_item_created(app, 1, item_id, "title")
+            db.session.rollback()
+            db.session.commit()
+            mock_task.assert_not_called()
+
+            # the items left at the end of the context are queued
+            cache_combined_pdfs_on_item_created(app, 1, item_id, "title")
+            queue_combined_pdfs_on_teardown(Exception("test_error"))
+            mock_task.assert_not_called()
+            cache_combined_pdfs_on_item_created(app, 1, item_id, "title")
+            queue_combined_pdfs_on_teardown()
+            mock_task.assert_called_once_with(("1",))
+            assert COMBINED_PDFS_SESSION_KEY not in db.session.info
+        finally:
+            app.config["WEKO_RECORDS_UI_PDF_COVERPAGE_CACHE_ENABLED"] = False
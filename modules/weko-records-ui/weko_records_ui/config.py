@@ -20,6 +20,7 @@
 
 """Configuration for weko-records-ui."""
 import os
+import tempfile
 from enum import Enum
 
 from flask_babelex import lazy_gettext as _
@@ -415,6 +416,25 @@ PDF_COVERPAGE_LANG_FILEPATH = "/translations/"
 
 PDF_COVERPAGE_LANG_FILENAME = "/pdf_coverpage.json"
 
+WEKO_RECORDS_UI_PDF_COVERPAGE_CACHE_ENABLED = False
+"""Keep the cover-page-combined PDF files to serve the next downloads."""
+
+WEKO_RECORDS_UI_PDF_COVERPAGE_CACHE_DIR = os.path.join(
+    tempfile.gettempdir(), 'comb_pdfs_cache')
+"""Directory of the cached cover-page-combined PDF files."""
+
+WEKO_RECORDS_UI_PDF_COVERPAGE_CACHE_MAX_SIZE = 10 * 1024 * 1024 * 1024
+"""Total size in bytes of the cached files, the least recently used are
+deleted over it."""
+
+WEKO_RECORDS_UI_PDF_COVERPAGE_CACHE_LANGUAGES = ['ja', 'en']
+"""Languages of the cover pages made when an item is published."""
+
+WEKO_RECORDS_UI_SIGNALS_CACHE_TIMEOUT = 0
+"""Seconds the user role and groups, the billing flag of the item types and
+the index names of the records sent with the download events are cached.
+0 to disable the cache."""
+
 WEKO_RECORDS_UI_DEFAULT_MAX_WIDTH_THUMBNAIL = 100
 """Default max width of thumbnail."""
 
@@ -44,8 +44,13 @@ class WekoRecordsUI(object):
 
         :param app: The Flask application.
         """
+        from weko_deposit.signals import item_created
+        from .tasks import cache_combined_pdfs_on_item_created, \
+            queue_combined_pdfs_on_teardown
         from .views import blueprint
         self.init_config(app)
+        item_created.connect(cache_combined_pdfs_on_item_created, app)
+        app.teardown_appcontext(queue_combined_pdfs_on_teardown)
         app.register_blueprint(blueprint)
         app.extensions['weko-records-ui'] = self
         app.before_request(verify_oauth_token_and_set_current_user)
@@ -21,12 +21,15 @@
 """Utilities for download file."""
 
 import base64
+import hashlib
+import json
 import mimetypes
 import os
 import random
 import shutil
 import string
 import tempfile
+import time
 import unicodedata
 from datetime import datetime, timezone
 
@@ -35,6 +38,7 @@ from flask_babelex import gettext as _
 from flask_babelex import get_locale
 from flask_login import current_user
 from flask_security.utils import verify_password
+from invenio_cache import current_cache
 from invenio_db import db
 from invenio_files_rest import signals
 from invenio_files_rest.models import FileInstance
@@ -45,6 +49,7 @@ from weko_accounts.views import _redirect_method
 from weko_admin.models import AdminSettings
 from weko_deposit.api import WekoRecord
 from weko_groups.api import Group
+from weko_index_tree.utils import get_index_tree_version, get_user_roles
 from weko_logging.activity_logger import UserActivityLogger
 from weko_records.api import FilesMetadata, ItemTypes
 from weko_redis.redis import RedisConnection
@@ -365,6 +370,107 @@ def _download_file(file_obj, is_preview, lang, obj, pid, record):
     return make_combined_pdf(pid, file_obj, obj, lang)
 
 
+def get_signals_user_info():
+    """Get the role and the groups of the current user for the event signals.
+
+    They are kept in the session for WEKO_RECORDS_UI_SIGNALS_CACHE_TIMEOUT
+    seconds.
+
+    :return: The user id, the role name and the list of the groups.
+    """
+    if not hasattr(current_user, 'id'):
+        return 0, 'guest', []
+
+    timeout = current_app.config['WEKO_RECORDS_UI_SIGNALS_CACHE_TIMEOUT']
+    cached = session.get('weko_records_ui_signals_user') if timeout else None
+    if cached and cached['userid'] == current_user.id \
+            and cached['expires'] > time.time():
+        return current_user.id, cached['userrole'], cached['groups']
+
+    userrole = 'guest'
+    user_groups = Group.query_by_user(current_user).all()
+    if len(current_user.roles) == 0:
+        userrole = 'user'
+    elif len(current_user.roles) == 1:
+        userrole = current_user.roles[0].name
+    else:
+        max_power_role_id = 2147483646
+        for r in current_user.roles:
+            if max_power_role_id > r.id:
+                if max_power_role_id == 2147483646 or r.id > 0:
+                    max_power_role_id = r.id
+                    userrole = r.name
+    groups = [{'group_id': g.id, 'group_name': g.name} for g in user_groups]
+
+    if timeout:
+        session['weko_records_ui_signals_user'] = {
+            'userid': current_user.id,
+            'userrole': userrole,
+            'groups': groups,
+            'expires': time.time() + timeout,
+        }
+    return current_user.id, userrole, groups
+
+
+def get_signals_billing_item(item_type_id):
+    """Check whether the item type is of billing items, with the cache.
+
+    :param item_type_id: Item type id.
+    :return: True if the items are billing items.
+    """
+    timeout = current_app.config['WEKO_RECORDS_UI_SIGNALS_CACHE_TIMEOUT']
+    if not timeout:
+        return is_billing_item(item_type_id)
+
+    key = 'weko_records_ui_signals_billing_item_{}'.format(item_type_id)
+    result = current_cache.get(key)
+    if result is None:
+        result = bool(is_billing_item(item_type_id))
+        current_cache.set(key, result, timeout=timeout)
+    return result
+
+
+def get_signals_index_list(record, groups):
+    """Get the index names of the record for the event signals.
+
+    The names are cached by record revision and index tree version when the
+    index tree snapshots are enabled, for the roles and the groups of the
+    user as the indexes are filtered by them.
+
+    :param record: the record metadata.
+    :param groups: groups of the current user.
+    :return: The index names joined by '|'.
+    """
+    def _get_index_list():
+        index_list = []
+        for index in record.navi:
+            current_app.logger.debug(index)
+            if index[3] is not None:
+                index_list.append(index[3])
+            else:
+                index_list.append(index[4])
+        return '|'.join(index_list)
+
+    timeout = current_app.config['WEKO_RECORDS_UI_SIGNALS_CACHE_TIMEOUT']
+    if not timeout \
+            or not current_app.config.get('WEKO_INDEX_TREE_SNAPSHOT_ENABLED'):
+        return _get_index_list()
+    version = get_index_tree_version()
+    if version is None:
+        return _get_index_list()
+
+    is_admin, roles = get_user_roles(is_super_role=True)
+    key = 'weko_records_ui_signals_index_list_' + hashlib.sha1(json.dumps([
+        str(record.id), record.revision_id, version, request.args.get('c'),
+        is_admin, sorted(roles or []), sorted(g['group_id'] for g in groups)
+    ]).encode('utf-8')).hexdigest()
+    index_list = current_cache.get(key)
+    if index_list is None:
+        index_list = _get_index_list()
+        current_cache.set(key, index_list, timeout=timeout)
+    return index_list
+
+
 def add_signals_info(record, obj):
     """Add event signals info.
 
@@ -374,33 +480,15 @@ def add_signals_info(record, obj):
     :param obj: send object.
     """
     # Add user role info to send_obj
-
-    userrole = 'guest'
-    userid = 0
-    user_groups = []
-    if hasattr(current_user, 'id'):
-        userid = current_user.id
-        user_groups = Group.query_by_user(current_user).all()
-        if len(current_user.roles) == 0:
-            userrole = 'user'
-        elif len(current_user.roles) == 1:
-            userrole = current_user.roles[0].name
-        else:
-            max_power_role_id = 2147483646
-            for r in current_user.roles:
-                if max_power_role_id > r.id:
-                    if max_power_role_id == 2147483646 or r.id > 0:
-                        max_power_role_id = r.id
-                        userrole = r.name
+    userid, userrole, groups = get_signals_user_info()
     obj.userrole = userrole
     obj.userid = userid
 
     # Add groups of current users
-    groups = [{'group_id': g.id, 'group_name': g.name} for g in user_groups]
     obj.user_group_list = groups if groups else None
 
     # Check whether billing file or not
-    obj.is_billing_item = is_billing_item(record['item_type_id'])
+    obj.is_billing_item = get_signals_billing_item(record['item_type_id'])
 
     # Add billing file price
     billing_file_price = ''
@@ -422,16 +510,7 @@ def add_signals_info(record, obj):
         if hasattr(current_user, 'site_license_name') else ''
 
     # Add index list info to send_obj
-    index_list = ''
-    record_navs = record.navi
-    if len(record_navs) > 0:
-        for index in record_navs:
-            current_app.logger.debug(index)
-            if index[3] is not None:
-                index_list += index[3] + '|'
-            else:
-                index_list += index[4] + '|'
-    obj.index_list = index_list[:len(index_list) - 1]
+    obj.index_list = get_signals_index_list(record, groups)
 
     # Add item info to send_obj
     obj.item_title = record['item_title']
@@ -21,6 +21,7 @@
 """Utilities for making the PDF cover page and newly combined PDFs."""
 
 import errno
+import hashlib
 import io
 import json
 import os
@@ -49,7 +50,8 @@ from weko_records_ui.utils import get_record_permalink, \
     item_setting_show_email,get_values_by_selected_lang
 
 from .models import PDFCoverPageSettings
-from .utils import get_license_pdf, get_pair_value
+from .utils import evict_file_cache, get_cached_file, get_license_pdf, \
+    get_pair_value
 
 
 def get_east_asian_width_count(text):
@@ -67,6 +69,58 @@ LANG_CONVERT = {
     "eng": "English"
 }
 
+def get_combined_pdf_cache_key(obj, records, item_type, lang):
+    """Get the cache key of a cover-page-combined PDF file.
+
+    The key changes with the file version, the record revisions, the item
+    type, the language and the cover page settings.
+
+    :param obj: File object
+    :param records: Records whose metadata is shown on the cover page
+    :param item_type: Item type of the records
+    :param lang: Language of the cover page
+    :return: The cache key.
+    """
+    settings = PDFCoverPageSettings.find(1)
+    key = [
+        str(obj.version_id),
+        [record.revision_id for record in records],
+        str(getattr(item_type, 'updated', None)),
+        lang,
+        str(settings.updated_at) if settings else None,
+        item_setting_show_email(),
+        request.host_url,
+    ]
+    return hashlib.sha1(json.dumps(key).encode('utf-8')).hexdigest()
+
+
+def get_combined_pdf_cache_path(cache_key):
+    """Get the path of a cached cover-page-combined PDF file.
+
+    :param cache_key: The cache key.
+    :return: The file path.
+    """
+    return os.path.join(
+        current_app.config['WEKO_RECORDS_UI_PDF_COVERPAGE_CACHE_DIR'],
+        cache_key + '.pdf')
+
+
+def get_cached_combined_pdf(cache_key):
+    """Get the cached cover-page-combined PDF file.
+
+    :param cache_key: The cache key.
+    :return: The file path, or None if it is not cached.
+    """
+    return get_cached_file(get_combined_pdf_cache_path(cache_key))
+
+
+def evict_combined_pdf_cache():
+    """Delete the least recently used cached files over the size limit."""
+    evict_file_cache(
+        current_app.config['WEKO_RECORDS_UI_PDF_COVERPAGE_CACHE_DIR'],
+        current_app.config['WEKO_RECORDS_UI_PDF_COVERPAGE_CACHE_MAX_SIZE'])
+
+
 def make_combined_pdf(pid, fileobj, obj, lang_user):
     """Make the cover-page-combined PDF file.
 
@@ -195,6 +249,22 @@ def make_combined_pdf(pid, fileobj, obj, lang_user):
         hide_list = get_hide_list_by_schema_form(schemaform=item_type.render.get('table_row_map', {}).get('form', []))
     else:
         meta_options = get_options_and_order_list(item_type_id, mapping_flag=False)
+    cache_key = None
+    if current_app.config['WEKO_RECORDS_UI_PDF_COVERPAGE_CACHE_ENABLED']:
+        cache_key = get_combined_pdf_cache_key(
+            obj, [item_metadata_json, wekoRecord], item_type, cur_lang)
+        cached_filepath = get_cached_combined_pdf(cache_key)
+        if cached_filepath:
+            return send_file(
+                cached_filepath,
+                as_attachment=True,
+                attachment_filename='CV_' + fileobj.get(
+                    'filename', item_metadata_json.get('item_title', '')
+                    + '.pdf'),
+                mimetype='application/pdf',
+                cache_timeout=-1
+            )
+
     item_map = get_mapping(item_type_id, 'jpcoar_mapping', item_type=item_type)
 
     try:
@@ -655,17 +725,26 @@ def make_combined_pdf(pid, fileobj, obj, lang_user):
     except (KeyError, IndexError):
         download_filename = 'CV_' + title + '.pdf'
 
-    dir_path = tempfile.gettempdir() + '/comb_pdfs/'
+    if cache_key:
+        dir_path = current_app.config['WEKO_RECORDS_UI_PDF_COVERPAGE_CACHE_DIR']
+        os.makedirs(dir_path, exist_ok=True)
+        # Written under a temporary name, other workers may read the cache.
+        cache_filepath = get_combined_pdf_cache_path(cache_key)
+        combined_filepath = '{}.{}.tmp'.format(cache_filepath, os.getpid())
+    else:
+        dir_path = tempfile.gettempdir() + '/comb_pdfs/'
 
-    if not os.path.isdir(dir_path):
-        os.mkdir(dir_path)
+        if not os.path.isdir(dir_path):
+            os.mkdir(dir_path)
 
-    combined_filepath = dir_path + 'CV_{}_{}.pdf'.format(
-        datetime.now().strftime('%Y%m%d'), fileobj.file_id)
+        combined_filepath = dir_path + 'CV_{}_{}.pdf'.format(
+            datetime.now().strftime('%Y%m%d'), fileobj.file_id)
 
+    is_written = False
     with open(combined_filepath, 'wb') as f:
         try:
             combined_pages.write(f)
+            is_written = True
         except FileNotFoundError as ex:
             current_app.logger.error(ex)
             err_txt = ''.join((
@@ -716,6 +795,11 @@ def make_combined_pdf(pid, fileobj, obj, lang_user):
                 )
             )
 
+    if cache_key and is_written:
+        os.replace(combined_filepath, cache_filepath)
+        combined_filepath = cache_filepath
+        evict_combined_pdf_cache()
+
     return send_file(
         combined_filepath,
         as_attachment=True,
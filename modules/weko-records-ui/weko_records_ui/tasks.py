@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+#
+# This file is part of WEKO3.
+# Copyright (C) 2017 National Institute of Informatics.
+#
+# WEKO3 is free software; you can redistribute it
+# and/or modify it under the terms of the GNU General Public License as
+# published by the Free Software Foundation; either version 2 of the
+# License, or (at your option) any later version.
+#
+# WEKO3 is distributed in the hope that it will be
+# useful, but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with WEKO3; if not, write to the
+# Free Software Foundation, Inc., 59 Temple Place, Suite 330, Boston,
+# MA 02111-1307, USA.
+
+"""Celery tasks for weko-records-ui."""
+
+from celery import shared_task
+from celery.utils.log import get_task_logger
+from flask import current_app
+from invenio_db import db
+from invenio_pidstore.errors import PIDDoesNotExistError
+from invenio_pidstore.models import PersistentIdentifier
+from weko_deposit.api import WekoRecord
+
+from .models import PDFCoverPageSettings
+from .pdf import make_combined_pdf
+
+logger = get_task_logger(__name__)
+
+COMBINED_PDFS_SESSION_KEY = 'weko_records_ui_combined_pdfs'
+"""Key of the items to cache the combined PDF files of in session.info."""
+
+
+@shared_task(ignore_result=True)
+def cache_combined_pdfs(pid_value, host_url=None):
+    """Make the cover-page-combined PDF files of an item in the cache.
+
+    :param pid_value: PID value of the item.
+    :param host_url: URL of the site the files are downloaded from.
+    """
+    if not current_app.config['WEKO_RECORDS_UI_PDF_COVERPAGE_CACHE_ENABLED']:
+        return
+    settings = PDFCoverPageSettings.find(1)
+    if settings is None or settings.avail == 'disable':
+        return
+    try:
+        pid = PersistentIdentifier.get('recid', pid_value)
+    except PIDDoesNotExistError:
+        return
+    if WekoRecord.get_record_cvs(pid.object_uuid) is False:
+        return
+
+    record = WekoRecord.get_record_by_pid(pid_value)
+    pdf_files = [f for f in record.files
+                 if f.obj.mimetype and 'pdf' in f.obj.mimetype]
+    host_url = host_url or current_app.config['THEME_SITEURL']
+    for lang in current_app.config[
+            'WEKO_RECORDS_UI_PDF_COVERPAGE_CACHE_LANGUAGES']:
+        with current_app.test_request_context(
+                host_url, headers=[('Accept-Language', lang)]):
+            for fileobj in pdf_files:
+                try:
+                    make_combined_pdf(pid, fileobj, fileobj.obj, lang)
+                except Exception as ex:
+                    logger.error(
+                        'Failed to make the cover page of {} {}: {}'.format(
+                            pid_value, fileobj.obj.key, ex))
+
+
+def cache_combined_pdfs_on_item_created(app, user_id, item_id, item_title,
+                                        **kwargs):
+    """Connect to the item_created signal.
+
+    The item is queued for cache_combined_pdfs once the session is
+    committed, so that the task does not read the item before the commit.
+
+    :param app: The Flask application.
+    :param user_id: Id of the user registering the item.
+    :param item_id: PID of the item.
+    :param item_title: Title of the item.
+    """
+    if app.config['WEKO_RECORDS_UI_PDF_COVERPAGE_CACHE_ENABLED']:
+        db.session.info.setdefault(
+            COMBINED_PDFS_SESSION_KEY, set()).add(item_id.pid_value)
+
+
+def queue_combined_pdfs(session):
+    """Queue cache_combined_pdfs for the items created in the session.
+
+    :param session: The database session.
+    """
+    for pid_value in sorted(session.info.pop(COMBINED_PDFS_SESSION_KEY, ())):
+        cache_combined_pdfs.apply_async((pid_value,))
+
+
+def queue_combined_pdfs_on_teardown(exception=None):
+    """Queue the items left when the application context ends.
+
+    The item_created signal of the workflow is sent after the item is
+    committed, so no commit follows it.
+
+    :param exception: The exception which ended the context, if any.
+    """
+    if exception is None:
+        queue_combined_pdfs(db.session)
+    else:
+        db.session.info.pop(COMBINED_PDFS_SESSION_KEY, None)
+
+
+@db.event.listens_for(db.session, 'after_commit')
+def _after_commit_combined_pdfs(session):
+    """Queue the combined PDF files of the committed items."""
+    queue_combined_pdfs(session)
+
+
+@db.event.listens_for(db.session, 'after_rollback')
+def _after_rollback_combined_pdfs(session):
+    """Forget the items of a rolled back session."""
+    session.info.pop(COMBINED_PDFS_SESSION_KEY, None)
@@ -2825,3 +2825,44 @@ def export_preprocess(pid, record, schema_type):
             data = data.decode('utf8')
 
         return data
+
+
+def get_cached_file(cache_path):
+    """Get a file of a local file cache.
+
+    The modified time of the file is updated so that the least recently
+    used files are evicted first by evict_file_cache.
+
+    :param cache_path: Path of the cached file.
+    :return: The file path, or None if it is not cached.
+    """
+    try:
+        os.utime(cache_path)
+    except OSError:
+        return None
+    return cache_path
+
+
+def evict_file_cache(cache_dir, max_size):
+    """Delete the least recently used files of a local file cache.
+
+    :param cache_dir: Directory of the cached files.
+    :param max_size: Size in bytes the directory is reduced to.
+    """
+    entries = []
+    total_size = 0
+    for entry in os.scandir(cache_dir):
+        try:
+            stat = entry.stat()
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, entry.path))
+        total_size += stat.st_size
+    for _mtime, size, path in sorted(entries):
+        if total_size <= max_size:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total_size -= size
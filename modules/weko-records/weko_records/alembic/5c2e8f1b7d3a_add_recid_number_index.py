@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2022 National Institute of Informatics.
+#
+# WEKO-Records is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Add recid number index."""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '5c2e8f1b7d3a'
+down_revision = 'e3b07ec6e628'
+branch_labels = ()
+depends_on = None
+
+
+def upgrade():
+    """Upgrade database."""
+    op.execute(
+        "CREATE INDEX ix_pidstore_pid_recid_number ON pidstore_pid "
+        "(CAST(split_part(pid_value, '.', 1) AS BIGINT)) "
+        "WHERE pid_type = 'recid' AND pid_value LIKE '%.1'"
+    )
+
+
+def downgrade():
+    """Downgrade database."""
+    op.drop_index('ix_pidstore_pid_recid_number', table_name='pidstore_pid')
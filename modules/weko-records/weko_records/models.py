@@ -12,7 +12,10 @@ from datetime import datetime
 
 from invenio_accounts.models import User
 from invenio_db import db
+from invenio_pidstore.models import PersistentIdentifier
+from sqlalchemy import event
 from sqlalchemy.dialects import mysql, postgresql
+from sqlalchemy.sql.ddl import DDL
 from sqlalchemy.sql.expression import desc
 from sqlalchemy.types import LargeBinary
 from sqlalchemy_utils.types import JSONType, UUIDType
@@ -904,6 +907,23 @@ class OaStatus(db.Model, Timestamp):
         return cls.query.filter(cls.weko_item_pid == weko_item_pid).first() if weko_item_pid else None
 
 
+RECID_NUMBER_INDEX = 'ix_pidstore_pid_recid_number'
+"""Partial index on the number of the first version recid of the items.
+
+It selects one PID per item without scanning all the recids, the latest
+version of the item is reached by the number.
+"""
+
+event.listen(
+    PersistentIdentifier.__table__,
+    'after_create',
+    DDL(
+        "CREATE INDEX " + RECID_NUMBER_INDEX + " ON pidstore_pid "
+        "(CAST(split_part(pid_value, '.', 1) AS BIGINT)) "
+        "WHERE pid_type = 'recid' AND pid_value LIKE '%%.1'"
+    ).execute_if(dialect='postgresql'))
+
+
 __all__ = (
     'Timestamp',
     'ItemType',
@@ -6,8 +6,11 @@ from weko_schema_ui.schema import (
     delete_schema,
     delete_schema_cache,
     get_oai_metadata_formats,
+    get_schema_context,
+    _schema_contexts,
 )
 import pytest
+import weko_schema_ui.schema
 from lxml import etree
 import os
 from flask import current_app
@@ -409,6 +412,55 @@ class TestSchemaTree:
         result = schema._SchemaTree__converter(node)
         assert result == {'description': ['this is description.']}
 
+# def get_schema_context(schema_name, item_type_id):
+# .tox/c1/bin/pytest --cov=weko_schema_ui tests/test_schema.py::test_get_schema_context -vv -s --cov-branch --cov-report=term --basetemp=/code/modules/weko-schema-ui/.tox/c1/tmp
+def test_get_schema_context(app, db_oaischema, records):
+    _, record_list = records
+    record_data = record_list[0]["record_data"]
+
+    # disabled
+    app.config.update(WEKO_SCHEMA_UI_CONTEXT_CACHE_SIZE=0)
+    assert get_schema_context("jpcoar_mapping", "1") is None
+    instance = SchemaTree(record={"metadata": copy.deepcopy(record_data)},
+                          schema_name="jpcoar_mapping")
+    assert instance._context is None
+    expected = etree.tostring(instance.create_xml())
+
+    app.config.update(WEKO_SCHEMA_UI_CONTEXT_CACHE_SIZE=1)
+    _schema_contexts.clear()
+    with patch("weko_schema_ui.schema.get_schema_context_version",
+               return_value=1):
+        with patch("weko_schema_ui.schema.build_schema_context",
+                   wraps=weko_schema_ui.schema.build_schema_context) as mock_build:
+            for _ in range(3):
+                instance = SchemaTree(
+                    record={"metadata": copy.deepcopy(record_data)},
+                    schema_name="jpcoar_mapping")
+                assert instance._context is not None
+                assert etree.tostring(instance.create_xml()) == expected
+            assert mock_build.call_count == 1
+
+            # the oldest context is dropped
+            get_schema_context("oai_dc_mapping", "1")
+            assert list(_schema_contexts.keys()) == [("oai_dc_mapping", "1")]
+            # no schema
+            assert get_schema_context("none_mapping", "1") is None
+
+    # rebuilt after a change
+    with patch("weko_schema_ui.schema.get_schema_context_version",
+               return_value=2):
+        with patch("weko_schema_ui.schema.build_schema_context",
+                   wraps=weko_schema_ui.schema.build_schema_context) as mock_build:
+            get_schema_context("oai_dc_mapping", "1")
+            assert mock_build.call_count == 1
+            assert _schema_contexts[("oai_dc_mapping", "1")][0] == 2
+
+    # version can not be read
+    with patch("weko_schema_ui.schema.get_schema_context_version",
+               return_value=None):
+        assert get_schema_context("jpcoar_mapping", "1") is None
+    _schema_contexts.clear()
+
 # .tox/c1/bin/pytest --cov=weko_schema_ui tests/test_schema.py::test_SchemaTree -vv --cov-branch --cov-report=term --basetemp=/code/modules/weko-schema-ui/.tox/c1/tmp
 def test_SchemaTree(app, db, db_oaischema, db_itemtype):
     record = {'_oai': {'id': 'oai:weko3.example.org:00000001', 'sets': []}, 'path': ['2'], 'owner': 1, 'recid': '1', 'title': ['ja_conference paperITEM00000009(public_open_access_open_access_simple)'], 'pubdate': {'attribute_name': 'PubDate', 'attribute_value': '2021-08-06', 'jpcoar_mapping': {'pubdate': {'@value': 'attribute_value'}}}, 'item_title': 'ja_conference paperITEM00000009(public_open_access_open_access_simple)', 'author_link': ['4'], 'publish_date': '2021-08-06', 'publish_status': '0', 'weko_shared_ids': [], 'item_1617186331708': {'attribute_name': 'Title', 'attribute_value_mlt': [{'subitem_1551255647225': 'ja_conference paperITEM00000009(public_open_access_open_access_simple)', 'subitem_1551255648112': 'ja'}, {'subitem_1551255647225': 'en_conference paperITEM00000009(public_open_access_simple)', 'subitem_1551255648112': 'en'}], 'jpcoar_mapping': {'title': {'@value': 'subitem_1551255647225', '@attributes': {'xml:lang': 'subitem_1551255648112'}}}}, 'item_1617186385884': {'attribute_name': 'Alternative Title', 'attribute_value_mlt': [{'subitem_1551255720400': 'Alternative Title', 'subitem_1551255721061': 'en'}, {'subitem_1551255720400': 'Alternative Title', 'subitem_1551255721061': 'ja'}], 'jpcoar_mapping': {'alternative': {'@value': 'subitem_1551255720400', '@attributes': {'xml:lang': 'subitem_1551255721061'}}}}, 'item_1617186419668': {'attribute_name': 'Creator', 'attribute_type': 'creator', 'attribute_value_mlt': [{'givenNames': [{'givenName': '太郎', 'givenNameLang': 'ja'}, {'givenName': 'タロウ', 'givenNameLang': 'ja-Kana'}, {'givenName': 'Taro', 'givenNameLang': 'en'}], 'familyNames': [{'familyName': '情報', 'familyNameLang': 'ja'}, {'familyName': 'ジョウホウ', 'familyNameLang': 'ja-Kana'}, {'familyName': 'Joho', 'familyNameLang': 'en'}], 'creatorMails': [{'creatorMail': 'wekosoftware@nii.ac.jp'}], 'creatorNames': [{'creatorName': '情報, 太郎', 'creatorNameLang': 'ja'}, {'creatorName': 'ジョウホウ, タロウ', 'creatorNameLang': 'ja-Kana'}, {'creatorName': 'Joho, Taro', 'creatorNameLang': 'en'}], 'nameIdentifiers': [{'nameIdentifier': 'e-Rad'},{'nameIdentifier': '4', 'nameIdentifierScheme': 'WEKO'}, {'nameIdentifier': 'xxxxxxx', 'nameIdentifierURI': 'https://orcid.org/', 'nameIdentifierScheme': 'ORCID'}, {'nameIdentifier': 'xxxxxxx', 'nameIdentifierURI': 'https://ci.nii.ac.jp/', 'nameIdentifierScheme': 'CiNii'}, {'nameIdentifier': 'zzzzzzz', 'nameIdentifierURI': 'https://kaken.nii.ac.jp/', 'nameIdentifierScheme': 'KAKEN2'}], 'creatorAffiliations': [{'affiliationNames': [{'affiliationName': 'University', 'affiliationNameLang': 'en'}], 'affiliationNameIdentifiers': [{'affiliationNameIdentifier': '0000000121691048', 'affiliationNameIdentifierURI': 'http://isni.org/isni/0000000121691048', 'affiliationNameIdentifierScheme': 'ISNI'}]}]}, {'givenNames': [{'givenName': '太郎', 'givenNameLang': 'ja'}, {'givenName': 'タロウ', 'givenNameLang': 'ja-Kana'}, {'givenName': 'Taro', 'givenNameLang': 'en'}], 'familyNames': [{'familyName': '情報', 'familyNameLang': 'ja'}, {'familyName': 'ジョウホウ', 'familyNameLang': 'ja-Kana'}, {'familyName': 'Joho', 'familyNameLang': 'en'}], 'creatorMails': [{'creatorMail': 'wekosoftware@nii.ac.jp'}], 'creatorNames': [{'creatorName': '情報, 太郎', 'creatorNameLang': 'ja'}, {'creatorName': 'ジョウホウ, タロウ', 'creatorNameLang': 'ja-Kana'}, {'creatorName': 'Joho, Taro', 'creatorNameLang': 'en'}], 'nameIdentifiers': [{'nameIdentifier': 'xxxxxxx', 'nameIdentifierURI': 'https://orcid.org/', 'nameIdentifierScheme': 'ORCID'}, {'nameIdentifier': 'xxxxxxx', 'nameIdentifierURI': 'https://ci.nii.ac.jp/', 'nameIdentifierScheme': 'CiNii'}, {'nameIdentifier': 'zzzzzzz', 'nameIdentifierURI': 'https://kaken.nii.ac.jp/', 'nameIdentifierScheme': 'KAKEN2'}]}, {'givenNames': [{'givenName': '太郎', 'givenNameLang': 'ja'}, {'givenName': 'タロウ', 'givenNameLang': 'ja-Kana'}, {'givenName': 'Taro', 'givenNameLang': 'en'}], 'familyNames': [{'familyName': '情報', 'familyNameLang': 'ja'}, {'familyName': 'ジョウホウ', 'familyNameLang': 'ja-Kana'}, {'familyName': 'Joho', 'familyNameLang': 'en'}], 'creatorMails': [{'creatorMail': 'wekosoftware@nii.ac.jp'}], 'creatorNames': [{'creatorName': '情報, 太郎', 'creatorNameLang': 'ja'}, {'creatorName': 'ジョウホウ, タロウ', 'creatorNameLang': 'ja-Kana'}, {'creatorName': 'Joho, Taro', 'creatorNameLang': 'en'}], 'nameIdentifiers': [{'nameIdentifier': 'xxxxxxx', 'nameIdentifierURI': 'https://orcid.org/', 'nameIdentifierScheme': 'ORCID'}, {'nameIdentifier': 'xxxxxxx', 'nameIdentifierURI': 'https://ci.nii.ac.jp/', 'nameIdentifierScheme': 'CiNii'}, {'nameIdentifier': 'zzzzzzz', 'nameIdentifierURI': 'https://kaken.nii.ac.jp/', 'nameIdentifierScheme': 'KAKEN2'}]}], 'jpcoar_mapping': {'creator': {'givenName': {'@value': 'givenNames.givenName', '@attributes': {'xml:lang': 'givenNames.givenNameLang'}}, 'familyName': {'@value': 'familyNames.familyName', '@attributes': {'xml:lang': 'familyNames.familyNameLang'}}, 'affiliation': {'nameIdentifier': {'@value': 'creatorAffiliations.affiliationNameIdentifiers.affiliationNameIdentifier', '@attributes': {'nameIdentifierURI': 'creatorAffiliations.affiliationNameIdentifiers.affiliationNameIdentifierURI', 'nameIdentifierScheme': 'creatorAffiliations.affiliationNameIdentifiers.affiliationNameIdentifierScheme'}}, 'affiliationName': {'@value': 'creatorAffiliations.affiliationNames.affiliationName', '@attributes': {'xml:lang': 'creatorAffiliations.affiliationNames.affiliationNameLang'}}}, 'creatorName': {'@value': 'creatorNames.creatorName,nameIdentifiers.nameIdentifier', '@attributes': {'xml:lang': 'creatorNames.creatorNameLang'}}, 'nameIdentifier': {'@value': 'nameIdentifiers.nameIdentifier', '@attributes': {'nameIdentifierURI': 'nameIdentifiers.nameIdentifierURI', 'nameIdentifierScheme': 'nameIdentifiers.nameIdentifierScheme'}}, 'creatorAlternative': {'@value': 'creatorAlternatives.creatorAlternative', '@attributes': {'xml:lang': 'creatorAlternatives.creatorAlternativeLang'}}}}}, 'item_1617186476635': {'attribute_name': 'Access Rights', 'attribute_value_mlt': [{'subitem_1522299639480': 'open access', 'subitem_1600958577026': 'http://purl.org/coar/access_right/c_abf2'}], 'jpcoar_mapping': {'accessRights': {'@value': 'subitem_1522299639480', '@attributes': {'rdf:resource': 'subitem_1600958577026'}}}}, 'item_1617186499011': {'attribute_name': 'Rights', 'attribute_value_mlt': [{'subitem_1522650717957': 'ja', 'subitem_1522650727486': 'http://localhost', 'subitem_1522651041219': 'Rights Information'}], 'jpcoar_mapping': {'rights': {'@value': 'subitem_1522651041219', '@attributes': {'xml:lang': 'subitem_1522650717957', 'rdf:resource': 'subitem_1522650727486'}}}}, 'item_1617186609386': {'attribute_name': 'Subject', 'attribute_value_mlt': [{'subitem_1522299896455': 'ja', 'subitem_1522300014469': 'Other', 'subitem_1522300048512': 'http://localhost/', 'subitem_1523261968819': 'Sibject1'}], 'jpcoar_mapping': {'subject': {'@value': 'subitem_1523261968819', '@attributes': {'xml:lang': 'subitem_1522299896455', 'subjectURI': 'subitem_1522300048512', 'subjectScheme': 'subitem_1522300014469'}}}}, 'item_1617186626617': {'attribute_name': 'Description', 'attribute_value_mlt': [{'subitem_description': 'Description\nDescription<br/>Description', 'subitem_description_type': 'Abstract', 'subitem_description_language': 'en'}, {'subitem_description': '概要\n概要\n概要\n概要', 'subitem_description_type': 'Abstract', 'subitem_description_language': 'ja'}], 'jpcoar_mapping': {'description': {'@value': 'subitem_description', '@attributes': {'xml:lang': 'subitem_description_language', 'descriptionType': 'subitem_description_type'}}}}, 'item_1617186643794': {'attribute_name': 'Publisher', 'attribute_value_mlt': [{'subitem_1522300295150': 'en', 'subitem_1522300316516': 'Publisher'}], 'jpcoar_mapping': {'publisher': {'@value': 'subitem_1522300316516', '@attributes': {'xml:lang': 'subitem_1522300295150'}}}}, 'item_1617186660861': {'attribute_name': 'Date', 'attribute_value_mlt': [{'subitem_1522300695726': 'Available', 'subitem_1522300722591': '2021-06-30'}], 'jpcoar_mapping': {'date': {'@value': 'subitem_1522300722591', '@attributes': {'dateType': 'subitem_1522300695726'}}}}, 'item_1617186702042': {'attribute_name': 'Language', 'attribute_value_mlt': [{'subitem_1551255818386': 'jpn'}], 'jpcoar_mapping': {'language': {'@value': 'subitem_1551255818386'}}}, 'item_1617186783814': {'attribute_name': 'Identifier', 'attribute_value_mlt': [{'subitem_identifier_uri': 'http://localhost', 'subitem_identifier_type': 'URI'}], 'jpcoar_mapping': {'identifier': {'@value': 'subitem_identifier_uri', '@attributes': {'identifierType': 'subitem_identifier_type'}}}}, 'item_1617186859717': {'attribute_name': 'Temporal', 'attribute_value_mlt': [{'subitem_1522658018441': 'en', 'subitem_1522658031721': 'Temporal'}], 'jpcoar_mapping': {'temporal': {'@value': 'subitem_1522658031721', '@attributes': {'xml:lang': 'subitem_1522658018441'}}}}, 'item_1617186882738': {'attribute_name': 'Geo Location', 'attribute_value_mlt': [{'subitem_geolocation_place': [{'subitem_geolocation_place_text': 'Japan'}]}], 'jpcoar_mapping': {'geoLocation': {'geoLocationBox': {'eastBoundLongitude': {'@value': 'subitem_geolocation_box.subitem_east_longitude'}, 'northBoundLatitude': {'@value': 'subitem_geolocation_box.subitem_north_latitude'}, 'southBoundLatitude': {'@value': 'subitem_geolocation_box.subitem_south_latitude'}, 'westBoundLongitude': {'@value': 'subitem_geolocation_box.subitem_west_longitude'}}, 'geoLocationPlace': {'@value': 'subitem_geolocation_place.subitem_geolocation_place_text'}, 'geoLocationPoint': {'pointLatitude': {'@value': 'subitem_geolocation_point.subitem_point_latitude'}, 'pointLongitude': {'@value': 'subitem_geolocation_point.subitem_point_longitude'}}}}}, 'item_1617186901218': {'attribute_name': 'Funding Reference', 'attribute_value_mlt': [{'subitem_1522399143519': {'subitem_1522399281603': 'ISNI', 'subitem_1522399333375': 'http://xxx'}, 'subitem_1522399412622': [{'subitem_1522399416691': 'en', 'subitem_1522737543681': 'Funder Name'}], 'subitem_1522399571623': {'subitem_1522399585738': 'Award URI', 'subitem_1522399628911': 'Award Number'}, 'subitem_1522399651758': [{'subitem_1522721910626': 'en', 'subitem_1522721929892': 'Award Title'}]}], 'jpcoar_mapping': {'fundingReference': {'awardTitle': {'@value': 'subitem_1522399651758.subitem_1522721929892', '@attributes': {'xml:lang': 'subitem_1522399651758.subitem_1522721910626'}}, 'funderName': {'@value': 'subitem_1522399412622.subitem_1522737543681', '@attributes': {'xml:lang': 'subitem_1522399412622.subitem_1522399416691'}}, 'awardNumber': {'@value': 'subitem_1522399571623.subitem_1522399628911', '@attributes': {'awardURI': 'subitem_1522399571623.subitem_1522399585738'}}, 'funderIdentifier': {'@value': 'subitem_1522399143519.subitem_1522399333375', '@attributes': {'funderIdentifierType': 'subitem_1522399143519.subitem_1522399281603'}}}}}, 'item_1617186920753': {'attribute_name': 'Source Identifier', 'attribute_value_mlt': [{'subitem_1522646500366': 'ISSN', 'subitem_1522646572813': 'xxxx-xxxx-xxxx'}], 'jpcoar_mapping': {'sourceIdentifier': {'@value': 'subitem_1522646572813', '@attributes': {'identifierType': 'subitem_1522646500366'}}}}, 'item_1617186941041': {'attribute_name': 'Source Title', 'attribute_value_mlt': [{'subitem_1522650068558': 'en', 'subitem_1522650091861': 'Source Title'}], 'jpcoar_mapping': {'sourceTitle': {'@value': 'subitem_1522650091861', '@attributes': {'xml:lang': 'subitem_1522650068558'}}}}, 'item_1617186959569': {'attribute_name': 'Volume Number', 'attribute_value_mlt': [{'subitem_1551256328147': '1'}], 'jpcoar_mapping': {'volume': {'@value': 'subitem_1551256328147'}}}, 'item_1617186981471': {'attribute_name': 'Issue Number', 'attribute_value_mlt': [{'subitem_1551256294723': '111'}], 'jpcoar_mapping': {'issue': {'@value': 'subitem_1551256294723'}}}, 'item_1617186994930': {'attribute_name': 'Number of Pages', 'attribute_value_mlt': [{'subitem_1551256248092': '12'}], 'jpcoar_mapping': {'numPages': {'@value': 'subitem_1551256248092'}}}, 'item_1617187024783': {'attribute_name': 'Page Start', 'attribute_value_mlt': [{'subitem_1551256198917': '1'}], 'jpcoar_mapping': {'pageStart': {'@value': 'subitem_1551256198917'}}}, 'item_1617187045071': {'attribute_name': 'Page End', 'attribute_value_mlt': [{'subitem_1551256185532': '3'}], 'jpcoar_mapping': {'pageEnd': {'@value': 'subitem_1551256185532'}}}, 'item_1617187112279': {'attribute_name': 'Degree Name', 'attribute_value_mlt': [{'subitem_1551256126428': 'Degree Name', 'subitem_1551256129013': 'en'}], 'jpcoar_mapping': {'degreeName': {'@value': 'subitem_1551256126428', '@attributes': {'xml:lang': 'subitem_1551256129013'}}}}, 'item_1617187136212': {'attribute_name': 'Date Granted', 'attribute_value_mlt': [{'subitem_1551256096004': '2021-06-30'}], 'jpcoar_mapping': {'dateGranted': {'@value': 'subitem_1551256096004'}}}, 'item_1617187187528': {'attribute_name': 'Conference', 'attribute_value_mlt': [{'subitem_1599711633003': [{'subitem_1599711636923': 'Conference Name', 'subitem_1599711645590': 'ja'}], 'subitem_1599711655652': '1', 'subitem_1599711660052': [{'subitem_1599711680082': 'Sponsor', 'subitem_1599711686511': 'ja'}], 'subitem_1599711699392': {'subitem_1599711704251': '2020/12/11', 'subitem_1599711712451': '1', 'subitem_1599711727603': '12', 'subitem_1599711731891': '2000', 'subitem_1599711735410': '1', 'subitem_1599711739022': '12', 'subitem_1599711743722': '2020', 'subitem_1599711745532': 'ja'}, 'subitem_1599711758470': [{'subitem_1599711769260': 'Conference Venue', 'subitem_1599711775943': 'ja'}], 'subitem_1599711788485': [{'subitem_1599711798761': 'Conference Place', 'subitem_1599711803382': 'ja'}], 'subitem_1599711813532': 'JPN'}], 'jpcoar_mapping': {'conference': {'conferenceDate': {'@value': 'subitem_1599711699392.subitem_1599711704251', '@attributes': {'endDay': 'subitem_1599711699392.subitem_1599711735410', 'endYear': 'subitem_1599711699392.subitem_1599711743722', 'endMonth': 'subitem_1599711699392.subitem_1599711739022', 'startDay': 'subitem_1599711699392.subitem_1599711712451', 'xml:lang': 'subitem_1599711699392.subitem_1599711745532', 'startYear': 'subitem_1599711699392.subitem_1599711731891', 'startMonth': 'subitem_1599711699392.subitem_1599711727603'}}, 'conferenceName': {'@value': 'subitem_1599711633003.subitem_1599711636923', '@attributes': {'xml:lang': 'subitem_1599711633003.subitem_1599711645590'}}, 'conferenceVenue': {'@value': 'subitem_1599711758470.subitem_1599711769260', '@attributes': {'xml:lang': 'subitem_1599711758470.subitem_1599711775943'}}, 'conferenceCountry': {'@value': 'subitem_1599711813532'}, 'conferenceSponsor': {'@value': 'subitem_1599711660052.subitem_1599711680082', '@attributes': {'xml:lang': 'subitem_1599711660052.subitem_1599711686511'}}, 'conferenceSequence': {'@value': 'subitem_1599711655652'}}}}, 'item_1617258105262': {'attribute_name': 'Resource Type', 'attribute_value_mlt': [{'resourceuri': 'http://purl.org/coar/resource_type/c_5794', 'resourcetype': 'experimental data'}], 'jpcoar_mapping': {'type': {'@value': 'resourcetype', '@attributes': {'rdf:resource': 'resourceuri'}}}}, 'item_1617265215918': {'attribute_name': 'Version Type', 'attribute_value_mlt': [{'subitem_1522305645492': 'AO', 'subitem_1600292170262': 'http://purl.org/coar/version/c_b1a7d7d4d402bcce'}], 'jpcoar_mapping': {'versiontype': {'@value': 'subitem_1522305645492', '@attributes': {'rdf:resource': 'subitem_1600292170262'}}}}, 'item_1617349709064': {'attribute_name': 'Contributor', 'attribute_value_mlt': [{'givenNames': [{'givenName': '太郎', 'givenNameLang': 'ja'}, {'givenName': 'タロウ', 'givenNameLang': 'ja-Kana'}, {'givenName': 'Taro', 'givenNameLang': 'en'}], 'familyNames': [{'familyName': '情報', 'familyNameLang': 'ja'}, {'familyName': 'ジョウホウ', 'familyNameLang': 'ja-Kana'}, {'familyName': 'Joho', 'familyNameLang': 'en'}], 'contributorType': 'ContactPerson', 'nameIdentifiers': [{'nameIdentifier': '000001', 'nameIdentifierURI': 'https://orcid.org/', 'nameIdentifierScheme': 'ORCID'}, {'nameIdentifier': '000001', 'nameIdentifierURI': 'https://ci.nii.ac.jp/', 'nameIdentifierScheme': 'CiNii'}, {'nameIdentifier': '000001', 'nameIdentifierURI': 'https://kaken.nii.ac.jp/', 'nameIdentifierScheme': 'KAKEN2'}], 'contributorMails': [{'contributorMail': 'test1@nii.ac.jp'}], 'contributorNames': [{'lang': 'ja', 'contributorName': '情報, 太郎'}, {'lang': 'ja-Kana', 'contributorName': 'ジョウホウ, タロウ'}, {'lang': 'en', 'contributorName': 'Joho, Taro'}]}, {'givenNames': [{'givenName': '二郎', 'givenNameLang': 'ja'}, {'givenName': 'ニロウ', 'givenNameLang': 'ja-Kana'}, {'givenName': 'Niro', 'givenNameLang': 'en'}], 'familyNames': [{'familyName': '情報', 'familyNameLang': 'ja'}, {'familyName': 'ジョウホウ', 'familyNameLang': 'ja-Kana'}, {'familyName': 'Joho', 'familyNameLang': 'en'}], 'contributorType': 'Distributor', 'nameIdentifiers': [{'nameIdentifier': '000002', 'nameIdentifierURI': 'https://orcid.org/', 'nameIdentifierScheme': 'ORCID'}, {'nameIdentifier': '000002', 'nameIdentifierURI': 'https://ci.nii.ac.jp/', 'nameIdentifierScheme': 'CiNii'}, {'nameIdentifier': '000002', 'nameIdentifierURI': 'https://kaken.nii.ac.jp/', 'nameIdentifierScheme': 'KAKEN2'}], 'contributorMails': [{'contributorMail': 'test2@nii.ac.jp'}], 'contributorNames': [{'lang': 'ja', 'contributorName': '情報, 二郎'}, {'lang': 'ja-Kana', 'contributorName': 'ジョウホウ, ニロウ'}, {'lang': 'en', 'contributorName': 'Joho, Niro'}]}, {'givenNames': [{'givenName': '三郎', 'givenNameLang': 'ja'}, {'givenName': 'サンロウ', 'givenNameLang': 'ja-Kana'}, {'givenName': 'Sanro', 'givenNameLang': 'en'}], 'familyNames': [{'familyName': '情報', 'familyNameLang': 'ja'}, {'familyName': 'ジョウホウ', 'familyNameLang': 'ja-Kana'}, {'familyName': 'Joho', 'familyNameLang': 'en'}], 'contributorType': 'Other', 'nameIdentifiers': [{'nameIdentifier': '000003', 'nameIdentifierURI': 'https://orcid.org/', 'nameIdentifierScheme': 'ORCID'}, {'nameIdentifier': '000003', 'nameIdentifierURI': 'https://ci.nii.ac.jp/', 'nameIdentifierScheme': 'CiNii'}, {'nameIdentifier': '000003', 'nameIdentifierURI': 'https://kaken.nii.ac.jp/', 'nameIdentifierScheme': 'KAKEN2'}], 'contributorMails': [{'contributorMail': 'test3@nii.ac.jp'}], 'contributorNames': [{'lang': 'ja', 'contributorName': '情報, 三郎'}, {'lang': 'ja-Kana', 'contributorName': 'ジョウホウ, サンロウ'}, {'lang': 'en', 'contributorName': 'Joho, Sanro'}]}, {'givenNames': [{'givenName': '四郎', 'givenNameLang': 'ja'}, {'givenName': 'シロウ', 'givenNameLang': 'ja-Kana'}, {'givenName': 'Siro', 'givenNameLang': 'en'}], 'familyNames': [{'familyName': '情報', 'familyNameLang': 'ja'}, {'familyName': 'ジョウホウ', 'familyNameLang': 'ja-Kana'}, {'familyName': 'Joho', 'familyNameLang': 'en'}], 'contributorType': 'DataCollector', 'nameIdentifiers': [{'nameIdentifier': '000004', 'nameIdentifierURI': 'https://orcid.org/', 'nameIdentifierScheme': 'ORCID'}, {'nameIdentifier': '000004', 'nameIdentifierURI': 'https://ci.nii.ac.jp/', 'nameIdentifierScheme': 'CiNii'}, {'nameIdentifier': '000004', 'nameIdentifierURI': 'https://kaken.nii.ac.jp/', 'nameIdentifierScheme': 'KAKEN2'}], 'contributorMails': [{'contributorMail': 'test4@nii.ac.jp'}], 'contributorNames': [{'lang': 'ja', 'contributorName': '情報, 四郎'}, {'lang': 'ja-Kana', 'contributorName': 'ジョウホウ, シロウ'}, {'lang': 'en', 'contributorName': 'Joho, Siro'}]}], 'jpcoar_mapping': {'contributor': {'givenName': {'@value': 'givenNames.givenName', '@attributes': {'xml:lang': 'givenNames.givenNameLang'}}, 'familyName': {'@value': 'familyNames.familyName', '@attributes': {'xml:lang': 'familyNames.familyNameLang'}}, '@attributes': {'contributorType': 'contributorType'}, 'affiliation': {'nameIdentifier': {'@value': 'contributorAffiliations.contributorAffiliationNameIdentifiers.contributorAffiliationNameIdentifier', '@attributes': {'nameIdentifierURI': 'contributorAffiliations.contributorAffiliationNameIdentifiers.contributorAffiliationURI', 'nameIdentifierScheme': 'contributorAffiliations.contributorAffiliationNameIdentifiers.contributorAffiliationScheme'}}, 'affiliationName': {'@value': 'contributorAffiliations.contributorAffiliationNames.contributorAffiliationName', '@attributes': {'xml:lang': 'contributorAffiliations.contributorAffiliationNames.contributorAffiliationNameLang'}}}, 'nameIdentifier': {'@value': 'nameIdentifiers.nameIdentifier', '@attributes': {'nameIdentifierURI': 'nameIdentifiers.nameIdentifierURI', 'nameIdentifierScheme': 'nameIdentifiers.nameIdentifierScheme'}}, 'contributorName': {'@value': 'contributorNames.contributorName', '@attributes': {'xml:lang': 'contributorNames.lang'}}, 'contributorAlternative': {'@value': 'contributorAlternatives.contributorAlternative', '@attributes': {'xml:lang': 'contributorAlternatives.contributorAlternativeLang'}}}}}, 'item_1617349808926': {'attribute_name': 'Version', 'attribute_value_mlt': [{'subitem_1523263171732': 'Version'}], 'jpcoar_mapping': {'version': {'@value': 'subitem_1523263171732'}}}, 'item_1617351524846': {'attribute_name': 'APC', 'attribute_value_mlt': [{'subitem_1523260933860': 'Unknown'}], 'jpcoar_mapping': {'apc': {'@value': 'subitem_1523260933860'}}}, 'item_1617353299429': {'attribute_name': 'Relation', 'attribute_value_mlt': [{'subitem_1522306207484': 'isVersionOf', 'subitem_1522306287251': {'subitem_1522306382014': 'arXiv', 'subitem_1522306436033': '001'}, 'subitem_1523320863692': [{'subitem_1523320867455': 'en', 'subitem_1523320909613': 'Related Title'}]}, {'subitem_1522306207484': 'isReferencedBy', 'subitem_1522306287251': {'subitem_1522306382014': 'arXiv', 'subitem_1522306436033': '002'}, 'subitem_1523320863692': [{'subitem_1523320867455': 'en', 'subitem_1523320909613': 'Related Title'}]}, {'subitem_1522306207484': 'isSupplementedBy', 'subitem_1522306287251': {'subitem_1522306382014': 'arXiv', 'subitem_1522306436033': '003'}, 'subitem_1523320863692': [{'subitem_1523320867455': 'en', 'subitem_1523320909613': 'Related Title'}]}, {'subitem_1522306207484': 'isPartOf', 'subitem_1522306287251': {'subitem_1522306382014': 'arXiv', 'subitem_1522306436033': '004'}, 'subitem_1523320863692': [{'subitem_1523320867455': 'en', 'subitem_1523320909613': 'Related Title'}]}], 'jpcoar_mapping': {'relation': {'@attributes': {'relationType': 'subitem_1522306207484'}, 'relatedTitle': {'@value': 'subitem_1523320863692.subitem_1523320909613', '@attributes': {'xml:lang': 'subitem_1523320863692.subitem_1523320867455'}}, 'relatedIdentifier': {'@value': 'subitem_1522306287251.subitem_1522306436033', '@attributes': {'identifierType': 'subitem_1522306287251.subitem_1522306382014'}}}}}, 'item_filemeta': {'attribute_name': 'File', 'attribute_type': 'file', 'attribute_value_mlt': [{'url': {'url': 'https://weko3.example.org/record/1/files/helloworld.pdf'}, 'date': [{'dateType': 'Available', 'dateValue': '2021-07-12'}], 'format': 'text/plain', 'filename': 'helloworld.pdf', 'filesize': [{'value': '1 KB'}], 'mimetype': 'application/pdf', 'accessrole': 'open_access', 'version_id': '2b7f50b3-08f7-4fda-aded-b3690ab237c9', 'displaytype': 'simple', 'file': 'JVBERi0xLjUKJdDUxdgKNSAwIG9iago8PAovTGVuZ3RoIDkyICAgICAgICAKL0ZpbHRlciAvRmxhdGVEZWNvZGUKPj4Kc3RyZWFtCnjacwrh0nczMlWw1LM0MzJTCElTMDQ21jM3s1AwMzXXMzI2VQhJUYjWyEjNycnXKdc0stDIL8pJUdSMDfFSMDSz1DM2M1XQNTUz17Mwh6g0BElxuYZwAQC67xVBCmVuZHN0cmVhbQplbmRvYmoKMTIgMCBvYmoKPDwKL0xlbmd0aDEgMTc4NQovTGVuZ3RoMiAyMTYwOAovTGVuZ3RoMyAwCi9MZW5ndGggMjI3NzAgICAgIAovRmlsdGVyIC9GbGF0ZURlY29kZQo+PgpzdHJlYW0KeNq0t2VUXN22LYq7u1NBgru7Q3B3l8Ip3N3dLTgEdye4BncIQRLc3d0e+fY59+yz7/37Gg0Ww/vqs49ZrSg/KakyiJjZmwAl7UEuDCyMzLwAOXkVeztjEAszgwrQwtXW2AnAysjMzI5ASSnmBDR2sbIHiRu7AHkBXC6WAEVTl4/ajwxmZh4ESoAUEAR0+giaAUw8AfJAF2M1TwcgC4Da+B9Dyd7ZhcHE2PkjDARZWIGANB8lYvYOnk5WFpYuf3uwMTD87fS3WpQRIGNsamPv7mxjBTAGmQFkGOUZAQr27h9OKwC1PQhgArQ0tjUH2JsD1IBaAHVVCRVVgJSKorqSKg3jR2NVVwcHe6f/wiKmqqYuRQ8QF1FQkwAANegBUuqqan//qgFBH/gt6AEKah/xv3M+Ev+Wy0uoiahpK0mwMP19BwALwA3o5Gz1d+x/YPv8gQzwP9A+Ss2d7O3+GQCgtnRxceBlYnJ3d2e0cHV2YbR3smB0sP0Hn5qllTPA3d7JBvDxdALaAv8hxhVk9kGniyXwXw3+ngpAzsoUCHIG/i2StP9X0O6Dyo+iD7/L/wH2QYTL3562/0oHOAOB/2uMpbHzP7VySkpyADtjK5ALEGQMMv1IdDF2cXUGGP3j+/gFmlH9CyAQIObq5PR3hvx/h5z+z5j/hi5q//Fmerbevsbu/3lixiBXZ69/4+Z/v7apPcjZytnF+V8dgQBzK1vgX/TOf8/MCvSPT15EQVpSQlWNQe5DeCAGefsPdkCMLh4u/2T/7SciLscL4GbmBLDwsAOYP0QqATITs7ez+0DtjPCXPnGrD55c7J08mf5vYduA7N1B3v+PgLkVyMz8L/dmrg5M6iArR1egtPh/pX+4EP7HZwF0ATADgI4AoIepJdPfgf/o5a+b5a/7gwhfbwd7B4C5sa0z0NfKHPjxQPB2NnYDAlycXIG+3v8e+N8WAgsXwMzK1OVD6h/rgvBPd2mQuT2A51/uDyT/HfovEVD/s6o0H3tqZg+y9QSYAc0RmBTsXT4kQf3/z6b9xyxJV1tbBWM7IPX/xel/JhrbWdl6/u/U/0jRBP5FS61g72RnbPsfMStnSSsPoJmSlYup5b+o/Zdf2sX4Q/8iIAtb4Mex/ONS/7tSth/a/bh/rP5eXwAGFnbO/4h9yNLUBgR0dgaw/6sM+EHEfyD+YP8vXgCTgpSIuLwG3f8tm3/yJECm9mZWIAsAKwcnwNjJydgTgflDC6wcHABvlg9hmwE9/hELgIkRZO/yUQJwcHXxBZjbOyH8PVB2dgCT6YeAjf+6//GwMDMDmMz+zWQBMAH/j8nG9mF5mNoa2/1bxkcPy38zuQFMtv9jsnzU2/8fk53nwwIB/y38Uez0b+ZH3P0f83/TofT3SvhH68z/w89/3ZX/2KouTvY2QE0rs4/PiX9LkTd2cbLy0GX+ECrLh//j57//0/9fAyj/Z8f+rVpU1N7Dm4GdjRnAwMrzQSv7x4qwsLBy+f6vWtN/XVv/LMnHQf63/ffOAACBHkBThOVf9qZ8IdbpLWHlfhKFMxXQlDyMJ1U4gloyiVDLmTOdhHji+VtkQKGiwNaArM9F9nJfePX9UgNBJVqUIdi2b2ttKdXTN2bKwtvGfvJ+hCgSIuN5GozqQVnySwEV3WQ0hzJ537RL2eey2hPbSQDq40diPJ09j7GsU+/oV2lkehXtfwqg3Yt/snzHcrLF8FhCI+giXJrpAnd5f8SKjzHuF1mmnTf6FoYzLgPj0NeDuQMeUyz0Ek29k8X7gClB/ei4tqJ+CKsb6dyFSARG7E9BVGEhBaBK1kPAcc8ckMdNhYyYRgFPLHLudg38Jj0jRpUbfITfjD679MTDdu2jLaz2Oyhd4uR3/0G6DQVvhp2Ul0pWmEWH0HcPAUR3vlRaCUBCVsGxTMOTPPdkFv2t68PGa8OBjp32OMLbFtxD87IRXFQKCSjruIcRYrww7PWMSQZBgjcNOWAUXLRRcYPwnskCzQASXR6P2JonAVKH87LqXPIgpAyPGSAaKSsKk7MQoZteJzWv2OMksXYP17wLtk9aVXKrzd03usEJfonW1gZqI0Eh0lpIqaN1Jw0JkLT/48ItJonI+45nwelrpoS7VTpqg9pRjpeToV8J/an6guKpk82S7ncYNLaBPh7mFp/M14Qlld+0wwyuYqex7CNbmRGucRfNnHLY1gKf+CYTjCLpudQ2RnZPliZ1tFDyNQjGSBKq9N1p1kvrpydGY1tp+hqOKFEVmuXW66M1lqNe5pNuVqTf8rJfUjB9OJ5CnUUT4qblwfCBMGaKn9HfFSzqkihwHT/vbGgv9peL5BMuub5VU4cJfyFe0yhxfB5QJvDcPRfCFvxsuCQsJWveyjymAy+hV1DbXU/xzgasDpL7vYmAWxfHK0VNv4eFCG/+8zhoXBdSfuiPvm03iCgDB7H+psxVYufX/Ikfc4/Kw31muAvOXVaHQRGsKrLS0Vtaj3XvlXtZoaYbHudOxtWnktXDKgTI6pnzRJYGkBgrK6niQrZyM7Yq4hFBo4vnNWEuKGVXCgHxGgrytZm4O8YXWoDQ8D6ubAz8egpEEqcpZHDQH8RKKP1dIEcw+8cAmP6xXOG3oGiG6Mkq6ZuaJ0dwaAPA5NcmgIQ8Ar2PLA9bZ2AV6gURsfKcya9WncU2B1ekmV9XSii/KykHJB+tjagL0OwYSgSLYft/tRCqKzWazGw9yDHrpzk9vQTNtokKfGlXjLQcdD1lHimL7lvJ9ga3WYz7UpugRdFzncK+fa8VfREoz/PbkthmX1jgAdV8T92sK3HDV3rk2+cOK+JDlYHhOBmb0dopzyJAivXq2458NwReZR/DglRjyvA6dUFCexsr6DzP+EIiIEPW4JBIYhVhmyY7/BueB38ZuvuW7QP128ysDc5XX5OWEzMkWDkVomtPFfv8Z9cJ4oQU2FHuk3LWVMyTEsoJIsOB2obEku862qw+IS3cUSFMKgW2HNJt01J/Tsqu7u4nQs8oa0PcPvNkV5AR9yYmTKfx8ZeJUEqWu8YCYhGHbHPvKZD76ewGcM4ODY1xcDo5A0hDbxua5gMuCUxrnlOgdO09e43XcXu6uplae2RLeDm573XMFWDV9BqkL80xtaYJIpIpwxsh7ut2LqYKkgrlan54cVV3D/O8miia8mceRxdFwXkfMbyrTxsIbOn01nvL/PGT4dc+VQdewdv0y/tjvCQYMNj14iR3zw6kAHoKT/MDK7iSWH7r87PRUg3Yj2rxQkUF3wVID8PuvmA576+nsVCWiCShmKwaRiU2UXmRSg/5UV6NxXmQNKdabc8syMc9bVyfbpl4ult3G3JKGL0w9eNR3jLl2c1gW333NvwylbHY5a7arCUEl4z7TZfI3Yen7ggTy6T0PjPRGKSP7t3F4wKiF6OnvToATRcIFalV6uMNsmupOeBSZFJ/79UD2+0d9Hnuj38f1TCDc2pKwn9CI4w4UNllzhBxexQNIqZj+ZJ81cbiPy2jM5zv9tulWznx7Bzor9ni7cV8mfE1Ue9QUttxqD6xdf7UlcbykbxmXKuBAHE0eTlxEdGgYriE55Ng7wMtsbvSJV4Y8hFNxL50YHr4hWxp+YTg78fJHVBVr1/8A9rXdzj5XPH6Ge1BIT/255mdO5MKOjOvd2gnxog9VgRRegfKX60IEOqVa83qZwal1fLuQWXcftKtF4Lgj1Bb6JUCbCZv5a0sW1Y/XqLp3VevSI1fGPfWlQtspK2ajXPpsN9+I+d0kf1pkCufPqnM4H7MJE+5amaL/z6H+EkP/Mg4xQhjNGzWC8spclWOu8gGBVxRXXzH5nB4oz7Dz259gx5cqeC7ARfTUN7hqxQ2AlIv/rP3FS1feq4npvWe2+7nAC5iSDs8cGFrXiX4hwrR2t8yqRENJUyYEBy97Vs/sTEbj5kEDR0Y6PwUS9ID+EnFU+zFDrg5i4+X2T+pnr4M0H1iWNaIVS8P7pBcX9YdiB4H6tR9ltxtZ/V1huFesUmM4iZ1sLzjvUiPXddmIe3SoxVTyYz8An401j3dw8k8Cl6P/0qbm7K1mjEtX21p2CEMLzxLCdtK3v41XA+MnHUhSTQR4oaY5ijIZC9ykJJ5XCzJPPRdia5DPPs4al3orJ4UPjHefH63Po36PrBePdMsuLzzwbLe/VIPK599H0mnyNLBB3Bq4Wo1JHlEvo1Ts3lC0x4r453kQORGGtb+UFtBQdw1GhFswf9wOsDwg9BjpKvsYRNdfuo2yPl8gI0sNKH9ivnC9AKSw1+lopM2WA2c6S7J7CXu+xib0d71OOw35aDtx7laM6xbHcKa2baEMXZEopmOqUWF5skSuzHML8SXTgxKp6RWJ3zNZvf3W45ayn45gvd4hIBbdotI9iJOhgZEpICI+978PMtITYcT0SaruhiHJGdegAQVmhUGne0uw8sDE8FqeSX3XQSOqoUr2JEiZLZ0YxaiF/eVDMs0XXeUjPsqBbJNq/ensJbK1bALOVldrusJbGTM78u2pQKtnfP71mH0bPlvsoVDUj27M4quYzyUh3Nk2BSStKRf3QgVXLKVuFXV67Ys0IFxnJzJvEaDaq2IOj5B+COt2/VUSITHRMKiHfnzIpTuclXurXiptao30L96lS7aLzRZ+/yfNX5rDYnMwH3WmtehJMl35QmzJv4enGxczHEU3wDPc14VeJd3kpNU86g6CVsigMBRjf6t9nV7VO1d6HGMqGFpsJhIhPDtmaS6JGw9vLM5T45Hn53oNOekBtLItdJxzLG6N9RhYU2wHzCM38Kbls4dlsDTbCGEz9zNV5EItX7ky8k/0hvKVyCuKVrSGyF7bdwiz+oXJnGjoAbnsYkxrvroSW5MHoHbzvHFWe/LKDxE/x54MGmFLZ9J/duUUlrlAeyJbuYe0rpZfJr7Nwd88beNXdKF7mZw9ZCGrJXoLF3u3S84lCFzZxJwJ34v8LHKn76XLpY7X51bXHka2C1Nq7cF8VNgtzj5i0YOjRCg0fpx48bNm3za4rMMIUd0B2Xl95DMqelAST51XfrY7dRq6RXq0UsgatN4CORXXbs4C7hIwet1y1fW+Xu3iLG2i+yGnBWjGt8MI7MpTtLcOPA3Zwj4xwSaOf52Ueodmw3Sk7npPQQqO9LEw65z2e0CZ7EhTB3obfofiXOd5DoWeIK23oKmnb75VwijYRWWUM9DWHmLUDa/z41TDa22yyewSjaipCGI5bHoCSffVESoUcnibVFlDWtOQDsq4iL0N6GNiHYsXfNA1sXW6k3Fg3+q3BWnrV5rPe3tCKbIvsFK84JA0Y1GlfuqgrUvjaNPveJH+1adbL1hXvk+dVQSFkrF8hNVtqNQ3dmkGoHnKtcPbXfcqfgP/6+BH48eqhJ/BLwM4QzuUVtXlqVnIXH1qWMLwPjcRgtCz6wDVQrR0028R3a+FolkWl3v28oQt6oaLdjQLXd1ToxkHJehu6rYMSzbOTKa9Ez1RduAOwrwMbcZirTnf0kgzx3lR3KLZwIH5Wy3PrHazJ3uA/Ws0B1ZBGG6iZxwuBZSVwx/yWVat6xZK5Efdbz6oy+/kMgdiscszqCwpsijVqgkXbDNKhxn0sWOhOQmXNOUn8vCkaNDbOH+GX4L2lL4GcoZaLWgBA3YqklmoF8X7+YqAlhy2e/DCL2/tQ4Sat4bTO+TR6+B+jxOMVA7kfHrWsuPcXM497wTyOHHTuMjapaxdFZvi3wQu7JFGEVoWArht2KUViqGQPagnSmZ6YOUAcGVYW22aZiO0EmVMhmV/1iCMlsvsOcoI1S4EKylDMbJ/KqBzAa0JMIacR2E1Ew/vHHQdTruDRpFeAEb571o5UIoVfOprp8S9D0/fANV7rTT5olnvpbAtuXWThmH4I+l0rBIsE9fmWwRkxZsg4CIsNmPM2kXBfLz39wSbelc0R8DmkfCTq9b9Y2op1u/D8C5c494hv+wyjzZPr5Imf9+p0Z860svMA9xThBKpm0Ys/Iu/wtVBiPd0uk2y7SnSIIEwujtop0KroE4y06H0yqZ8HzC0d6ENk2F0qd4ej7/WCeGLA3HIXdVOK3v5xLudtqP8dPTnDGrP3o8Y2mSn+4Gq94nKRMN54py9uAP9csqdkoe6hpOeTMks6Zzu6DSLnvYGAyasrbw3bFsI5xOquWDytlq4bQelZdAKHImPRfMN8Z7WFXhCNRT4OA7jY8BAUkTA28bF/cSBy9lyROPNi/dLsFluueGXL+yR4eJtPNnrpnJ8GLKD/hUnPlarL+fKKf+FmvYd4scBSlHXMh1HyHo7e8FtZRpL6nM0a6ONFUcXlE6cTNuaXnNzM8XhWMdffLWJkZX93ziuxr0QEkn5lExi96uaqI7sdPVzx+7zEvWMdRPLrCr/fpbsjIyRL2mCISoMBnnasCk/Dnsgn7CnF0geCyV4XIo1O1ZfGufc4mA4MfGXZB9QvTjxf1yWP1PDspc+/BAhFFhEmKdtfSWKe+NiYTWED6GTdhMBPD1OvjnWJb7X7eVM5Ivs7thYWH4x/BahPLbRACENNhFxcF7pPcltk7bndqb1cXYleB+rloNhXCZmCEweSjS4zjXbkNBx30etqT8N2lqdXNqGkPDcZV8G3yDhqKveyjGgRWKFxFGJIgTwN8vLMN8E71XD8Re4+0F39E0ZvDG9NYPuockUsBrWLAmgusbFPflOEgqOznjNDYeF2IVYzrB8LNIPusK9GJDZIpE7ryEiF/L266iydO23OpaS7AuQ2sPiw0EryAnzwQWmaP/JAjt198b6FwKTz2LWELSoJscyRW2L7Q7kWCbRFA6CskTfMmkQA3wUsYtlyRKWnMsazz0gHRAUUqAi8/ts8WYpJW8RScuX+JOXt0vqz/CcsZj2YhGUR7hBJpOvyONelaLoAay4A88vVjIsGPhDydfnO2ef/K6eJg8isH01NIC23FCZ7teCsZJvy96gNi3OcRW62PTTreU4BfoFTijpgzl68GsndGWjBNYxKER8kRSBzoNyhZl3KRol2+imWuV5rO315LY3saLgFWOuLGfHxdkVepRnI/1ZOEyNrrG7ggiJK5lsKtp8KrEkdjj7+PFs+bSrxgvauXSS5Q0CDOg9ooWm+NHnl6yD/05aaiVS8In0HB8GcjtiUBMnLgLkyiJd6I2bCgO+35HtvBtZG2wsK4rrIQakj0931kJLl5CK7lVmqS1SYIbTCnjqLjia11izRTMRfVXG8CR2i6iw/Fq9GcJrGmUTEd/+QH8puaMHzQjMJvWUU3PPSui/qjo4MreDIUmJsI3pp+K54sTQJ/g1g24X5YHDW+wnKS4vnqxzZ7Zu7x3/dJS5jQaPpTHXD64AM/EgmP34ioaqoGe50cyTUgZ1YyPKggl6pGjyUsiDkQBb24lewdrrN/GXQWorqnay26P2KebHS7esHAbNy3R9kY4YRY8T1V/w1f0nvaq0cg+x7Y58WAUNzl2Wp8lGCVEPUbw5EgRLEnPCsnnIPmSleZlL2YTxEfAtIy1Wn3ePDjGK7Yt4qalovKicg4a1BxpMWMokDVoqNjl3M17+p1XgD4ZMoi5VcTwDlJyfroUelhDBAThfuZj0jZf1gaT3tSBvs3R2D3tEqZ/+YMJEpP3H9x3hNZuw9WoRnc85Vc6jn2KHgl92shMkVxfT+IxrtGDwSGz3m6guHSnz05jLcaFFVCIIwKoR3TNkCnMPLJhPs/WqULcvjkErfe62wVogbMM5GXceZvRfHlLgxSvqCJ1M11lV0Nk3fAvpQn/YbZQDFuESg9DTNzR/4BedP/I02Ij/2c7T1AbjlwbaXFYtzta67T//mYU8laBbKteZEHE/8euDReCKkBqyaFyu4LlmZa1qJfTv7Pi9LbkRji3iI0wjYWX9M3Kt1XVzZrg0z1LZivmVsHRH57WY68TIrYJk7AGeNolp3qtC7383N5bhNJO+GsYL8/9k0H5MJWVKid9mB1xUmHeHDQDKe5fX6zdh6pckc3p0yI5+k7qwVZWq/yTKFjQrBdrICp0SrjJVMfpSo4nnvttOHoYg5d1fXsEqLRmaN7sSPrYrLFl1RKW1lwkVFPEfHi9pbz6/V1Dkd4WuhouHI+9W2k1tJmoXqguf+YY3nT0bpqwBPjImt4pab1l8bbpbTC4djFNuBtQHaXHQXSYMqP+lOOghKRZaC/EzjV9ZtbivWpF0F1tOLwzgherK54XRx6B7GA6pZRUPdIBDZL+GhgsuXEtqnvZnba2dA+lJkffwV/weOVT/ILJRg0uzDEm+atkBamsjs5aNO/PH5xvjHebC3lEPxZwxYu0cn3KFnb9ByEgz0BDJjrdI9LrD7HGlS1Dp2oXcjhI+S50tzDO/JcDZ7hX+/2HufiSS2NjhsiTCuu8TuVF5dJcNiMQ9TQGjdhg/Llu6Kaw8lq86gMjIJUdcKqUjGEUsePZA3znJbB9wKH973dCBmKHFzqGnzvH+tHODnPvFc3taJiANMrzH2qoGa6mm9HUASL4NNTmD83sFFnI47N85DwKVuYdxC0Be3vMNC9b0xDKZ0SmmUM7Fn7e2WzKFueu1NcRxleDpHr3+5RBOwhXpd1bKvf0Ao12YPyc7nuY4oXifG7we6F9+chBVHgd5xjjjahiUK8FKv7XPbBmstsSm1/zwHvsU4e6bcsRrNpgZwQqFA71OfjX5gxq7llMStKtIucxHTZiOHXHiiPbniUPveoAq9yLhF5LinAJvwkCfUKt0IrfuLMILjCPx99pcb3MkcNfiZzgjywmGx3cNo9qZqkDhVNCJb2x+3wZkNhGKIphx5latkPao2tfcdYousEgE+IS16+gBFUp6Ijj7MjVcmZg+T3QTepJPKUH/a5uNrvgLyZ9Kj03U1pTEqRxVLHN2llHM3NzZdyTe6ycT79hWQ99E7LViaoJloEOX06AkO0OX+cW3tfy7Fa44Ms87m5sJihNt3SUmMr2NPh2u9OZXSF+cvAaNmYndRUDmKq72UvA8tFpPR51nozlkdxFVtXc9Vm6qS4HyZnESqD4EQpTwuWuQ88AfmgNXzRh6y72wOcGueEKiHOHVMGAsWYbebvNnTF7EghGEgQ5nk3IN2qhNfCe2zWxnT27zqWY3ZdY93o44d25/UJd0ED0C7xKI5OJ4s5B5SDmd1FC2QWnh+2Es0LJEN+NigrxQmAuwsMzQvZSaeHDJCD1DhO0ZGFTnTh3zzIBK4DyBpj5dDKJUnuAh83/UezbQgher3EmqYY0Le044Vo2XCupgxcataeJmm0O8GEry6yXdJ53ME5NchCQjmtE7ZZdXsoIZah4y9LXRWbQhs6JFQKEg3G3HPEbiBTu7R3to5hyvkKFMTIP2dKS0qlBowjp+dnrCefMNja2dki2I9KmHaCtTdvatV6wKB/nQWVW7E+T/Yh1WQ094OVPtz/ghvg5sUxNWm7lmK9zc03T2IPvT7QRJR/G0RldE0Cvr4vl4xKBBPPNCMTbt8HMqBAmtIs8fHsizojFQyiBG7tCrusFWwkqNeE0zKgpGe6X2xzqjYX1ZUeeJwxC8aWZaCExhVqFnASE0LHp++dbOquiP5rDJxendCy62r6quaPQxgZ2SeIt4xSiDCMuMEb5u2MF99s03JtQcea/zi1hVorZOQ4a4FwyOBHdLS+2EVPRNuNz8rHEaaUtq8CdE/eBZZPkUH8noLCB4t9RAF78gDMq83ozPcSy+uPe0zz1XUfAjgbvNI7PgfpeNOXZ3cGjfUlxo23Lz6CRIfnsYZ3/p0GV6SKAkYlcOVSiVN1yAnJNBzycPdM0AFfdEMrYrZwmPKymkvCaHkIuu2i7UQ9xGDaT/mqrQCVVaUFf3GF3h05M5HDPcWlFFSUp1D1u3b0F7M7wF9adeW/meoDpcCv0D+7q7qht4bgOGx84MMlpMJmbRdsQ9j3r304tjgh4zI3Vnhtb8TszGmmZrb3i5ncNrNzSu2Wulv+vbwl4sBPJmN5TjPKqcNlJktXT0K4e+Aq9ooArwkzyEWeWUc2svKLikpFsVM+KEhJ3/lqsn1KH0kwJ3gvVTFjtHB2gFJb7ux+0VKl74LarAYnOPOz1B27CEXapKsXb9mkgqprWLk+z6z4CxldD3J4X81SjfEp6TdqKesNzv2RFfaivP7rloRi6w07bGwlxs6yIX7oC70RlXyaoBlf+qExm9EsWmG2Q4nClvY9XrZD181SdvrlvcHSYyKoUV4Sdwe5ILb0t9fymAvOEoDvhKU4XcTcxx6swoGk9OPE5SlTuELrZYNHOlc6v53KIV4Qlqnfp7z1wSiyKC+N1/BPjVna/kuQthZyTeNXXRTITA/6zLVS7Gq8If+Vi7AdBhayOT8R60lw1+C8N5aOLNRglWAK17i8Dlrb3jF9DQbEKinRC3PQCiC8DpciLtmHUzA85FJFxXnkgyJY9h0E1ytjj8xLCMoBUF70YrW4RZIJciU8807osso8jPaYFnD1K8Og30X7K5LR4rZZt5G91eQ3gVLhV/GOoTq8Cv/a2JD+9p0D/MYvUKYzu4o77UQTFM16dEhpwM7pm9Yk43/BSQooZ9an+lUc40VXUptPJ1VrH/Jz5OdUAit2PvTcVhRIavTXXrfX5luo52ZNomNZ8B7cHBKZN6kHFeW6tcPh1fCl2cKnMNJHlaJaQlhVSoAgzpzHoCo+kFwECbkOC1AapkBNhOSfIwSYszzYpc/2FiUhprSxVmVaOlHyuMW7Bmrbxx1QwKGPtmlZFyU0nR1ZaKmIcKzDO/HUfrUh0ZA5BhxwckzU6iGY3KiOP08868fx+CIudzKN91a6u2Jz/cFNM2WCyb/ge4sXzqLpl7pfj/bAMB3jy9vICGXYF9F7CU6lgP44H/49LmNfSlU87oBUX/t3FzhKdrWxFsKtnwNUohjGdBw0PGTIH0QFu7p5S3fIgNIxDZfn85W2nWmdhAGpwxXG8gFGNLgYqjlBGyBAJ9xINqYZ0RVjHCVo6uFbylnJQHKLS/nVn4l0294QJxgpMYf4wcxnjLZd3EOwT/3Z3sibEQ2GiXnUSDIQ7z8D16g5WqqghQvnGBZakRMKvLDSdC0yGZwn2P0YuKmOVqfaFwya2DvXW0Oypd0hQrqwbh4EPnt9ThCd7bPsU8WPbvWL9CTo3NPKx4yC5ONxb5nri/3xe9Cvv3NRn9J1H8ub9U2lU7bY3Uby3K+Ye+02iYZRxIQir3piaJki6TXTAA3Eh8xH6U8JN33J0EW05jlFDDc99e3E5rH8TEC0Idw0p9gwVEr2rjpILZyyJ0rZnmBXqVZz2C0yXNAHei8PY3Xv3d4QDj7aXLAjcz83kyP41TxcMIzv9QXZuNRPpkuqU2bcNWnIT1yIxoJwoBqzARKRUR5g9JgnOa1Kf++WjzrY0xJ+Dn91spjxdcOmfwn7+0P1t+ukoLyX8Ez/7e86qD5JLaUKwT7f6QWCUmZCQUEQHmV+CGiFOLFfhD2kUOvEuuIdzsRHDqJ6WieJR8EBJ2urieyvG7IcxkjlWWClY9Cbat55QbXSoENarAxQ8XKnEkk0DzK9+bdb0k5+GtU+SHSBdkaibduXQbgjfryjeXYwNPWWnhjhxnEP5hN8ZRA2rU1rZYRXyJO7rVRyY/L60saiXrgU3lvzxr40hW8uhzYYxziyZ6BRYwkDYs7a2jjAZx2Yny88BR0Hf+5nt/pKWQzKIf4ZyxNtDiCTk7mUTwZTWpvzIqK+gvMB6lTU5Rq61bMZMKRgpUnumBRneXiSF98KtfdnqxjjDMa/ia+EGoHpXgbcdFbnx/Wp22SUqw/vzZmUYv6tZ3thLfw0k/pqPTnSkIK0u1a9PnbxtQCFmqP7tl+3h6+mkuU5jka+mjIDlGzceaQx8tV2fuA0vZtXLrWWPeREpH2/r4ja/4ulqOgRLMRZO5Fkpdt2mnWmmkbaetQcfe4c9LGWi0WpMJ0J4GJywd5LFSV5bWkGmXwBKxDP0O3PXYfpvy+wDQ1OMknJFxOAxC86pqYiyxwIGydaXYuQbMT7EqFNr07ZNQ7FfBwyTwgeT1F7d/pejUnYcwuwKSaKwHaMyuxFRXorL1EZKuoqJ1FJwcG/KvNKrCgyIcfj1CWuZS3N1DujWWDpyUvzRQcgzn0gY5kldF8fAxzV2yqDxIfFgQGCUib6Ev/1yuaqTtdjaRNhedZsp4RpzE16t5xmefx6MZOYVu9Mt/hgJBvb9/IqOvB4o86tj+wen7OyQYjYp5mUuXMA5DbeMTuUXXt3c8HpfnjoBBiyE+n7Kk6lCnMmDEgYur+spT5UWtWICtFVBClcIF197uYJ2B+T0ScLIb5rowiJZkWoCzhoh7XwrnqzuZCDrlTGeIHCW6CQgArU59ZvDhgvWDXpv0uVqy91MJM30r3azg7TThqprc5jM3/VtY47z7gVvTxUq3hIWWern4SwWQfX+bqIeOrHKFl/UMUjP/jik6YOH3m66XLiGAIwB2t9W9kMRzANdJitnukiX4HxPb9fCBE3kEXuJ/I+jbC6DJL2mt+sM9wjMegw7Vq4O9V/rV3ao1wqwWFPr414RFKlTyz9/GUgIKR/GxtGim6I8vu/bWBLDEsU+RwedsKfPLcni38X1OFI+QyRBmVed3aI+U4anCLw2DYXJXb44qkwAwmDVZ4aj5rQnJw851TrCy7/QakHlOaZk4hHP8rcWV8KGDnnAvDXkFF0RPgpWN8pcMVdBcSmOCMaXRYPNVHmjtfh1MloE4xQdLSlOfhXQLXHMuch79g2OsvFazNNyTG7HP2xmovlRVA5n4ZeQBqMSPc7YHhdYukVJFf2H7gIyznxu9KSqg6+Ql+B5dNs8CRbrT5FKyhzJZSMcA3aCsgzI/2WagW13a8BoBdlxcENytCiT6SCr4tOSyIUHmp1aoVD6+zwK516WkBib6o74tHmHHBgICxOiY2wfeOUewx6pQGyB2W3DUcmW2fFlVUF44xiElT3mjjncu8ybdOcXytD4xHlWmBV/4XNiR1gv6/BSDW1tK6P7dY9+ykAN2zX13V/TOFhSZFfzuZ0bl++VbOQS/dZOtXpIQqozmv6NtoGRypvgNhHDp+xbXFPia0iicwzHOqbqF2PWKANJ56L6gLIawqN0fPmu+WdKQYp3mVLaZXQvJ1OyVwQmpRXg13rfAcrudee4lgWlMOaM0RprYoEOPWPWzS2R+HdCcZpis8pQfxJyNh/XfbolFMADwUBNd12G3dlezlAMZnzT/dbDTK5Px+Is6duYHKtdTjRzPvEa0MXr4epnV4tiDtS0yiTkmwln7ncM0hKMJq11DfOVC5jY0SE9SB8/S9Z5HCe//Aeqdlx9wKbxI7P6gBh9E0Y7TV6LW26ajgnOjKn4PX9RmmDUVN+iqNovw8oMpPkAtmayT+Y/pFoZXVXWoB0JuYN5ZMtXQXj0prKbyQ6Vd7zewmtdofOGWo/s/d5a/CHw83RHdDRdBHCHbYZpincsCl7OhjqlLNWDW8jM10gXJvpjlHI4CYqOvmBGcHnpENvLojCCCBa1KtJnD9kUouQtn7iwWGuqr1kjUnAhoSCDVEWJT8+NFsoix4ZYOFHABRSdkDOmsyGa+gbJMtVvjWHO/J4Q12Zo5qiYWTdHiidhs27RrReNh2q/NqxMA51tgt/YmWEwqwXICtOpputOfrGkQ4T0Z4kTMs69yaOcOfo5/IlH/Q4xVdzLJHTAxcDQYZHLetAySN322+5oxFVmK7dGZ8QNp7ffUn04M6wJVv/TND4BbZ7oWUxuJhnYyJkxQTwNfJlDbZO/9tWevV/QWSh+8mVTF+aMsZRjcSzTPKTCDXkYWPIS6RP6+YjZLv6ksoOdSWPwZsHhxbJ/quf7nxAptGG993THTLKe23mibFvUW/ssgcs0Li70zpRPZJD9BDwtYQ/homMOANEp+zNihR/z82wEhqMxCNgMlXmBFGBCIqA3hog7uSrV4U8wsBBnGENmuBkZ8sc/44cpR263MjZ67y9nRgSnIkI0R8EO6EVYeb77qZfsuV/U+GropvPTF3Z4t7/6CQWM3WircAiCFjxOnrY1efhWinhKin50sl799OUr9oJBbRuCHUydSeX2iOV7bNFS+jm1I3E8/EBJMund4mI58/1CAm1M/1CHa3nqEer0xK+nbg8+ddpMcxq+fNzx4FZeRxJ5YQ1sytc0YCw15KiJQLIe82HVRFMaPIqkL9tbqsxmBWoV7cT7qH9TWIxTuEFRphuLXd+al5I/zXv2HVum68a2CP6iuG+7VwRCb7z6Eou8fsH3p3D3p+86rmm0MK6hzpFFbPvhazl6V2upl7ewb30YCUIUPH0bsZEU7ect5Dn2rsMZN1z7iih4Ogt433ckB6Cwx7B81C3muk6cT/iC4drka4gAJ672ePvpBPLbAlOtfzjF7RvkTe+MyfYhJpNqcVv3vn+OnqaTXyl2PuFIjFKhYJF2R1hZyMt8+qF6gQ04mmUtyeVACaEgvkH0/ERjiYRyjyeKPuI5O/2tmidCQzowXm7YhFXKl5SnVMhn0kxYpl/5gN4+tjpnlNjp8eHnBWBQi5sXq2uopb2q0TwAvpl8VYoW/C35CGvk1CBDelJ6NWyiaxSX06SlKPxSNidTFxAZQzkgv8xyWZeewRc4T+e2xK+gUJpFm+gHkXAday7J1ZRpAlH1XMJRKjjk//lHoWXKDwwkO5p9ZmCn1VA7FBVWCe2DPv0eayKw0Df6+yaXTgIWlkUpBqyOYxjOMTj0WGILMU2GBK8HzbmjLuz3mBLRRRiRs+pISby9HMY+9/AfGPtUAgx0PB3qSwoQN/NZ60t8y43GzuyhfuX0DM1J03CNa0yP6luZuyl+isb7JxbTHiQeCOzH7DeWMtLldjYgA9kSuuQGwoyvqle0WESyJmiHV9pI2L/Bzk8rSA2ehLzgINg+g5qpBz3PXKoRh3qeN03X7H4musAYvd+TPUZ1deAD+bL3y6zNzbd0K/WbbBcBiN+uiXQkxdAYXhFelizpdsfQK9rVqPVPYwJGPhuWsN+KBkhqzSPorpHS9J0nUPUAyA0ZCXQ4W10T3INsByjrt15CEoffuD18KmeefYtu8VpJq8vwsNjoTBgbyjMIJ/YgY/HkhxUY8azNxRK/tyqQBWz5FLdBRnDJM3p3tTslOc6SQwRuneUmGR+XveFSZyFiD/BXih9KktZlZdGXTYRU77lVDW5T0woxcdxgDzYnj3nYa05l/u59Bbt0wNG/iaC8x6/B0oGgKEb9OXp8Qmls2+v2x8mzVaiA8teqKIdwO9ZtyyXsJWpYvFrI0afI2L61UEabmVyLdX17rrmuw80YGekz7874oKXjEpvCkpW9qW8ug2qtIQNdUDglAXp2X1kqN5fW2Xynv7m6sSJNhta5r7AROOhteLwbaDkKzoWRehDc6KvPLbGFH4YrlJpHm4RDJWHrrJbtQ53ovT7Y8YGNebL3p9du1PT63Bx8A7PxuXY+xmyJTmyD9vI1czShBdAym1zhadFrN6ULKuTV/6nixkHdpnbpq/yUpHxXsfNrLrBaie/xyPVrScC1R1TVtz9xz5dBGsz16i5/SM/6AzDmDjEHPMrrCutpV1Fs0yV8dV+/2Z3ZdQEFfaF1I5IkOsyNLfL8HvEtaglMkAWJAkXsGlWLTgTDQ3iyN0ZszsSjeYtEaNOHoygHHb2vye9xfDGuneDB/TgVk36GtyXkGDFxEmwZecAhP9x5Y3Q6x2WPful+qHKHyTH7lvIim+SHc91P4X+51WU12BEQkhX6Mhh8ajMsNlyJEs9+16axtHSlKWkJua4eJrxEj/hyhsGvv8E74rnJYwaVC+g0stuGkNHv4rGnSTZq6EwjDDAy/c6RAGu5ry8OCXbRIYPAWFKL6fKGj9wi8Ln/9da7m6Di2+/sL6qQojjC3mSFUBelWxsR6bMKBQkTsjp61LY/jI3WSNFPnX+tD7OBpAuqpR6iN2JlJdfxQURZs6CNEHzb3zXxOCnWZvOO4FDzz77oiyvOTsrPUjMNGBj7CFDMLm2sR1xfLZQq2ziCbR6gOtWW/aiuzItoZUtUF/ptyWQ0UA61nNTCXiLzBIJTxMY82fQnp76FBihImpN2tkNQauYXxvTbjKzIfaawqDAf652DBYALmKNQFuewsdYLMGTgij41MJjfYgeORuhVl3vOIYrU2FBHoGaLTXbfJ1DjZGwTCQU/ZJtAbHPR0mpVHNFIfvmNKXVDV+WInEBSY21A0PDY/3womJ4T41Jf1UaQP4cXvI4iwaB7ommPVxjHL7EZ1nrUN9aQCidQyWk4065BdWkNtzH7rWcxL577JF6x1YYeIsLsTZnzczAzBmynJnqtsxZv+RHPOqRQfDlyuwALhikzQl2IPJk57bxHck8TBQuIoKgxXLKoqrzOUgjxM4/kvVPzrlX88O9a5T/0PVOwgYm5ELaOz9DCv6Kio43z4o76eGzMrTgS75D4mN6wsgU37AhbggV3lL0XgWdZ39wZxbRSMb2Mf6f7DXcN3Kv/Nk/WItJVGCQcx5ChoRn4mgijOaAkdY2/rmYXJluUkVSuHX4uhOR4iHzT4HceUgjqcJkymDG87wRbMnTtMWRtVNqalmxHiQUHtH4pvCmrYgkynDiqPMaiEHqUda66vF+kDFzWClFUUzIaMg8gwqN9zJGJEjjaLwpfCNGEI0W5umwuC5rk8NvaQMOyrdujCG5/Gy1jZK4ohehG7WTQ2tY8rCBIG+PiXkpxR5jzp6sgiPqRoz6Pvtjg/RMny8z1/FIQo+y0cKOqX6weljWgYohTiwA7EdbKIn5wmWZt0IHygf6s9v1hdaL/sKIJzLjETUHd5yT8tyataNNNhpyLXeESScr3TBrgLy7VI100aQIA/1dsFqio0y6YV8/2ozq9ad3A5ex5eSyahWeucTbIYsfkfJdSvaUOZ3kGeCjNJa4cBh+VDQbv8mkltRyPB5CTTl7dJ3FD6686ium8mTKoA9z2XnUH7rpuE3xWtq2L9XBgkfm59198dMmdCQX5g8fwaYpRA+NRnXXzJSPVVCi+wtlOkYSXi6nFLEkMDtJzWbJNZMPOZtVFaeS1zlUQ4R/2eoQfh6jbi9WsFfE8X/IUWKuz02kImdXqFJqt7mvmalfGmzZtzP5YgPJQfANX5/KF6EVBhR11cq93rs5LIP7cfJaIuRG+Hvuzjkykkg9bJDLRsRNjpMyZpc41gJSVi2b0nWYv8NUbCQ5BV3Mvmlk7WZc75l5XVHC9UzKgsQD2KNGi8dmpAdpiWgh+liA8kzi3PKnx2TODxAgdnBFVCJNxWTy1Ey+pwzJG8Sr6/BAKfPCqB14hrgHLrZTOmGJLnvat4VXMV4CXUN+qb6G/Yh0lDVpl7o1qXwVzu5kqKA/RsYhkLrYPMtsGEZzjM9CctMue7NVcyUybxFrMitUiopdFWnfz2MLRQTuwvh2HlyI+E6AyHhmAnifE+DYxTWcg14sfT6NZADnOhEyqXoHxmTqU1X0eSnQz4YV/U4r43kRNLDdv9UtC8CGclRocCWOmtZkEmoQMgsha+36PF86lrzMA/CKKOi/Zg5xYFzvbtPv3SItpOZf9SD/nwJhGwB0ZupPK7CKtXQ60l4iQEwZcFn9FWQLPlbQsnzhMf5H7+Oy5a+PW1o0AW5VKSfSQvrRoczOev7pZ7DHG3A56VuUFlr4lxYXypGliZ7IUkwcqsjFdSPZn2xayx/tVFwSUKIKKc/uckAGmUXI2FMXSPU3tL5kxBCooHBPc/Lujd03YxtZ36L2LfcXeLq7sjSehfQVoJbcq4C7OnpBrFvuu5nyhjd3rCPMES8gFMG2L7lTz0blbqteEKaO1SQ6DfAbfdtjWQNlxgTV6yN8w1t7LDOiTK1GaEaLMq6p9IRa0x4OmUKDAbXl3Yb4OCbJD+4bu93YhdLUUQ1pdugydScP7t6K+IYcgw490wFrr1AQ2b2OPJZB8pnNnUURZ/pyk36nRbPIbvZw3dYatpUK+Lbpyht44EfeP9bWTqKatQqZGz9X8Pu56IamdpTbhsucv0VepRQufat2gJrXo6RNtjJnkn221KDAX5CmZmNRYQa17h1TjUQHnX8Q6FWRWn2tjxqCLEnjwj201uHV/+vgbEaJw4ns/iWF/+UPOA7EgXwyl60dREO48P4iPNIjsRfub+/R7woS4GDrTt4OhP3pJc3QULjVFuZwWZ5lnjgxkOhgDQYLLsy/vNsrnJQsuuzldVQF413dMGO1XR7RtXNB2fAE2pTdwl4oU61V09NNyz8Xs7ix2pAr544W2fJnyINOdFXR+SlxdLDj+1cbKt0SZzLPZrDnqQBBEyAMqRt9VBB3FkefFLDyV9fG2q1LuZ5SZV44byouHiwymR7SMYQUChO9YQVc06JlUKhW0v+hKKtMNHMmQDQSo+JlYdn4FvxCPrcTkJYyXOty1lKj/6WkN2dF80TAQf7gIiP9cxkhZbSPi1tgOrXKtu5jHjf7kfR8x2zctYwxsPes0qxYiTsllDLDXODOk0RgyWgj4NFmYlIyQefHnbiwbJpgRcbLLjDDXQghQu/sz4Nm4cxqlUa4j0Qvil36MeE4m0ZTKgj5st9Jn5/dQw50sQoGpRq3dBAkXPySiV4rbGDhD0yGCSyG7S9in63mW/gfLRxKgyiE50aBhxQ/QSkaIuOKwUrLLhuWbIH80go4yRVXSAgvmqLsAiOrBzzIto1AxK32W8M1YlNdQl+IeOkGEP+fPF0ZmfSwGImMSEcZ8Ahsk9x+ZkHhihWbG3TqpLgsceNjl2hDQicDsa11cZHRvsqGxggOPiSYpPljTWtnzoD/kXmm4lFvGEAZrbTkDCTIPfOAvbUkg8HeIiKqydF3SiueKy30yIynwJ7M+W56AUrP8zBCSWFy8E7cmDBvi84HRgMeW0IqVpfr1cdoTPlhalZlqAdmpBXiKtlfhHIOXSIaSEdLhvl02kjViXFlGNs8eotdfy/AdI6/qdOQW3sJRQgq9DHqz6mPKFhVYRdNaVn32rqhSES2NA/3udvJrZHSbOHWiDC+aeM6CZ5cIjGplcLQZlO0cMPqSIlqNoTXryMLnqKsKPNEtE3E/s++VbFNz8By7B107XEYa4a2+4B/l/ZEuE48isNh+J55Iai0CRzBsk2QbOUpxnWAOI8d7wlbQi6BrTpESCEq9RSU1D5mdR/mOaIOSqA3DcbQK0Yl5gTb9WiRnvrBMuV4xSke5K2YkRKej0HPDko17B3E3Bh03C6Sei1Pa9u6un1WXgDTT7x0a1+dD9Um+wn1QLt+aLuJgB94CYRUMaC9olroYQho9cwR6U34tyBcIy84Gs96Bpcfy+291zEUVOH9+YtPGWg58/Jy7qrQyj5cqHR1yXCqgbX6C0zhhgOr12rdg8VM3z8tejy4lgOSp22wZwX+ZYAuEUVpvR3FcdYexnAwucfCLKHAeqQqLD4Y801y3qBD8axwGN37Y1S/CS3j/r9E8vThXZCPWdegpvdMKfe6MjN0cVREYViRRDHUmdnGu6J/9e1dSpDKvaviVXTl4E7vO8DZMG1PXgIz+ueDwd4KYQjQZmNy5LXcO7Ya/n3spawnljgqnE7Yi3RJ+skUJpId2reu3L0kRE9mnEHZ8y0R6EK+Zlp7jmh1rFd21ZWF++bLVUCNWofdLqDZEURVs8fF+s0GN7ROdgty3OciFfdYnCE9vbntqtAg0JP6LXj0U5ovGHyhmcBrCrJKp+hKQ7wg3URqV8yKcUjlJKdBvFm8Ur3fjPPjI1m2fc0lfBcxYyYmlGp3y/PPCtbCg29MqaisV9ngwdMzrUGs4MH0TfZ96LQgu9FwZ6RdSZnSxcQV0QksH42DYsUiPvznF0MGH9gLxxYGzK87eh+grV5x1cKV8sMrRuWWFELG+5V+97Y45VOK78NKAdbqsL9I4KBo2U7k/ToORsZM/y5UIYenhXAbSNjyk5WUtSkGz5EKOxKEy0Ex9kn8YiHRcMJCr3k71YvI+R5wsbtf5SsfiG12OKiR+NzZOOgVdMh6UPxXIaTrPCi0hQyDLkOi8kGysJ64dXJl9p2D3JCvRssPIYgI438iQUGGV0E/hW/Hsh0yxEMgppxiIPZuhhI+Wq7nwi8v2F4tZjxRf1YHR4nWFTUyBVowBr4WOHVxXIM/3t0XBDF9Vux3pgiVSyJVwl3yqx4PGpsL5ggQf0o5ZJsb7+xftTMI8nWwJQFcPP3qBus4oaV1Iqc1RsReJybwnmnoCK0jlEBXkyrnDqMEQwMaucnd/geGjk1SskBOn1KvzbnwGhfzUFeHMXIEHbvBweCVHrXqiX1GBwH8XgyoL6M4KyLDcfnozu+OEKBq1D5mbrWnd3BTdo76fGbuy4mp64iV3BD9Gl3FEzXI6fiptj+Se+1xqA06ct2reL6cqDv+aicvow5MdyCFVj6s4K2mHT8vubR5HBfXulxmuPAumFuadtgD8HG1Uzi1snaHAwPn25D5ny37adjX7MyWF0GwyWx1tklm2++0AsS1/jkujjaBYZ/3hGpcpLHHT/vpW4LEL3lnnlunBPcBMFN/n9FCMt+l+cterVBoJDrI5e5z7u3dP1BQQmR5u9i1apUUsgfXnbOcCkwRCQLRI1Se7VRrAfzGMtEkbf2554WD3xvhaGdaVCYvzVB6JlBKpqc/+efgdMnYoUmAmvpRnXjGcUNuvMsg8jvO33l1kEhQ7wfw+4S/9g5aYqwNJxVB6sHXaOCwu5tasF9ky4ZeY/pLIbrLP88m+oT/ndmJd0VTfrjhJFzAVwRDcb4+ulFTSpJsn5O203hM5JJEKpW1Cm6Bp44gz35jhVH8hITaWgQ3/fsAst2Nz5636CYbsiIWwqwlsTDj0U2klZdYEpH3a/3aDqFTUSSG/01TtQVutOyhGVfmdpSq8c7623XVt4ufLiT8Grakht4N0/oD2p3gVy9FvMfzRjSIJVTAlp2jMBvDVf9ycORzpJCSx0MAbty2sTK99X0bFpsltYOU7x2BaFcEcjryNVzooGR9JdiNNW6sQV9AiC7RCnjMbaklplkTC/4wy2DOAgtebHNQG+REfL7pzqLxJCZpmHOdZWDdQzu6eB4/7MTNbFJ/wv0NBB3KqPHezPe92Jn1RRKJIkqo/CeFV7ovHbovDOdN/BulEBpLJIhbVc0yEwzeKcB3vSJXEE+RG3T1LIM8KL7UEuRtN3fXtVQrREFpupNpKomBmdMXXvHdDVWN2BzHT/9bufvmiXF8x07SN92Xbolbs6P1INSzu7PuSFdeFKcFUjy/nr5DOjoi59IoEMCdlXj2qfLyCYXqp6Zq+07LIcwyXHIlOskZnfhSVle+DRwLK6dwpzH2sSDxcdgntAK5KNIBYavhb3kv/o9nXDWNbC7niNNSmCCTXALR1LFVbbKUkpISMz5yMctO6kdetzOAyJsUd9c9Iy9mxcsg4C0jf32+JMiozzhekCL0YYeWBROvwdYYnCfsz1d5LDHQBUBsEDtiOhhzIe2IJevLfwwMCk0V2lpy+xkGihAlhJdnpnxWRU6wpyon3x284XHpLhCp6xf7aIsVqNlUvb9a6Wf+5VkEb9A1+S9KTFLzFHHsCbxOpti30e7SZJ6R+6cROAb0Oo6Z3WycQedh5mqV/8kLrzURhHV233PyQPWH4FCS59JY+gLkk8AUj8S7s+yEG+idmYPJ4dUnzqy7VxL7vUffZUEBlKlVZGxE3wDnKoQonXXN5XlQG9r3/uysIpgny+KACO0aCB3Wwqx3iq0jFz6xSPeoq5u/Cr2GVk9ryu0xvJLEZwW1Fx12uGwNCPHHaavbOrC7TjH4QNfZsQVd3dTsGsttbPifbFIk+Ohk3heSH3qK3Ar3BMfi4lWuab8TsY1jM5ptQwhjXXNekfWCjjGbQi6tERNXTfo60USfCepKiLvFeRIL5nZKF4wUUlTZkj4KFHOnw8qZHJOFHijrFO/kjX8cjVRiuW8Xl4a5POG0vHH84T9X6l8iGsZhVJHek1YblpjDqecTbbErQoPNPyWDrF0hs+XiKavdafSVpykgCS9OLKOxn5KG27yofZhP//Ibv87aO8pqyQiRLBuvQRJ0pi0ATWHfFnthaGX7gN4q5Ay8G1SS4FKo+tWpDuL5wWH02TIP3+nvEBJ2hMyWAFoqyr+iq2tbkvo2Ns3pRmAkdqp9ltPRFCnMAnlNhVH8rzw5EejDwZXfPvsoZ4q758xdGuSTNyUENFnm9dAaWYxBEqGfrnlg9b0xwDYL5k7SDvGjXip0cnhNCXo6DTw47ztdSVSxqRikH50gyf6NqIFAKXiur2o88MsaDgK0vbst5BpJZN+XkvWgDzUJUN01Ga1OVoeqWRsmVKcQwACjqIP7/Ba8XUOhbqSU/nheh4II8Iiarfw0phSDC0GmMM3v1lNJJAP7LZyh00j/52d9NxVmQXF/9Fv9mFMTTloLOJnIYkw0HTXajXxmJHjhCcz+KyR/evf7n1mZeig2w6gCE8kU7ifdO7PokcVOFYYtAj1a+XdIh9OBdjIZPndPpn/hgMgeg8lYkzLZTGuyeNXL8KcxzGXMxZfc2nH8YdVgITZzUCO9/3OI/Rlr8qo6vyN2jAsnxy7NyL5sJVz12v2qSR0pGFc21N6WYfEPjS3ohqn0VGlrgfzAhAjRKmnFD6rt6FkRYZElLGBpXnTc1OeioGCGLMhfiJiAhF8++PeLG2/sLsluxPaU/NQd2cPYxEga9b5bQPmXAiCehLwOWdLVKCt7Ciez3yRpGNE5hmoRXfpDpmqTrbAeGLTCQrIqB2AGb+WjuMSEDKCc7IbKrb6GuEiowBLQbyYUB/SG+qDODFoj0JXgmWL2vY+h5LXk0DSI8kswGv3neR5uYdwgtMhyfzJKGOPzC/VsE4q5Ctp7BCwzNfAwkeOsv7qDGl1QSi/vUWbeKaiAke0nOQQkIBCrN6UFCZMBt3pscIfdEzn86Z6wGnQCZpbu08S/ZniyuRsDZioGwwMT1102pVxcbEq8udS3DfhqMeHzTY6OYBYrU7SGBTVEy4H2U90fHuWXZroLRbw3foDBrJgxc1NmlhHBefQhXfhQjZ7iyx5PEw/Qp7CfA3nC31encB1p4lQacPKzzPMH+2k4DDGBvOMjbiMbZPbggBNuNnoovFho4/rlQYuP/QbfHZIYC3WLDLN9E3Y5DDct2OOAMzNeUgdkYFMR6Cjv690ZVQtaCL1ZOwGtyKheSPgEShOj6Ff5ue5RdRSV210unQEFK8ior5ttDYdCdN+hNlN8/POYu2VsMzracFVWMKt8QKodkld+qxXMjKbhwpd0m0TVrEW30RpXZK7dRWkzOCiEoHTFVY4lZcr7oi7tFkGT9sNME+ezmqRFC2VWT75/VHphMaHazf23FuTvaMUxBZ8JWA3It+PGfGCX/vzH2zb7J9h9kofRUNMpE+XIFRUHkV6Wio3On5NMDqkgGHJSLzjwN94jWyt/PS/JcdNIqYbpphX+AuImV9vNqNckofrvVGTh4rw0+51W9WVj9NjLmcDSm/uKxOme1GuixLlv+/eXZK+e8XsODKSu1RMX3FFwfaCaD4GIhHKeVkLFNMOicYezcIXFNME2r4tS3XSTEe+kHcLGQsIunsKU8gcVb+X2LE4HhIocDph51uPw6JGQWkVU29vpT1/2Dx6DJaXbc2u24dTTgzyFMnHSUVouhidLrpPvbgsBu6IF5qcPTFmw53LZDN9ehQVKbEP2vkbqI89CFNmDi6CvkIMOPa1YWiuuXGq/2/xSqE3Fd329wNNDqTx+3NHYCT4drECCQu51Vjhu/ZsCDn1/3WeeR7z2LQ8jMQEKEmwxLRyr0XsrIxwnigmLBfArwUfIxxYVTz8/NIOMW+yKXYrG6BB1G+NLIR5FJuPcdeUhEd54+daO1h+zrgM9LtE3//L9BgahvCkvSXDkhzSuoNgn+8Zu7O69rKFpMsAV2iect4dfVdw8OVZaolPUwh4DHjEJ+jgUbmeldIFrZ0Uvajzp/U9uHkEk9jsFEo8OxWGtQHc7+y1tIvoEEza7F3WUaR4c7nDxtKnR5shCEMaUhfXcpXeXqdi+EiBwsJc/y8MQ4g+oAHHa2gWdfXkQA11jEI9N24sW1XK/AL7vjNQI0/8KnognH4d2VncbfcqPZgJzPsYD4AXqEumv8G6WUDsowcc4RCNT04eLMZOHojt6fI3raMNPA4koxnHc9vdgHBnJ88PXEUz5cfjzFxAuAIgA3/hNls5hdwtp9fmhhkzcYW97ADN4hq/akz3LTQZegJ9XhcpS8OfU90eGU4gbWepqCviqm18JNxwjLrRer2PiH7AEuCcMNu8EOEIZl263sl39ueEbXOW3XFfEle3drRy5MX83NEbVu0xSty1JdT9+Ub8CTu+TLKHoDz5STc4YkbsRC0FGGknoKE21SKIlieCTtDaG/6iktsn9FE/djRh7XZLUw0rRt2OT7tgA+QWAhn9GicBzUfq2Vbexj1MCxsFMy/tPxsdqZa+67fhpPEZVOZp3hS5B8q0SOOvURIBCat2MbMhJYKB2q2iIcTQO6oc5PiM5mvGvAjI3dtUG1cRyUB5jZXS+fwigR/CPz3vIE6JW49mzwdFyrQGjL4hh/RhqoeqvFb3jw8hPZY62VUzSy3F7GKWrTqhex/Y8V+QY8OchUDbK9BYqJCyqYh+FAgBOZ5dnSaHpP5v3v5b8yE9USGLekYKLeRJjyWoHeyTYMua2IFSpffWsnTmTTHTRcyj7P/OyNg7ztYGb8xDMXhBCPGNs+zGmKanRDwlwpG/fcm9MRc+B9WSbhWjU/xLYLrRcJt+uQDAS+dQcfJjbXKHsgnSp/s/j+P/AZGhu7lY1WqbwBIM1htWEVpCB975CW0n09a2cuZT609ZByUvlVjgNjb20m+SfL6CyQWzfpuT550dmw6EU1USATx0dp5Jf0yfp4vNlYYvKIT/+hfCaWn6esKKb/KMYudKDOzKxWXBa1PHxeGiAvU2OJLHGehsFhpIBZoEY7F/Pf6Kc7RukTuZ0lM40jzRtdLe08Ma6Rvo4oPsIEcXTc4zbb3jaUb7/E0YTLNHH5WPmLXUEZMxfb993UnwNftpdJNvmb0/2hS1YedO4fm2UijToWSgofrsKZfbAqO3yjtdLApvWpWzg58+B7Zt6QR7zOmJiVEnr5Ly2/Gkq2QK50uNkk5I6O6nurH3750j7Bntm+qiJxTNRKBM4pybQU70Y2eaIvA2beXWJHpYks9KHZl6owOGEBbyw2EDlaI5uRQUlwt7v93XhWPh1OzU3YsGWtGZ5AmBEalxpRnBPVWxL2h1lzQcSVdd3Gp2S0kTdEu4wiLbyAs6J8Ky6YGQcRhFK2Smr6VGLSdhifjbdyglH20SrNdJeSwaax5C7uFUOEE0N5r+H2oiQQByrJiH1TOsJ17PaEC4grSfB5cFSHsI+apLy3RjsWSS7GKNvm09YIp74LfuIExVKgOrjzgKGfX9zc+2hxIN0r5TBTYwDVzp7bXVuKotVqMREgl2MUwCxNhMpkexhY2sD1qEshe9C3VpK88rRd1xFIiK8MmeQTYX50W2bjGQjpCskuGwzI+nTmwrSVlEm910FmsZ8DyDAOaBYsaHF0eE9p2Gnl1A6zROXSwR5SXwjPR1LtJukNqjhUKU2mL1f4wNBmy9NxpKD/ZFnscO+ayDezOGq/EEh+ilnimbZx8cw5y4Qr9AbbrExfVV7JbnYMgkWhrZ9Qjjchx1P4F/lKppOdrihv6geyA+cidJZX+6541SjQ3xfxX/ePqGGK+Ei7xi6tAacG4q08W6iESl0dP2NtCWQZg24YPnWQ7eLi7O1J9UhHDXVQCAW5fjwS58sLZU5zC3j3Owo3/5Rivj1AnX29iOfXFb5cUug9GTDpnVgVGIrOTPyTmiGex6fbyUQY2WLArOgg+ciQidbpPlN7N6qArH3RHpUQCd/XwY3WoYkwSltb2TNIlRs1QQL5iC3pxnS2vlg+MTRGT15tRC59i1gCCgfyOZF8bC4DMkDIZwNQjSOAJ4+5uOErRgkYv2kamHoKoERKKFTw2BuHO7KGL0Q9rXlCkyGo+W4uHwKtcOL9vu5iW7Gv3UKXCXdvBMTV5NBNrr9cR1x8PrLs1IVTf2qqWcXPeVTUCKZ4JNbeJ7A//nBDySffgyHDZaUQTxrq+Ou81Epg8rniWJyzgrwzL9EhlZOCuGDsQIcvPnrTfJvj38Q1szdPRa9BqgkSbMRtbGBN+JS5YeWpTRdmJlctsm+kxWbnbHS1wkvsvpo3gW++8DV/urvBXz4efsggpa42pdkNv5jyaesvndJOTFdMx48kY1zEPWq0yBwZMCg5COxYi0z7ZLwNzqcNOQOW8dO+b5LLzeEek2ph6jGspk+kbb8DzKt1Snb4r4bOkVHvKkr+T6MhEpVMW4bveuPQExl2Tb8pdTZJkrOZbqO08wxAEGFB7r+nJq/oxre9cXFZHHEDlkQSNYpbEwQNvV/Mpxy+lW0g4kUpE9n283whYc9tlu9oQH80sN2fyLe5PM1tTyQHAJetm5ZqGZNPxM9NodbtBFHAHcySuKQBCl+5RjPI6pbqta/MHjDQ37ljjp3J5l91jw/E/XkC2r3oj7OWUloKnQ+KdVyC838zposGzb3E6XGHXpVmANt9m8noBrKwU4+WsoqFFHuquMeOns/d3n9CEo6uMAT0aJRwgkbLre4LqgjEpaPD85mM0zKPDclktCbzHCkhsVrWjK1yhG+1BoMT6JuhG5znzWMReUt4MH07ARR1a4LClit40FNzt61doHE+ku3p5NQVd+9YrHC0AqRCf22tTWbkE7NEkUy/EfYOhN8SYSUkAP59kBGo3mjMroCw//h+UUq89bh4U6OSM+qoURGwg+F6pfIPUHidO0joJNh1BMr2zy3OJ4PUsbkoTUhd1AvN/LtJCkaMfew4wDJhDsSpeEIB7oQ7nxIWh79RGawtCseeQUv8BgVeBv2w3y1c0VXKU9cqJar0GiTZt0oP6br431930nVC/kGIC3z0zbGBHAwhVDBiIKEhKx/1ItpRrfvLa//0lQb1TJ6lxBs3qh19V718dRTweceewuE7RGAjaat073c0G/UgVTZ++p7qCCqcUKBXd202P2jkLOcMF2US+aoVn2A+P0af4iJ9Emqaof0s7axh0vif2Jd5EvvSrEzPlnYGN78QQhVb4QoMxJw8HNQixgV0Cok5SH4mu5Iz1M3pJ+26vz3XO5aNfgJTEb6hH9PQm0UFq0gvazS1RX5uSBQdWOgtJIogboDtxY+IdAKTJXYYNgb5MuUzfS5EfGAsOyhmMDmXDgi5viE9uC0J0p19BEfE9ciomYiu1wVHwGmVfeKd0ZUy+6SYFJCZ+mNLgEqLo8I1vIY2iLQ+xRUDEKHhyrLIdm69TyN1oagxkcZcyTYGL5N9583Xr65rsVdge+/7Rqkg4Apb94EXa769YL/JvJp88n+aGOC4VIvx9Nss584RH/Hrwl/m6FeIfLVE4B0DhcyqQHYJKxaYYVQSkibeUkENbGHsyKHRSvTuYjHvjloYuIjY6B5B8U0WgqET2LoUgtnd/ecSCKXWjupnlwo58VCJPEYO2r2HVwLAVkDg3z0ikeoblLkfMCnie7YWkRbgtx5NeUMOA1dt8tMsNG1qUeztKHX3+Up0TG5cO6kaHLlCHeHde8XRCbUrcJPXhfQ0Nn9o9uzW2P7oJVnwCPKWkNB3BtlTyMscAbTiT4Nfy4aG6i736cEQZXNnTzousSuHp7a/T+vQMTL5B1wnHyBUB4OWzs6uPo74a9XL2QqqYIo/ZcD7EtJM3wj7tW27SJImj7GaUDi5KEajEdXpRDcZuMPsLpUd5C3UQDl1sgegXb+ujM/gQCM82Bbep7Ic/yDzN5+3MaaFgs8wfJAETzxSFMQvfW1F1ZClCH20bzcWPDtFgSIYw+TmgZr9BPAY3uv7jVozzippQv72BMLKxwcn8ky18rI+k6PLcDti9dxjyNv/eiCrmXDPQia4TFZiJ0rgj6MEcnxFiIUfd7GY64YFOuEQ7DcgQnYaayyexn2R9ymarFaCPNS+km0O5OjNC0tfUNQbVM3IEG5HrCO5IPe1NRk9uPfa315GM5/GOpSSWcJ1QVxlU6tGJEha52ondLneQLUFu6aUFb9GFpGGcCpoI7pm6rRrcv/TN9Yt6g7s2sCsyMGyWOiG1NJF+KPVJ0GLWmaN8GRjIBsA+DPvkS2ewc94TgeuOXBJXwAMQo1rvpkAlT/2aKLnGS2qDW+eHuqNddmpOjdcBdedb4Ua1YlqygGymJmT1DLuk6dYYOUHUoH6oOPDNCG4AGw82TYX5rCx4N/tf+Vlf18UY6v/N67Nab6a17h+wT33tmykPeGwuaXUu5x0VvvwvXV+cZhZIN4bzOmIk6wPe+3ZFp3J/Ps73jLzyBBz2mrW7vW+bJf7dfSjtL7WseOvGyQ7et73859+wElK52gLw4mh14xuLm8XK/ZakrBeYUPZ5QRe2LJXQJYVwOLBsZgpc1swEGG6UxhBEdpek5Tc6o6pR8yawSzHBRygxVmtjcl4BCZnZyTIZBhKPoCSoPMQ0OrnL7BMbStE5JfYgaFtx1MvcaYBe88VnF52Cew6xwj/aBZZh3LhLBB5oR+YXNNwlpTl2tYE8VcxpSPXzhACbfE+mdqJmdUEtJvTCx9TerEJ9twABo0Xie6nFbDhbWOaYFlcang7NLtvBy7Vonsv1DXb5oBx0FY7IB02TilhD1FvsawOZXPVzgkMLb3Kk7V6gq9SoU216zi4V5Ncgc98xhJgzysife1pmt3mnwFGnX/T8CxlAQXoCScCPXlht2vAwyua+7HcfkoS3buAKLyJck6ohOWqW62GGg+pEK9nt+ZZ4MNDBNy7HB/xLlv+1SUxVuOna0XOk49gatW6d+JcOnjmVn41LU/P8Im4Nn7KEyVz/Ji+la8CCq42tXxSRAEwEfdwnsMvdv8BDSrZQWiy1tR1RxoDc7jZuWXAzWidNKSv+SeJUBcWWvj2tzDvzqJSWBEB4G1OOl2bFYwoUNOASj/UbWyAokTWBeMjrE18724YIPnxhE3S7ExcWKcHHVpGhs73ueX2U60/dDS5xXnxXH8YWY3Nw9m4FXQEdNhTZ0TLavNdKqkRZDwvwD/VJ2xs1/OxbSMlfezwl0Z46lFeaMirb7OtasVVdeZnIfWPw51jTjxp+DlU+s0StcaJ2+Odc7qMnAk/82wAhRtG8jj8be6A3zZUmByq2nVXSyve0lpslTPpybOO9dUk6Z6tV6ZsWH8W87QYuQmmqw1jBQ2v7ysrlw6jhMtuol0E67kT+OkLNRsBUyB5SonoTDTzK0ZeIBlMHBAw9sybUE4f/8yjUkMaDVv8/PrZJTZSrXV3yOtLzIisvFpi6h8FTYxClGo8OcU7TcNly8QS6cVtdUntbvy7iHLqQd7gxSVcey9s0dTikMfKo5pknPyxx7RqNuyjorKtVIt+a8EfNATfuRlivCmkPevtC6tjZYLRA4I76sb+CigTo1hg/MawbGsrkBL1wtgaunm4WRbFzVH9i3Ns+52TnKndRNiOKRlpdHlop2dARCep2v0UxgRZdyMdhshN7SOe/DAJBzdzJLVPe4H7wySnN4+glO0kYuio+XXhUgMa2rrrQNvXyboVx2tzs5H7h/cElzrmIR0s6nC40egAUILnpALKmnLtjFAwDk9DHLWjJ70+fK3SZU8gA/zXIGUlBfbjnf8T5cyJxOAw/fpSpKDd9RuveibEZzBTlwqI/nOqtnRQ9XBbOMM1TbSAcTs8Ryend1NSI1UTEy7pEUf+B8LuE2fW4rt4bExCoe77sTdpRAvWRN1RpKsJAjUltCaqu6MP0+kYRMIqPN4I8AytsD/plARrtASHEUx+lA5idkNvQp8UddLn8Womud5zZU7L/XDAAVtNLSjSrFK6cx/D3ldBDaEu3KOeE7a7vUPsRSr5nLp7Sb/c1NEJNR9cU6mVMYVKfOhTloKgcXACl7N+i5r6GY7xdAwtNDihgPUd5nrW4zXig//2s+akJY31GrIpz35k+jF7hBpSTnWU5DKPLSwO21yL1h70r+W9qZNhZmBxqUUipTZOcIAFT5wIGJuYn8tywyt/hf8l8hLurUqpXojb6jb2d76GuXOpW8Gp+TSlSm7o2+2s+PU2x3QXNVQGP9+9tVvhdpV6ApRp0Xp2XTPoHlQ4v9Z6Cg09M/G/mViUHsBn7EwDTepqTr7K63GZCx3mjm0KWi/yuXKdghqV4b+F0bu9q0+5l0PDQwoAlviTT/EAVopdotCPuNRbitW7nDgsasgSBfZLbtjrbUCBjETDg695n99R/irM1QeKKViN1Rc0vXQEyJE6Nr6+SqzkQC+Pq1rqjh8moliYPN5a76M+Iw+VPS3/kt5/Hel/6thdvNJ3S2M7UhE5IXZodCM0YDBQaTeTKZXYkh+szScOSWxX4gDdYe48lh6FCmVuZHN0cmVhbQplbmRvYmoKMTcgMCBvYmoKPDwKL1Byb2R1Y2VyIChwZGZUZVgtMS40MC4yMCkKL0F1dGhvcigpL1RpdGxlKCkvU3ViamVjdCgpL0NyZWF0b3IoTGFUZVggd2l0aCBoeXBlcnJlZikvS2V5d29yZHMoKQovQ3JlYXRpb25EYXRlIChEOjIwMjIwOTE3MjMxMjQwWikKL01vZERhdGUgKEQ6MjAyMjA5MTcyMzEyNDBaKQovVHJhcHBlZCAvRmFsc2UKL1BURVguRnVsbGJhbm5lciAoVGhpcyBpcyBwZGZUZVgsIFZlcnNpb24gMy4xNDE1OTI2NS0yLjYtMS40MC4yMCAoVGVYIExpdmUgMjAxOS9EZWJpYW4pIGtwYXRoc2VhIHZlcnNpb24gNi4zLjEpCj4+CmVuZG9iagoyIDAgb2JqCjw8Ci9UeXBlIC9PYmpTdG0KL04gMTMKL0ZpcnN0IDg2Ci9MZW5ndGggNzYxICAgICAgIAovRmlsdGVyIC9GbGF0ZURlY29kZQo+PgpzdHJlYW0KeNqNVFlP20AQfvevmEdQFe9l79oSQgLS0KpcAkppozy4zpJYcryR7Qj67zuzXkhS1KoPXu/OfHMfAjgoUAI0CMnBgNASEpA8BSFAphkIBQb5gkNuUsA3NxpyRMs8Egn+DTIRrVKOwvg3PDo6AnYH7NzdO2BjmCq0cgtsUvUzOD5GdsTuf60tsJtiYSN25preNn0HKeEidms7t2lL26EnnnBp51Vx6l5gypGghQSTy1mE4i3KoTeECoq35h6//0B3ZGx0BoanMdfQbOp69jek8kitTSzybB86QQ+BoppIygEJIYfdtK68sz1MMZLxBNi9fenBC02lMXEGyig8M1StIOU83IznBUSWxXk4CbHH8+jhTrz//eSODvPuTIyM5SsFi2Z4Rj5JT9UK/dAZjzXoVBIiS2LjcUqLWEAqCDFIa0xGLnTgB5qXDdqVJok0Jcqgn3DUKFy+mU+poqR6G2i4DYIp302BpyVJEqd7d8XpvkWEBA5UuU1HKEW6jx4QKhcYisq9vqEgO1wfwGynd6knxrYr22rdu3bokatihZyr85Px5cOHi8tbtyoawUe3drGpC8LUxQK7egCf+o4eJYrDSOaYlETg/OFAYWefdCV1ts5yHI9i/clWi2V4kk3ijUSOij73RV2VJ82itsAjdtfb1QNohD0GmUQJVLEsWmrUA1a61apgc2aZfSnrYsWWrGaOucaylj0fDp5NKtSGU7YzVkPMH5vSzatmgV5UT08Wp4+mdKpU0IbVGCxAkpNOLDQnY/hP2BLPjNUYomAOz4S1eObsebZvhDzASDY/e/8kIoZwWnTWj+G/0rtXElpdfn1MqrbrKQU4URG7KMIDbUfsWzXvlx0tOw99DZD23bvoaVt1tK426Aa69KWad2GHvIVAHYDEg7ErR3d90faHuFRpXxysUToWh7hpPZ5dVKuq/wP6CtruKNshRiTvnTkrsPJuEQ1ehR0YzIuwSIl16eaWfe3s9aavq4b8v17b5qTsK9eAeNX7G6u0eL0KZW5kc3RyZWFtCmVuZG9iagoxOCAwIG9iago8PAovVHlwZSAvWFJlZgovSW5kZXggWzAgMTldCi9TaXplIDE5Ci9XIFsxIDIgMV0KL1Jvb3QgMTYgMCBSCi9JbmZvIDE3IDAgUgovSUQgWzxEQ0I0QkQzQkFEMDZCQTdDN0FDOUNFQzM1ODQ5RjQwRT4gPERDQjRCRDNCQUQwNkJBN0M3QUM5Q0VDMzU4NDlGNDBFPl0KL0xlbmd0aCA2MyAgICAgICAgCi9GaWx0ZXIgL0ZsYXRlRGVjb2RlCj4+CnN0cmVhbQp42hXJSwqAMBRD0eT5rS24CRclCi7UQbfW3g7OJRBJLRTye9MwZuscOzBhR8KGxfrHt+JARvFzyV9VB6RABJ0KZW5kc3RyZWFtCmVuZG9iagpzdGFydHhyZWYKMjQyNTQKJSVFT0YK'}], 'jpcoar_mapping': {'file': {'URI': {'@value': 'url.url', '@attributes': {'label': 'url.label', 'objectType': 'url.fulltext'}}, 'date': {'@value': 'fileDate.fileDateValue', '@attributes': {'dateType': 'fileDate.fileDateType'}}, 'extent': {'@value': 'filesize.value'}, 'version': {'@value': 'version'}, 'mimeType': {'@value': 'format'}}}}, 'item_1617610673286': {'attribute_name': 'Rights Holder', 'attribute_value_mlt': [{'nameIdentifiers': [{'nameIdentifier': 'xxxxxx', 'nameIdentifierURI': 'https://orcid.org/', 'nameIdentifierScheme': 'ORCID'}], 'rightHolderNames': [{'rightHolderName': 'Right Holder Name', 'rightHolderLanguage': 'ja'}]}], 'jpcoar_mapping': {'rightsHolder': {'nameIdentifier': {'@value': 'nameIdentifiers.nameIdentifier', '@attributes': {'nameIdentifierURI': 'nameIdentifiers.nameIdentifierURI', 'nameIdentifierScheme': 'nameIdentifiers.nameIdentifierScheme'}}, 'rightsHolderName': {'@value': 'rightHolderNames.rightHolderName', '@attributes': {'xml:lang': 'rightHolderNames.rightHolderLanguage'}}}}}, 'item_1617620223087': {'attribute_name': 'Heading', 'attribute_value_mlt': [{'subitem_1565671149650': 'ja', 'subitem_1565671169640': 'Banner Headline', 'subitem_1565671178623': 'Subheading'}, {'subitem_1565671149650': 'en', 'subitem_1565671169640': 'Banner Headline', 'subitem_1565671178623': 'Subheding'}], 'jpcoar_mapping': ''}, 'item_1617944105607': {'attribute_name': 'Degree Grantor', 'attribute_value_mlt': [{'subitem_1551256015892': [{'subitem_1551256027296': 'xxxxxx', 'subitem_1551256029891': 'kakenhi'}], 'subitem_1551256037922': [{'subitem_1551256042287': 'Degree Grantor Name', 'subitem_1551256047619': 'en'}]}], 'jpcoar_mapping': {'degreeGrantor': {'nameIdentifier': {'@value': 'subitem_1551256015892.subitem_1551256027296', '@attributes': {'nameIdentifierScheme': 'subitem_1551256015892.subitem_1551256029891'}}, 'degreeGrantorName': {'@value': 'subitem_1551256037922.subitem_1551256042287', '@attributes': {'xml:lang': 'subitem_1551256037922.subitem_1551256047619'}}}}}, 'relation_version_is_last': True, '_files': [{'bucket': '18fbd2e3-488b-4a21-8ab5-3beab8059db4', 'checksum': 'sha256:da6b42cf277e20282fda7d4e3af7434fc1a2c5f4148057770b3c45cb9a24cf88', 'key': 'helloworld.pdf', 'size': 24567, 'version_id': '9e4d7b8c-c633-49bc-b135-d127176fbece'}]}
@@ -69,6 +69,16 @@ WEKO_SCHEMA_UI_RESPONSE_MESSAGES = {}
 WEKO_SCHEMA_CACHE_PREFIX = 'cache_{schema_name}'
 """ cache items prifix info"""
 
+WEKO_SCHEMA_UI_CONTEXT_CACHE_SIZE = 0
+"""Number of schema contexts held by each worker, 0 disables them.
+
+A schema context is the schema and the mapping of an item type compiled once
+for SchemaTree. It is rebuilt when a schema, an item type or a mapping is
+changed."""
+
+WEKO_SCHEMA_UI_CONTEXT_VERSION_KEY = 'schema_context_version'
+"""Redis key of the schema context version."""
+
 # WEKO_SCHEMA_UI_FORMAT_EDIT = 'weko_schema_ui/edit.html'
 # WEKO_SCHEMA_UI_FORMAT_EDIT_API = '/api/schemas/'
 # """URL of search endpoint for schemas."""
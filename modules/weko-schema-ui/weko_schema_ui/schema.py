@@ -22,17 +22,22 @@
 
 import copy
 import json
-from collections import Iterable, OrderedDict
+import pickle
+import threading
+from collections import Iterable, OrderedDict, namedtuple
 from functools import partial
+from itertools import chain
 
 import redis
 from redis import sentinel
 import xmlschema
-from flask import abort, current_app, request, url_for
+from flask import abort, current_app, g, has_app_context, request, url_for
+from invenio_db import db
 from lxml import etree
 from lxml.builder import ElementMaker
 from simplekv.memory.redisstore import RedisStore
 from weko_records.api import ItemLink, Mapping, ItemTypes
+from weko_records.models import ItemType, ItemTypeMapping
 from weko_redis import RedisConnection
 from xmlschema.validators import XsdAnyAttribute, XsdAnyElement, \
     XsdAtomicBuiltin, XsdAtomicRestriction, XsdEnumerationFacet, XsdGroup, \
@@ -234,6 +239,8 @@ class SchemaTree:
         self._record = record["metadata"] \
             if record and record.get("metadata") else None
         self._schema_name = schema_name if schema_name else None
+        self._context = None
+        self._element_list = None
         if self._record:
             self._root_name, self._ns, self._schema_obj, self._item_type_id = \
                 self.get_mapping_data()
@@ -247,12 +254,23 @@ class SchemaTree:
         self._separate_nodes = None
         self._location = ''
         self._target_namespace = ''
-        schemas = WekoSchema.get_all()
         self._item_type = None
+        self._item_type_schema = None
+        if self._context:
+            self._location = self._context.location
+            self._target_namespace = self._context.target_namespace
+            self._ignore_list_all = self._context.ignore_list_all
+            self._ignore_list = self._context.ignore_list
+            self._item_type_schema = self._context.item_type_schema
+            self._element_list = self._context.element_list
+            return
+        schemas = WekoSchema.get_all()
         if self._record and self._item_type_id:
             self._ignore_list_all, self._ignore_list = \
                 self.get_ignore_item_from_option()
             self._item_type = ItemTypes.get_by_id(self._item_type_id)
+            if self._item_type:
+                self._item_type_schema = self._item_type.schema
         if isinstance(schemas, list):
             for schema in schemas:
                 if isinstance(schema, OAIServerSchema) and self._schema_name == schema.schema_name:
@@ -261,23 +279,7 @@ class SchemaTree:
 
     def get_ignore_item_from_option(self):
         """Get all keys of properties that is enable Hide option in metadata."""
-        ignore_list_parents = []
-        ignore_list_all = []
-        ignore_dict_all = {}
-        from weko_records.utils import get_options_and_order_list
-        ignore_list_all, meta_options = \
-            get_options_and_order_list(self._item_type_id)
-        if isinstance(meta_options, dict):
-            for key, val in meta_options.items():
-                hidden = val.get('option', {}).get('hidden', False)
-                if hidden:
-                    ignore_list_parents.append(key)
-        for element_info in ignore_list_all:
-            if len(element_info) >= 4:
-                element_info[0] = element_info[0].replace("[]", "")
-                # only get hide option
-                ignore_dict_all[element_info[0]] = element_info[3].get("hide", False)
-        return ignore_dict_all, ignore_list_parents
+        return get_ignore_item_from_option(self._item_type_id)
 
     def get_mapping_data(self):
         """
@@ -286,6 +288,24 @@ class SchemaTree:
         :return: root name, namespace and schema
 
         """
+        if isinstance(self._record, dict):
+            self._context = get_schema_context(
+                self._schema_name, self._record.get("item_type_id"))
+        if self._context:
+            _id = self._record.pop("item_type_id")
+            self._record.pop("_buckets", {})
+            self._record.pop("_deposit", {})
+            self.item_type_mapping = self._context.mapping
+            # inject mappings info to record
+            for k, v in pickle.loads(self._context.record_mapping).items():
+                if k in self._record:
+                    self._record[k].update({self._schema_name: v})
+                else:
+                    self._record[k] = {self._schema_name: v}
+            return self._context.root_name, \
+                OrderedDict(self._context.namespaces), \
+                self._context.schema, _id
+
         # Get Schema info
         rec = cache_schema(self._schema_name)
 
@@ -647,9 +667,9 @@ class SchemaTree:
             while is_next:
                 cnt = 0
                 ava = ""
-                for g in glst:
+                for gen in glst:
                     try:
-                        _eval, _ = next(g)
+                        _eval, _ = next(gen)
                         ava = ava + exp + _eval
                     except StopIteration:
                         cnt += 1
@@ -1047,8 +1067,8 @@ class SchemaTree:
                     else:
                         # current_app.logger.error(item_type.schema["properties"][key_item_parent])
                         atr_name = ""
-                        if self._item_type and self._item_type.schema and "title" in self._item_type.schema.get("properties", {}).get(key_item_parent, {}):
-                             atr_name = self._item_type.schema["properties"][key_item_parent]["title"]
+                        if self._item_type_schema and "title" in self._item_type_schema.get("properties", {}).get(key_item_parent, {}):
+                             atr_name = self._item_type_schema["properties"][key_item_parent]["title"]
                         vlst_child = get_mapping_value(mpdic, {},
                                                            key_item_parent,
                                                            atr_name)
@@ -1739,34 +1759,9 @@ class SchemaTree:
 
     def to_list(self):
         """Get a elementName List."""
-        elst = []
-        klst = []
-
-        def get_element(str):
-            return str.split(":")[-1] if ":" in str else str
-
-        def get_key_list(nodes):
-            # if no child
-            if len(nodes.keys()) == 1:
-                _str = ""
-                for lst in klst:
-                    _str = _str + "." + get_element(lst)
-                elst.append(_str[1:])
-
-                klst.pop(-1)
-                return
-
-            for k, v in nodes.items():
-                if k != "type" and isinstance(v, dict):
-                    klst.append(k)
-                    get_key_list(v)
-
-            if len(klst) > 0:
-                klst.pop(-1)
-
-        get_key_list(self._schema_obj)
-
-        return elst
+        if self._element_list is None:
+            self._element_list = get_element_list(self._schema_obj)
+        return list(self._element_list)
 
     # def get_node(self, dc, key=None):
     #     """
@@ -1883,6 +1878,230 @@ class SchemaTree:
         # end
 
 
+def get_ignore_item_from_option(item_type_id):
+    """Get all keys of properties that is enable Hide option in metadata.
+
+    :param item_type_id: Item type id.
+    :return: Hide options of all keys and the list of hidden properties.
+    """
+    ignore_list_parents = []
+    ignore_list_all = []
+    ignore_dict_all = {}
+    from weko_records.utils import get_options_and_order_list
+    ignore_list_all, meta_options = \
+        get_options_and_order_list(item_type_id)
+    if isinstance(meta_options, dict):
+        for key, val in meta_options.items():
+            hidden = val.get('option', {}).get('hidden', False)
+            if hidden:
+                ignore_list_parents.append(key)
+    for element_info in ignore_list_all:
+        if len(element_info) >= 4:
+            element_info[0] = element_info[0].replace("[]", "")
+            # only get hide option
+            ignore_dict_all[element_info[0]] = element_info[3].get("hide", False)
+    return ignore_dict_all, ignore_list_parents
+
+
+def get_element_list(schema):
+    """Get the element name paths of the leaves of a schema.
+
+    :param schema: Schema.
+    :return: The list of paths.
+    """
+    elst = []
+    klst = []
+
+    def get_element(str):
+        return str.split(":")[-1] if ":" in str else str
+
+    def get_key_list(nodes):
+        # if no child
+        if len(nodes.keys()) == 1:
+            _str = ""
+            for lst in klst:
+                _str = _str + "." + get_element(lst)
+            elst.append(_str[1:])
+
+            klst.pop(-1)
+            return
+
+        for k, v in nodes.items():
+            if k != "type" and isinstance(v, dict):
+                klst.append(k)
+                get_key_list(v)
+
+        if len(klst) > 0:
+            klst.pop(-1)
+
+    get_key_list(schema)
+
+    return elst
+
+
+class SchemaContext(namedtuple('SchemaContext', [
+        'root_name', 'namespaces', 'schema', 'location', 'target_namespace',
+        'element_list', 'mapping', 'record_mapping', 'ignore_list_all',
+        'ignore_list', 'item_type_schema'])):
+    """Schema and mapping of an item type compiled for SchemaTree.
+
+    A context is shared by the schema trees of this worker, so it must not be
+    modified. ``record_mapping`` is pickled and loaded for each record.
+    """
+
+
+_schema_contexts = OrderedDict()
+"""Schema contexts of this worker: (schema name, item type id) -> (version,
+context)."""
+
+_schema_contexts_lock = threading.Lock()
+
+
+def __get_schema_context_version_store():
+    """Get the Redis connection holding the schema context version."""
+    return RedisConnection().connection(
+        db=current_app.config['CACHE_REDIS_DB'], kv=False)
+
+
+def get_schema_context_version():
+    """Get the schema context version.
+
+    The version is read from Redis once per application context.
+
+    :return: The version, or None if it can not be read.
+    """
+    if 'weko_schema_context_version' not in g:
+        try:
+            version = __get_schema_context_version_store().get(
+                current_app.config['WEKO_SCHEMA_UI_CONTEXT_VERSION_KEY'])
+            g.weko_schema_context_version = int(version or 0)
+        except Exception as ex:
+            current_app.logger.error(ex)
+            g.weko_schema_context_version = None
+    return g.weko_schema_context_version
+
+
+def update_schema_context_version():
+    """Increment the schema context version.
+
+    :return: The new version, or None if it can not be updated.
+    """
+    with _schema_contexts_lock:
+        _schema_contexts.clear()
+    try:
+        version = __get_schema_context_version_store().incr(
+            current_app.config['WEKO_SCHEMA_UI_CONTEXT_VERSION_KEY'])
+    except Exception as ex:
+        current_app.logger.error(ex)
+        version = None
+    g.weko_schema_context_version = version
+    return version
+
+
+@db.event.listens_for(db.session, 'after_flush')
+def _after_flush_schema_context(session, flush_context):
+    """Remember the changes of schemas, item types and mappings."""
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if isinstance(obj, (OAIServerSchema, ItemType, ItemTypeMapping)):
+            session.info['weko_schema_context_updated'] = True
+            break
+
+
+@db.event.listens_for(db.session, 'after_commit')
+def _after_commit_schema_context(session):
+    """Update the schema context version after a change is committed."""
+    if session.info.pop('weko_schema_context_updated', False) \
+            and has_app_context() \
+            and current_app.config.get('WEKO_SCHEMA_UI_CONTEXT_CACHE_SIZE'):
+        update_schema_context_version()
+
+
+@db.event.listens_for(db.session, 'after_rollback')
+def _after_rollback_schema_context(session):
+    """Forget the changes of a rolled back session."""
+    session.info.pop('weko_schema_context_updated', None)
+
+
+def build_schema_context(schema_name, item_type_id):
+    """Build the schema context of an item type.
+
+    :param schema_name: Schema name.
+    :param item_type_id: Item type id.
+    :return: The context, or None if the schema does not exist.
+    """
+    rec = cache_schema(schema_name)
+    if not rec:
+        return None
+
+    mapping = Mapping.get_record(item_type_id)
+    mapping = mapping.dumps() if isinstance(mapping, Mapping) else {}
+    record_mapping = {k: v.get(schema_name) for k, v in mapping.items()
+                      if isinstance(v, dict)}
+
+    location = ''
+    target_namespace = ''
+    schemas = WekoSchema.get_all()
+    if isinstance(schemas, list):
+        for schema in schemas:
+            if isinstance(schema, OAIServerSchema) \
+                    and schema_name == schema.schema_name:
+                location = schema.schema_location
+                target_namespace = schema.target_namespace
+
+    ignore_list_all, ignore_list = get_ignore_item_from_option(item_type_id)
+    item_type = ItemTypes.get_by_id(item_type_id)
+    item_type_schema = copy.deepcopy(item_type.schema) \
+        if item_type else None
+
+    return SchemaContext(
+        root_name=rec.get('root_name'),
+        namespaces=rec.get('namespaces'),
+        schema=rec.get('schema'),
+        location=location,
+        target_namespace=target_namespace,
+        element_list=tuple(get_element_list(rec.get('schema') or {})),
+        mapping=mapping,
+        record_mapping=pickle.dumps(record_mapping, -1),
+        ignore_list_all=ignore_list_all,
+        ignore_list=ignore_list,
+        item_type_schema=item_type_schema)
+
+
+def get_schema_context(schema_name, item_type_id):
+    """Get the schema context of an item type held by this worker.
+
+    The context is rebuilt when a schema, an item type or a mapping has been
+    changed since it was built.
+
+    :param schema_name: Schema name.
+    :param item_type_id: Item type id.
+    :return: The context, or None if it is disabled or can not be built.
+    """
+    size = current_app.config.get('WEKO_SCHEMA_UI_CONTEXT_CACHE_SIZE')
+    if not size or not schema_name or not item_type_id:
+        return None
+    version = get_schema_context_version()
+    if version is None:
+        return None
+
+    key = (schema_name, str(item_type_id))
+    with _schema_contexts_lock:
+        cached = _schema_contexts.get(key)
+        if cached is not None and cached[0] == version:
+            _schema_contexts.move_to_end(key)
+            return cached[1]
+
+    context = build_schema_context(schema_name, item_type_id)
+    if context is None:
+        return None
+    with _schema_contexts_lock:
+        _schema_contexts[key] = (version, context)
+        _schema_contexts.move_to_end(key)
+        while len(_schema_contexts) > size:
+            _schema_contexts.popitem(last=False)
+    return context
+
+
 def cache_schema(schema_name, delete=False):
     """
     Cache the schema to Redis.
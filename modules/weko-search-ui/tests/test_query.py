@@ -13,6 +13,8 @@ from weko_search_ui.config import WEKO_SEARCH_KEYWORDS_DICT, WEKO_SEARCH_TYPE_DI
 from weko_search_ui.query import (
     get_item_type_aggs,
     get_permission_filter,
+    get_permission_paths_query,
+    PERMISSION_LOOKUP_MAPPING,
     default_search_factory,
     item_path_search_factory,
     check_permission_user,
@@ -28,6 +30,63 @@ def test_get_item_type_aggs(i18n_app, users, client_request_args, db_records2, r
         assert not get_item_type_aggs("test-weko")
 
 
+# def get_permission_paths_query(index_ids):
+# .tox/c1/bin/pytest --cov=weko_search_ui tests/test_query.py::test_get_permission_paths_query -vv -s --cov-branch --cov-report=xml --basetemp=/code/modules/weko-search-ui/.tox/c1/tmp
+def test_get_permission_paths_query(i18n_app):
+    from weko_search_ui.query import _permission_lookup_ids
+    _permission_lookup_ids.clear()
+    # terms lookup is disabled
+    assert get_permission_paths_query(["33", "44"]) == Terms(path=["33", "44"])
+
+    i18n_app.config["WEKO_SEARCH_UI_PERMISSION_TERMS_LOOKUP"] = True
+    try:
+        lookup_index = i18n_app.config["WEKO_SEARCH_UI_PERMISSION_TERMS_LOOKUP_INDEX"]
+        assert get_permission_paths_query([]) == Terms(path=[])
+
+        # the lookup document is written once
+        with patch("weko_search_ui.query.current_search_client") as mock_client:
+            mock_client.exists.return_value = False
+            mock_client.indices.exists.return_value = False
+            res = get_permission_paths_query(["33", "44"])
+            lookup_id = res.path["id"]
+            assert res == Terms(path={"index": lookup_index, "type": "_doc",
+                                      "id": lookup_id, "path": "path"})
+            assert get_permission_paths_query(["44", "33"]) == res
+            mock_client.indices.create.assert_called_once_with(
+                index=lookup_index, body=PERMISSION_LOOKUP_MAPPING, ignore=400)
+            mock_client.index.assert_called_once_with(
+                index=lookup_index, doc_type="_doc", id=lookup_id,
+                body={"path": ["33", "44"]})
+
+        # the document is checked again after the ttl
+        with patch("weko_search_ui.query.current_search_client") as mock_client, \
+                patch("weko_search_ui.query.time.time",
+                      return_value=_permission_lookup_ids[lookup_id] + 300):
+            mock_client.exists.return_value = True
+            assert get_permission_paths_query(["33", "44"]) == res
+            mock_client.exists.assert_called_once_with(
+                index=lookup_index, doc_type="_doc", id=lookup_id)
+            mock_client.index.assert_not_called()
+
+        # a deleted document is written again
+        _permission_lookup_ids.clear()
+        with patch("weko_search_ui.query.current_search_client") as mock_client:
+            mock_client.exists.return_value = False
+            mock_client.indices.exists.return_value = True
+            assert get_permission_paths_query(["33", "44"]) == res
+            mock_client.indices.create.assert_not_called()
+            mock_client.index.assert_called_once()
+
+        # the index ids are sent when the document can not be written
+        with patch("weko_search_ui.query.current_search_client") as mock_client:
+            mock_client.exists.return_value = False
+            mock_client.index.side_effect = Exception("test_error")
+            assert get_permission_paths_query(["55"]) == Terms(path=["55"])
+    finally:
+        i18n_app.config["WEKO_SEARCH_UI_PERMISSION_TERMS_LOOKUP"] = False
+        _permission_lookup_ids.clear()
+
+
 # def get_permission_filter(index_id: str = None):
 # .tox/c1/bin/pytest --cov=weko_search_ui tests/test_query.py::test_get_permission_filter -vv -s --cov-branch --cov-report=xml --basetemp=/code/modules/weko-search-ui/.tox/c1/tmp
 class MockSearchPerm:
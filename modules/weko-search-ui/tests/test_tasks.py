@@ -13,6 +13,8 @@ from weko_search_ui.tasks import (
     check_import_items_task,
     check_rocrate_import_items_task,
     import_item,
+    import_items_chunk,
+    get_import_chunks_summary,
     remove_temp_dir_task,
     export_all_task,
     write_files_task,
@@ -187,6 +189,66 @@ def test_import_item(i18n_app, users, mocker):
             res = import_item({"item"}, "request_info")
             assert res == None
 
+# def import_items_chunk(items, request_info, chunk_no):
+# .tox/c1/bin/pytest --cov=weko_search_ui tests/test_tasks.py::test_import_items_chunk -vv -s --cov-branch --cov-report=term --basetemp=/code/modules/weko-search-ui/.tox/c1/tmp
+def test_import_items_chunk(i18n_app, users, mocker):
+    mock_datetime = mocker.patch("weko_search_ui.tasks.datetime")
+    mock_datetime.now.return_value = datetime(2025, 1, 1, 12, 00, 00)
+    items = [{"id": "1"}, {"id": "2"}, {"id": "3"}]
+    results = [
+        {"success": True, "recid": "1"},
+        {"success": False, "recid": "2", "error_id": None},
+        {"success": True, "recid": "3"},
+    ]
+    with patch("weko_search_ui.tasks.import_items_chunk_to_system", return_value=results):
+        res = import_items_chunk(items, "request_info", 2)
+        assert res == {
+            "chunk": 2,
+            "start_date": "2025-01-01 12:00:00",
+            "end_date": "2025-01-01 12:00:00",
+            "results": results,
+            "success": 2,
+            "failure": 1,
+        }
+    with patch("weko_search_ui.tasks.import_items_chunk_to_system", side_effect=Exception("test error")):
+        res = import_items_chunk(items, "request_info", 1)
+        assert res["success"] == 0
+        assert res["failure"] == 3
+        assert [r["recid"] for r in res["results"]] == ["1", "2", "3"]
+
+
+# def get_import_chunks_summary(task_ids):
+# .tox/c1/bin/pytest --cov=weko_search_ui tests/test_tasks.py::test_get_import_chunks_summary -vv -s --cov-branch --cov-report=term --basetemp=/code/modules/weko-search-ui/.tox/c1/tmp
+def test_get_import_chunks_summary(i18n_app, mocker):
+    class MockAsyncResult:
+        def __init__(self, task_id):
+            self.task_id = task_id
+            self.status = {"t1": "SUCCESS", "t2": "FAILURE", "t3": "STARTED"}[task_id]
+            self.result = {
+                "chunk": 1, "start_date": "s", "end_date": "e",
+                "results": [], "success": 9, "failure": 1
+            } if task_id == "t1" else None
+        def successful(self):
+            return self.status == "SUCCESS"
+        def failed(self):
+            return self.status == "FAILURE"
+
+    mocker.patch("weko_search_ui.tasks.import_items_chunk.AsyncResult", side_effect=MockAsyncResult)
+    res = get_import_chunks_summary(["t1", "t2"])
+    assert res == {
+        "status": "done",
+        "chunks": [
+            {"task_id": "t1", "task_status": "SUCCESS", "chunk": 1,
+             "start_date": "s", "end_date": "e", "success": 9, "failure": 1},
+            {"task_id": "t2", "task_status": "FAILURE"},
+        ],
+        "success": 9,
+        "failure": 1,
+    }
+    res = get_import_chunks_summary(["t1", "t3"])
+    assert res["status"] == "doing"
+
+
 # def remove_temp_dir_task(path):
 def test_remove_temp_dir_task(i18n_app, users, indices):
     current_path = os.path.dirname(os.path.abspath(__file__))
@@ -54,6 +54,7 @@ from weko_search_ui.config import (
 )
 from weko_search_ui.utils import (
     DefaultOrderedDict,
+    ImportCheckLookup,
     cancel_export_all,
     check_jsonld_import_items,
     check_tsv_import_items,
@@ -76,6 +77,9 @@ from weko_search_ui.utils import (
     delete_records,
     execute_search_with_pagination,
     export_all,
+    get_export_checkpoint,
+    get_export_throughput,
+    get_record_id_pages,
     get_retry_info,
     generate_metadata_from_jpcoar,
     get_change_identifier_mode_content,
@@ -174,7 +178,9 @@ from weko_search_ui.utils import (
     search_results_to_tsv,
     create_tsv_row,
     get_priority,
-    get_record_ids
+    get_record_ids,
+    get_all_record_id,
+    import_items_chunk_to_system
 )
 
 
@@ -1455,6 +1461,56 @@ def test_send_item_created_event_to_es(
     send_item_created_event_to_es(item, request_info)
 
 
+# def import_items_chunk_to_system(items, request_info=None):
+# .tox/c1/bin/pytest --cov=weko_search_ui tests/test_utils.py::test_import_items_chunk_to_system -vv -s --cov-branch --cov-report=term --basetemp=/code/modules/weko-search-ui/.tox/c1/tmp
+def test_import_items_chunk_to_system(i18n_app, db, mocker):
+    from elasticsearch import ElasticsearchException
+    from weko_deposit.api import WekoIndexer
+
+    def _import(item, request_info):
+        indexer = WekoIndexer()
+        indexer.get_es_index()
+        indexer.upload_metadata({"title": item["id"]}, "uuid" + item["id"], 1)
+        if item["id"] == "2":
+            return {"success": False, "error_id": "test_error"}
+        if item["id"] == "3":
+            raise Exception("test_error")
+        try:
+            db.session.commit()
+        except ElasticsearchException:
+            db.session.rollback()
+            return {"success": False, "error_id": "failed_to_update_elasticsearch"}
+        indexer.upload_metadata({"title": item["id"]}, "after" + item["id"], 1)
+        return {"success": True, "recid": item["id"]}
+
+    batches = []
+    def _bulk_upload(self, actions, chunk_size=500):
+        batches.append([action["_id"] for action in actions])
+        errors = [{"index": {"_id": action["_id"], "status": 400}}
+                  for action in actions if action["_id"] in ("uuid4", "after5")]
+        return len(actions) - len(errors), errors
+
+    mocker.patch("weko_search_ui.utils.import_items_to_system", side_effect=_import)
+    mocker.patch.object(WekoIndexer, "bulk_upload", _bulk_upload)
+    items = [{"id": "1"}, {"id": "2"}, {"id": "3"}, {"id": "4"}, {"id": "5"}]
+    res = import_items_chunk_to_system(items, {"user_id": 1})
+    # the writes of an item are sent before its commit, the rest after it
+    assert batches == [["uuid1"], ["after1"], ["uuid4"], ["uuid5"], ["after5"]]
+    assert res == [
+        {"success": True, "recid": "1"},
+        {"success": False, "recid": "2", "error_id": "test_error"},
+        {"success": False, "recid": "3", "error_id": None},
+        {"success": False, "recid": "4", "error_id": "failed_to_update_elasticsearch"},
+        {"success": True, "recid": "5", "warnings": ["failed_to_update_elasticsearch"]},
+    ]
+
+    # elasticsearch is not available
+    from elasticsearch.exceptions import ConnectionError as ESConnectionError
+    mocker.patch.object(WekoIndexer, "bulk_upload", side_effect=ESConnectionError("test_error"))
+    res = import_items_chunk_to_system([{"id": "1"}], {"user_id": 1})
+    assert res == [{"success": False, "recid": "1", "error_id": "failed_to_update_elasticsearch"}]
+
+
 # def import_items_to_system(item: dict, request_info=None, is_gakuninrdm=False): ERROR = TypeError: handle_remove_es_metadata() missing 2 required positional arguments: 'bef_metadata' and 'bef_las...
 # .tox/c1/bin/pytest --cov=weko_search_ui tests/test_utils.py::test_import_items_to_system -vv -s --cov-branch --cov-report=term --basetemp=/code/modules/weko-search-ui/.tox/c1/tmp
 def test_import_items_to_system(i18n_app, db, es_item_file_pipeline, es_records, app, mocker):
@@ -1583,6 +1639,7 @@ def test_import_items_to_activity(i18n_app, es_item_file_pipeline, es_records, d
         user_id=request_info["user_id"],
         workflow_id=request_info["workflow_id"],
         item_id=item["id"],
+        new_activity_id=None,
         index=item["metadata"]["path"],
         metadata=item["metadata"],
         files=[tempfile.gettempdir()+"/hello.txt"],
@@ -4000,6 +4057,89 @@ def test_export_all(db_activity, i18n_app, users, item_type, db_records2, redis_
                     assert json.loads(datastore.get(file_key).decode()).get("cancel_flg")==True
                     assert datastore.get(msg_key).decode() == "Export failed."
 
+# def export_all(root_url, user_id, data, start_time):
+# .tox/c1/bin/pytest --cov=weko_search_ui tests/test_utils.py::test_export_all_streaming -vv -s --cov-branch --cov-report=term --basetemp=/code/modules/weko-search-ui/.tox/c1/tmp
+def test_export_all_streaming(db_activity, i18n_app, users, item_type, db_records2, redis_connect, db, create_export_all_data, mocker, tmpdir):
+    i18n_app.config["WEKO_ADMIN_CACHE_PREFIX"] = "test_admin_cache_{name}_{user_id}"
+    i18n_app.config["WEKO_SEARCH_UI_BULK_EXPORT_STREAMING"] = True
+    i18n_app.config["WEKO_SEARCH_UI_BULK_EXPORT_LIMIT"] = 50
+    i18n_app.config["WEKO_SEARCH_UI_BULK_EXPORT_PAGE_SIZE"] = 20
+    user_id = users[3]["obj"].id
+    data = {"item_type_id": "1", "item_id_range": ""}
+    start_time_str = '2024/05/21 23:44:12'
+    file_key = i18n_app.config["WEKO_ADMIN_CACHE_PREFIX"].format(
+        name="RUN_MSG_EXPORT_ALL_FILE_CREATE", user_id=user_id
+    )
+    expected = get_record_ids(get_all_record_id("", "1", "1"))
+    assert len(expected) > 100
+
+    written = []
+    def _write_files(item_datas, export_path, user_id, retrys):
+        assert len(item_datas["data"]) == len(item_datas["recids"])
+        written.append((item_datas["name"], item_datas["recids"]))
+        # the second part fails
+        return len(written) != 2
+
+    mocker.patch("weko_search_ui.utils.write_files", side_effect=_write_files)
+    with patch("weko_search_ui.utils.os.getenv", return_value=str(tmpdir)):
+        export_all("/", user_id, data, start_time_str)
+        checkpoint = get_export_checkpoint(user_id)
+        assert checkpoint["finished"] == ["1.1"]
+        assert checkpoint["exported"] == 50
+        assert checkpoint["item_types"]["1"]["part"] == 2
+        assert os.path.isdir(checkpoint["export_path"])
+        file_json = json.loads(redis_connect.get(file_key).decode())
+        assert file_json["write_file_status"] == {"1.1": "finished", "1.2": "error"}
+        assert file_json["cancel_flg"] == True
+
+        # the export resumes from the second part
+        export_all("/", user_id, data, start_time_str)
+        assert written[2][0] == written[1][0]
+        assert written[2][1] == written[1][1]
+        assert written[0][0].endswith(".part1")
+        assert written[-1][0].endswith(".part{}".format(len(written) - 1))
+        exported = [recid for _, recids in written[:1] + written[2:] for recid in recids]
+        assert sorted(exported) == sorted(recid for recid, _ in expected)
+        assert get_export_checkpoint(user_id) is None
+        file_json = json.loads(redis_connect.get(file_key).decode())
+        assert set(file_json["write_file_status"].values()) == {"finished"}
+        assert file_json["exported_count"] == len(expected)
+        assert file_json["resumed_count"] == 50
+        assert get_export_throughput(file_json) > 0
+
+        # other conditions discard the checkpoint of an interrupted export
+        written.clear()
+        export_all("/", user_id, data, start_time_str)
+        old_path = get_export_checkpoint(user_id)["export_path"]
+        export_all("/", user_id, {"item_type_id": "1", "item_id_range": "1-1000"}, start_time_str)
+        assert not os.path.isdir(old_path)
+        assert get_export_checkpoint(user_id) is None
+
+
+# def get_record_id_pages(item_type_id, fromid="", toid="", after_key=None, page_size=None):
+# .tox/c1/bin/pytest --cov=weko_search_ui tests/test_utils.py::test_get_record_id_pages -vv -s --cov-branch --cov-report=term --basetemp=/code/modules/weko-search-ui/.tox/c1/tmp
+def test_get_record_id_pages(i18n_app, db_records2, create_export_all_data):
+    expected = get_record_ids(get_all_record_id("1050", "1", "1"))
+    pages = list(get_record_id_pages("1", "1", "1050", page_size=7))
+    assert all(len(page) == 7 for page in pages[:-1])
+    rows = [row for page in pages for row in page]
+    assert get_record_ids(rows) == expected
+
+    after_key = rows[9].pid_value
+    resumed = [row for page in get_record_id_pages("1", "1", "1050", after_key=after_key) for row in page]
+    assert resumed == rows[10:]
+
+
+# def get_export_throughput(write_file_data):
+# .tox/c1/bin/pytest --cov=weko_search_ui tests/test_utils.py::test_get_export_throughput -vv -s --cov-branch --cov-report=term --basetemp=/code/modules/weko-search-ui/.tox/c1/tmp
+def test_get_export_throughput():
+    assert get_export_throughput({}) is None
+    data = {"run_started": 100.0, "run_finished": 130.0, "exported_count": 300, "resumed_count": 100}
+    assert get_export_throughput(data) == 400.0
+    data["run_finished"] = 100.0
+    assert get_export_throughput(data) is None
+
+
 def test_get_retry_info():
     # Test case 1: When item_type_id is included in retry_info
     item_type_id = "1"
@@ -6125,3 +6265,62 @@ class TestHandleCheckAuthorsAffiliation:
         handle_check_authors_affiliation(list_record)
 
         assert "errors" not in list_record[0]
+
+
+# class ImportCheckLookup(object):
+# .tox/c1/bin/pytest --cov=weko_search_ui tests/test_utils.py::test_ImportCheckLookup -vv -s --cov-branch --cov-report=term --basetemp=/code/modules/weko-search-ui/.tox/c1/tmp
+def test_ImportCheckLookup(app, doi_records, mocker):
+    list_record = [
+        {"id": "1", "uri": "http://TEST_SERVER/records/1",
+         "metadata": {"path": ["1", "2"]}},
+        {"id": "2", "link_data": [
+            {"item_id": "http://TEST_SERVER/records/3", "sele_id": "isSupplementTo"}
+        ]},
+        {"id": "1000"},
+        {"id": None},
+    ]
+    lookup = ImportCheckLookup(list_record)
+
+    # record and identifiers are the same as WekoRecord
+    for item_id in ["1", "2", "3"]:
+        record = WekoRecord.get_record_by_pid(item_id)
+        assert lookup.get_record(item_id).pid == record.pid
+        assert lookup.get_record(item_id).get("recid") == record.get("recid")
+        assert lookup.get_identifier(item_id, "doi") == record.pid_doi
+        assert lookup.get_identifier(item_id, "hdl") == record.pid_cnri
+    with pytest.raises(PIDDoesNotExistError):
+        lookup.get_record("1000")
+    with pytest.raises(PIDDoesNotExistError):
+        lookup.get_identifier("1000", "doi")
+
+    # collected values do not query again
+    mock_get_record = mocker.patch("weko_search_ui.utils.WekoRecord.get_record_by_pid")
+    mock_path_list = mocker.patch("weko_index_tree.api.Indexes.get_path_list")
+    lookup.get_record("1")
+    lookup.get_identifier("2", "doi")
+    lookup.get_path_list("1")
+    mock_get_record.assert_not_called()
+    mock_path_list.assert_not_called()
+
+    # values which are not collected are resolved per item
+    lookup.get_path_list("3")
+    mock_path_list.assert_called_once_with(["3"])
+
+
+# .tox/c1/bin/pytest --cov=weko_search_ui tests/test_utils.py::test_handle_check_exist_record_with_lookup -vv -s --cov-branch --cov-report=term --basetemp=/code/modules/weko-search-ui/.tox/c1/tmp
+def test_handle_check_exist_record_with_lookup(app, doi_records):
+    list_record = [
+        {
+            "id": str(i % 10 + 1),
+            "uri": "http://TEST_SERVER/records/{}".format(i % 10 + 1),
+            "edit_mode": "Keep",
+            "link_data": [
+                {"item_id": "http://TEST_SERVER/records/1", "sele_id": "isSupplementTo"}
+            ],
+        } for i in range(20)
+    ]
+    with app.test_request_context():
+        expected = handle_check_exist_record(copy.deepcopy(list_record))
+        lookup = ImportCheckLookup(list_record)
+        result = handle_check_exist_record(copy.deepcopy(list_record), lookup)
+    assert result == expected
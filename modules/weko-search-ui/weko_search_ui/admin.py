@@ -76,7 +76,9 @@ from .tasks import (
     check_import_items_task,
     check_rocrate_import_items_task,
     export_all_task,
+    get_import_chunks_summary,
     import_item,
+    import_items_chunk,
     is_import_running,
     remove_temp_dir_task,
 )
@@ -495,6 +497,8 @@ class ItemImportView(BaseView):
         UserActivityLogger.info(operation="ITEM_IMPORT")
         if list_record:
             group_tasks = []
+            chunked = current_app.config.get("WEKO_SEARCH_UI_IMPORT_CHUNKED", False)
+            prepared_items = []
             UserActivityLogger.info(operation="ITEM_BULK_CREATE")
             for idx, item in enumerate(list_record):
                 try:
@@ -504,7 +508,10 @@ class ItemImportView(BaseView):
                     if (list_doi[idx]):
                         metadata_doi = handle_metadata_by_doi(item, list_doi[idx])
                         item["metadata"] = metadata_doi
-                    group_tasks.append(import_item.s(item, request_info))
+                    if chunked:
+                        prepared_items.append(item)
+                    else:
+                        group_tasks.append(import_item.s(item, request_info))
                     db.session.commit()
                 except Exception as ex:
                     db.session.rollback()
@@ -516,15 +523,37 @@ class ItemImportView(BaseView):
                         remarks=tb_info[0]
                     )
 
-            # handle import tasks
-            import_task = chord(group_tasks)(remove_temp_dir_task.si(data_path))
-            for idx, task in enumerate(import_task.parent.results):
-                tasks.append(
-                    {
-                        "task_id": task.task_id,
-                        "item_id": list_record[idx].get("id"),
-                    }
-                )
+            if chunked:
+                # handle import tasks by chunk
+                _chunk_size = current_app.config["WEKO_SEARCH_UI_IMPORT_CHUNK_SIZE"]
+                chunks = [
+                    prepared_items[i:i + _chunk_size]
+                    for i in range(0, len(prepared_items), _chunk_size)
+                ]
+                group_tasks = [
+                    import_items_chunk.s(chunk, request_info, chunk_no)
+                    for chunk_no, chunk in enumerate(chunks, 1)
+                ]
+                import_task = chord(group_tasks)(remove_temp_dir_task.si(data_path))
+                for chunk, task in zip(chunks, import_task.parent.results):
+                    for idx, item in enumerate(chunk):
+                        tasks.append(
+                            {
+                                "task_id": task.task_id,
+                                "item_id": item.get("id"),
+                                "chunk_index": idx,
+                            }
+                        )
+            else:
+                # handle import tasks
+                import_task = chord(group_tasks)(remove_temp_dir_task.si(data_path))
+                for idx, task in enumerate(import_task.parent.results):
+                    tasks.append(
+                        {
+                            "task_id": task.task_id,
+                            "item_id": list_record[idx].get("id"),
+                        }
+                    )
 
         response_object = {
             "status": "success",
@@ -542,6 +571,12 @@ class ItemImportView(BaseView):
             for task_item in data.get("tasks"):
                 task_id = task_item.get("task_id")
                 task = import_item.AsyncResult(task_id)
+                task_result = task.result
+                if "chunk_index" in task_item:
+                    task_result = (
+                        task.result["results"][task_item["chunk_index"]]
+                        if isinstance(task.result, dict) else None
+                    )
                 start_date = (
                     task.result.get("start_date")
                     if task and isinstance(task.result, dict)
@@ -553,11 +588,11 @@ class ItemImportView(BaseView):
                     else ""
                 )
                 item_id = task_item.get("item_id", None)
-                if not item_id and task.result:
-                    item_id = task.result.get("recid", None)
+                if not item_id and task_result:
+                    item_id = task_result.get("recid", None)
                 result.append({
                     "task_status": task.status,
-                    "task_result": task.result,
+                    "task_result": task_result,
                     "start_date": start_date,
                     "end_date": task_item.get("end_date") or end_date,
                     "task_id": task_id,
@@ -573,6 +608,19 @@ class ItemImportView(BaseView):
             response_object = {"status": "error", "result": result}
         return jsonify(response_object)
 
+    @expose("/chunk_status", methods=["POST"])
+    def get_chunk_status(self):
+        """Get the summary of a chunked import process."""
+        data = request.get_json()
+        if not data or not data.get("tasks"):
+            return jsonify({"status": "error", "result": {}})
+        task_ids = []
+        for task_item in data.get("tasks"):
+            if task_item.get("task_id") not in task_ids:
+                task_ids.append(task_item.get("task_id"))
+        summary = get_import_chunks_summary(task_ids)
+        return jsonify({"status": summary.pop("status"), "result": summary})
+
     @expose("/export_import", methods=["POST"])
     def download_import(self):
         """Download import result."""
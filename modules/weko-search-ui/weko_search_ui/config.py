@@ -745,9 +745,36 @@ Note: If set to 500 or more, errors may occur during export processing.
 WEKO_SEARCH_UI_BULK_EXPORT_RETRY = 5
 """Number of export retries."""
 
+WEKO_SEARCH_UI_BULK_EXPORT_STREAMING = False
+"""Write the bulk export files while paging through the records.
+
+If True, the records are read page by page and each tsv/csv part is written
+as soon as it is filled. The last exported key is checkpointed, so that an
+interrupted or canceled export resumes where it stopped when it is started
+again with the same conditions.
+"""
+
+WEKO_SEARCH_UI_BULK_EXPORT_PAGE_SIZE = 1000
+"""Number of records read per page in the streaming bulk export."""
+
+WEKO_SEARCH_UI_BULK_EXPORT_CHECKPOINT = "CHECKPOINT_EXPORT_ALL"
+"""Bulk export checkpoint key."""
+
 WEKO_SEARCH_UI_IMPORT_TMP_PREFIX = "weko_import_"
 """Import tmp prefix."""
 
+WEKO_SEARCH_UI_IMPORT_CHUNKED = False
+"""Import the items in chunks.
+
+If True, the items of an import are split into chunks of
+WEKO_SEARCH_UI_IMPORT_CHUNK_SIZE items and each chunk is imported by one
+Celery task. The Elasticsearch writes of a chunk are sent with bulk requests
+after its items are imported.
+"""
+
+WEKO_SEARCH_UI_IMPORT_CHUNK_SIZE = 100
+"""Number of items imported by one task in the chunked import."""
+
 WEKO_SEARCH_UI_ROCRATE_IMPORT_TMP_PREFIX = "weko_rocrate_import_"
 """RO-Crate Import tmp prefix."""
 
@@ -772,6 +799,18 @@ CHILD_INDEX_THUMBNAIL_HEIGHT = 100
 
 WEKO_SEARCH_UI_RESULT_TMP_PREFIX = 'weko_search_result_list_'
 
+WEKO_SEARCH_UI_PERMISSION_TERMS_LOOKUP = False
+""" Filter the searches by a lookup document of the browsable indexes instead
+of sending every browsable index id with each search. """
+
+WEKO_SEARCH_UI_PERMISSION_TERMS_LOOKUP_INDEX = \
+    "{}-weko-permission-paths".format(index_prefix)
+""" Index of the lookup documents of the browsable indexes. """
+
+WEKO_SEARCH_UI_PERMISSION_TERMS_LOOKUP_TTL = 300
+""" Seconds after which a worker checks again that a lookup document of the
+browsable indexes still exists. """
+
 SWORD_METADATA_FILE = "metadata/sword.json"
 """ Metadata file name for SWORDBagIt. """
 
@@ -20,9 +20,11 @@
 
 """Query factories for REST API."""
 
+import hashlib
 import json
 import re
 import sys
+import time
 from datetime import datetime
 from functools import partial
 
@@ -32,6 +34,7 @@ from flask_security import current_user
 from flask_babelex import get_timezone
 from invenio_communities.models import Community
 from invenio_records_rest.errors import InvalidQueryRESTError
+from invenio_search import current_search_client
 from weko_index_tree.api import Indexes
 from weko_index_tree.utils import get_user_roles
 from weko_schema_ui.models import PublishStatus
@@ -53,6 +56,84 @@ def get_item_type_aggs(search_index):
     return facets.get(search_index).get("aggs", {})
 
 
+_permission_lookup_ids = {}
+"""Time each permission lookup document was last seen by this worker."""
+
+PERMISSION_LOOKUP_MAPPING = {
+    "settings": {"number_of_shards": 1},
+    "mappings": {
+        "_doc": {
+            "dynamic": False,
+            "properties": {"path": {"type": "keyword"}},
+        }
+    },
+}
+"""Mapping of the index of the permission lookup documents."""
+
+
+def put_permission_lookup(lookup_index, lookup_id, index_ids):
+    """Write a permission lookup document unless it exists.
+
+    The index is created with PERMISSION_LOOKUP_MAPPING when it is missing.
+
+    Args:
+        lookup_index (str): Index of the lookup documents.
+        lookup_id (str): Identifier of the lookup document.
+        index_ids (list): Browsable index identifiers.
+    """
+    if current_search_client.exists(
+            index=lookup_index, doc_type="_doc", id=lookup_id):
+        return
+    if not current_search_client.indices.exists(index=lookup_index):
+        current_search_client.indices.create(
+            index=lookup_index, body=PERMISSION_LOOKUP_MAPPING, ignore=400)
+    current_search_client.index(
+        index=lookup_index, doc_type="_doc", id=lookup_id,
+        body={"path": index_ids})
+
+
+def get_permission_paths_query(index_ids):
+    """Get the terms query on path for the browsable indexes.
+
+    With WEKO_SEARCH_UI_PERMISSION_TERMS_LOOKUP, the index ids are written
+    once in a lookup document named by their hash and the query refers to
+    the document instead of carrying every index id. The existence of the
+    document is checked again after WEKO_SEARCH_UI_PERMISSION_TERMS_LOOKUP_TTL
+    seconds, so a deleted document or index is written again.
+
+    Args:
+        index_ids (list): Browsable index identifiers.
+
+    Returns:
+        Q: Query command.
+
+    """
+    if not current_app.config.get("WEKO_SEARCH_UI_PERMISSION_TERMS_LOOKUP") \
+            or not index_ids:
+        return Q("terms", path=index_ids)
+
+    lookup_index = current_app.config[
+        "WEKO_SEARCH_UI_PERMISSION_TERMS_LOOKUP_INDEX"]
+    lookup_id = hashlib.sha1(
+        json.dumps(sorted(index_ids)).encode("utf-8")).hexdigest()
+    now = time.time()
+    ttl = current_app.config["WEKO_SEARCH_UI_PERMISSION_TERMS_LOOKUP_TTL"]
+    if now - _permission_lookup_ids.get(lookup_id, 0) >= ttl:
+        try:
+            put_permission_lookup(lookup_index, lookup_id, index_ids)
+        except Exception as ex:
+            current_app.logger.error(ex)
+            _permission_lookup_ids.pop(lookup_id, None)
+            return Q("terms", path=index_ids)
+        _permission_lookup_ids[lookup_id] = now
+    return Q("terms", path={
+        "index": lookup_index,
+        "type": "_doc",
+        "id": lookup_id,
+        "path": "path",
+    })
+
+
 def get_permission_filter(index_id: str = None, is_community=False):
     """Check permission.
 
@@ -90,7 +171,7 @@ def get_permission_filter(index_id: str = None, is_community=False):
                     term_list.extend([i for i in child_ids if i in is_perm_indexes])
                 else:
                     term_list.append(index_id)
-                should_path.append(Q("terms", path=term_list))
+                should_path.append(get_permission_paths_query(term_list))
 
             terms = Q("bool", should=should_path)
         else:  # In case search_type is keyword or index
@@ -101,9 +182,9 @@ def get_permission_filter(index_id: str = None, is_community=False):
                 else:
                     term_list.append(index_id)
 
-            terms = Q("terms", path=term_list)
+            terms = get_permission_paths_query(term_list)
     else:
-        terms = Q("terms", path=is_perm_indexes)
+        terms = get_permission_paths_query(is_perm_indexes)
 
     if is_admin:
         mst.append(status)
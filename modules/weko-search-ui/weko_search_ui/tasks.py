@@ -47,6 +47,7 @@ from .utils import (
     export_all,
     write_files,
     get_lifetime,
+    import_items_chunk_to_system,
     import_items_to_system,
 )
 
@@ -161,6 +162,39 @@ def import_item(item, request_info):
         current_app.logger.error(traceback.format_exc())
 
 
+@shared_task(ignore_results=False)
+def import_items_chunk(items, request_info, chunk_no):
+    """Import a chunk of items.
+
+    Args:
+        items (list): Import items with metadata.
+        request_info (dict): Information from request.
+        chunk_no (int): Chunk number starting from 1.
+
+    Returns:
+        dict: Chunk number, results of the items and the numbers of
+            succeeded and failed items.
+    """
+    start_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    try:
+        results = import_items_chunk_to_system(items, request_info)
+    except Exception:
+        current_app.logger.error(traceback.format_exc())
+        results = [
+            {"success": False, "recid": item.get("id"), "error_id": None}
+            for item in items
+        ]
+    success = len([r for r in results if r.get("success")])
+    return {
+        "chunk": chunk_no,
+        "start_date": start_date,
+        "end_date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "results": results,
+        "success": success,
+        "failure": len(results) - success,
+    }
+
+
 @shared_task
 def remove_temp_dir_task(path):
     """Import Item ."""
@@ -302,18 +336,52 @@ def is_import_running():
 
     _timeout = current_app.config.get("CELERY_GET_STATUS_TIMEOUT", 3.0)
     active = inspect(timeout=_timeout).active()
+    _import_tasks = [
+        "weko_search_ui.tasks.import_item",
+        "weko_search_ui.tasks.import_items_chunk",
+    ]
     for worker in active:
         for task in active[worker]:
-            if task["name"] == "weko_search_ui.tasks.import_item":
+            if task["name"] in _import_tasks:
                 return "is_import_running"
 
     reserved = inspect(timeout=_timeout).reserved()
     for worker in reserved:
         for task in reserved[worker]:
-            if task["name"] == "weko_search_ui.tasks.import_item":
+            if task["name"] in _import_tasks:
                 return "is_import_running"
 
 
+def get_import_chunks_summary(task_ids):
+    """Get the progress of a chunked import.
+
+    Args:
+        task_ids (list): Task IDs of the import_items_chunk tasks.
+
+    Returns:
+        dict: Status of each chunk and the totals. The status is "doing"
+            until all chunks are finished.
+    """
+    chunks = []
+    total = {"success": 0, "failure": 0}
+    status = "done"
+    for task_id in task_ids:
+        task = import_items_chunk.AsyncResult(task_id)
+        chunk = {"task_id": task_id, "task_status": task.status}
+        if task.successful() and isinstance(task.result, dict):
+            chunk.update({
+                key: task.result.get(key)
+                for key in ("chunk", "start_date", "end_date",
+                            "success", "failure")
+            })
+            total["success"] += task.result.get("success", 0)
+            total["failure"] += task.result.get("failure", 0)
+        elif not task.failed():
+            status = "doing"
+        chunks.append(chunk)
+    return {"status": status, "chunks": chunks, **total}
+
+
 def check_celery_is_run():
     """Check celery is running, or not."""
     if not inspect(timeout=current_app.config.get("CELERY_GET_STATUS_TIMEOUT", 3.0)).ping():
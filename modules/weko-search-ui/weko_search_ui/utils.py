@@ -45,7 +45,7 @@ from functools import partial, reduce, wraps
 import io
 from io import StringIO
 from operator import getitem
-from time import sleep
+from time import sleep, time
 import pickle
 
 import redis
@@ -572,13 +572,15 @@ def check_tsv_import_items(
 
         handle_check_duplicate_record(list_record)
 
-        list_record = handle_check_exist_record(list_record)
+        lookup = ImportCheckLookup(list_record)
+        list_record = handle_check_exist_record(list_record, lookup)
         handle_item_title(list_record)
         
         list_record = handle_check_date(list_record)
         handle_check_id(list_record)
 
-        handle_check_and_prepare_index_tree(list_record, all_index_permission, can_edit_indexes)
+        handle_check_and_prepare_index_tree(
+            list_record, all_index_permission, can_edit_indexes, lookup)
         handle_check_and_prepare_publish_status(list_record)
         handle_check_and_prepare_feedback_mail(list_record)
 
@@ -596,10 +598,10 @@ def check_tsv_import_items(
         handle_check_authors_affiliation(list_record)
         
         if not is_gakuninrdm:
-            handle_check_cnri(list_record)
-            handle_check_doi_indexes(list_record)
+            handle_check_cnri(list_record, lookup)
+            handle_check_doi_indexes(list_record, lookup)
             handle_check_doi_ra(list_record)
-            handle_check_doi(list_record)
+            handle_check_doi(list_record, lookup)
         result["list_record"] = list_record
     except Exception as ex:
         error = _("Internal server error")
@@ -695,7 +697,8 @@ def check_xml_import_items(
         handle_check_duplicate_record(list_record)
 
         # add: {"id": null, "status": "new"}
-        list_record = handle_check_exist_record(list_record)
+        lookup = ImportCheckLookup(list_record)
+        list_record = handle_check_exist_record(list_record, lookup)
         # current_app.logger.debug("list_record2: {}".format(list_record))
 
         # add: {"item_title": "****"}
@@ -714,10 +717,10 @@ def check_xml_import_items(
         handle_shared_ids(list_record, shared_ids)
 
         if not is_gakuninrdm:
-            handle_check_cnri(list_record)
-            handle_check_doi_indexes(list_record)
+            handle_check_cnri(list_record, lookup)
+            handle_check_doi_indexes(list_record, lookup)
             handle_check_doi_ra(list_record)
-            handle_check_doi(list_record)
+            handle_check_doi(list_record, lookup)
 
         result["list_record"] = list_record
     except zipfile.BadZipFile as ex:
@@ -957,11 +960,13 @@ def check_jsonld_import_items(
         list_record = handle_validate_item_import(list_record, item_type.schema)
         handle_check_duplicate_record(list_record)
 
-        list_record = handle_check_exist_record(list_record)
+        lookup = ImportCheckLookup(list_record)
+        list_record = handle_check_exist_record(list_record, lookup)
         handle_item_title(list_record)
         list_record = handle_check_date(list_record)
         handle_check_id(list_record)
-        handle_check_and_prepare_index_tree(list_record, True, can_edit_indexes)
+        handle_check_and_prepare_index_tree(
+            list_record, True, can_edit_indexes, lookup)
         handle_check_and_prepare_publish_status(list_record)
 
         handle_check_and_prepare_feedback_mail(list_record)
@@ -973,12 +978,12 @@ def check_jsonld_import_items(
         handle_check_authors_prefix(list_record)
         handle_check_authors_affiliation(list_record)
 
-        handle_check_cnri(list_record)
-        handle_check_doi_indexes(list_record)
+        handle_check_cnri(list_record, lookup)
+        handle_check_doi_indexes(list_record, lookup)
         handle_check_doi_ra(list_record)
-        handle_check_doi(list_record)
+        handle_check_doi(list_record, lookup)
 
-        handle_check_item_link(list_record)
+        handle_check_item_link(list_record, lookup)
         handle_check_duplicate_item_link(list_record)
 
         check_result.update({"list_record": list_record})
@@ -1518,6 +1523,244 @@ def get_item_type(item_type_id=0) -> dict:
 
     return result
 
+class ImportCheckLookup(object):
+    """Lookups shared by the checks of import items.
+
+    The record ids, index ids, DOIs and item links referenced by the import
+    items are collected once and resolved with one query per kind, so that
+    the checks of each item do not query the database. Values which are not
+    collected in advance are resolved in the same way as the checks do
+    without the lookup.
+    """
+
+    class Record(dict):
+        """Existing record referenced by an import item."""
+
+        def __init__(self, pid, recid):
+            """Init with the deposit PID and the recid of the record."""
+            super(ImportCheckLookup.Record, self).__init__(recid=recid)
+            self.pid = pid
+
+    def __init__(self, list_record):
+        """Collect the referenced ids of the import items and resolve them.
+
+        Args:
+            list_record (list): list record import.
+        """
+        recids = set()
+        index_ids = set()
+        doi_links = set()
+        for item in list_record:
+            item_id = item.get("id")
+            if isinstance(item_id, (str, int)) and str(item_id).isdecimal():
+                recids.add(str(item_id))
+            for link_info in item.get("link_data") or []:
+                uri = link_info.get("item_id") if isinstance(link_info, dict) else None
+                if isinstance(uri, str) and uri.split("/")[-1].isdecimal():
+                    recids.add(uri.split("/")[-1])
+            for index_id in (item.get("metadata") or {}).get("path") or []:
+                if str(index_id).isdecimal():
+                    index_ids.add(int(index_id))
+            doi_ra = item.get("doi_ra")
+            if item.get("doi") and doi_ra in WEKO_IMPORT_DOI_TYPE:
+                doi_domain = IDENTIFIER_GRANT_LIST[
+                    WEKO_IMPORT_DOI_TYPE.index(doi_ra) + 1][2]
+                doi_links.add(doi_domain + "/" + item.get("doi"))
+
+        self._depids = {}
+        self._recids = {}
+        self._identifiers = {}
+        self._indexes = {}
+        self._index_ids = index_ids
+        self._doi_pids = {link: [] for link in doi_links}
+        self._indexes_by_name = {}
+        self._restrict_doi = {}
+        self._doi_prefix = {}
+        self._handle_prefix = None
+        self._load_records(recids)
+        self._load_indexes(index_ids)
+        self._load_doi_pids(doi_links)
+
+    def _load_records(self, recids):
+        """Resolve the records and their identifiers."""
+        if not recids:
+            return
+        depids = PersistentIdentifier.query.filter(
+            PersistentIdentifier.pid_type == "depid",
+            PersistentIdentifier.pid_value.in_(recids)
+        ).all()
+        self._depids = {pid.pid_value: pid for pid in depids}
+        if not depids:
+            return
+        rows = db.session.query(
+            RecordMetadata.id,
+            _func.jsonb_extract_path_text(RecordMetadata.json, "recid"),
+            _func.jsonb_extract_path_text(RecordMetadata.json, "_deposit", "id"),
+        ).filter(
+            RecordMetadata.id.in_([pid.object_uuid for pid in depids]),
+            RecordMetadata.json != None
+        ).all()
+        records = {row[0]: (row[1], row[2]) for row in rows}
+        self._recids = {
+            pid.pid_value: records[pid.object_uuid]
+            for pid in depids if pid.object_uuid in records
+        }
+
+        # PIDs of the records without version, which own the identifiers.
+        from invenio_pidrelations.models import PIDRelation
+        deposit_ids = {
+            deposit_id for _, deposit_id in self._recids.values() if deposit_id
+        }
+        if not deposit_ids:
+            return
+        pid_recids = PersistentIdentifier.query.filter(
+            PersistentIdentifier.pid_type == "recid",
+            PersistentIdentifier.pid_value.in_(deposit_ids)
+        ).all()
+        relations = db.session.query(
+            PIDRelation.child_id, PersistentIdentifier.pid_value
+        ).join(
+            PersistentIdentifier, PIDRelation.parent_id == PersistentIdentifier.id
+        ).filter(
+            PIDRelation.child_id.in_([pid.id for pid in pid_recids])
+        ).all()
+        parent_values = {}
+        for child_id, parent_value in relations:
+            parent_values.setdefault(child_id, parent_value.split(":")[-1])
+        parents = PersistentIdentifier.query.filter(
+            PersistentIdentifier.pid_type == "recid",
+            PersistentIdentifier.pid_value.in_(set(parent_values.values()))
+        ).all() if parent_values else []
+        parents = {pid.pid_value: pid for pid in parents}
+        without_versions = {
+            pid.pid_value: parents.get(parent_values.get(pid.id))
+            for pid in pid_recids
+        }
+        object_uuids = [
+            pid.object_uuid for pid in without_versions.values() if pid
+        ]
+        identifiers = PersistentIdentifier.query.filter(
+            PersistentIdentifier.pid_type.in_(["doi", "hdl"]),
+            PersistentIdentifier.object_uuid.in_(object_uuids),
+            PersistentIdentifier.status == PIDStatus.REGISTERED
+        ).order_by(
+            db.desc(PersistentIdentifier.created)
+        ).all() if object_uuids else []
+        latest = {}
+        for pid in identifiers:
+            latest.setdefault((pid.object_uuid, pid.pid_type), pid)
+        for deposit_id, pid in without_versions.items():
+            self._identifiers[deposit_id] = {
+                pid_type: latest.get((pid.object_uuid, pid_type)) if pid else None
+                for pid_type in ("doi", "hdl")
+            }
+
+    def _load_indexes(self, index_ids):
+        """Resolve the index paths."""
+        from weko_index_tree.api import Indexes
+        if index_ids:
+            for index_info in Indexes.get_path_list(list(index_ids)):
+                self._indexes[index_info.cid] = index_info
+
+    def _load_doi_pids(self, doi_links):
+        """Resolve the DOI PIDs."""
+        if not doi_links:
+            return
+        pids = PersistentIdentifier.query.filter(
+            PersistentIdentifier.pid_type == "doi",
+            PersistentIdentifier.pid_value.in_(doi_links)
+        ).all()
+        for pid in pids:
+            self._doi_pids[pid.pid_value].append(pid)
+
+    def get_record(self, item_id):
+        """Get the record of the item.
+
+        Args:
+            item_id (str): Item id.
+
+        Returns:
+            ImportCheckLookup.Record: Record with the deposit PID and recid.
+
+        Raises:
+            PIDDoesNotExistError: Record does not exist.
+        """
+        item_id = str(item_id)
+        if item_id not in self._depids:
+            raise PIDDoesNotExistError("depid", item_id)
+        recid, deposit_id = self._recids.get(item_id, (None, None))
+        if deposit_id != item_id:
+            # record.pid is the deposit PID of "_deposit.id".
+            record = WekoRecord.get_record_by_pid(item_id)
+            return self.Record(record.pid, record.get("recid"))
+        return self.Record(self._depids[item_id], recid)
+
+    def get_identifier(self, item_id, pid_type):
+        """Get the registered DOI or CNRI PID of the item.
+
+        Args:
+            item_id (str): Item id.
+            pid_type (str): 'doi' or 'hdl'.
+
+        Returns:
+            PersistentIdentifier: PID, or None.
+
+        Raises:
+            PIDDoesNotExistError: Record does not exist.
+        """
+        item_id = str(item_id)
+        if item_id not in self._depids:
+            raise PIDDoesNotExistError("depid", item_id)
+        deposit_id = self._recids.get(item_id, (None, None))[1]
+        if deposit_id not in self._identifiers:
+            record = WekoRecord.get_record_by_pid(item_id)
+            return record.pid_doi if pid_type == "doi" else record.pid_cnri
+        return self._identifiers[deposit_id][pid_type]
+
+    def get_path_list(self, index_id):
+        """Get the path of the index as Indexes.get_path_list does."""
+        from weko_index_tree.api import Indexes
+        if str(index_id).isdecimal() and int(index_id) in self._index_ids:
+            index_info = self._indexes.get(int(index_id))
+            return [index_info] if index_info else []
+        return Indexes.get_path_list([index_id])
+
+    def get_path_list_by_name(self, index_name):
+        """Get the paths of the indexes which have the name."""
+        from weko_index_tree.api import Indexes
+        if index_name not in self._indexes_by_name:
+            index_all_name = Indexes.get_index_by_all_name(index_name)
+            self._indexes_by_name[index_name] = Indexes.get_path_list(
+                [i.id for i in index_all_name])
+        return self._indexes_by_name[index_name]
+
+    def check_restrict_doi_with_indexes(self, index_ids):
+        """Memoized check_restrict_doi_with_indexes."""
+        key = tuple(index_ids)
+        if key not in self._restrict_doi:
+            self._restrict_doi[key] = check_restrict_doi_with_indexes(index_ids)
+        return self._restrict_doi[key]
+
+    def get_doi_pids(self, doi_link):
+        """Get the DOI PIDs which have the value."""
+        if doi_link not in self._doi_pids:
+            self._doi_pids[doi_link] = PersistentIdentifier.query.filter_by(
+                pid_type="doi", pid_value=doi_link).all()
+        return self._doi_pids[doi_link]
+
+    def get_doi_prefix(self, doi_ra):
+        """Memoized get_doi_prefix."""
+        if doi_ra not in self._doi_prefix:
+            self._doi_prefix[doi_ra] = get_doi_prefix(doi_ra)
+        return self._doi_prefix[doi_ra]
+
+    def get_handle_prefix(self):
+        """Memoized Handle().get_prefix()."""
+        if self._handle_prefix is None:
+            self._handle_prefix = Handle().get_prefix()
+        return self._handle_prefix
+
+
 def handle_check_duplicate_record(list_record):
     """Check record is duplicate in system.
 
@@ -1546,11 +1789,12 @@ def handle_check_duplicate_record(list_record):
             )
 
 
-def handle_check_exist_record(list_record) -> list:
+def handle_check_exist_record(list_record, lookup=None) -> list:
     """Check record is exist in system.
 
     :argument
         list_record -- {list} list record import.
+        lookup      -- {ImportCheckLookup} lookups of the import items.
     :return
         return      -- list record has property status.
 
@@ -1575,7 +1819,8 @@ def handle_check_exist_record(list_record) -> list:
             else:
                 item_exist = None
                 try:
-                    item_exist = WekoRecord.get_record_by_pid(item_id)
+                    item_exist = lookup.get_record(item_id) if lookup \
+                        else WekoRecord.get_record_by_pid(item_id)
                 except PIDDoesNotExistError:
                     item["status"] = None
                     errors.append(_("Item does not exist in the system."))
@@ -2400,12 +2645,64 @@ def import_items_to_system(
     return {"success": True, "recid": item["id"]}
 
 
-def import_items_to_activity(item, request_info):
+def import_items_chunk_to_system(items, request_info=None):
+    """Import a chunk of items and send their index writes in bulk.
+
+    Each item is imported and committed by import_items_to_system, so a
+    failed item does not affect the other items of the chunk. The
+    Elasticsearch writes of an item are collected and sent in one bulk
+    request before its commit, and an indexing error rolls the item back
+    as the direct writes do. The writes issued after the commit are sent
+    once the item is imported; if they fail, the item is reported as
+    imported with a warning, as it is already committed.
+
+    Args:
+        items (list): Import items with metadata.
+        request_info (dict): Information from request. Default is None.
+
+    Returns:
+        list: Results of import_items_to_system for each item.
+    """
+    results = []
+    indexer = WekoIndexer()
+    indexer.get_es_index()
+
+    with WekoIndexer.deferred_upload() as actions:
+        for item in items:
+            try:
+                result = import_items_to_system(item, request_info) or dict()
+            except Exception as ex:
+                current_app.logger.error(traceback.format_exc())
+                db.session.rollback()
+                result = {"success": False, "error_id": None}
+            result.setdefault("recid", item.get("id"))
+            if result.get("success") and actions:
+                try:
+                    _, errors = indexer.bulk_upload(
+                        actions, chunk_size=current_app.config.get(
+                            "WEKO_SEARCH_UI_IMPORT_CHUNK_SIZE", 100)
+                    )
+                except ElasticsearchException as ex:
+                    current_app.logger.error("elasticsearch  error: %s", ex)
+                    errors = [ex]
+                if errors:
+                    current_app.logger.error(
+                        "item id: %s is imported but not indexed."
+                        % result["recid"])
+                    result["warnings"] = ["failed_to_update_elasticsearch"]
+            del actions[:]
+            results.append(result)
+    return results
+
+
+def import_items_to_activity(item, request_info, activity_id=None):
     """Import items to activity.
 
     Args:
         item (dict): Item metadata.
         request_info (dict): Information from request.
+        activity_id (str, optional): ID of the new activity allocated by
+            WorkActivity.get_new_activity_ids. Defaults to None.
 
     Returns:
         tuple(str, str, str, str):
@@ -2435,6 +2732,7 @@ def import_items_to_activity(item, request_info):
         url, current_action, recid = headless.auto(
             user_id=request_info.get("user_id"),
             workflow_id=workflow_id, item_id=item_id,
+            new_activity_id=activity_id,
             index=index, metadata=metadata, files=files,
             comment=comment, link_data=link_data, grant_data=grant_data,
             non_extract=item.get("non_extract")
@@ -2592,13 +2890,15 @@ def handle_check_and_prepare_publish_status(list_record):
             item["errors"] = item["errors"] + [error] if item.get("errors") else [error]
 
 
-def handle_check_and_prepare_index_tree(list_record, all_index_permission, can_edit_indexes):
+def handle_check_and_prepare_index_tree(list_record, all_index_permission,
+                                        can_edit_indexes, lookup=None):
     """Check index existed and prepare index tree data.
 
     :argument
         list_record -- {list} list record import.
         all_index_permission -- {bool} All indexes can be import.
         can_edit_indexes -- {list} Editable index list.
+        lookup -- {ImportCheckLookup} lookups of the import items.
     :return
 
     """
@@ -2620,7 +2920,10 @@ def handle_check_and_prepare_index_tree(list_record, all_index_permission, can_e
         """
         temp_res = []
         index_info = None
-        index_info = Indexes.get_path_list([index_id])
+        if lookup:
+            index_info = lookup.get_path_list(index_id)
+        else:
+            index_info = Indexes.get_path_list([index_id])
 
         msg_not_exist = _("The specified {} does not exist in system.")
         if index_info and len(index_info) == 1:
@@ -2640,8 +2943,11 @@ def handle_check_and_prepare_index_tree(list_record, all_index_permission, can_e
         elif index_name_path:          # has pos_index info
             index_path_list = index_name_path.split(
                 current_app.config['WEKO_ITEMS_UI_INDEX_PATH_SPLIT'])
-            index_all_name = Indexes.get_index_by_all_name(index_path_list[-1])
-            index_infos = Indexes.get_path_list([i.id for i in index_all_name])
+            if lookup:
+                index_infos = lookup.get_path_list_by_name(index_path_list[-1])
+            else:
+                index_all_name = Indexes.get_index_by_all_name(index_path_list[-1])
+                index_infos = Indexes.get_path_list([i.id for i in index_all_name])
             if index_infos:      # index exists by index name
                 for info in index_infos:
                     index_info = None
@@ -2890,11 +3196,12 @@ def handle_set_change_identifier_flag(list_record, is_change_identifier):
         item["is_change_identifier"] = is_change_identifier
 
 
-def handle_check_cnri(list_record):
+def handle_check_cnri(list_record, lookup=None):
     """Check CNRI.
 
     :argument
         list_record -- {list} list record import.
+        lookup -- {ImportCheckLookup} lookups of the import items.
     :return
 
     """
@@ -2923,7 +3230,9 @@ def handle_check_cnri(list_record):
                     if not suffix:
                         item["cnri_suffix_not_existed"] = True
 
-                    if prefix != Handle().get_prefix():
+                    handle_prefix = lookup.get_handle_prefix() if lookup \
+                        else Handle().get_prefix()
+                    if prefix != handle_prefix:
                         error = _("Specified Prefix of {} is incorrect.").format("CNRI")
         else:
             if (
@@ -2936,7 +3245,10 @@ def handle_check_cnri(list_record):
             else:
                 pid_cnri = None
                 try:
-                    pid_cnri = WekoRecord.get_record_by_pid(item_id).pid_cnri
+                    if lookup:
+                        pid_cnri = lookup.get_identifier(item_id, "hdl")
+                    else:
+                        pid_cnri = WekoRecord.get_record_by_pid(item_id).pid_cnri
                     if pid_cnri:
                         if not cnri and not pid_cnri.pid_value.endswith(str(item_id)):
                             error = _("Please specify {}.").format("CNRI")
@@ -2957,11 +3269,12 @@ def handle_check_cnri(list_record):
             item["errors"] = list(set(item["errors"]))
 
 
-def handle_check_doi_indexes(list_record):
+def handle_check_doi_indexes(list_record, lookup=None):
     """Check restrict DOI with Indexes.
 
     :argument
         list_record -- {list} list record import.
+        lookup -- {ImportCheckLookup} lookups of the import items.
     :return
 
     """
@@ -2984,9 +3297,15 @@ def handle_check_doi_indexes(list_record):
             errors.append(_("You cannot keep an item private because it has a DOI."))
         # Check restrict DOI with Indexes:
         index_ids = [str(idx) for idx in item["metadata"].get("path", [])]
-        if doi_ra and check_restrict_doi_with_indexes(index_ids):
+        if doi_ra and (
+            lookup.check_restrict_doi_with_indexes(index_ids) if lookup
+            else check_restrict_doi_with_indexes(index_ids)
+        ):
             if not item.get("status") or item.get("status") == "new":
                 errors.append(err_msg_register_doi)
+            elif lookup:
+                pid_doi = lookup.get_identifier(item.get("id"), "doi")
+                errors.append(err_msg_update_doi if pid_doi else err_msg_register_doi)
             else:
                 pid_doi = WekoRecord.get_record_by_pid(item.get("id")).pid_doi
                 errors.append(err_msg_update_doi if pid_doi else err_msg_register_doi)
@@ -3063,12 +3382,15 @@ def handle_check_doi_ra(list_record):
             item["errors"] = list(set(item["errors"]))
 
 
-def handle_check_doi(list_record):
+def handle_check_doi(list_record, lookup=None):
     """Check DOI.
 
     Args:
         list_record (list): list record import.
+        lookup (ImportCheckLookup, optional): lookups of the import items.
     """
+    _get_doi_prefix = lookup.get_doi_prefix if lookup else get_doi_prefix
+
     def _check_doi(doi_ra, doi, item):
         """Check DOI value when chang identifier mode is off."""
         error = None
@@ -3078,7 +3400,7 @@ def handle_check_doi(list_record):
                 error = _("{} cannot be set.").format("DOI")
             else:
                 prefix = split_doi[0]
-                if not item.get("ignore_check_doi_prefix") and prefix != get_doi_prefix(
+                if not item.get("ignore_check_doi_prefix") and prefix != _get_doi_prefix(
                     doi_ra
                 ):
                     error = _("Specified Prefix of {} is incorrect.").format("DOI")
@@ -3089,7 +3411,7 @@ def handle_check_doi(list_record):
             else:
                 prefix = re.sub("/$", "", doi)
                 item["doi_suffix_not_existed"] = True
-                if not item.get("ignore_check_doi_prefix") and prefix != get_doi_prefix(
+                if not item.get("ignore_check_doi_prefix") and prefix != _get_doi_prefix(
                     doi_ra
                 ):
                     error = _("Specified Prefix of {} is incorrect.").format("DOI")
@@ -3113,7 +3435,10 @@ def handle_check_doi(list_record):
         doi_domain = IDENTIFIER_GRANT_LIST[WEKO_IMPORT_DOI_TYPE.index(doi_ra) + 1][2]
         doi_link = doi_domain + "/" + doi
 
-        doi_pidstore = identifier.check_pidstore_exist("doi", doi_link)
+        if lookup:
+            doi_pidstore = lookup.get_doi_pids(doi_link)
+        else:
+            doi_pidstore = identifier.check_pidstore_exist("doi", doi_link)
         if any(doi.status == PIDStatus.DELETED for doi in doi_pidstore):
             current_app.logger.warning(
                 f"Specified DOI was withdrawn: {doi}"
@@ -3160,7 +3485,7 @@ def handle_check_doi(list_record):
 
                         if not item.get(
                             "ignore_check_doi_prefix"
-                        ) and prefix != get_doi_prefix(doi_ra):
+                        ) and prefix != _get_doi_prefix(doi_ra):
                             error = _("Specified Prefix of {} is incorrect.").format(
                                 "DOI"
                             )
@@ -3233,13 +3558,14 @@ def handle_check_doi(list_record):
             f"Specified DOI is duplicated with another import item: {doi}"
         )
 
-def handle_check_item_link(list_record):
+def handle_check_item_link(list_record, lookup=None):
     """Check item link.
 
     Check if item link url is valid.
 
     Args:
         list_record (list): List of records.
+        lookup (ImportCheckLookup, optional): lookups of the import items.
     """
     for item in list_record:
         errors = []
@@ -3276,7 +3602,8 @@ def handle_check_item_link(list_record):
                     _("Specified Item Link URI and system URI do not match.")
                 )
             try:
-                item_exist = WekoRecord.get_record_by_pid(item_id)
+                item_exist = lookup.get_record(item_id) if lookup \
+                    else WekoRecord.get_record_by_pid(item_id)
             except PIDDoesNotExistError:
                 traceback.print_exc(file=sys.stdout)
                 errors.append(_("Linking item does not exist in the system."))
@@ -4784,10 +5111,161 @@ def export_all(root_url, user_id, data, start_time):
             else:
                 return False
 
+    def _get_export_data_stream(export_path, item_types, retrys,
+                                fromid="", toid="", checkpoint=None,
+                                user_id=None):
+        """Export item data in bulk while paging through the records.
+
+            Records are read page by page with keyset pagination and each
+            tsv/csv part is written as soon as it is filled, so only one part
+            is held in memory. After each part the key of its last record is
+            saved in the checkpoint, so that a restarted export skips the parts
+            which are already written.
+
+        Args:
+            export_path (str): Directory path where export files will be written.
+            item_types (list): List of tuples (item_type_id, item_type_name) to export.
+            retrys (int): Number of retry attempts.
+            fromid (str, optional): Start item ID for export range. Defaults to "".
+            toid (str, optional): End item ID for export range. Defaults to "".
+            checkpoint (dict, optional): Export checkpoint. Defaults to None.
+
+        Returns:
+            bool: True if all parts were written, False if failed or canceled.
+        """
+        _limit = current_app.config["WEKO_SEARCH_UI_BULK_EXPORT_LIMIT"]
+        try:
+            write_file_json = {
+                'start_time': start_time,
+                'finish_time': '',
+                'export_path': export_path,
+                'cancel_flg': False,
+                'write_file_status': {
+                    part: 'finished' for part in checkpoint["finished"]
+                },
+                'exported_count': checkpoint["exported"],
+                'resumed_count': checkpoint["exported"],
+                'run_started': time(),
+                'run_finished': None,
+            }
+            reset_redis_cache(_file_create_key, json.dumps(write_file_json))
+
+            def _write_part(item_type_id, item_type_name, part, target_ids,
+                            is_last):
+                """Write one part file and checkpoint it."""
+                cached = json.loads(get_redis_cache(_file_create_key) or "{}")
+                if cached.get("cancel_flg"):
+                    return False
+                name = f"{item_type_name}({item_type_id})"
+                if part != 1 or not is_last:
+                    name = f"{name}.part{part}"
+                status_key = f"{item_type_id}.{part}"
+                write_file_json['write_file_status'][status_key] = 'started'
+                reset_redis_cache(_file_create_key, json.dumps(write_file_json))
+
+                item_datas = {
+                    "item_type_id": item_type_id,
+                    "name": name,
+                    "root_url": root_url,
+                    "jsonschema": "items/jsonschema/" + item_type_id,
+                    "keys": [],
+                    "labels": [],
+                    "recids": list(target_ids.values()),
+                    "data": {},
+                }
+                records = WekoRecord.get_records(list(target_ids.keys()))
+                for record in records:
+                    item_datas["data"][target_ids[record.id]] = record
+                result = write_files(item_datas, export_path, user_id, retrys)
+                del item_datas, records
+                gc.collect()
+                if not result:
+                    write_file_json['write_file_status'][status_key] = 'error'
+                    write_file_json['cancel_flg'] = True
+                    reset_redis_cache(_file_create_key, json.dumps(write_file_json))
+                    return False
+
+                write_file_json['write_file_status'][status_key] = 'finished'
+                write_file_json['exported_count'] += len(target_ids)
+                reset_redis_cache(_file_create_key, json.dumps(write_file_json))
+
+                state = checkpoint["item_types"][item_type_id]
+                state["after"] = target_ids[next(reversed(target_ids))]
+                state["part"] = part + 1
+                state["counter"] += len(target_ids)
+                checkpoint["finished"].append(status_key)
+                checkpoint["exported"] += len(target_ids)
+                set_export_checkpoint(user_id, checkpoint)
+                return True
+
+            index_id_list = _get_index_id_list(user_id)
+            for it in item_types.copy():
+                item_type_id = it[0]
+                item_type_name = it[1]
+                state = checkpoint["item_types"].setdefault(item_type_id, {
+                    "after": None,
+                    "part": 1,
+                    "counter": 0,
+                    "done": False,
+                })
+                if state["done"]:
+                    item_types.remove(it)
+                    continue
+                current_app.logger.info(
+                    f"Start bulk export of item type {item_type_name}({item_type_id})"
+                    f" after {state['after']}."
+                )
+
+                file_part = state["part"]
+                target_ids = OrderedDict()
+                for page in get_record_id_pages(
+                        item_type_id, fromid, toid, after_key=state["after"]):
+                    for recid, uuid in get_record_ids(page, index_id_list):
+                        if len(target_ids) >= _limit:
+                            if not _write_part(item_type_id, item_type_name,
+                                               file_part, target_ids, False):
+                                return False
+                            file_part += 1
+                            target_ids = OrderedDict()
+                        target_ids[uuid] = recid
+                    del page
+                if target_ids and not _write_part(item_type_id, item_type_name,
+                                                  file_part, target_ids, True):
+                    return False
+
+                state["done"] = True
+                set_export_checkpoint(user_id, checkpoint)
+                item_types.remove(it)
+                current_app.logger.info(
+                    f"Processed {state['counter']} items of item type {item_type_name}."
+                )
+
+            write_file_json['run_finished'] = time()
+            reset_redis_cache(_file_create_key, json.dumps(write_file_json))
+            delete_export_checkpoint(user_id)
+            return True
+        except SQLAlchemyError as ex:
+            import traceback
+            current_app.logger.error(traceback.format_exc())
+            _num_retry = current_app.config["WEKO_SEARCH_UI_BULK_EXPORT_RETRY"]
+            if retrys < _num_retry:
+                retrys += 1
+                current_app.logger.info(f"retry count: {retrys}")
+                db.session.rollback()
+                sleep(5)
+                return _get_export_data_stream(
+                    export_path, item_types, retrys, fromid, toid, checkpoint,
+                    user_id=user_id
+                )
+            else:
+                return False
+
     reset_redis_cache(_msg_key, "")
     reset_redis_cache(_run_msg_key, "")
     reset_redis_cache(_file_create_key, json.dumps({}))
 
+    _streaming = current_app.config.get(
+        "WEKO_SEARCH_UI_BULK_EXPORT_STREAMING", False)
     temp_path = os.getenv('TMPDIR')
     os.makedirs(temp_path, exist_ok=True)
     try:
@@ -4801,8 +5279,31 @@ def export_all(root_url, user_id, data, start_time):
         if prev_uri:
             delete_exported_file(prev_uri, _uri_key)
 
-        export_path = temp_path + "/" + datetime.utcnow().strftime("%Y%m%d%H%M%S%f")
-        os.makedirs(export_path, exist_ok=True)
+        checkpoint = None
+        if _streaming:
+            checkpoint = get_export_checkpoint(user_id)
+            if checkpoint and (checkpoint.get("data") != data
+                               or not os.path.isdir(checkpoint["export_path"])):
+                discard_export_checkpoint(user_id)
+                checkpoint = None
+        if checkpoint:
+            export_path = checkpoint["export_path"]
+            current_app.logger.info(
+                f"Resume bulk export in {export_path}: "
+                f"{checkpoint['exported']} items have been exported."
+            )
+        else:
+            export_path = temp_path + "/" + datetime.utcnow().strftime("%Y%m%d%H%M%S%f")
+            os.makedirs(export_path, exist_ok=True)
+            if _streaming:
+                checkpoint = {
+                    "data": data,
+                    "export_path": export_path,
+                    "item_types": {},
+                    "finished": [],
+                    "exported": 0,
+                }
+                set_export_checkpoint(user_id, checkpoint)
 
         item_type_id = data.get('item_type_id', "-1")
         item_types = _get_item_type_list(item_type_id)
@@ -4820,7 +5321,13 @@ def export_all(root_url, user_id, data, start_time):
 
         result = None
         if not fromid or not toid or (fromid and toid and int(fromid) <= int(toid)):
-            result = _get_export_data(export_path, item_types, 0, fromid, toid, user_id=user_id)
+            if _streaming:
+                result = _get_export_data_stream(
+                    export_path, item_types, 0, fromid, toid, checkpoint,
+                    user_id=user_id
+                )
+            else:
+                result = _get_export_data(export_path, item_types, 0, fromid, toid, user_id=user_id)
 
             if result:
                 db.session.commit()
@@ -4837,8 +5344,9 @@ def export_all(root_url, user_id, data, start_time):
         current_app.logger.error(traceback.format_exc())
         reset_redis_cache(_msg_key, "Export failed.")
         reset_redis_cache(_run_msg_key, "")
-        # delete temp directory
-        if "export_path" in locals() and os.path.isdir(export_path):
+        # delete temp directory unless the export can be resumed from it
+        if "export_path" in locals() and os.path.isdir(export_path) \
+                and not is_export_checkpointed(user_id, export_path):
             shutil.rmtree(export_path)
 
 
@@ -4957,6 +5465,169 @@ def get_record_ids(recids, index_id_list=None):
     return record_ids
 
 
+def get_record_id_pages(item_type_id, fromid="", toid="", after_key=None,
+                        page_size=None):
+    """Get record ids page by page with keyset pagination.
+
+    Pages are ordered by the number of the recid, as get_all_record_id, and
+    each page is read with ``recid > last recid of the previous page``, so
+    the cost of a page does not grow with how deep the export is. Only
+    publish_status and path are read from the record metadata.
+
+    Args:
+        item_type_id (str): The item type ID.
+        fromid (str, optional): The starting ID. Defaults to "".
+        toid (str, optional): The ending ID. Defaults to "".
+        after_key (str, optional): Recid to resume after. Defaults to None.
+        page_size (int, optional): Number of records per page.
+            Defaults to WEKO_SEARCH_UI_BULK_EXPORT_PAGE_SIZE.
+
+    Yields:
+        list: Rows of pid_value, object_uuid and json.
+    """
+    page_size = page_size or current_app.config.get(
+        "WEKO_SEARCH_UI_BULK_EXPORT_PAGE_SIZE", 1000)
+    to_number = _func.to_number(
+        PersistentIdentifier.pid_value,
+        current_app.config["WEKO_SEARCH_UI_TO_NUMBER_FORMAT"]
+    )
+    query = db.session.query(
+        PersistentIdentifier.pid_value,
+        PersistentIdentifier.object_uuid,
+        _func.jsonb_strip_nulls(_func.jsonb_build_object(
+            'publish_status', RecordMetadata.json['publish_status'],
+            'path', RecordMetadata.json['path']
+        )).label('json')
+    ).join(
+        ItemMetadata,
+        PersistentIdentifier.object_uuid == ItemMetadata.id,
+    ).join(
+        RecordMetadata,
+        PersistentIdentifier.object_uuid == RecordMetadata.id,
+    ).filter(
+        PersistentIdentifier.pid_type == "recid",
+        PersistentIdentifier.status == PIDStatus.REGISTERED,
+        PersistentIdentifier.pid_value.notlike("%.%"),
+        ItemMetadata.item_type_id == item_type_id
+    )
+    if fromid:
+        query = query.filter(to_number >= fromid)
+    if toid:
+        query = query.filter(to_number <= toid)
+
+    while True:
+        page_query = query
+        if after_key:
+            page_query = page_query.filter(to_number > after_key)
+        page = page_query.order_by(to_number).limit(page_size).all()
+        if not page:
+            break
+        yield page
+        if len(page) < page_size:
+            break
+        after_key = page[-1].pid_value
+
+
+def _get_export_checkpoint_key(user_id):
+    """Get cache key of the bulk export checkpoint."""
+    return current_app.config["WEKO_ADMIN_CACHE_PREFIX"].format(
+        name=current_app.config["WEKO_SEARCH_UI_BULK_EXPORT_CHECKPOINT"],
+        user_id=user_id
+    )
+
+
+def get_export_checkpoint(user_id):
+    """Get the checkpoint of the streaming bulk export.
+
+    Args:
+        user_id (int): performing user id
+
+    Returns:
+        dict: checkpoint, or None if there is no interrupted export.
+    """
+    checkpoint = get_redis_cache(_get_export_checkpoint_key(user_id))
+    return json.loads(checkpoint) if checkpoint else None
+
+
+def set_export_checkpoint(user_id, checkpoint):
+    """Save the checkpoint of the streaming bulk export.
+
+    Args:
+        user_id (int): performing user id
+        checkpoint (dict): export conditions, export path, last exported key
+            of each item type and the finished parts.
+    """
+    reset_redis_cache(
+        _get_export_checkpoint_key(user_id),
+        json.dumps(checkpoint),
+        ttl=current_app.config["WEKO_SEARCH_UI_EXPORT_FILE_RETENTION_DAYS"]
+            * 24 * 60 * 60
+    )
+
+
+def delete_export_checkpoint(user_id):
+    """Delete the checkpoint of the streaming bulk export.
+
+    Args:
+        user_id (int): performing user id
+    """
+    redis_connection = RedisConnection()
+    datastore = redis_connection.connection(db=current_app.config['CACHE_REDIS_DB'], kv = True)
+    cache_key = _get_export_checkpoint_key(user_id)
+    if datastore.redis.exists(cache_key):
+        datastore.delete(cache_key)
+
+
+def discard_export_checkpoint(user_id):
+    """Delete the checkpoint and the files of an interrupted export.
+
+    Args:
+        user_id (int): performing user id
+    """
+    checkpoint = get_export_checkpoint(user_id)
+    if checkpoint and os.path.isdir(checkpoint.get("export_path", "")):
+        shutil.rmtree(checkpoint["export_path"])
+    delete_export_checkpoint(user_id)
+
+
+def is_export_checkpointed(user_id, export_path):
+    """Check whether an export directory is kept for resuming.
+
+    Args:
+        user_id (int): performing user id
+        export_path (str): export directory
+
+    Returns:
+        bool: True if the checkpoint refers to the directory.
+    """
+    if not current_app.config.get("WEKO_SEARCH_UI_BULK_EXPORT_STREAMING", False):
+        return False
+    checkpoint = get_export_checkpoint(user_id)
+    return bool(checkpoint) and checkpoint.get("export_path") == export_path
+
+
+def get_export_throughput(write_file_data):
+    """Get the throughput of the streaming bulk export.
+
+    Args:
+        write_file_data (dict): file create status of the bulk export.
+
+    Returns:
+        float: exported items per minute in the current run,
+            or None if it is unknown.
+    """
+    run_started = write_file_data.get("run_started")
+    if not run_started:
+        return None
+    run_finished = write_file_data.get("run_finished") or time()
+    elapsed = run_finished - run_started
+    if elapsed <= 0:
+        return None
+    exported = write_file_data.get("exported_count", 0) \
+        - write_file_data.get("resumed_count", 0)
+    return round(exported * 60 / elapsed, 1)
+
+
 def write_files(item_datas, export_path, user_id, retrys):
     """Write TSV/CSV data to files.
     Args:
@@ -5133,7 +5804,8 @@ def cancel_export_all():
                     write_file_status[file] = 'canceled'
             json_data['write_file_status'] = write_file_status
             export_path = json_data.get("export_path")
-            shutil.rmtree(export_path)
+            if not is_export_checkpointed(current_user.get_id(), export_path):
+                shutil.rmtree(export_path)
             reset_redis_cache(_file_create_key, json.dumps(json_data))
 
         delete_task_id_cache_on_revoke.apply_async(
@@ -5310,9 +5982,17 @@ def get_export_status():
             os.remove(export_path + ".zip")
         elif status_cond and (write_file_status == 'REVOKED' or write_file_status == 'ERROR'):
             export_path = write_file_data['export_path']
-            if os.path.isdir(export_path):
+            if os.path.isdir(export_path) and \
+                    not is_export_checkpointed(current_user.get_id(), export_path):
                 shutil.rmtree(export_path)
 
+        throughput = get_export_throughput(write_file_data)
+        if throughput is not None:
+            run_message = "{} Throughput: {} items/min ({} items exported).".format(
+                run_message or "", throughput,
+                write_file_data.get("exported_count", 0)
+            ).strip()
+
     except Exception as ex:
         import traceback
         current_app.logger.error(traceback.format_exc())
@@ -5354,45 +6034,47 @@ def handle_remove_es_metadata(item, bef_metadata, bef_last_ver_metadata):
         item - {dict} Item metadata.
     """
     try:
-        item_id = item.get("id")
-        status = item.get("status")
-        indexer = WekoIndexer()
-        pid = WekoRecord.get_record_by_pid(item_id).pid_recid
-        if status == "new":
-            # delete temp data in ES
-            pid_lastest = WekoRecord.get_record_by_pid(item_id + ".1").pid_recid
-            indexer.delete_by_id(pid_lastest.object_uuid)
-            indexer.delete_by_id(pid.object_uuid)
-        else:
-            aft_metadata = indexer.get_metadata_by_item_id(pid.object_uuid)
-            aft_last_ver_metadata = indexer.get_metadata_by_item_id(
-                PIDVersioning(child=pid).last_child.object_uuid
-            )
-
-            # revert to previous data in ES
-            if bef_metadata["_version"] < aft_metadata["_version"]:
-                indexer.upload_metadata(
-                    bef_metadata["_source"], bef_metadata["_id"], 0, True
-                )
-            if (
-                status == "keep"
-                and bef_last_ver_metadata["_version"]
-                < aft_last_ver_metadata["_version"]
-            ):
-                indexer.upload_metadata(
-                    bef_last_ver_metadata["_source"],
-                    bef_last_ver_metadata["_id"],
-                    0,
-                    True,
+        # Restore the documents now, even in deferred_upload.
+        with WekoIndexer.direct_upload():
+            item_id = item.get("id")
+            status = item.get("status")
+            indexer = WekoIndexer()
+            pid = WekoRecord.get_record_by_pid(item_id).pid_recid
+            if status == "new":
+                # delete temp data in ES
+                pid_lastest = WekoRecord.get_record_by_pid(item_id + ".1").pid_recid
+                indexer.delete_by_id(pid_lastest.object_uuid)
+                indexer.delete_by_id(pid.object_uuid)
+            else:
+                aft_metadata = indexer.get_metadata_by_item_id(pid.object_uuid)
+                aft_last_ver_metadata = indexer.get_metadata_by_item_id(
+                    PIDVersioning(child=pid).last_child.object_uuid
                 )
 
-            # delete new version in ES
-            if (
-                status == "upgrade"
-                and bef_last_ver_metadata["_source"]["control_number"]
-                < aft_last_ver_metadata["_source"]["control_number"]
-            ):
-                indexer.delete_by_id(aft_last_ver_metadata["_id"])
+                # revert to previous data in ES
+                if bef_metadata["_version"] < aft_metadata["_version"]:
+                    indexer.upload_metadata(
+                        bef_metadata["_source"], bef_metadata["_id"], 0, True
+                    )
+                if (
+                    status == "keep"
+                    and bef_last_ver_metadata["_version"]
+                    < aft_last_ver_metadata["_version"]
+                ):
+                    indexer.upload_metadata(
+                        bef_last_ver_metadata["_source"],
+                        bef_last_ver_metadata["_id"],
+                        0,
+                        True,
+                    )
+
+                # delete new version in ES
+                if (
+                    status == "upgrade"
+                    and bef_last_ver_metadata["_source"]["control_number"]
+                    < aft_last_ver_metadata["_source"]["control_number"]
+                ):
+                    indexer.delete_by_id(aft_last_ver_metadata["_id"])
     except Exception as ex:
         current_app.logger.error(ex)
 
@@ -5990,7 +6672,8 @@ def check_replace_file_import_items(list_record, data_path=None, is_gakuninrdm=F
         list_record = list_record[:1]
     # current_app.logger.debug("list_record1: {}".format(list_record))
     # [{'pos_index': ['Index A'], 'publish_status': 'public', 'feedback_mail': ['wekosoftware@nii.ac.jp'], 'edit_mode': 'Keep', 'metadata': {'pubdate': '2021-03-19', 'item_1617186331708': [{'subitem_1551255647225': 'ja_conference paperITEM00000001(public_open_access_open_access_simple)', 'subitem_1551255648112': 'ja'}, {'subitem_1551255647225': 'en_conference paperITEM00000001(public_open_access_simple)', 'subitem_1551255648112': 'en'}], 'item_1617186385884': [{'subitem_1551255720400': 'Alternative Title', 'subitem_1551255721061': 'en'}, {'subitem_1551255720400': 'Alternative Title', 'subitem_1551255721061': 'ja'}], 'item_1617186419668': [{'creatorAffiliations': [{'affiliationNameIdentifiers': [{'affiliationNameIdentifier': '0000000121691048', 'affiliationNameIdentifierScheme': 'ISNI', 'affiliationNameIdentifierURI': 'http://isni.org/isni/0000000121691048'}], 'affiliationNames': [{'affiliationName': 'University', 'affiliationNameLang': 'en'}]}], 'creatorMails': [{'creatorMail': 'wekosoftware@nii.ac.jp'}], 'creatorNames': [{'creatorName': '情報, 太郎', 'creatorNameLang': 'ja'}, {'creatorName': 'ジョウホウ, タロウ', 'creatorNameLang': 'ja-Kana'}, {'creatorName': 'Joho, Taro', 'creatorNameLang': 'en'}], 'familyNames': [{'familyName': '情報', 'familyNameLang': 'ja'}, {'familyName': 'ジョウホウ', 'familyNameLang': 'ja-Kana'}, {'familyName': 'Joho', 'familyNameLang': 'en'}], 'givenNames': [{'givenName': '太郎', 'givenNameLang': 'ja'}, {'givenName': 'タロウ', 'givenNameLang': 'ja-Kana'}, {'givenName': 'Taro', 'givenNameLang': 'en'}], 'nameIdentifiers': [{'nameIdentifier': '4', 'nameIdentifierScheme': 'WEKO'}, {'nameIdentifier': 'xxxxxxx', 'nameIdentifierScheme': 'ORCID', 'nameIdentifierURI': 'https://orcid.org/'}, {'nameIdentifier': 'xxxxxxx', 'nameIdentifierScheme': 'CiNii', 'nameIdentifierURI': 'https://ci.nii.ac.jp/'}, {'nameIdentifier': 'zzzzzzz', 'nameIdentifierScheme': 'KAKEN2', 'nameIdentifierURI': 'https://kaken.nii.ac.jp/'}]}, {'creatorMails': [{'creatorMail': 'wekosoftware@nii.ac.jp'}], 'creatorNames': [{'creatorName': '情報, 太郎', 'creatorNameLang': 'ja'}, {'creatorName': 'ジョウホウ, タロウ', 'creatorNameLang': 'ja-Kana'}, {'creatorName': 'Joho, Taro', 'creatorNameLang': 'en'}], 'familyNames': [{'familyName': '情報', 'familyNameLang': 'ja'}, {'familyName': 'ジョウホウ', 'familyNameLang': 'ja-Kana'}, {'familyName': 'Joho', 'familyNameLang': 'en'}], 'givenNames': [{'givenName': '太郎', 'givenNameLang': 'ja'}, {'givenName': 'タロウ', 'givenNameLang': 'ja-Kana'}, {'givenName': 'Taro', 'givenNameLang': 'en'}], 'nameIdentifiers': [{'nameIdentifier': 'xxxxxxx', 'nameIdentifierScheme': 'ORCID', 'nameIdentifierURI': 'https://orcid.org/'}, {'nameIdentifier': 'xxxxxxx', 'nameIdentifierScheme': 'CiNii', 'nameIdentifierURI': 'https://ci.nii.ac.jp/'}, {'nameIdentifier': 'zzzzzzz', 'nameIdentifierScheme': 'KAKEN2', 'nameIdentifierURI': 'https://kaken.nii.ac.jp/'}]}, {'creatorMails': [{'creatorMail': 'wekosoftware@nii.ac.jp'}], 'creatorNames': [{'creatorName': '情報, 太郎', 'creatorNameLang': 'ja'}, {'creatorName': 'ジョウホウ, タロウ', 'creatorNameLang': 'ja-Kana'}, {'creatorName': 'Joho, Taro', 'creatorNameLang': 'en'}], 'familyNames': [{'familyName': '情報', 'familyNameLang': 'ja'}, {'familyName': 'ジョウホウ', 'familyNameLang': 'ja-Kana'}, {'familyName': 'Joho', 'familyNameLang': 'en'}], 'givenNames': [{'givenName': '太郎', 'givenNameLang': 'ja'}, {'givenName': 'タロウ', 'givenNameLang': 'ja-Kana'}, {'givenName': 'Taro', 'givenNameLang': 'en'}], 'nameIdentifiers': [{'nameIdentifier': 'xxxxxxx', 'nameIdentifierScheme': 'ORCID', 'nameIdentifierURI': 'https://orcid.org/'}, {'nameIdentifier': 'xxxxxxx', 'nameIdentifierScheme': 'CiNii', 'nameIdentifierURI': 'https://ci.nii.ac.jp/'}, {'nameIdentifier': 'zzzzzzz', 'nameIdentifierScheme': 'KAKEN2', 'nameIdentifierURI': 'https://kaken.nii.ac.jp/'}]}], 'item_1617349709064': [{'contributorMails': [{'contributorMail': 'wekosoftware@nii.ac.jp'}], 'contributorNames': [{'contributorName': '情報, 太郎', 'lang': 'ja'}, {'contributorName': 'ジョウホウ, タロウ', 'lang': 'ja-Kana'}, {'contributorName': 'Joho, Taro', 'lang': 'en'}], 'contributorType': 'ContactPerson', 'familyNames': [{'familyName': '情報', 'familyNameLang': 'ja'}, {'familyName': 'ジョウホウ', 'familyNameLang': 'ja-Kana'}, {'familyName': 'Joho', 'familyNameLang': 'en'}], 'givenNames': [{'givenName': '太郎', 'givenNameLang': 'ja'}, {'givenName': 'タロウ', 'givenNameLang': 'ja-Kana'}, {'givenName': 'Taro', 'givenNameLang': 'en'}], 'nameIdentifiers': [{'nameIdentifier': 'xxxxxxx', 'nameIdentifierScheme': 'ORCID', 'nameIdentifierURI': 'https://orcid.org/'}, {'nameIdentifier': 'xxxxxxx', 'nameIdentifierScheme': 'CiNii', 'nameIdentifierURI': 'https://ci.nii.ac.jp/'}, {'nameIdentifier': 'xxxxxxx', 'nameIdentifierScheme': 'KAKEN2', 'nameIdentifierURI': 'https://kaken.nii.ac.jp/'}]}], 'item_1617186476635': {'subitem_1522299639480': 'open access', 'subitem_1600958577026': 'http://purl.org/coar/access_right/c_abf2'}, 'item_1617351524846': {'subitem_1523260933860': 'Unknown'}, 'item_1617186499011': [{'subitem_1522650717957': 'ja', 'subitem_1522650727486': 'http://localhost', 'subitem_1522651041219': 'Rights Information'}], 'item_1617610673286': [{'nameIdentifiers': [{'nameIdentifier': 'xxxxxx', 'nameIdentifierScheme': 'ORCID', 'nameIdentifierURI': 'https://orcid.org/'}], 'rightHolderNames': [{'rightHolderLanguage': 'ja', 'rightHolderName': 'Right Holder Name'}]}], 'item_1617186609386': [{'subitem_1522299896455': 'ja', 'subitem_1522300014469': 'Other', 'subitem_1522300048512': 'http://localhost/', 'subitem_1523261968819': 'Sibject1'}], 'item_1617186626617': [{'subitem_description': 'Description\nDescription<br/>Description', 'subitem_description_language': 'en', 'subitem_description_type': 'Abstract'}, {'subitem_description': '概要\n概要\n概要\n概要', 'subitem_description_language': 'ja', 'subitem_description_type': 'Abstract'}], 'item_1617186643794': [{'subitem_1522300295150': 'en', 'subitem_1522300316516': 'Publisher'}], 'item_1617186660861': [{'subitem_1522300695726': 'Available', 'subitem_1522300722591': '2021-06-30'}], 'item_1617186702042': [{'subitem_1551255818386': 'jpn'}], 'item_1617258105262': {'resourcetype': 'conference paper', 'resourceuri': 'http://purl.org/coar/resource_type/c_5794'}, 'item_1617349808926': {'subitem_1523263171732': 'Version'}, 'item_1617265215918': {'subitem_1522305645492': 'AO', 'subitem_1600292170262': 'http://purl.org/coar/version/c_b1a7d7d4d402bcce'}, 'item_1617186783814': [{'subitem_identifier_type': 'URI', 'subitem_identifier_uri': 'http://localhost'}], 'item_1617353299429': [{'subitem_1522306207484': 'isVersionOf', 'subitem_1522306287251': {'subitem_1522306382014': 'arXiv', 'subitem_1522306436033': 'xxxxx'}, 'subitem_1523320863692': [{'subitem_1523320867455': 'en', 'subitem_1523320909613': 'Related Title'}]}], 'item_1617186859717': [{'subitem_1522658018441': 'en', 'subitem_1522658031721': 'Temporal'}], 'item_1617186882738': [{'subitem_geolocation_place': [{'subitem_geolocation_place_text': 'Japan'}]}], 'item_1617186901218': [{'subitem_1522399143519': {'subitem_1522399281603': 'ISNI', 'subitem_1522399333375': 'http://xxx'}, 'subitem_1522399412622': [{'subitem_1522399416691': 'en', 'subitem_1522737543681': 'Funder Name'}], 'subitem_1522399571623': {'subitem_1522399585738': 'Award URI', 'subitem_1522399628911': 'Award Number'}, 'subitem_1522399651758': [{'subitem_1522721910626': 'en', 'subitem_1522721929892': 'Award Title'}]}], 'item_1617186920753': [{'subitem_1522646500366': 'ISSN', 'subitem_1522646572813': 'xxxx-xxxx-xxxx'}], 'item_1617186941041': [{'subitem_1522650068558': 'en', 'subitem_1522650091861': 'Source Title'}], 'item_1617186959569': {'subitem_1551256328147': '1'}, 'item_1617186981471': {'subitem_1551256294723': '111'}, 'item_1617186994930': {'subitem_1551256248092': '12'}, 'item_1617187024783': {'subitem_1551256198917': '1'}, 'item_1617187045071': {'subitem_1551256185532': '3'}, 'item_1617187112279': [{'subitem_1551256126428': 'Degree Name', 'subitem_1551256129013': 'en'}], 'item_1617187136212': {'subitem_1551256096004': '2021-06-30'}, 'item_1617944105607': [{'subitem_1551256015892': [{'subitem_1551256027296': 'xxxxxx', 'subitem_1551256029891': 'kakenhi'}], 'subitem_1551256037922': [{'subitem_1551256042287': 'Degree Grantor Name', 'subitem_1551256047619': 'en'}]}], 'item_1617187187528': [{'subitem_1599711633003': [{'subitem_1599711636923': 'Conference Name', 'subitem_1599711645590': 'ja'}], 'subitem_1599711655652': '1', 'subitem_1599711660052': [{'subitem_1599711680082': 'Sponsor', 'subitem_1599711686511': 'ja'}], 'subitem_1599711699392': {'subitem_1599711704251': '2020/12/11', 'subitem_1599711712451': '1', 'subitem_1599711727603': '12', 'subitem_1599711731891': '2000', 'subitem_1599711735410': '1', 'subitem_1599711739022': '12', 'subitem_1599711743722': '2020', 'subitem_1599711745532': 'ja'}, 'subitem_1599711758470': [{'subitem_1599711769260': 'Conference Venue', 'subitem_1599711775943': 'ja'}], 'subitem_1599711788485': [{'subitem_1599711798761': 'Conference Place', 'subitem_1599711803382': 'ja'}], 'subitem_1599711813532': 'JPN'}], 'item_1617605131499': [{'accessrole': 'open_access', 'date': [{'dateType': 'Available', 'dateValue': '2021-07-12'}], 'displaytype': 'simple', 'filename': '1KB.pdf', 'filesize': [{'value': '1 KB'}], 'format': 'text/plain'}, {'filename': ''}], 'item_1617620223087': [{'subitem_1565671149650': 'ja', 'subitem_1565671169640': 'Banner Headline', 'subitem_1565671178623': 'Subheading'}, {'subitem_1565671149650': 'en', 'subitem_1565671169640': 'Banner Headline', 'subitem_1565671178623': 'Subheding'}]}, 'file_path': ['file00000001/1KB.pdf', ''], 'item_type_name': 'デフォルトアイテムタイプ（フル）', 'item_type_id': 15, '$schema': 'https://localhost:8443/items/jsonschema/15', 'identifier_key': 'item_1617186819068', 'errors': None}]
-    list_record = handle_check_exist_record(list_record)
+    lookup = ImportCheckLookup(list_record)
+    list_record = handle_check_exist_record(list_record, lookup)
     # current_app.logger.debug("list_record2: {}".format(list_record))
     # [{'pos_index': ['Index A'], 'publish_status': 'public', 'feedback_mail': ['wekosoftware@nii.ac.jp'], 'edit_mode': 'Keep', 'metadata': {'pubdate': '2021-03-19', 'item_1617186331708': [{'subitem_1551255647225': 'ja_conference paperITEM00000001(public_open_access_open_access_simple)', 'subitem_1551255648112': 'ja'}, {'subitem_1551255647225': 'en_conference paperITEM00000001(public_open_access_simple)', 'subitem_1551255648112': 'en'}], 'item_1617186385884': [{'subitem_1551255720400': 'Alternative Title', 'subitem_1551255721061': 'en'}, {'subitem_1551255720400': 'Alternative Title', 'subitem_1551255721061': 'ja'}], 'item_1617186419668': [{'creatorAffiliations': [{'affiliationNameIdentifiers': [{'affiliationNameIdentifier': '0000000121691048', 'affiliationNameIdentifierScheme': 'ISNI', 'affiliationNameIdentifierURI': 'http://isni.org/isni/0000000121691048'}], 'affiliationNames': [{'affiliationName': 'University', 'affiliationNameLang': 'en'}]}], 'creatorMails': [{'creatorMail': 'wekosoftware@nii.ac.jp'}], 'creatorNames': [{'creatorName': '情報, 太郎', 'creatorNameLang': 'ja'}, {'creatorName': 'ジョウホウ, タロウ', 'creatorNameLang': 'ja-Kana'}, {'creatorName': 'Joho, Taro', 'creatorNameLang': 'en'}], 'familyNames': [{'familyName': '情報', 'familyNameLang': 'ja'}, {'familyName': 'ジョウホウ', 'familyNameLang': 'ja-Kana'}, {'familyName': 'Joho', 'familyNameLang': 'en'}], 'givenNames': [{'givenName': '太郎', 'givenNameLang': 'ja'}, {'givenName': 'タロウ', 'givenNameLang': 'ja-Kana'}, {'givenName': 'Taro', 'givenNameLang': 'en'}], 'nameIdentifiers': [{'nameIdentifier': '4', 'nameIdentifierScheme': 'WEKO'}, {'nameIdentifier': 'xxxxxxx', 'nameIdentifierScheme': 'ORCID', 'nameIdentifierURI': 'https://orcid.org/'}, {'nameIdentifier': 'xxxxxxx', 'nameIdentifierScheme': 'CiNii', 'nameIdentifierURI': 'https://ci.nii.ac.jp/'}, {'nameIdentifier': 'zzzzzzz', 'nameIdentifierScheme': 'KAKEN2', 'nameIdentifierURI': 'https://kaken.nii.ac.jp/'}]}, {'creatorMails': [{'creatorMail': 'wekosoftware@nii.ac.jp'}], 'creatorNames': [{'creatorName': '情報, 太郎', 'creatorNameLang': 'ja'}, {'creatorName': 'ジョウホウ, タロウ', 'creatorNameLang': 'ja-Kana'}, {'creatorName': 'Joho, Taro', 'creatorNameLang': 'en'}], 'familyNames': [{'familyName': '情報', 'familyNameLang': 'ja'}, {'familyName': 'ジョウホウ', 'familyNameLang': 'ja-Kana'}, {'familyName': 'Joho', 'familyNameLang': 'en'}], 'givenNames': [{'givenName': '太郎', 'givenNameLang': 'ja'}, {'givenName': 'タロウ', 'givenNameLang': 'ja-Kana'}, {'givenName': 'Taro', 'givenNameLang': 'en'}], 'nameIdentifiers': [{'nameIdentifier': 'xxxxxxx', 'nameIdentifierScheme': 'ORCID', 'nameIdentifierURI': 'https://orcid.org/'}, {'nameIdentifier': 'xxxxxxx', 'nameIdentifierScheme': 'CiNii', 'nameIdentifierURI': 'https://ci.nii.ac.jp/'}, {'nameIdentifier': 'zzzzzzz', 'nameIdentifierScheme': 'KAKEN2', 'nameIdentifierURI': 'https://kaken.nii.ac.jp/'}]}, {'creatorMails': [{'creatorMail': 'wekosoftware@nii.ac.jp'}], 'creatorNames': [{'creatorName': '情報, 太郎', 'creatorNameLang': 'ja'}, {'creatorName': 'ジョウホウ, タロウ', 'creatorNameLang': 'ja-Kana'}, {'creatorName': 'Joho, Taro', 'creatorNameLang': 'en'}], 'familyNames': [{'familyName': '情報', 'familyNameLang': 'ja'}, {'familyName': 'ジョウホウ', 'familyNameLang': 'ja-Kana'}, {'familyName': 'Joho', 'familyNameLang': 'en'}], 'givenNames': [{'givenName': '太郎', 'givenNameLang': 'ja'}, {'givenName': 'タロウ', 'givenNameLang': 'ja-Kana'}, {'givenName': 'Taro', 'givenNameLang': 'en'}], 'nameIdentifiers': [{'nameIdentifier': 'xxxxxxx', 'nameIdentifierScheme': 'ORCID', 'nameIdentifierURI': 'https://orcid.org/'}, {'nameIdentifier': 'xxxxxxx', 'nameIdentifierScheme': 'CiNii', 'nameIdentifierURI': 'https://ci.nii.ac.jp/'}, {'nameIdentifier': 'zzzzzzz', 'nameIdentifierScheme': 'KAKEN2', 'nameIdentifierURI': 'https://kaken.nii.ac.jp/'}]}], 'item_1617349709064': [{'contributorMails': [{'contributorMail': 'wekosoftware@nii.ac.jp'}], 'contributorNames': [{'contributorName': '情報, 太郎', 'lang': 'ja'}, {'contributorName': 'ジョウホウ, タロウ', 'lang': 'ja-Kana'}, {'contributorName': 'Joho, Taro', 'lang': 'en'}], 'contributorType': 'ContactPerson', 'familyNames': [{'familyName': '情報', 'familyNameLang': 'ja'}, {'familyName': 'ジョウホウ', 'familyNameLang': 'ja-Kana'}, {'familyName': 'Joho', 'familyNameLang': 'en'}], 'givenNames': [{'givenName': '太郎', 'givenNameLang': 'ja'}, {'givenName': 'タロウ', 'givenNameLang': 'ja-Kana'}, {'givenName': 'Taro', 'givenNameLang': 'en'}], 'nameIdentifiers': [{'nameIdentifier': 'xxxxxxx', 'nameIdentifierScheme': 'ORCID', 'nameIdentifierURI': 'https://orcid.org/'}, {'nameIdentifier': 'xxxxxxx', 'nameIdentifierScheme': 'CiNii', 'nameIdentifierURI': 'https://ci.nii.ac.jp/'}, {'nameIdentifier': 'xxxxxxx', 'nameIdentifierScheme': 'KAKEN2', 'nameIdentifierURI': 'https://kaken.nii.ac.jp/'}]}], 'item_1617186476635': {'subitem_1522299639480': 'open access', 'subitem_1600958577026': 'http://purl.org/coar/access_right/c_abf2'}, 'item_1617351524846': {'subitem_1523260933860': 'Unknown'}, 'item_1617186499011': [{'subitem_1522650717957': 'ja', 'subitem_1522650727486': 'http://localhost', 'subitem_1522651041219': 'Rights Information'}], 'item_1617610673286': [{'nameIdentifiers': [{'nameIdentifier': 'xxxxxx', 'nameIdentifierScheme': 'ORCID', 'nameIdentifierURI': 'https://orcid.org/'}], 'rightHolderNames': [{'rightHolderLanguage': 'ja', 'rightHolderName': 'Right Holder Name'}]}], 'item_1617186609386': [{'subitem_1522299896455': 'ja', 'subitem_1522300014469': 'Other', 'subitem_1522300048512': 'http://localhost/', 'subitem_1523261968819': 'Sibject1'}], 'item_1617186626617': [{'subitem_description': 'Description\nDescription<br/>Description', 'subitem_description_language': 'en', 'subitem_description_type': 'Abstract'}, {'subitem_description': '概要\n概要\n概要\n概要', 'subitem_description_language': 'ja', 'subitem_description_type': 'Abstract'}], 'item_1617186643794': [{'subitem_1522300295150': 'en', 'subitem_1522300316516': 'Publisher'}], 'item_1617186660861': [{'subitem_1522300695726': 'Available', 'subitem_1522300722591': '2021-06-30'}], 'item_1617186702042': [{'subitem_1551255818386': 'jpn'}], 'item_1617258105262': {'resourcetype': 'conference paper', 'resourceuri': 'http://purl.org/coar/resource_type/c_5794'}, 'item_1617349808926': {'subitem_1523263171732': 'Version'}, 'item_1617265215918': {'subitem_1522305645492': 'AO', 'subitem_1600292170262': 'http://purl.org/coar/version/c_b1a7d7d4d402bcce'}, 'item_1617186783814': [{'subitem_identifier_type': 'URI', 'subitem_identifier_uri': 'http://localhost'}], 'item_1617353299429': [{'subitem_1522306207484': 'isVersionOf', 'subitem_1522306287251': {'subitem_1522306382014': 'arXiv', 'subitem_1522306436033': 'xxxxx'}, 'subitem_1523320863692': [{'subitem_1523320867455': 'en', 'subitem_1523320909613': 'Related Title'}]}], 'item_1617186859717': [{'subitem_1522658018441': 'en', 'subitem_1522658031721': 'Temporal'}], 'item_1617186882738': [{'subitem_geolocation_place': [{'subitem_geolocation_place_text': 'Japan'}]}], 'item_1617186901218': [{'subitem_1522399143519': {'subitem_1522399281603': 'ISNI', 'subitem_1522399333375': 'http://xxx'}, 'subitem_1522399412622': [{'subitem_1522399416691': 'en', 'subitem_1522737543681': 'Funder Name'}], 'subitem_1522399571623': {'subitem_1522399585738': 'Award URI', 'subitem_1522399628911': 'Award Number'}, 'subitem_1522399651758': [{'subitem_1522721910626': 'en', 'subitem_1522721929892': 'Award Title'}]}], 'item_1617186920753': [{'subitem_1522646500366': 'ISSN', 'subitem_1522646572813': 'xxxx-xxxx-xxxx'}], 'item_1617186941041': [{'subitem_1522650068558': 'en', 'subitem_1522650091861': 'Source Title'}], 'item_1617186959569': {'subitem_1551256328147': '1'}, 'item_1617186981471': {'subitem_1551256294723': '111'}, 'item_1617186994930': {'subitem_1551256248092': '12'}, 'item_1617187024783': {'subitem_1551256198917': '1'}, 'item_1617187045071': {'subitem_1551256185532': '3'}, 'item_1617187112279': [{'subitem_1551256126428': 'Degree Name', 'subitem_1551256129013': 'en'}], 'item_1617187136212': {'subitem_1551256096004': '2021-06-30'}, 'item_1617944105607': [{'subitem_1551256015892': [{'subitem_1551256027296': 'xxxxxx', 'subitem_1551256029891': 'kakenhi'}], 'subitem_1551256037922': [{'subitem_1551256042287': 'Degree Grantor Name', 'subitem_1551256047619': 'en'}]}], 'item_1617187187528': [{'subitem_1599711633003': [{'subitem_1599711636923': 'Conference Name', 'subitem_1599711645590': 'ja'}], 'subitem_1599711655652': '1', 'subitem_1599711660052': [{'subitem_1599711680082': 'Sponsor', 'subitem_1599711686511': 'ja'}], 'subitem_1599711699392': {'subitem_1599711704251': '2020/12/11', 'subitem_1599711712451': '1', 'subitem_1599711727603': '12', 'subitem_1599711731891': '2000', 'subitem_1599711735410': '1', 'subitem_1599711739022': '12', 'subitem_1599711743722': '2020', 'subitem_1599711745532': 'ja'}, 'subitem_1599711758470': [{'subitem_1599711769260': 'Conference Venue', 'subitem_1599711775943': 'ja'}], 'subitem_1599711788485': [{'subitem_1599711798761': 'Conference Place', 'subitem_1599711803382': 'ja'}], 'subitem_1599711813532': 'JPN'}], 'item_1617605131499': [{'accessrole': 'open_access', 'date': [{'dateType': 'Available', 'dateValue': '2021-07-12'}], 'displaytype': 'simple', 'filename': '1KB.pdf', 'filesize': [{'value': '1 KB'}], 'format': 'text/plain'}, {'filename': ''}], 'item_1617620223087': [{'subitem_1565671149650': 'ja', 'subitem_1565671169640': 'Banner Headline', 'subitem_1565671178623': 'Subheading'}, {'subitem_1565671149650': 'en', 'subitem_1565671169640': 'Banner Headline', 'subitem_1565671178623': 'Subheding'}]}, 'file_path': ['file00000001/1KB.pdf', ''], 'item_type_name': 'デフォルトアイテムタイプ（フル）', 'item_type_id': 15, '$schema': 'https://localhost:8443/items/jsonschema/15', 'identifier_key': 'item_1617186819068', 'errors': None, 'status': 'new', 'id': None}]
     handle_item_title(list_record)
@@ -6002,7 +6685,8 @@ def check_replace_file_import_items(list_record, data_path=None, is_gakuninrdm=F
     # [{'pos_index': ['Index A'], 'publish_status': 'public', 'feedback_mail': ['wekosoftware@nii.ac.jp'], 'edit_mode': 'Keep', 'metadata': {'pubdate': '2021-03-19', 'item_1617186331708': [{'subitem_1551255647225': 'ja_conference paperITEM00000001(public_open_access_open_access_simple)', 'subitem_1551255648112': 'ja'}, {'subitem_1551255647225': 'en_conference paperITEM00000001(public_open_access_simple)', 'subitem_1551255648112': 'en'}], 'item_1617186385884': [{'subitem_1551255720400': 'Alternative Title', 'subitem_1551255721061': 'en'}, {'subitem_1551255720400': 'Alternative Title', 'subitem_1551255721061': 'ja'}], 'item_1617186419668': [{'creatorAffiliations': [{'affiliationNameIdentifiers': [{'affiliationNameIdentifier': '0000000121691048', 'affiliationNameIdentifierScheme': 'ISNI', 'affiliationNameIdentifierURI': 'http://isni.org/isni/0000000121691048'}], 'affiliationNames': [{'affiliationName': 'University', 'affiliationNameLang': 'en'}]}], 'creatorMails': [{'creatorMail': 'wekosoftware@nii.ac.jp'}], 'creatorNames': [{'creatorName': '情報, 太郎', 'creatorNameLang': 'ja'}, {'creatorName': 'ジョウホウ, タロウ', 'creatorNameLang': 'ja-Kana'}, {'creatorName': 'Joho, Taro', 'creatorNameLang': 'en'}], 'familyNames': [{'familyName': '情報', 'familyNameLang': 'ja'}, {'familyName': 'ジョウホウ', 'familyNameLang': 'ja-Kana'}, {'familyName': 'Joho', 'familyNameLang': 'en'}], 'givenNames': [{'givenName': '太郎', 'givenNameLang': 'ja'}, {'givenName': 'タロウ', 'givenNameLang': 'ja-Kana'}, {'givenName': 'Taro', 'givenNameLang': 'en'}], 'nameIdentifiers': [{'nameIdentifier': '4', 'nameIdentifierScheme': 'WEKO'}, {'nameIdentifier': 'xxxxxxx', 'nameIdentifierScheme': 'ORCID', 'nameIdentifierURI': 'https://orcid.org/'}, {'nameIdentifier': 'xxxxxxx', 'nameIdentifierScheme': 'CiNii', 'nameIdentifierURI': 'https://ci.nii.ac.jp/'}, {'nameIdentifier': 'zzzzzzz', 'nameIdentifierScheme': 'KAKEN2', 'nameIdentifierURI': 'https://kaken.nii.ac.jp/'}]}, {'creatorMails': [{'creatorMail': 'wekosoftware@nii.ac.jp'}], 'creatorNames': [{'creatorName': '情報, 太郎', 'creatorNameLang': 'ja'}, {'creatorName': 'ジョウホウ, タロウ', 'creatorNameLang': 'ja-Kana'}, {'creatorName': 'Joho, Taro', 'creatorNameLang': 'en'}], 'familyNames': [{'familyName': '情報', 'familyNameLang': 'ja'}, {'familyName': 'ジョウホウ', 'familyNameLang': 'ja-Kana'}, {'familyName': 'Joho', 'familyNameLang': 'en'}], 'givenNames': [{'givenName': '太郎', 'givenNameLang': 'ja'}, {'givenName': 'タロウ', 'givenNameLang': 'ja-Kana'}, {'givenName': 'Taro', 'givenNameLang': 'en'}], 'nameIdentifiers': [{'nameIdentifier': 'xxxxxxx', 'nameIdentifierScheme': 'ORCID', 'nameIdentifierURI': 'https://orcid.org/'}, {'nameIdentifier': 'xxxxxxx', 'nameIdentifierScheme': 'CiNii', 'nameIdentifierURI': 'https://ci.nii.ac.jp/'}, {'nameIdentifier': 'zzzzzzz', 'nameIdentifierScheme': 'KAKEN2', 'nameIdentifierURI': 'https://kaken.nii.ac.jp/'}]}, {'creatorMails': [{'creatorMail': 'wekosoftware@nii.ac.jp'}], 'creatorNames': [{'creatorName': '情報, 太郎', 'creatorNameLang': 'ja'}, {'creatorName': 'ジョウホウ, タロウ', 'creatorNameLang': 'ja-Kana'}, {'creatorName': 'Joho, Taro', 'creatorNameLang': 'en'}], 'familyNames': [{'familyName': '情報', 'familyNameLang': 'ja'}, {'familyName': 'ジョウホウ', 'familyNameLang': 'ja-Kana'}, {'familyName': 'Joho', 'familyNameLang': 'en'}], 'givenNames': [{'givenName': '太郎', 'givenNameLang': 'ja'}, {'givenName': 'タロウ', 'givenNameLang': 'ja-Kana'}, {'givenName': 'Taro', 'givenNameLang': 'en'}], 'nameIdentifiers': [{'nameIdentifier': 'xxxxxxx', 'nameIdentifierScheme': 'ORCID', 'nameIdentifierURI': 'https://orcid.org/'}, {'nameIdentifier': 'xxxxxxx', 'nameIdentifierScheme': 'CiNii', 'nameIdentifierURI': 'https://ci.nii.ac.jp/'}, {'nameIdentifier': 'zzzzzzz', 'nameIdentifierScheme': 'KAKEN2', 'nameIdentifierURI': 'https://kaken.nii.ac.jp/'}]}], 'item_1617349709064': [{'contributorMails': [{'contributorMail': 'wekosoftware@nii.ac.jp'}], 'contributorNames': [{'contributorName': '情報, 太郎', 'lang': 'ja'}, {'contributorName': 'ジョウホウ, タロウ', 'lang': 'ja-Kana'}, {'contributorName': 'Joho, Taro', 'lang': 'en'}], 'contributorType': 'ContactPerson', 'familyNames': [{'familyName': '情報', 'familyNameLang': 'ja'}, {'familyName': 'ジョウホウ', 'familyNameLang': 'ja-Kana'}, {'familyName': 'Joho', 'familyNameLang': 'en'}], 'givenNames': [{'givenName': '太郎', 'givenNameLang': 'ja'}, {'givenName': 'タロウ', 'givenNameLang': 'ja-Kana'}, {'givenName': 'Taro', 'givenNameLang': 'en'}], 'nameIdentifiers': [{'nameIdentifier': 'xxxxxxx', 'nameIdentifierScheme': 'ORCID', 'nameIdentifierURI': 'https://orcid.org/'}, {'nameIdentifier': 'xxxxxxx', 'nameIdentifierScheme': 'CiNii', 'nameIdentifierURI': 'https://ci.nii.ac.jp/'}, {'nameIdentifier': 'xxxxxxx', 'nameIdentifierScheme': 'KAKEN2', 'nameIdentifierURI': 'https://kaken.nii.ac.jp/'}]}], 'item_1617186476635': {'subitem_1522299639480': 'open access', 'subitem_1600958577026': 'http://purl.org/coar/access_right/c_abf2'}, 'item_1617351524846': {'subitem_1523260933860': 'Unknown'}, 'item_1617186499011': [{'subitem_1522650717957': 'ja', 'subitem_1522650727486': 'http://localhost', 'subitem_1522651041219': 'Rights Information'}], 'item_1617610673286': [{'nameIdentifiers': [{'nameIdentifier': 'xxxxxx', 'nameIdentifierScheme': 'ORCID', 'nameIdentifierURI': 'https://orcid.org/'}], 'rightHolderNames': [{'rightHolderLanguage': 'ja', 'rightHolderName': 'Right Holder Name'}]}], 'item_1617186609386': [{'subitem_1522299896455': 'ja', 'subitem_1522300014469': 'Other', 'subitem_1522300048512': 'http://localhost/', 'subitem_1523261968819': 'Sibject1'}], 'item_1617186626617': [{'subitem_description': 'Description\nDescription<br/>Description', 'subitem_description_language': 'en', 'subitem_description_type': 'Abstract'}, {'subitem_description': '概要\n概要\n概要\n概要', 'subitem_description_language': 'ja', 'subitem_description_type': 'Abstract'}], 'item_1617186643794': [{'subitem_1522300295150': 'en', 'subitem_1522300316516': 'Publisher'}], 'item_1617186660861': [{'subitem_1522300695726': 'Available', 'subitem_1522300722591': '2021-06-30'}], 'item_1617186702042': [{'subitem_1551255818386': 'jpn'}], 'item_1617258105262': {'resourcetype': 'conference paper', 'resourceuri': 'http://purl.org/coar/resource_type/c_5794'}, 'item_1617349808926': {'subitem_1523263171732': 'Version'}, 'item_1617265215918': {'subitem_1522305645492': 'AO', 'subitem_1600292170262': 'http://purl.org/coar/version/c_b1a7d7d4d402bcce'}, 'item_1617186783814': [{'subitem_identifier_type': 'URI', 'subitem_identifier_uri': 'http://localhost'}], 'item_1617353299429': [{'subitem_1522306207484': 'isVersionOf', 'subitem_1522306287251': {'subitem_1522306382014': 'arXiv', 'subitem_1522306436033': 'xxxxx'}, 'subitem_1523320863692': [{'subitem_1523320867455': 'en', 'subitem_1523320909613': 'Related Title'}]}], 'item_1617186859717': [{'subitem_1522658018441': 'en', 'subitem_1522658031721': 'Temporal'}], 'item_1617186882738': [{'subitem_geolocation_place': [{'subitem_geolocation_place_text': 'Japan'}]}], 'item_1617186901218': [{'subitem_1522399143519': {'subitem_1522399281603': 'ISNI', 'subitem_1522399333375': 'http://xxx'}, 'subitem_1522399412622': [{'subitem_1522399416691': 'en', 'subitem_1522737543681': 'Funder Name'}], 'subitem_1522399571623': {'subitem_1522399585738': 'Award URI', 'subitem_1522399628911': 'Award Number'}, 'subitem_1522399651758': [{'subitem_1522721910626': 'en', 'subitem_1522721929892': 'Award Title'}]}], 'item_1617186920753': [{'subitem_1522646500366': 'ISSN', 'subitem_1522646572813': 'xxxx-xxxx-xxxx'}], 'item_1617186941041': [{'subitem_1522650068558': 'en', 'subitem_1522650091861': 'Source Title'}], 'item_1617186959569': {'subitem_1551256328147': '1'}, 'item_1617186981471': {'subitem_1551256294723': '111'}, 'item_1617186994930': {'subitem_1551256248092': '12'}, 'item_1617187024783': {'subitem_1551256198917': '1'}, 'item_1617187045071': {'subitem_1551256185532': '3'}, 'item_1617187112279': [{'subitem_1551256126428': 'Degree Name', 'subitem_1551256129013': 'en'}], 'item_1617187136212': {'subitem_1551256096004': '2021-06-30'}, 'item_1617944105607': [{'subitem_1551256015892': [{'subitem_1551256027296': 'xxxxxx', 'subitem_1551256029891': 'kakenhi'}], 'subitem_1551256037922': [{'subitem_1551256042287': 'Degree Grantor Name', 'subitem_1551256047619': 'en'}]}], 'item_1617187187528': [{'subitem_1599711633003': [{'subitem_1599711636923': 'Conference Name', 'subitem_1599711645590': 'ja'}], 'subitem_1599711655652': '1', 'subitem_1599711660052': [{'subitem_1599711680082': 'Sponsor', 'subitem_1599711686511': 'ja'}], 'subitem_1599711699392': {'subitem_1599711704251': '2020/12/11', 'subitem_1599711712451': '1', 'subitem_1599711727603': '12', 'subitem_1599711731891': '2000', 'subitem_1599711735410': '1', 'subitem_1599711739022': '12', 'subitem_1599711743722': '2020', 'subitem_1599711745532': 'ja'}, 'subitem_1599711758470': [{'subitem_1599711769260': 'Conference Venue', 'subitem_1599711775943': 'ja'}], 'subitem_1599711788485': [{'subitem_1599711798761': 'Conference Place', 'subitem_1599711803382': 'ja'}], 'subitem_1599711813532': 'JPN'}], 'item_1617605131499': [{'accessrole': 'open_access', 'date': [{'dateType': 'Available', 'dateValue': '2021-07-12'}], 'displaytype': 'simple', 'filename': '1KB.pdf', 'filesize': [{'value': '1 KB'}], 'format': 'text/plain'}, {'filename': ''}], 'item_1617620223087': [{'subitem_1565671149650': 'ja', 'subitem_1565671169640': 'Banner Headline', 'subitem_1565671178623': 'Subheading'}, {'subitem_1565671149650': 'en', 'subitem_1565671169640': 'Banner Headline', 'subitem_1565671178623': 'Subheding'}]}, 'file_path': ['file00000001/1KB.pdf', ''], 'item_type_name': 'デフォルトアイテムタイプ（フル）', 'item_type_id': 15, '$schema': 'https://localhost:8443/items/jsonschema/15', 'identifier_key': 'item_1617186819068', 'errors': None, 'status': 'new', 'id': None, 'item_title': 'ja_conference paperITEM00000001(public_open_access_open_access_simple)'}]
     handle_check_id(list_record)
 
-    handle_check_and_prepare_index_tree(list_record, all_index_permission, can_edit_indexes)
+    handle_check_and_prepare_index_tree(
+        list_record, all_index_permission, can_edit_indexes, lookup)
     # current_app.logger.debug("list_record5: {}".format(list_record))
     # [{'pos_index': ['Index A'], 'publish_status': 'public', 'feedback_mail': ['wekosoftware@nii.ac.jp'], 'edit_mode': 'Keep', 'metadata': {'pubdate': '2021-03-19', 'item_1617186331708': [{'subitem_1551255647225': 'ja_conference paperITEM00000001(public_open_access_open_access_simple)', 'subitem_1551255648112': 'ja'}, {'subitem_1551255647225': 'en_conference paperITEM00000001(public_open_access_simple)', 'subitem_1551255648112': 'en'}], 'item_1617186385884': [{'subitem_1551255720400': 'Alternative Title', 'subitem_1551255721061': 'en'}, {'subitem_1551255720400': 'Alternative Title', 'subitem_1551255721061': 'ja'}], 'item_1617186419668': [{'creatorAffiliations': [{'affiliationNameIdentifiers': [{'affiliationNameIdentifier': '0000000121691048', 'affiliationNameIdentifierScheme': 'ISNI', 'affiliationNameIdentifierURI': 'http://isni.org/isni/0000000121691048'}], 'affiliationNames': [{'affiliationName': 'University', 'affiliationNameLang': 'en'}]}], 'creatorMails': [{'creatorMail': 'wekosoftware@nii.ac.jp'}], 'creatorNames': [{'creatorName': '情報, 太郎', 'creatorNameLang': 'ja'}, {'creatorName': 'ジョウホウ, タロウ', 'creatorNameLang': 'ja-Kana'}, {'creatorName': 'Joho, Taro', 'creatorNameLang': 'en'}], 'familyNames': [{'familyName': '情報', 'familyNameLang': 'ja'}, {'familyName': 'ジョウホウ', 'familyNameLang': 'ja-Kana'}, {'familyName': 'Joho', 'familyNameLang': 'en'}], 'givenNames': [{'givenName': '太郎', 'givenNameLang': 'ja'}, {'givenName': 'タロウ', 'givenNameLang': 'ja-Kana'}, {'givenName': 'Taro', 'givenNameLang': 'en'}], 'nameIdentifiers': [{'nameIdentifier': '4', 'nameIdentifierScheme': 'WEKO'}, {'nameIdentifier': 'xxxxxxx', 'nameIdentifierScheme': 'ORCID', 'nameIdentifierURI': 'https://orcid.org/'}, {'nameIdentifier': 'xxxxxxx', 'nameIdentifierScheme': 'CiNii', 'nameIdentifierURI': 'https://ci.nii.ac.jp/'}, {'nameIdentifier': 'zzzzzzz', 'nameIdentifierScheme': 'KAKEN2', 'nameIdentifierURI': 'https://kaken.nii.ac.jp/'}]}, {'creatorMails': [{'creatorMail': 'wekosoftware@nii.ac.jp'}], 'creatorNames': [{'creatorName': '情報, 太郎', 'creatorNameLang': 'ja'}, {'creatorName': 'ジョウホウ, タロウ', 'creatorNameLang': 'ja-Kana'}, {'creatorName': 'Joho, Taro', 'creatorNameLang': 'en'}], 'familyNames': [{'familyName': '情報', 'familyNameLang': 'ja'}, {'familyName': 'ジョウホウ', 'familyNameLang': 'ja-Kana'}, {'familyName': 'Joho', 'familyNameLang': 'en'}], 'givenNames': [{'givenName': '太郎', 'givenNameLang': 'ja'}, {'givenName': 'タロウ', 'givenNameLang': 'ja-Kana'}, {'givenName': 'Taro', 'givenNameLang': 'en'}], 'nameIdentifiers': [{'nameIdentifier': 'xxxxxxx', 'nameIdentifierScheme': 'ORCID', 'nameIdentifierURI': 'https://orcid.org/'}, {'nameIdentifier': 'xxxxxxx', 'nameIdentifierScheme': 'CiNii', 'nameIdentifierURI': 'https://ci.nii.ac.jp/'}, {'nameIdentifier': 'zzzzzzz', 'nameIdentifierScheme': 'KAKEN2', 'nameIdentifierURI': 'https://kaken.nii.ac.jp/'}]}, {'creatorMails': [{'creatorMail': 'wekosoftware@nii.ac.jp'}], 'creatorNames': [{'creatorName': '情報, 太郎', 'creatorNameLang': 'ja'}, {'creatorName': 'ジョウホウ, タロウ', 'creatorNameLang': 'ja-Kana'}, {'creatorName': 'Joho, Taro', 'creatorNameLang': 'en'}], 'familyNames': [{'familyName': '情報', 'familyNameLang': 'ja'}, {'familyName': 'ジョウホウ', 'familyNameLang': 'ja-Kana'}, {'familyName': 'Joho', 'familyNameLang': 'en'}], 'givenNames': [{'givenName': '太郎', 'givenNameLang': 'ja'}, {'givenName': 'タロウ', 'givenNameLang': 'ja-Kana'}, {'givenName': 'Taro', 'givenNameLang': 'en'}], 'nameIdentifiers': [{'nameIdentifier': 'xxxxxxx', 'nameIdentifierScheme': 'ORCID', 'nameIdentifierURI': 'https://orcid.org/'}, {'nameIdentifier': 'xxxxxxx', 'nameIdentifierScheme': 'CiNii', 'nameIdentifierURI': 'https://ci.nii.ac.jp/'}, {'nameIdentifier': 'zzzzzzz', 'nameIdentifierScheme': 'KAKEN2', 'nameIdentifierURI': 'https://kaken.nii.ac.jp/'}]}], 'item_1617349709064': [{'contributorMails': [{'contributorMail': 'wekosoftware@nii.ac.jp'}], 'contributorNames': [{'contributorName': '情報, 太郎', 'lang': 'ja'}, {'contributorName': 'ジョウホウ, タロウ', 'lang': 'ja-Kana'}, {'contributorName': 'Joho, Taro', 'lang': 'en'}], 'contributorType': 'ContactPerson', 'familyNames': [{'familyName': '情報', 'familyNameLang': 'ja'}, {'familyName': 'ジョウホウ', 'familyNameLang': 'ja-Kana'}, {'familyName': 'Joho', 'familyNameLang': 'en'}], 'givenNames': [{'givenName': '太郎', 'givenNameLang': 'ja'}, {'givenName': 'タロウ', 'givenNameLang': 'ja-Kana'}, {'givenName': 'Taro', 'givenNameLang': 'en'}], 'nameIdentifiers': [{'nameIdentifier': 'xxxxxxx', 'nameIdentifierScheme': 'ORCID', 'nameIdentifierURI': 'https://orcid.org/'}, {'nameIdentifier': 'xxxxxxx', 'nameIdentifierScheme': 'CiNii', 'nameIdentifierURI': 'https://ci.nii.ac.jp/'}, {'nameIdentifier': 'xxxxxxx', 'nameIdentifierScheme': 'KAKEN2', 'nameIdentifierURI': 'https://kaken.nii.ac.jp/'}]}], 'item_1617186476635': {'subitem_1522299639480': 'open access', 'subitem_1600958577026': 'http://purl.org/coar/access_right/c_abf2'}, 'item_1617351524846': {'subitem_1523260933860': 'Unknown'}, 'item_1617186499011': [{'subitem_1522650717957': 'ja', 'subitem_1522650727486': 'http://localhost', 'subitem_1522651041219': 'Rights Information'}], 'item_1617610673286': [{'nameIdentifiers': [{'nameIdentifier': 'xxxxxx', 'nameIdentifierScheme': 'ORCID', 'nameIdentifierURI': 'https://orcid.org/'}], 'rightHolderNames': [{'rightHolderLanguage': 'ja', 'rightHolderName': 'Right Holder Name'}]}], 'item_1617186609386': [{'subitem_1522299896455': 'ja', 'subitem_1522300014469': 'Other', 'subitem_1522300048512': 'http://localhost/', 'subitem_1523261968819': 'Sibject1'}], 'item_1617186626617': [{'subitem_description': 'Description\nDescription<br/>Description', 'subitem_description_language': 'en', 'subitem_description_type': 'Abstract'}, {'subitem_description': '概要\n概要\n概要\n概要', 'subitem_description_language': 'ja', 'subitem_description_type': 'Abstract'}], 'item_1617186643794': [{'subitem_1522300295150': 'en', 'subitem_1522300316516': 'Publisher'}], 'item_1617186660861': [{'subitem_1522300695726': 'Available', 'subitem_1522300722591': '2021-06-30'}], 'item_1617186702042': [{'subitem_1551255818386': 'jpn'}], 'item_1617258105262': {'resourcetype': 'conference paper', 'resourceuri': 'http://purl.org/coar/resource_type/c_5794'}, 'item_1617349808926': {'subitem_1523263171732': 'Version'}, 'item_1617265215918': {'subitem_1522305645492': 'AO', 'subitem_1600292170262': 'http://purl.org/coar/version/c_b1a7d7d4d402bcce'}, 'item_1617186783814': [{'subitem_identifier_type': 'URI', 'subitem_identifier_uri': 'http://localhost'}], 'item_1617353299429': [{'subitem_1522306207484': 'isVersionOf', 'subitem_1522306287251': {'subitem_1522306382014': 'arXiv', 'subitem_1522306436033': 'xxxxx'}, 'subitem_1523320863692': [{'subitem_1523320867455': 'en', 'subitem_1523320909613': 'Related Title'}]}], 'item_1617186859717': [{'subitem_1522658018441': 'en', 'subitem_1522658031721': 'Temporal'}], 'item_1617186882738': [{'subitem_geolocation_place': [{'subitem_geolocation_place_text': 'Japan'}]}], 'item_1617186901218': [{'subitem_1522399143519': {'subitem_1522399281603': 'ISNI', 'subitem_1522399333375': 'http://xxx'}, 'subitem_1522399412622': [{'subitem_1522399416691': 'en', 'subitem_1522737543681': 'Funder Name'}], 'subitem_1522399571623': {'subitem_1522399585738': 'Award URI', 'subitem_1522399628911': 'Award Number'}, 'subitem_1522399651758': [{'subitem_1522721910626': 'en', 'subitem_1522721929892': 'Award Title'}]}], 'item_1617186920753': [{'subitem_1522646500366': 'ISSN', 'subitem_1522646572813': 'xxxx-xxxx-xxxx'}], 'item_1617186941041': [{'subitem_1522650068558': 'en', 'subitem_1522650091861': 'Source Title'}], 'item_1617186959569': {'subitem_1551256328147': '1'}, 'item_1617186981471': {'subitem_1551256294723': '111'}, 'item_1617186994930': {'subitem_1551256248092': '12'}, 'item_1617187024783': {'subitem_1551256198917': '1'}, 'item_1617187045071': {'subitem_1551256185532': '3'}, 'item_1617187112279': [{'subitem_1551256126428': 'Degree Name', 'subitem_1551256129013': 'en'}], 'item_1617187136212': {'subitem_1551256096004': '2021-06-30'}, 'item_1617944105607': [{'subitem_1551256015892': [{'subitem_1551256027296': 'xxxxxx', 'subitem_1551256029891': 'kakenhi'}], 'subitem_1551256037922': [{'subitem_1551256042287': 'Degree Grantor Name', 'subitem_1551256047619': 'en'}]}], 'item_1617187187528': [{'subitem_1599711633003': [{'subitem_1599711636923': 'Conference Name', 'subitem_1599711645590': 'ja'}], 'subitem_1599711655652': '1', 'subitem_1599711660052': [{'subitem_1599711680082': 'Sponsor', 'subitem_1599711686511': 'ja'}], 'subitem_1599711699392': {'subitem_1599711704251': '2020/12/11', 'subitem_1599711712451': '1', 'subitem_1599711727603': '12', 'subitem_1599711731891': '2000', 'subitem_1599711735410': '1', 'subitem_1599711739022': '12', 'subitem_1599711743722': '2020', 'subitem_1599711745532': 'ja'}, 'subitem_1599711758470': [{'subitem_1599711769260': 'Conference Venue', 'subitem_1599711775943': 'ja'}], 'subitem_1599711788485': [{'subitem_1599711798761': 'Conference Place', 'subitem_1599711803382': 'ja'}], 'subitem_1599711813532': 'JPN'}], 'item_1617605131499': [{'accessrole': 'open_access', 'date': [{'dateType': 'Available', 'dateValue': '2021-07-12'}], 'displaytype': 'simple', 'filename': '1KB.pdf', 'filesize': [{'value': '1 KB'}], 'format': 'text/plain'}, {'filename': ''}], 'item_1617620223087': [{'subitem_1565671149650': 'ja', 'subitem_1565671169640': 'Banner Headline', 'subitem_1565671178623': 'Subheading'}, {'subitem_1565671149650': 'en', 'subitem_1565671169640': 'Banner Headline', 'subitem_1565671178623': 'Subheding'}], 'path': [1031]}, 'file_path': ['file00000001/1KB.pdf', ''], 'item_type_name': 'デフォルトアイテムタイプ（フル）', 'item_type_id': 15, '$schema': 'https://localhost:8443/items/jsonschema/15', 'identifier_key': 'item_1617186819068', 'errors': None, 'status': 'new', 'id': None, 'item_title': 'ja_conference paperITEM00000001(public_open_access_open_access_simple)'}]
     handle_check_and_prepare_publish_status(list_record)
@@ -6023,11 +6707,11 @@ def check_replace_file_import_items(list_record, data_path=None, is_gakuninrdm=F
 
     result = {}
     if not is_gakuninrdm:
-        handle_check_cnri(list_record)
-        handle_check_doi_indexes(list_record)
+        handle_check_cnri(list_record, lookup)
+        handle_check_doi_indexes(list_record, lookup)
         handle_check_doi_ra(list_record)
         #current_app.logger.error(list_record)
-        handle_check_doi(list_record)
+        handle_check_doi(list_record, lookup)
     result["list_record"] = list_record
     return result
 
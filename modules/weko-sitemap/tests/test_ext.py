@@ -6,6 +6,8 @@ from flask import current_app,make_response, url_for
 from flask_babelex import format_datetime
 
 from invenio_cache import InvenioCache, current_cache
+from invenio_db import db
+from invenio_pidstore.models import PIDStatus
 
 from weko_sitemap import WekoSitemap
 
@@ -141,6 +143,53 @@ def test_generate_all_item_urls(app,records):
             if i==1:
                 assert r["loc"] == "http://test_server/records/2"
     
+# def update_cache_pages(self):
+# .tox/c1/bin/pytest --cov=weko_sitemap tests/test_ext.py::test_update_cache_pages -vv -s --cov-branch --cov-report=term --basetemp=/code/modules/weko-sitemap/.tox/c1/tmp
+def test_update_cache_pages(app,records,mocker):
+    current_app.config.update(SITEMAP_MAX_URL_COUNT=1)
+    mock_render = mocker.patch.object(
+        current_app.extensions["sitemap"], "render_page",
+        side_effect=lambda urlset: [url["loc"] for url in urlset])
+    weko_sitemap = current_app.extensions["weko-sitemap"]
+    current_cache.delete(weko_sitemap.last_run_key)
+    current_cache.set("sitemap_page_keys",{"sitemap_0003"})
+    current_cache.set("sitemap_0003",{"page":"old"})
+    with app.test_request_context():
+        assert weko_sitemap.get_max_recid_number() == 2
+        assert weko_sitemap.update_cache_pages() == 2
+        assert current_cache.get("sitemap_page_keys") == {"sitemap_0001","sitemap_0002"}
+        assert current_cache.get("sitemap_0001")["page"] == ["http://test_server/records/1"]
+        assert current_cache.get("sitemap_0002")["page"] == ["http://test_server/records/2"]
+        assert current_cache.get("sitemap_0003") == None
+
+        # Unchanged pages are not regenerated.
+        mock_render.reset_mock()
+        assert weko_sitemap.get_updated_pages(datetime.utcnow()) == set()
+        assert weko_sitemap.update_cache_pages() == 0
+        mock_render.assert_not_called()
+
+        records[2][0].status = PIDStatus.DELETED
+        db.session.commit()
+        current_cache.set(weko_sitemap.last_run_key, datetime(2000,1,1))
+        assert weko_sitemap.get_updated_pages(datetime(2000,1,1)) == {1,2}
+        assert weko_sitemap.update_cache_pages() == 1
+        # Empty pages are not stored.
+        assert current_cache.get("sitemap_page_keys") == {"sitemap_0002"}
+        assert current_cache.get("sitemap_0001") == None
+        assert current_cache.get("sitemap_0002")["page"] == ["http://test_server/records/2"]
+
+        # The total cap counts the urls, not the recid numbers.
+        current_app.config.update(WEKO_SITEMAP_TOTAL_MAX_URL_COUNT=1)
+        assert weko_sitemap.get_max_recid_number() == 2
+        records[2][0].status = PIDStatus.REGISTERED
+        db.session.commit()
+        assert weko_sitemap.get_max_recid_number() == 1
+        current_cache.set(weko_sitemap.last_run_key, datetime(2000,1,1))
+        assert weko_sitemap.update_cache_pages() == 1
+        assert current_cache.get("sitemap_page_keys") == {"sitemap_0001"}
+        assert current_cache.get("sitemap_0001")["page"] == ["http://test_server/records/1"]
+        assert current_cache.get("sitemap_0002") == None
+
 # .tox/c1/bin/pytest --cov=weko_sitemap tests/test_ext.py::test_load_cache_pages -vv -s --cov-branch --cov-report=term --cov-report=html --basetemp=/code/modules/weko-sitemap/.tox/c1/tmp
 def test_load_cache_pages(create_app):
     app = create_app(CACHE_REDIS_URL='redis://redis:6379/0',
@@ -149,16 +198,18 @@ def test_load_cache_pages(create_app):
     InvenioCache(app)
     with app.app_context():
         with app.test_request_context():
-            current_cache.set("sitemap_page_keys",["key1","key1000"])
-            current_cache.set("key1",{"lastmod":format_datetime(datetime(2023,1,12,10,1,2,123),'yyyy-MM-ddTHH:mm:ssz','full')})
-            current_cache.set("key2",{"lastmod":format_datetime(datetime(2023,1,21,10,1,2,123),'yyyy-MM-ddTHH:mm:ssz','full')})
-            result = iter(current_app.extensions["weko-sitemap"]._load_cache_pages())
-            for i,r in enumerate(result):
-                if i==0:
-                    assert r == {"loc": "https://localhost/weko/sitemaps/sitemap_1.xml.gz", "lastmod":"2023-01-12T10:01:02+0000"}
+            current_cache.set("sitemap_page_keys",{"sitemap_0003","sitemap_0001","sitemap_1000"})
+            current_cache.set("sitemap_0001",{"lastmod":format_datetime(datetime(2023,1,12,10,1,2,123),'yyyy-MM-ddTHH:mm:ssz','full')})
+            current_cache.set("sitemap_0003",{"lastmod":format_datetime(datetime(2023,1,21,10,1,2,123),'yyyy-MM-ddTHH:mm:ssz','full')})
+            result = list(current_app.extensions["weko-sitemap"]._load_cache_pages())
+            # The page numbers are those of the keys, skipped pages leave gaps.
+            assert result == [
+                {"loc": "https://localhost/weko/sitemaps/sitemap_1.xml.gz", "lastmod":"2023-01-12T10:01:02+0000"},
+                {"loc": "https://localhost/weko/sitemaps/sitemap_3.xml.gz", "lastmod":"2023-01-21T10:01:02+0000"},
+            ]
             current_cache.delete("sitemap_page_keys")
-            current_cache.delete("key1")
-            current_cache.delete("key2")
+            current_cache.delete("sitemap_0001")
+            current_cache.delete("sitemap_0003")
 
 # .tox/c1/bin/pytest --cov=weko_sitemap tests/test_ext.py::test_dbsession_clean -vv -s --cov-branch --cov-report=term --basetemp=/code/modules/weko-sitemap/.tox/c1/tmp
 def test_dbsession_clean(app,db, db_sessionlifetime):
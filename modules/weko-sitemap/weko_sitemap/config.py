@@ -23,6 +23,9 @@ WEKO_SITEMAP_URL_SCHEME = 'https'
 
 WEKO_SITEMAP_CACHE_TIMEOUT = 60 * 60 * 24 * 3
 
+WEKO_SITEMAP_INCREMENTAL_ENABLED = False
+"""Partition the pages by recid and regenerate only the updated pages."""
+
 # base URL for site (don't chang name)
 SITEMAP_BLUEPRINT = None
 """Set our own Blueprint"""
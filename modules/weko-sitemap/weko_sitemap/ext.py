@@ -22,11 +22,31 @@ from invenio_db import db
 from invenio_pidstore.models import PersistentIdentifier, PIDStatus
 from invenio_records.models import RecordMetadata
 from weko_records.models import ItemMetadata
-from sqlalchemy import Float, Integer, cast, not_
+from sqlalchemy import BigInteger, Float, Integer, cast, func, not_, or_
 
 from . import config
 
 
+def get_recid_number():
+    """Get the number of the recid, the stable key of the sitemap pages.
+
+    With the filters of ``_query_item_pids`` it is served by the
+    ix_pidstore_pid_recid_number index of weko-records.
+    """
+    return cast(func.split_part(PersistentIdentifier.pid_value, '.', 1),
+                BigInteger)
+
+
+def _query_item_pids(*columns):
+    """Query the first version recid of the registered items."""
+    return (db.session
+            .query(*columns)
+            .select_from(PersistentIdentifier)
+            .filter(PersistentIdentifier.pid_type == 'recid',
+                    PersistentIdentifier.pid_value.like('%.1'),
+                    PersistentIdentifier.status == PIDStatus.REGISTERED))
+
+
 class WekoSitemap(Sitemap):
     """Weko-sitemap extension."""
 
@@ -113,7 +133,7 @@ class WekoSitemap(Sitemap):
                    RecordMetadata.id == PersistentIdentifier.object_uuid)
              .filter(PersistentIdentifier.status == PIDStatus.REGISTERED,
                      PersistentIdentifier.pid_type == 'recid',
-                     PersistentIdentifier.pid_value.ilike('%.1'))
+                     PersistentIdentifier.pid_value.like('%.1'))
              .order_by(PersistentIdentifier.id)
              .limit(current_app.config['WEKO_SITEMAP_TOTAL_MAX_URL_COUNT']))
 
@@ -128,17 +148,145 @@ class WekoSitemap(Sitemap):
                     rm.updated, 'yyyy-MM-ddTHH:mm:ssz', 'full')
             }
 
+    def get_max_recid_number(self):
+        """Get the largest recid number of the items in the sitemap.
+
+        WEKO_SITEMAP_TOTAL_MAX_URL_COUNT caps the number of the items, the
+        items after the cap are left out by their recid number. The cap is
+        only looked up when the largest number exceeds it, as the numbers
+        are unique.
+
+        :return: The recid number, 0 if there are no items.
+        """
+        total_max = current_app.config['WEKO_SITEMAP_TOTAL_MAX_URL_COUNT']
+        recid_number = get_recid_number()
+        max_number = _query_item_pids(func.max(recid_number)).scalar() or 0
+        if max_number > total_max:
+            max_number = (_query_item_pids(recid_number)
+                          .order_by(recid_number)
+                          .offset(total_max - 1)
+                          .limit(1)
+                          .scalar()) or max_number
+        return max_number
+
+    def get_updated_pages(self, since):
+        """Get the pages holding the items updated since the date.
+
+        :param since: The datetime of the last update of the sitemap.
+        :return: The set of the page numbers.
+        """
+        size = current_app.config['SITEMAP_MAX_URL_COUNT']
+        # Deleted items are also included to remove them from their pages.
+        q = (db.session
+             .query((get_recid_number() - 1) / size + 1)
+             .select_from(PersistentIdentifier)
+             .outerjoin(RecordMetadata,
+                        RecordMetadata.id == PersistentIdentifier.object_uuid)
+             .filter(PersistentIdentifier.pid_type == 'recid',
+                     PersistentIdentifier.pid_value.like('%.1'),
+                     or_(RecordMetadata.updated >= since,
+                         PersistentIdentifier.updated >= since))
+             .distinct())
+        return {int(page) for page, in q}
+
+    def _generate_page_item_urls(self, page, max_number):
+        """Make url set for the items in the recid range of the page.
+
+        :param page: The page number.
+        :param max_number: The largest recid number in the sitemap.
+        """
+        size = current_app.config['SITEMAP_MAX_URL_COUNT']
+        recid_number = get_recid_number()
+        q = (_query_item_pids(PersistentIdentifier.pid_value,
+                              RecordMetadata.updated)
+             .join(RecordMetadata,
+                   RecordMetadata.id == PersistentIdentifier.object_uuid)
+             .filter(recid_number.between((page - 1) * size + 1,
+                                          min(page * size, max_number)))
+             .order_by(recid_number))
+        for pid_value, updated in q.yield_per(1000):
+            yield {
+                'loc': url_for('invenio_records_ui.recid',
+                               pid_value=pid_value.split('.')[0],
+                               _external=True),
+                # W3C Datetime format YYYY-MM-DDThh:mmTZD
+                'lastmod': format_datetime(
+                    updated, 'yyyy-MM-ddTHH:mm:ssz', 'full')
+            }
+
+    def update_cache_pages(self):
+        """Regenerate the pages holding the items updated since last run.
+
+        Page N holds the items whose recid number is in
+        ``((N - 1) * SITEMAP_MAX_URL_COUNT, N * SITEMAP_MAX_URL_COUNT]``,
+        so an update changes only the page of the item. Pages without items
+        are not stored, as an empty urlset is invalid. Each page is
+        replaced in the cache by one set and the set of the page keys is
+        replaced after all the pages, the cached sitemap is readable
+        during the update.
+
+        :return: The number of the urls in the regenerated pages.
+        """
+        size = current_app.config['SITEMAP_MAX_URL_COUNT']
+        timeout = current_app.config['WEKO_SITEMAP_CACHE_TIMEOUT']
+        start_time = datetime.utcnow()
+        last_run = current_cache.get(self.last_run_key)
+        max_number = self.get_max_recid_number()
+        page_count = (max_number + size - 1) // size
+        updated = self.get_updated_pages(last_run) if last_run else None
+        old_keys = current_cache.get(self.cached_pages_set_key) or set()
+        last_max_number = current_cache.get(self.max_number_key) or 0
+        if updated is not None and last_max_number != max_number:
+            # The cap moved, the last pages change without an update.
+            updated.add(page_count)
+            updated.add((last_max_number + size - 1) // size)
+
+        total = 0
+        page_keys = set()
+        for page in range(1, page_count + 1):
+            page_name = 'sitemap_' + str(page).zfill(4)
+            if updated is not None and page not in updated:
+                if page_name not in old_keys:
+                    # Still empty.
+                    continue
+                page_dic = current_cache.get(page_name)
+                if page_dic:
+                    # Unchanged, only extend the timeout.
+                    current_cache.set(page_name, page_dic, timeout=timeout)
+                    page_keys.add(page_name)
+                    continue
+            urlset = list(self._generate_page_item_urls(page, max_number))
+            if not urlset:
+                continue
+            total += len(urlset)
+            page_keys.add(page_name)
+            current_cache.set(page_name, dict(
+                page=current_app.extensions['sitemap'].render_page(
+                    urlset=urlset),
+                # W3C Datetime format YYYY-MM-DDThh:mmTZD
+                lastmod=format_datetime(
+                    datetime.now(), 'yyyy-MM-ddTHH:mm:ssz', 'full')
+            ), timeout=timeout)
+
+        current_cache.set(self.cached_pages_set_key, page_keys,
+                          timeout=timeout)
+        for key in old_keys - page_keys:
+            current_cache.delete(key)
+        current_cache.set(self.max_number_key, max_number, timeout=timeout)
+        current_cache.set(self.last_run_key, start_time, timeout=timeout)
+        return total
+
     def _load_cache_pages(self):
         """Get pages from cache instead of re-creating them."""
         kwargs = dict(
             _external=True,
             _scheme=current_app.config.get('WEKO_SITEMAP_URL_SCHEME')
         )
-        kwargs['page'] = 0
         page_keys = current_cache.get(self.cached_pages_set_key) or set()
-        for page_number in page_keys:
-            kwargs['page'] += 1
-            page = current_cache.get(page_number)
+        for page_name in sorted(page_keys):
+            # The keys are 'sitemap_' and the zero-padded page number.
+            kwargs['page'] = int(page_name[len('sitemap_'):])
+            page = current_cache.get(page_name)
             if page:
                 yield {'loc': url_for('flask_sitemap.page', **kwargs),
                        'lastmod': page['lastmod']}
@@ -153,6 +301,8 @@ class WekoSitemap(Sitemap):
         self.init_config(app)
         # Keep track of cached pages
         self.cached_pages_set_key = 'sitemap_page_keys'
+        self.last_run_key = 'sitemap_last_run'
+        self.max_number_key = 'sitemap_max_recid_number'
         app.extensions['weko-sitemap'] = self
         app.config['SITEMAP_VIEW_DECORATORS'] = [self.load_page]
 
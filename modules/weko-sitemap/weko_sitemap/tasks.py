@@ -67,6 +67,21 @@ def update_sitemap(start_time=datetime.utcnow().strftime('%Y-%m-%dT%H:%M:%S'),
                 0, 'Sitemap update'))
         start_time = datetime.strptime(start_time, '%Y-%m-%dT%H:%M:%S')
         flask_sitemap = current_app.extensions['weko-sitemap']
+        if current_app.config['WEKO_SITEMAP_INCREMENTAL_ENABLED']:
+            total = flask_sitemap.update_cache_pages()
+            current_app.logger.info(
+                '[{0}] [{1}] DONE'.format(0, 'Sitemap update'))
+            end_time = datetime.now()
+            return ({'total': total,
+                     'start_time': start_time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+                     'end_time': end_time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+                     'execution_time': str(end_time - start_time),
+                     'task_name': 'sitemap',
+                     'repository_name': 'weko',  # TODO: Grab from config
+                     'task_id': update_sitemap.request.id,
+                     'task_state': 'SUCCESS'},
+                    user_data)
+
         size = current_app.config['SITEMAP_MAX_URL_COUNT']
         args = [iter(flask_sitemap._generate_all_item_urls())] * size
 
@@ -109,11 +109,14 @@ def test_post_service_document(app,client,db,users,make_crate,esindex,location,i
         "duplicate_check": True
     }
     mocker.patch("weko_items_ui.utils.check_duplicate", return_value=(False, [], []))
-    mocker.patch("weko_swordserver.views.import_items_to_activity", return_value=(url_for("weko_workflow.display_activity", activity_id="A-TEST-00001"), "2000001", "end_action", None))
+    mocker.patch("weko_swordserver.views.WorkActivity.get_new_activity_ids", return_value=["A-TEST-00001"])
+    mock_activity = mocker.patch("weko_swordserver.views.import_items_to_activity", return_value=(url_for("weko_workflow.display_activity", activity_id="A-TEST-00001"), "2000001", "end_action", None))
 
     result = client.post(url, data={"file": storage}, content_type="multipart/form-data", headers=headers)
     assert result.status_code == 201
     assert result.json.get("recid") == "2000001"
+    # the activity ids are allocated before the items are imported
+    assert mock_activity.call_args[1]["activity_id"] == "A-TEST-00001"
 
 
     # invalid Content-Disposition's filename
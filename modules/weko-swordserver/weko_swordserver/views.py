@@ -43,6 +43,7 @@ from weko_search_ui.utils import (
     import_items_to_system, import_items_to_activity,
     delete_items_with_activity
 )
+from weko_workflow.api import WorkActivity
 from weko_workflow.errors import WekoWorkflowException
 from weko_workflow.utils import get_site_info_name
 from weko_workflow.scopes import activity_scope
@@ -358,12 +359,13 @@ def post_service_document():
     }
 
     # Define a nested function to process a single item
-    def process_item(item, request_info):
+    def process_item(item, request_info, new_activity_id=None):
         """Process a single item for import.
 
         Args:
             item (dict): The item to process.
             request_info (dict): Information about the request.
+            new_activity_id (str, optional): ID of the new activity.
 
         Returns:
             tuple(str, str, str):
@@ -389,7 +391,7 @@ def post_service_document():
 
         elif register_type == "Workflow":
             url, recid, action , error = import_items_to_activity(
-                item, request_info=request_info
+                item, request_info=request_info, activity_id=new_activity_id
             )
             activity_id = str(url.split("/")[-1])
 
@@ -399,11 +401,18 @@ def post_service_document():
     activity_id = None
     recid = None
     action = None
+    # Allocate the IDs of the new activities at once
+    new_activity_ids = [None] * len(check_result["list_record"])
+    if register_type == "Workflow":
+        new_activity_ids = WorkActivity().get_new_activity_ids(
+            len(check_result["list_record"]))
     # Process and register items
-    for item in check_result["list_record"]:
+    for item, new_activity_id in zip(
+            check_result["list_record"], new_activity_ids):
         item["root_path"] = os.path.join(data_path, "data")
         try:
-            activity_id, recid, action, error = process_item(item, request_info)
+            activity_id, recid, action, error = process_item(
+                item, request_info, new_activity_id)
             if error:
                 warns.append((activity_id, recid, error))
             if file_format == "JSON":
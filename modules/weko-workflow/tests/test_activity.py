@@ -74,6 +74,7 @@ class TestHeadlessActivity:
             assert activity.activity_id == mock_activity.activity_id
             assert activity.community is None
             mock_init_activity.assert_called_once()
+            assert mock_init_activity.call_args[1]["activity_id"] is None
             mock_get_activity.assert_called_once()
 
         # with community
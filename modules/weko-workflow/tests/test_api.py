@@ -1,5 +1,6 @@
 # .tox/c1/bin/pytest --cov=weko_workflow tests/test_api.py -vv -s --cov-branch --cov-report=term --basetemp=/code/modules/weko-workflow/.tox/c1/tmp
 import json
+import threading
 import uuid
 from datetime import datetime
 from unittest.mock import Mock, MagicMock, call, patch
@@ -18,7 +19,7 @@ from sqlalchemy.exc import SQLAlchemyError
 from weko_notifications.notifications import Notification
 from weko_records.api import ItemsMetadata
 from weko_workflow.api import Flow, GetCommunity, WorkActivity, WorkFlow, UpdateItem
-from weko_workflow.models import Activity, ActivityHistory, ActivityAction, FlowAction, FlowActionRole
+from weko_workflow.models import Activity, ActivityCount, ActivityHistory, ActivityAction, FlowAction, FlowActionRole
 from weko_schema_ui.models import PublishStatus
 
 from invenio_accounts.testutils import login_user_via_session
@@ -741,6 +742,74 @@ class TestWorkActivity:
             assert size == '20'
             assert page == '1'
 
+    # .tox/c1/bin/pytest --cov=weko_workflow tests/test_api.py::TestWorkActivity::test_get_activity_list_keyset -vv -s --cov-branch --cov-report=term --basetemp=/code/modules/weko-workflow/.tox/c1/tmp
+    def test_get_activity_list_keyset(self, app, client, activity_acl, activity_acl_users, db):
+        acts = [43, 42, 41, 40, 39, 38, 37, 36, 35, 34, 33, 32, 31, 30, 29, 28, 27, 26, 25, 24, 23, 22, 21, 20, 19, 18, 17, 16, 15, 14, 13, 12, 11, 10, 9, 8, 7, 6, 5, 4, 3, 2, 1]
+        activity = WorkActivity()
+        user = User.query.filter_by(id=1).one()
+        with app.test_request_context():
+            login_user(user)
+            # next pages are seeked from the last activity of the page
+            pages = []
+            after = None
+            for res_page in range(1, 5):
+                conditions = {"tab": ["all"], "sizeall": ["10"], "pagesall": [str(res_page)]}
+                if after:
+                    conditions["afterall"] = [str(after)]
+                activities, max_page, size, page, name_param, count = activity.get_activity_list(conditions=conditions)
+                pages.append([ac.id for ac in activities])
+                after = activities[-1].id
+                assert max_page == 5
+                assert count == len(acts)
+            assert pages == [acts[i:i + 10] for i in range(0, 40, 10)]
+
+            # previous pages are seeked from the first activity of the page
+            conditions = {"tab": ["all"], "sizeall": ["10"], "pagesall": ["3"],
+                          "beforeall": [str(acts[30])]}
+            activities, _, _, page, _, _ = activity.get_activity_list(conditions=conditions)
+            assert [ac.id for ac in activities] == acts[20:30]
+            assert page == "3"
+
+            # the cursor is ignored when the page is out of range
+            conditions = {"tab": ["all"], "sizeall": ["10"], "pagesall": ["9"],
+                          "afterall": [str(acts[30])]}
+            activities, _, _, page, name_param, _ = activity.get_activity_list(conditions=conditions)
+            assert [ac.id for ac in activities] == acts[0:10]
+            assert page == 1
+            assert name_param == "pagesall"
+
+    # .tox/c1/bin/pytest --cov=weko_workflow tests/test_api.py::TestWorkActivity::test_get_activity_list_count_cache -vv -s --cov-branch --cov-report=term --basetemp=/code/modules/weko-workflow/.tox/c1/tmp
+    def test_get_activity_list_count_cache(self, app, client, activity_acl, activity_acl_users, db, mocker):
+        activity = WorkActivity()
+        user = User.query.filter_by(id=1).one()
+        app.config.update(WEKO_WORKFLOW_ACTIVITY_LIST_COUNT_CACHE_TIMEOUT=60)
+        cache = {}
+        mocker.patch("weko_workflow.api.current_cache.get", side_effect=cache.get)
+        mocker.patch("weko_workflow.api.current_cache.set",
+                     side_effect=lambda key, value, timeout=None: cache.update({key: value}))
+        with app.test_request_context():
+            login_user(user)
+            conditions = {"tab": ["all"], "sizeall": ["10"]}
+            _, max_page, _, _, _, count = activity.get_activity_list(conditions=conditions)
+            assert count == 43
+            assert len(cache) == 1
+
+            # the cached count is used for the other pages
+            conditions = {"tab": ["all"], "sizeall": ["10"], "pagesall": ["2"], "afterall": ["34"]}
+            _, max_page, _, _, _, count = activity.get_activity_list(conditions=conditions)
+            assert count == 43
+            assert len(cache) == 1
+            cache[list(cache.keys())[0]] = 50
+            _, max_page, _, _, _, count = activity.get_activity_list(conditions=conditions)
+            assert count == 50
+            assert max_page == 5
+
+            # filter conditions are counted separately
+            conditions = {"tab": ["todo"]}
+            activity.get_activity_list(conditions=conditions)
+            assert len(cache) == 2
+        app.config.update(WEKO_WORKFLOW_ACTIVITY_LIST_COUNT_CACHE_TIMEOUT=0)
+
     # .tox/c1/bin/pytest --cov=weko_workflow tests/test_api.py::TestWorkActivity::test_get_usage_report_activities -vv -s --cov-branch --cov-report=term --basetemp=/code/modules/weko-workflow/.tox/c1/tmp
     def test_get_usage_report_activities(app, activity_usage_report):
         activity = WorkActivity()
@@ -1157,6 +1226,83 @@ def test_WorkActivity_init_activity(app, users, item_type, workflow):
                 with pytest.raises(Exception):
                     activity.init_activity(input)
 
+# def get_new_activity_ids(self, count, for_delete=False):
+# .tox/c1/bin/pytest --cov=weko_workflow tests/test_api.py::test_WorkActivity_get_new_activity_ids -vv -s --cov-branch --cov-report=term --basetemp=/code/modules/weko-workflow/.tox/c1/tmp
+def test_WorkActivity_get_new_activity_ids(app, db):
+    date_str = datetime.utcnow().strftime("%Y%m%d")
+    db.session.add(ActivityCount(date=datetime(2000, 1, 1).date(), activity_count=10))
+    db.session.commit()
+    with app.test_request_context():
+        activity = WorkActivity()
+        assert activity.get_new_activity_id() == "A-{}-00001".format(date_str)
+        # the counter of the previous day is deleted
+        assert ActivityCount.query.filter(
+            ActivityCount.date < datetime.utcnow().date()).count() == 0
+        assert activity.get_new_activity_ids(3) == [
+            "A-{}-0000{}".format(date_str, i) for i in range(2, 5)]
+        assert activity.get_new_activity_id(for_delete=True) == "D-{}-00005".format(date_str)
+
+        # numbers of a rolled back transaction are not reused
+        activity.get_new_activity_id()
+        db.session.rollback()
+        assert activity.get_new_activity_id() == "A-{}-00007".format(date_str)
+
+        app.config.update(WEKO_WORKFLOW_MAX_ACTIVITY_ID=8)
+        with pytest.raises(IndexError):
+            activity.get_new_activity_ids(2)
+        app.config.update(WEKO_WORKFLOW_MAX_ACTIVITY_ID=99999)
+
+
+# .tox/c1/bin/pytest --cov=weko_workflow tests/test_api.py::test_WorkActivity_init_activity_concurrent -vv -s --cov-branch --cov-report=term --basetemp=/code/modules/weko-workflow/.tox/c1/tmp
+def test_WorkActivity_init_activity_concurrent(app, db, users, item_type, workflow):
+    workflow_id = workflow['workflow'].id
+    flow_def_id = workflow['flow'].id
+    user_id = users[2]["obj"].id
+    activity_ids = []
+    errors = []
+
+    def create_activities(count):
+        with app.test_request_context():
+            try:
+                for _ in range(count):
+                    activity = WorkActivity().init_activity({
+                        'workflow_id': workflow_id,
+                        'flow_id': flow_def_id,
+                        'activity_login_user': user_id,
+                        'activity_update_user': user_id})
+                    db.session.commit()
+                    activity_ids.append(activity.activity_id)
+                ids = WorkActivity().get_new_activity_ids(count)
+                for activity_id in ids:
+                    activity = WorkActivity().init_activity({
+                        'workflow_id': workflow_id,
+                        'flow_id': flow_def_id,
+                        'activity_login_user': user_id,
+                        'activity_update_user': user_id},
+                        activity_id=activity_id)
+                    activity_ids.append(activity.activity_id)
+                db.session.commit()
+            except Exception as ex:
+                errors.append(ex)
+            finally:
+                db.session.remove()
+
+    threads = [threading.Thread(target=create_activities, args=(5,))
+               for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert len(activity_ids) == 100
+    assert len(set(activity_ids)) == 100
+    date_str = datetime.utcnow().strftime("%Y%m%d")
+    assert sorted(activity_ids) == [
+        "A-{}-{:05d}".format(date_str, i) for i in range(1, 101)]
+    assert Activity.query.count() == 100
+
+
 # .tox/c1/bin/pytest --cov=weko_workflow tests/test_api.py::test_init_activity_with_single_flow_action -vv -s --cov-branch --cov-report=term --basetemp=/code/modules/weko-workflow/.tox/c1/tmp
 def test_init_activity_with_single_flow_action(app, users, item_type, workflow_one, mocker):
     """
@@ -20,6 +20,7 @@
 
 """WEKO3 module docstring."""
 
+import hashlib
 import json
 import math
 from typing import List
@@ -35,6 +36,7 @@ from flask_login import current_user
 from marshmallow import ValidationError
 from requests import HTTPError
 from invenio_accounts.models import Role, User, userrole
+from invenio_cache import current_cache
 from invenio_communities.models import Community
 from invenio_db import db
 from invenio_pidstore.models import PersistentIdentifier, PIDStatus
@@ -879,13 +881,16 @@ class ActionStatus(object):
 class WorkActivity(object):
     """Operated on the Activity."""
 
-    def init_activity(self, activity, community_id=None, item_id=None):
+    def init_activity(self, activity, community_id=None, item_id=None,
+                      activity_id=None):
         """Create new activity.
 
         Args:
             activity (dict): activity info.
             community_id (int): community id.
             item_id (int): item id.
+            activity_id (str): activity id allocated by
+                :meth:`get_new_activity_ids`, a new one is allocated if None.
 
         Returns:
             _Activity:
@@ -952,7 +957,7 @@ class WorkActivity(object):
             for_delete = flow_define.flow_type == WEKO_WORKFLOW_DELETION_FLOW_TYPE
 
             db_activity = _Activity(
-                activity_id=self.get_new_activity_id(for_delete),
+                activity_id=activity_id or self.get_new_activity_id(for_delete),
                 item_id=item_id,
                 workflow_id=activity.get('workflow_id'),
                 flow_id=activity.get('flow_id'),
@@ -1025,42 +1030,31 @@ class WorkActivity(object):
 
         :return: activity ID.
         """
-        number = 1
-        try:
-            # Table lock for calculate new activity id
-            if db.get_engine().driver!='pysqlite':
-                db.session.execute(
-                    'LOCK TABLE ' + ActivityCount.__tablename__ + ' IN EXCLUSIVE MODE'
-                )
+        return self.get_new_activity_ids(1, for_delete)[0]
 
-            # Calculate activity_id based on id
-            utc_now = datetime.now(timezone.utc)
-            current_date = utc_now.strftime("%Y-%m-%d")
-            today_count = ActivityCount.query.filter_by(date=current_date).one_or_none()
-            # Cannot use '.with_for_update()'. FOR UPDATE is not allowed
-            # with aggregate functions
-
-            if today_count:
-                # Calculate aid
-                number = today_count.activity_count + 1
-                if number > current_app.config['WEKO_WORKFLOW_MAX_ACTIVITY_ID']:
-                    raise IndexError(
-                        'The number is out of range (maximum is {}, current is {}'
-                        .format(current_app.config['WEKO_WORKFLOW_MAX_ACTIVITY_ID'], number)
-                    )
-                today_count.activity_count = number
+    def get_new_activity_ids(self, count, for_delete=False):
+        """Get new activity IDs.
+
+        Bulk callers can allocate the IDs of many activities at once and pass
+        them to :meth:`init_activity`.
+
+        :param count: Number of the IDs.
+        :param for_delete: True for the IDs of deletion activities.
+        :return: List of activity IDs.
+        """
+        utc_now = datetime.now(timezone.utc)
+        try:
+            if db.get_engine().driver != 'pysqlite':
+                number = ActivityCount.allocate(utc_now.date(), count)
             else:
-                # The default activity Id of the current day
-                _activty_count = ActivityCount(date=current_date, activity_count=number)
-                db.session.add(_activty_count)
-                prev_counts = ActivityCount.query.filter(ActivityCount.date<current_date).all()
-                if prev_counts:
-                    for prev_count in prev_counts:
-                        db.session.delete(prev_count)
+                number = self.__count_activities(utc_now.date(), count)
         except SQLAlchemyError as ex:
             raise ex
-        except IndexError as ex:
-            raise ex
+        if number > current_app.config['WEKO_WORKFLOW_MAX_ACTIVITY_ID']:
+            raise IndexError(
+                'The number is out of range (maximum is {}, current is {}'
+                .format(current_app.config['WEKO_WORKFLOW_MAX_ACTIVITY_ID'], number)
+            )
 
         # Activity Id's format
         activity_id_format = (
@@ -1073,9 +1067,31 @@ class WorkActivity(object):
         date_str = utc_now.strftime("%Y%m%d")
 
         # Define activity Id of day
-        return activity_id_format.format(
-            date_str, "{inc:05d}".format(inc=number)
-        )
+        return [
+            activity_id_format.format(date_str, "{inc:05d}".format(inc=inc))
+            for inc in range(number - count + 1, number + 1)
+        ]
+
+    def __count_activities(self, current_date, count):
+        """Count the activities of the day in the session.
+
+        :param current_date: Date of the activity ids.
+        :param count: Number of the new activities.
+        :return: The last number of the new activities.
+        """
+        today_count = ActivityCount.query.filter_by(
+            date=current_date).one_or_none()
+        if today_count:
+            today_count.activity_count += count
+            return today_count.activity_count
+
+        # The default activity Id of the current day
+        db.session.add(ActivityCount(date=current_date, activity_count=count))
+        prev_counts = ActivityCount.query.filter(
+            ActivityCount.date < current_date).all()
+        for prev_count in prev_counts:
+            db.session.delete(prev_count)
+        return count
 
     def upt_activity_agreement_step(self, activity_id, is_agree):
         """Update agreement step of activity.
@@ -2349,9 +2365,8 @@ class WorkActivity(object):
                 comm_list = Community.get_by_user(
                     cur_role, with_deleted=True
                 ).all()
-                for comm in comm_list:
-                    comadmin_index_list += [str(i.cid) for i in Indexes.get_self_list(comm.root_node_id)
-                                  if i.cid not in comadmin_index_list]
+                comadmin_index_list = Indexes.get_self_list_ids(
+                    [comm.root_node_id for comm in comm_list])
             activities = []
             # query activities
             query_action_activities = self.__common_query_activity_list()
@@ -2413,22 +2428,60 @@ class WorkActivity(object):
                 size = current_app.config.get("WEKO_WORKFLOW_ACTIVITYLOG_BULK_MAX")
 
             # Count all result
-            count = query_action_activities.distinct(_Activity.id).count()
+            count = self.__count_activity_list(
+                query_action_activities, conditions, tab)
             max_page = math.ceil(count / int(size))
             name_param = ''
             if count > 0:
                 name_param, page = self.__get_activity_list_per_page(
                     activities, max_page, name_param, page,
-                    query_action_activities, size, tab, is_get_all
+                    query_action_activities, size, tab, is_get_all,
+                    conditions.get('after' + tab),
+                    conditions.get('before' + tab)
                 )
             return activities, max_page, size, page, name_param, count
 
+    @staticmethod
+    def __count_activity_list(query_action_activities, conditions, tab):
+        """Count the activities of the list.
+
+        The count is cached for each user and filter conditions for
+        WEKO_WORKFLOW_ACTIVITY_LIST_COUNT_CACHE_TIMEOUT seconds.
+
+        @param query_action_activities:
+        @param conditions:
+        @param tab:
+        @return:
+        """
+        timeout = current_app.config[
+            'WEKO_WORKFLOW_ACTIVITY_LIST_COUNT_CACHE_TIMEOUT']
+        if not timeout:
+            return query_action_activities.distinct(_Activity.id).count()
+
+        page_params = ('pages', 'size', 'after', 'before')
+        filters = {k: v for k, v in conditions.items()
+                   if not k.startswith(page_params)}
+        key = 'weko_workflow_activity_list_count_{}'.format(
+            hashlib.sha1(json.dumps(
+                [current_user.get_id(), tab, filters],
+                sort_keys=True).encode('utf-8')).hexdigest())
+        count = current_cache.get(key)
+        if count is None:
+            count = query_action_activities.distinct(_Activity.id).count()
+            current_cache.set(key, count, timeout=timeout)
+        return count
+
     def __get_activity_list_per_page(
         self, activities, max_page, name_param,
-        page, query_action_activities, size, tab, is_get_all=False
+        page, query_action_activities, size, tab, is_get_all=False,
+        after=None, before=None
     ):
         """Get activity list per page.
 
+        The page next to or previous to the shown page is seeked from the
+        last or the first activity id of the shown page, the other pages are
+        got by offset.
+
         @param activities:
         @param max_page:
         @param name_param:
@@ -2436,19 +2489,37 @@ class WorkActivity(object):
         @param query_action_activities:
         @param size:
         @param tab:
+        @param after: Activity id which the activities of the page are older
+                      than.
+        @param before: Activity id which the activities of the page are newer
+                       than.
         @return:
         """
         if int(page) > max_page:
             page = 1
             name_param = 'pages' + tab
-        offset = int(size) * (int(page) - 1)
-        # Get activities
+            after = before = None
         query_action_activities = query_action_activities \
-            .distinct(_Activity.id).order_by(desc(_Activity.id))
-        if not is_get_all:
-            query_action_activities = query_action_activities.limit(
-                size).offset(offset)
-        action_activities = query_action_activities.all()
+            .distinct(_Activity.id)
+        after = after[0] if after and after[0].isnumeric() else None
+        before = before[0] if before and before[0].isnumeric() else None
+        # Get activities
+        if is_get_all:
+            action_activities = query_action_activities.order_by(
+                desc(_Activity.id)).all()
+        elif after:
+            action_activities = query_action_activities.filter(
+                _Activity.id < int(after)).order_by(
+                desc(_Activity.id)).limit(size).all()
+        elif before:
+            action_activities = query_action_activities.filter(
+                _Activity.id > int(before)).order_by(
+                asc(_Activity.id)).limit(size).all()
+            action_activities.reverse()
+        else:
+            offset = int(size) * (int(page) - 1)
+            action_activities = query_action_activities.order_by(
+                desc(_Activity.id)).limit(size).offset(offset).all()
         if action_activities:
             # Format activities
             self.__format_activity_data_to_show_on_workflow(
@@ -471,9 +471,15 @@ WEKO_WORKFLOW_SEND_MAIL_USER_GROUP = {}
 
 WEKO_WORKFLOW_FILTER_PARAMS = [
     'createdfrom', 'createdto', 'workflow', 'user', 'item', 'status', 'action', 'tab',
-    'sizewait', 'sizetodo', 'sizeall', 'pagesall', 'pagestodo', 'pageswait'
+    'sizewait', 'sizetodo', 'sizeall', 'pagesall', 'pagestodo', 'pageswait',
+    'afterwait', 'aftertodo', 'afterall', 'beforewait', 'beforetodo',
+    'beforeall'
 ]
 
+WEKO_WORKFLOW_ACTIVITY_LIST_COUNT_CACHE_TIMEOUT = 0
+"""Seconds the number of activities in the activity list is cached for each
+user and filter conditions, 0 disables the cache."""
+
 WEKO_WORKFLOW_ACTIVITY_TOKEN_PATTERN = "activity={} file_name={} date={} email={}"
 """Token pattern."""
 
@@ -180,6 +180,9 @@ class HeadlessActivity(WorkActivity):
                 - workflow_id (int): Workflow ID
                 - community (str): Community ID
                 - activity_id (str): Activity ID
+                - new_activity_id (str): <br>
+                    ID of a new activity allocated by
+                    WorkActivity.get_new_activity_ids.
                 - item_id (str): Item ID
                 - for_delete (bool): <br>
                     Flag to create activity for delete item. Defaults to False.
@@ -283,7 +286,9 @@ class HeadlessActivity(WorkActivity):
                 "activity_login_user": user_id
             }
 
-            result, _ = init_activity(activity, community)
+            result, _ = init_activity(
+                activity, community,
+                activity_id=kwargs.get("new_activity_id"))
 
             if result.json.get("code") != 0:
                 current_app.logger.error(
@@ -316,6 +321,9 @@ class HeadlessActivity(WorkActivity):
             workflow_id (int, optional): Workflow ID <br>
             community (str, optional): Community ID <br>
             activity_id (str, optional): Activity ID <br>
+            new_activity_id (str, optional):
+                ID of a new activity allocated by
+                WorkActivity.get_new_activity_ids <br>
             item_id (str, optional): Item ID <br>
             files (list, optional): List of temporary file avsolute path <br>
             index (list, optional): List of index ID <br>
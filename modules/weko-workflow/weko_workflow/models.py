@@ -29,6 +29,7 @@ from invenio_accounts.models import Role, User
 from invenio_db import db
 from sqlalchemy import func
 from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.sql.expression import desc
 from sqlalchemy_utils.models import Timestamp
 from sqlalchemy_utils.types import JSONType, UUIDType
@@ -1326,3 +1327,30 @@ class ActivityCount(db.Model, TimestampMixin):
         db.Integer(), default=1,
         nullable=False, unique=False)
     """today count"""
+
+    @classmethod
+    def allocate(cls, date, count=1):
+        """Allocate the activity numbers of a day.
+
+        The counter is incremented by one statement on its own connection
+        and committed at once, so the row is not locked until the end of the
+        caller's transaction. Numbers of rolled back activities are not
+        reused.
+
+        :param date: Date of the activity ids.
+        :param count: Number of the numbers to allocate.
+        :return: The last allocated number.
+        """
+        table = cls.__table__
+        stmt = insert(table).values(date=date, activity_count=count)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.date],
+            set_={'activity_count': table.c.activity_count + count,
+                  'updated': datetime.now()}
+        ).returning(table.c.activity_count)
+        with db.engine.begin() as conn:
+            number = conn.execute(stmt).scalar()
+            if number == count:
+                # The first numbers of the day
+                conn.execute(table.delete().where(table.c.date < date))
+        return number
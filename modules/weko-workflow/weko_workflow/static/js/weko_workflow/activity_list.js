@@ -71,6 +71,9 @@ require([
           if (param.name == $("#change_page_param").val()) {
             param.value = 1;
           }
+          else if (param.name.startsWith('after') || param.name.startsWith('before')) {
+            continue;
+          }
           else {
             param.value = locationParam[key].split('=')[1];
           }
@@ -88,13 +91,28 @@ require([
   }
 
   $("#page_count").change(function () {
-    window.location.href = creatURL(createParamArray($(this).val(), getSizeAndPagesName('size')));
+    window.location.href = creatURL(removeCursorParams(createParamArray($(this).val(), getSizeAndPagesName('size'))));
   });
 
   $(".get-pages").click(function () {
-    window.location.href = creatURL(createParamArray($(this).data('pages'), getSizeAndPagesName('pages')));
+    let params = removeCursorParams(createParamArray($(this).data('pages'), getSizeAndPagesName('pages')));
+    // The next and previous pages are seeked from the activities of this page
+    if ($(this).data('after')) {
+      params.push({'name': getSizeAndPagesName('after'), 'value': $(this).data('after')});
+    }
+    else if ($(this).data('before')) {
+      params.push({'name': getSizeAndPagesName('before'), 'value': $(this).data('before')});
+    }
+    window.location.href = creatURL(params);
   });
 
+  function removeCursorParams(params) {
+    let cursorNames = [getSizeAndPagesName('after'), getSizeAndPagesName('before')];
+    return params.filter(function (param) {
+      return cursorNames.indexOf(param.name) < 0;
+    });
+  }
+
   $(".activity_tab").click(function () {
     window.location.href = creatURL(createParamArray($(this).data('tab'), 'tab'));
   });
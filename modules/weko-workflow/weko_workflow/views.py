@@ -476,9 +476,11 @@ def new_activity():
 
 @workflow_blueprint.route('/activity/init', methods=['POST'])
 @login_required
-def init_activity(json_data=None, community=None):
+def init_activity(json_data=None, community=None, activity_id=None):
     """Return URL of workflow activity made from the request body.
     Args:
+        activity_id (str): activity id allocated by
+            WorkActivity.get_new_activity_ids, a new one is allocated if None.
 
     Returns:
         dict: json data validated by ResponseMessageSchema.
@@ -549,9 +551,11 @@ def init_activity(json_data=None, community=None):
     community_id = request.args.get('c') or community
     try:
         if community_id is not None:
-            rtn = activity.init_activity(post_activity.data, community_id)
+            rtn = activity.init_activity(post_activity.data, community_id,
+                                         activity_id=activity_id)
         else:
-            rtn = activity.init_activity(post_activity.data)
+            rtn = activity.init_activity(post_activity.data,
+                                         activity_id=activity_id)
         if rtn is None:
             res = ResponseMessageSchema().load({'code':-1,'msg':'can not make activity_id'})
             return jsonify(res.data), 500
@@ -0,0 +1,15 @@
+CREATE TABLE index_closure (
+    ancestor bigint NOT NULL,
+    descendant bigint NOT NULL,
+    depth integer NOT NULL,
+    CONSTRAINT pk_index_closure PRIMARY KEY (ancestor, descendant)
+);
+CREATE INDEX ix_index_closure_descendant_depth ON index_closure (descendant, depth);
+INSERT INTO index_closure (ancestor, descendant, depth)
+WITH RECURSIVE closure(ancestor, descendant, depth) AS (
+    SELECT id, id, 0 FROM "index"
+    UNION ALL
+    SELECT i.parent, c.descendant, c.depth + 1
+    FROM closure c JOIN "index" i ON i.id = c.ancestor
+)
+SELECT ancestor, descendant, depth FROM closure;
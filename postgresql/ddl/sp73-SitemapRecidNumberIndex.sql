@@ -0,0 +1 @@
+CREATE INDEX ix_pidstore_pid_recid_number ON pidstore_pid (CAST(split_part(pid_value, '.', 1) AS BIGINT)) WHERE pid_type = 'recid' AND pid_value LIKE '%.1';
@@ -0,0 +1,12 @@
+CREATE TABLE stats_report_rollup (
+    created timestamp without time zone NOT NULL,
+    updated timestamp without time zone NOT NULL,
+    id serial PRIMARY KEY,
+    report character varying(100) NOT NULL,
+    target_month character varying(7) NOT NULL,
+    params_key character varying(40) NOT NULL,
+    params jsonb,
+    data jsonb,
+    CONSTRAINT uq_stats_report_rollup UNIQUE (report, target_month, params_key)
+);
+CREATE INDEX ix_stats_report_rollup_target_month ON stats_report_rollup (target_month);
@@ -24,6 +24,17 @@ SET row_security = off;
 INSERT INTO public.index (created, updated, id, parent, "position", index_name, index_name_english, index_link_name, index_link_name_english, harvest_spec, index_link_enabled, comment, more_check, display_no, harvest_public_state, display_format, image_name, public_state, public_date, recursive_public_state, rss_status, coverpage_state, recursive_coverpage_check, browsing_role, recursive_browsing_role, contribute_role, recursive_contribute_role, browsing_group, recursive_browsing_group, contribute_group, recursive_contribute_group, owner_user_id, item_custom_sort, biblio_flag, online_issn, is_deleted) VALUES ('2021-06-14 01:07:10.647996', '2024-06-12 12:21:26.526676', 1623632832836, 0, 0, 'サンプルインデックス', 'Sample Index', '', 'New Index', '', false, '', false, 5, false, '1', '', false, NULL, false, false, false, false, '3,-98,-99', false, '1,2,3,4,-98', false, '', false, '', false, 1, '{}', false, '', false);
 
 
+--
+-- Data for Name: index_closure; Type: TABLE DATA; Schema: public; Owner: invenio
+--
+
+INSERT INTO public.index_closure (ancestor, descendant, depth)
+SELECT id, id, 0 FROM public.index WHERE id = 1623632832836
+UNION ALL
+SELECT parent, id, 1 FROM public.index WHERE id = 1623632832836
+ON CONFLICT (ancestor, descendant) DO NOTHING;
+
+
 --
 -- Name: index_id_seq; Type: SEQUENCE SET; Schema: public; Owner: invenio
 --
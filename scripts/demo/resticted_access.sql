@@ -387,6 +387,16 @@ INSERT INTO index (created, updated, id, parent, "position", index_name, index_n
 )
 ON CONFLICT (id) DO NOTHING;
 
+--
+-- Data for Name: index_closure; Type: TABLE DATA; Schema: public; Owner: invenio
+--
+
+INSERT INTO index_closure (ancestor, descendant, depth)
+SELECT id, id, 0 FROM index WHERE id IN (1703552310404, 1616224532673)
+UNION ALL
+SELECT parent, id, 1 FROM index WHERE id IN (1703552310404, 1616224532673)
+ON CONFLICT (ancestor, descendant) DO NOTHING;
+
 --
 -- Data for Name: workflow_flow_define; Type: TABLE DATA; Schema: public; Owner: invenio
 --